@@ -0,0 +1,219 @@
+"""Kraken - core.build_events module.
+
+Classes:
+BuildEvent - Timing of a build step of a scene item.
+BuildEventStream - Dispatches the build events to the listeners.
+BuildEventFileWriter - Listener writing the build events to a file.
+BuildEventRecorder - Listener collecting the build events.
+
+"""
+
+import json
+from timeit import default_timer
+
+
+class BuildEvent(object):
+    """Timing of a build step of a scene item.
+
+    Events only reference the scene item, the path strings are only built by
+    the listeners which need them.
+
+    """
+
+    __slots__ = ('item', 'phase', 'start', 'duration')
+
+
+    def __init__(self, item, phase, start, duration):
+        super(BuildEvent, self).__init__()
+
+        self.item = item
+        self.phase = phase
+        self.start = start
+        self.duration = duration
+
+
+    def toDict(self):
+        """Returns the event as a dictionary of plain values.
+
+        Returns:
+            dict: The 'path', 'type', 'phase', 'start' and 'duration' of the
+                event, times are in seconds.
+
+        """
+
+        return {
+            'path': self.item.getPath(),
+            'type': self.item.getTypeName(),
+            'phase': self.phase,
+            'start': self.start,
+            'duration': self.duration
+        }
+
+
+class BuildEventStream(object):
+    """Dispatches the build events to its listeners.
+
+    Listeners are callables receiving a BuildEvent. The builder only times the
+    build steps while the stream has listeners.
+
+    """
+
+    __instance = None
+
+
+    def __init__(self):
+        super(BuildEventStream, self).__init__()
+
+        self.__listeners = []
+
+
+    def addListener(self, listener):
+        """Adds a listener to the stream.
+
+        Args:
+            listener (function): Callable receiving each BuildEvent.
+
+        Returns:
+            bool: True if the listener was added.
+
+        """
+
+        if listener in self.__listeners:
+            return False
+
+        self.__listeners.append(listener)
+
+        return True
+
+
+    def removeListener(self, listener):
+        """Removes a listener from the stream.
+
+        Args:
+            listener (function): The listener to remove.
+
+        Returns:
+            bool: True if the listener was removed.
+
+        """
+
+        if listener not in self.__listeners:
+            return False
+
+        self.__listeners.remove(listener)
+
+        return True
+
+
+    def hasListeners(self):
+        """Returns whether any listener receives the events.
+
+        Returns:
+            bool: True if the stream has listeners.
+
+        """
+
+        return len(self.__listeners) > 0
+
+
+    def getTime(self):
+        """Returns the time used to stamp the events.
+
+        Returns:
+            float: Time in seconds.
+
+        """
+
+        return default_timer()
+
+
+    def emit(self, item, phase, start):
+        """Sends an event ending now to the listeners.
+
+        Args:
+            item (object): Scene item the event is about.
+            phase (int): Build phase of the event.
+            start (float): Time the step started at, see getTime.
+
+        """
+
+        event = BuildEvent(item, phase, start, default_timer() - start)
+        for listener in self.__listeners:
+            listener(event)
+
+
+    @classmethod
+    def getInstance(cls):
+        """This class method returns the singleton instance for the
+        BuildEventStream.
+
+        Returns:
+            object: The singleton build event stream instance.
+
+        """
+
+        if cls.__instance is None:
+            cls.__instance = BuildEventStream()
+
+        return cls.__instance
+
+
+class BuildEventFileWriter(object):
+    """Writes the build events to a file, one JSON object per line."""
+
+    def __init__(self, filepath):
+        super(BuildEventFileWriter, self).__init__()
+
+        self._file = open(filepath, 'w')
+
+
+    def __call__(self, event):
+        self._file.write(json.dumps(event.toDict()) + '\n')
+
+
+    def close(self):
+        """Closes the file."""
+
+        self._file.close()
+
+
+class BuildEventRecorder(object):
+    """Collects the build events, e.g. to display them once a build is done."""
+
+    def __init__(self):
+        super(BuildEventRecorder, self).__init__()
+
+        self.events = []
+
+
+    def __call__(self, event):
+        self.events.append(event)
+
+
+    def clear(self):
+        """Removes the collected events."""
+
+        self.events = []
+
+
+    def getTotals(self, key=None):
+        """Sums the durations of the collected events.
+
+        Args:
+            key (function): Returns the key to group an event under, defaults
+                to the type name of its item.
+
+        Returns:
+            dict: The total duration of each key, in seconds.
+
+        """
+
+        if key is None:
+            key = lambda event: event.item.getTypeName()
+
+        totals = {}
+        for event in self.events:
+            groupKey = key(event)
+            totals[groupKey] = totals.get(groupKey, 0.0) + event.duration
+
+        return totals
@@ -12,9 +12,12 @@ from kraken.log import getLogger
 from kraken.core.kraken_system import KrakenSystem
 from kraken.core.configs.config import Config
 from kraken.core.profiler import Profiler
+from kraken.core.evaluation_cache import EvaluationCache
+from kraken.core.build_events import BuildEventStream
 
 from kraken.core.objects.scene_item import SceneItem
 from kraken.core.objects.object_3d import Object3D
+from kraken.core.objects.components.component import Component
 from kraken.core.traverser import Traverser
 
 logger = getLogger('kraken')
@@ -43,11 +46,30 @@ class Builder(object):
     _buildPhase_AttributeConnections = 1
     _buildPhase_ConstraintsOperators = 2
 
+    # Build handlers keyed on type name then build phase. See
+    # registerBuildHandler.
+    _buildHandlers = {}
+    _buildHandlersVersion = 0
+
+    # Whether the builder can delete the built elements of single components,
+    # see rebuild.
+    _supportsIncrementalBuild = False
+
     def __init__(self, debugMode=False):
         super(Builder, self).__init__()
         self._buildElements = []
+        self._buildElementsById = {}
+        self._buildElementsByPath = {}
+        self._buildElementsByDCCItem = {}
         self._sceneItemsById = {}
 
+        self._previousBuild = None
+        self._reusableBuildElements = None
+        self._buildReport = {}
+
+        self._logBuildSteps = False
+        self._buildEvents = None
+
         self.config = Config.getInstance()
 
         self._debugMode = debugMode
@@ -75,13 +97,73 @@ class Builder(object):
 
         self._buildElements.append(pairing)
 
+        # The first pairing registered for an item wins, as it did when the
+        # pairings were searched linearly.
+        self._buildElementsById.setdefault(kSceneItem.getId(), pairing)
+        self._buildElementsByPath.setdefault(kSceneItem.getPath(), pairing)
+
+        if dccSceneItem is not None:
+            self._buildElementsByDCCItem.setdefault(
+                self.__getDCCSceneItemKey(dccSceneItem), pairing)
+
         return True
 
+    def _clearBuildElements(self):
+        """Removes all the registered scene item pairings.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        self._buildElements = []
+        self._buildElementsById = {}
+        self._buildElementsByPath = {}
+        self._buildElementsByDCCItem = {}
+
+        return True
+
+    def __getDCCSceneItemKey(self, dccSceneItem):
+        """Returns the key used to index a dcc scene item.
+
+        DCC scene items which are not hashable are indexed by identity.
+
+        Args:
+            dccSceneItem (object): dcc scene item to get the key for.
+
+        Returns:
+            object: The key of the dcc scene item.
+
+        """
+
+        try:
+            hash(dccSceneItem)
+        except TypeError:
+            return ('id', id(dccSceneItem))
+
+        return dccSceneItem
+
     def deleteBuildElements(self):
         """Clear out all dcc built elements from the scene if exist."""
 
         return None
 
+    def _deleteBuildElements(self, buildElements):
+        """Deletes the dcc scene items of some of the built elements.
+
+        Builders supporting incremental builds implement this method.
+
+        Args:
+            buildElements (list): The 'src' and 'tgt' pairings to delete.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        raise NotImplementedError("Incremental builds are not supported by " +
+                                  self.__class__.__name__)
+
     def getDCCSceneItem(self, kSceneItem):
         """Given a kSceneItem, returns the built dcc scene item.
 
@@ -94,9 +176,75 @@ class Builder(object):
         """
 
         if isinstance(kSceneItem, SceneItem):
-            for builtElement in self._buildElements:
-                if builtElement['src'] == kSceneItem:
-                    return builtElement['tgt']
+            pairing = self._buildElementsById.get(kSceneItem.getId(), None)
+            if pairing is not None:
+                return pairing['tgt']
+
+        return None
+
+    def getDCCSceneItems(self, kSceneItems):
+        """Given a list of kSceneItems, returns the built dcc scene items.
+
+        Args:
+            kSceneItems (list): kSceneItems to base the search.
+
+        Returns:
+            list: The DCC Scene Items that correspond to the given scene items,
+                None for the items that have not been built.
+
+        """
+
+        buildElementsById = self._buildElementsById
+
+        dccSceneItems = []
+        for kSceneItem in kSceneItems:
+            pairing = None
+            if isinstance(kSceneItem, SceneItem):
+                pairing = buildElementsById.get(kSceneItem.getId(), None)
+
+            if pairing is None:
+                dccSceneItems.append(None)
+            else:
+                dccSceneItems.append(pairing['tgt'])
+
+        return dccSceneItems
+
+    def getDCCSceneItemByPath(self, path):
+        """Given the path of a kSceneItem, returns the built dcc scene item.
+
+        Args:
+            path (str): Path of the kSceneItem at the time it was built.
+
+        Returns:
+            object: The DCC Scene Item that corresponds to the given path.
+
+        """
+
+        pairing = self._buildElementsByPath.get(path, None)
+        if pairing is not None:
+            return pairing['tgt']
+
+        return None
+
+    def getKrakenSceneItem(self, dccSceneItem):
+        """Given a built dcc scene item, returns the kraken scene item it was
+        built from.
+
+        Args:
+            dccSceneItem (object): dcc scene item to base the search.
+
+        Returns:
+            object: The kraken scene item that corresponds to the dcc scene item.
+
+        """
+
+        if dccSceneItem is None:
+            return None
+
+        pairing = self._buildElementsByDCCItem.get(
+            self.__getDCCSceneItemKey(dccSceneItem), None)
+        if pairing is not None:
+            return pairing['src']
 
         return None
 
@@ -126,7 +274,7 @@ class Builder(object):
 
         """
 
-        logger.info("buildContainer: " + kContainer.getPath() + " as: " +
+        logger.info("buildContainer: %s as: %s", kContainer.getPath(),
                     buildName)
 
         return self.buildLocator(kContainer, buildName)
@@ -143,7 +291,7 @@ class Builder(object):
 
         """
 
-        logger.info("buildLayer: " + kSceneItem.getPath() + " as: " + buildName)
+        logger.info("buildLayer: %s as: %s", kSceneItem.getPath(), buildName)
 
         return None
 
@@ -160,7 +308,7 @@ class Builder(object):
         """
 
 
-        logger.info("buildHierarchyGroup: " + kSceneItem.getPath() + " as: " +
+        logger.info("buildHierarchyGroup: %s as: %s", kSceneItem.getPath(),
                     buildName)
 
         return None
@@ -177,8 +325,7 @@ class Builder(object):
 
         """
 
-        logger.info("buildGroup: " + kSceneItem.getPath() + " as: " +
-                    buildName)
+        logger.info("buildGroup: %s as: %s", kSceneItem.getPath(), buildName)
 
         return None
 
@@ -194,8 +341,7 @@ class Builder(object):
 
         """
 
-        logger.info("buildJoint: " + kSceneItem.getPath() + " as: " +
-                    buildName)
+        logger.info("buildJoint: %s as: %s", kSceneItem.getPath(), buildName)
 
         return None
 
@@ -212,8 +358,7 @@ class Builder(object):
         """
 
 
-        logger.info("buildLocator: " + kSceneItem.getPath() + " as: " +
-                    buildName)
+        logger.info("buildLocator: %s as: %s", kSceneItem.getPath(), buildName)
 
         return None
 
@@ -229,8 +374,7 @@ class Builder(object):
 
         """
 
-        logger.info("buildCurve: " + kSceneItem.getPath() + " as: " +
-                    buildName)
+        logger.info("buildCurve: %s as: %s", kSceneItem.getPath(), buildName)
 
         return None
 
@@ -246,8 +390,7 @@ class Builder(object):
 
         """
 
-        logger.info("buildControl:" + kSceneItem.getPath() + " as: " +
-                    buildName)
+        logger.info("buildControl: %s as: %s", kSceneItem.getPath(), buildName)
 
         return None
 
@@ -265,7 +408,7 @@ class Builder(object):
 
         """
 
-        logger.info("buildBoolAttribute: " + kAttribute.getPath())
+        logger.info("buildBoolAttribute: %s", kAttribute.getPath())
 
         return True
 
@@ -281,7 +424,7 @@ class Builder(object):
         """
 
 
-        logger.info("buildScalarAttribute: " + kAttribute.getPath())
+        logger.info("buildScalarAttribute: %s", kAttribute.getPath())
 
         return True
 
@@ -297,7 +440,7 @@ class Builder(object):
         """
 
 
-        logger.info("buildIntegerAttribute: " + kAttribute.getPath())
+        logger.info("buildIntegerAttribute: %s", kAttribute.getPath())
 
         return True
 
@@ -312,7 +455,7 @@ class Builder(object):
 
         """
 
-        logger.info("buildStringAttribute: " + kAttribute.getPath())
+        logger.info("buildStringAttribute: %s", kAttribute.getPath())
 
         return True
 
@@ -327,7 +470,7 @@ class Builder(object):
 
         """
 
-        logger.info("buildAttributeGroup: " + kAttributeGroup.getPath())
+        logger.info("buildAttributeGroup: %s", kAttributeGroup.getPath())
 
         return True
 
@@ -343,7 +486,7 @@ class Builder(object):
         """
 
 
-        logger.info("connectAttribute: " + kAttribute.getPath())
+        logger.info("connectAttribute: %s", kAttribute.getPath())
 
         return True
 
@@ -361,8 +504,9 @@ class Builder(object):
 
         """
 
-        logger.info("buildOrientationConstraint: " + kConstraint.getPath() +
-                    " to: " + kConstraint.getConstrainee().getPath())
+        logger.info("buildOrientationConstraint: %s to: %s",
+                    kConstraint.getPath(),
+                    kConstraint.getConstrainee().getPath())
 
         dccSceneItem = None  # Add constraint object here.
         self._registerSceneItemPair(kConstraint, dccSceneItem)
@@ -380,7 +524,8 @@ class Builder(object):
 
         """
 
-        logger.info("buildPoseConstraint: " + kConstraint.getPath() + " to: " +
+        logger.info("buildPoseConstraint: %s to: %s",
+                    kConstraint.getPath(),
                     kConstraint.getConstrainee().getPath())
 
         dccSceneItem = None  # Add constraint object here.
@@ -399,8 +544,9 @@ class Builder(object):
 
         """
 
-        logger.info("buildPositionConstraint:" + kConstraint.getPath() +
-                    " to: " + kConstraint.getConstrainee().getPath())
+        logger.info("buildPositionConstraint: %s to: %s",
+                    kConstraint.getPath(),
+                    kConstraint.getConstrainee().getPath())
 
         dccSceneItem = None  # Add constraint object here.
         self._registerSceneItemPair(kConstraint, dccSceneItem)
@@ -418,8 +564,9 @@ class Builder(object):
 
         """
 
-        logger.info("buildScaleConstraint: " + kConstraint.getPath() +
-                    " to: " + kConstraint.getConstrainee().getPath())
+        logger.info("buildScaleConstraint: %s to: %s",
+                    kConstraint.getPath(),
+                    kConstraint.getConstrainee().getPath())
 
         dccSceneItem = None  # Add constraint object here.
         self._registerSceneItemPair(kConstraint, dccSceneItem)
@@ -443,7 +590,7 @@ class Builder(object):
 
         """
 
-        logger.info("buildAttributeConnection: " + componentInput.getPath())
+        logger.info("buildAttributeConnection: %s", componentInput.getPath())
 
         return True
 
@@ -464,7 +611,7 @@ class Builder(object):
 
         """
 
-        logger.info("buildKLOperator:" + kKLOperator.getPath())
+        logger.info("buildKLOperator: %s", kKLOperator.getPath())
 
         return True
 
@@ -483,13 +630,91 @@ class Builder(object):
 
         """
 
-        logger.info("buildCanvasOperator: " + kOperator.getPath())
+        logger.info("buildCanvasOperator: %s", kOperator.getPath())
 
         return True
 
     # =====================
     # Build Object Methods
     # =====================
+    @classmethod
+    def registerBuildHandler(cls, typeName, phase=None, handler=None):
+        """Registers the function building the objects of a type in a phase.
+
+        Objects are built by the handlers of the first type in their class
+        hierarchy that has been registered, so registering a type without a
+        handler for a phase stops its objects from being built in that phase by
+        the handlers of its base types. Handlers registered on a builder class
+        apply to its sub-classes too.
+
+        Args:
+            typeName (str): Name of the type to register.
+            phase (int): Build phase the handler is called in, None to only
+                register the type.
+            handler (function): Function called with the builder, the object and
+                its build name, returning the DCC scene item that was created.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        if '_buildHandlers' not in cls.__dict__:
+            cls._buildHandlers = {}
+
+        typeHandlers = cls._buildHandlers.setdefault(typeName, {})
+        if phase is not None:
+            typeHandlers[phase] = handler
+
+        # Invalidates the dispatch tables of all the builder classes.
+        Builder._buildHandlersVersion += 1
+
+        return True
+
+    @classmethod
+    def __getBuildHandlers(cls, objectType):
+        """Returns the build handlers of a scene item class, keyed on phase.
+
+        Dispatch tables are cached per builder class and scene item class.
+
+        Args:
+            objectType (type): Class of the scene item.
+
+        Returns:
+            dict: The handlers of the scene item class, None if no type in its
+                class hierarchy has been registered.
+
+        """
+
+        cache = cls.__dict__.get('_buildDispatchCache', None)
+        if cache is None or cache['version'] != Builder._buildHandlersVersion:
+            cache = {
+                'version': Builder._buildHandlersVersion,
+                'handlers': {}
+            }
+            cls._buildDispatchCache = cache
+
+        handlers = cache['handlers']
+        if objectType in handlers:
+            return handlers[objectType]
+
+        # Merge the registered handlers of this builder class and its bases,
+        # the most derived builder class wins.
+        registeredHandlers = {}
+        for builderCls in reversed(type.mro(cls)):
+            for typeName, typeHandlers in builderCls.__dict__.get('_buildHandlers', {}).iteritems():
+                registeredHandlers.setdefault(typeName, {}).update(typeHandlers)
+
+        typeHandlers = None
+        for typeName in SceneItem.getClassTypeHierarchyNames(objectType):
+            if typeName in registeredHandlers:
+                typeHandlers = registeredHandlers[typeName]
+                break
+
+        handlers[objectType] = typeHandlers
+
+        return typeHandlers
+
     def __buildSceneItem(self, kObject, phase):
         """Builds the DCC sceneitem for the supplied kObject.
 
@@ -508,117 +733,31 @@ class Builder(object):
         if hasattr(kObject, 'getBuildName'):
             buildName = kObject.getBuildName()
 
-        logger.debug("building(" + str(phase) + "): " + kObject.getPath() +
-                     " as: " + buildName + " type: " + kObject.getTypeName())
-
-        # Build Object
-        if kObject.isTypeOf("Rig"):
-            if phase == self._buildPhase_3DObjectsAttributes:
-                dccSceneItem = self.buildContainer(kObject, buildName)
-
-        elif kObject.isTypeOf("Layer"):
-            if phase == self._buildPhase_3DObjectsAttributes:
-                dccSceneItem = self.buildLayer(kObject, buildName)
-
-        elif kObject.isTypeOf("Component"):
-            return None
+        if self._reusableBuildElements is not None:
+            reusable = self._reusableBuildElements.get(kObject.getDecoratedPath(), None)
+            if reusable is not None:
+                return self.__reuseSceneItem(kObject, phase, buildName, reusable)
 
-        elif kObject.isTypeOf("ComponentGroup"):
-            if phase == self._buildPhase_3DObjectsAttributes:
-                dccSceneItem = self.buildGroup(kObject, buildName)
-
-        elif kObject.isTypeOf("HierarchyGroup"):
-            if phase == self._buildPhase_3DObjectsAttributes:
-                dccSceneItem = self.buildHierarchyGroup(kObject, buildName)
-
-        elif kObject.isTypeOf("CtrlSpace"):
-            if phase == self._buildPhase_3DObjectsAttributes:
-                dccSceneItem = self.buildGroup(kObject, buildName)
-
-        elif kObject.isTypeOf("Transform"):
-            if phase == self._buildPhase_3DObjectsAttributes:
-                dccSceneItem = self.buildGroup(kObject, buildName)
-
-        elif kObject.isTypeOf("Locator"):
-            if phase == self._buildPhase_3DObjectsAttributes:
-                dccSceneItem = self.buildLocator(kObject, buildName)
-
-        elif kObject.isTypeOf("Joint"):
-            if phase == self._buildPhase_3DObjectsAttributes:
-                dccSceneItem = self.buildJoint(kObject, buildName)
-
-        elif kObject.isTypeOf("Control"):
-            if phase == self._buildPhase_3DObjectsAttributes:
-                dccSceneItem = self.buildControl(kObject, buildName)
-
-        elif kObject.isTypeOf("Curve"):
-            if phase == self._buildPhase_3DObjectsAttributes:
-                dccSceneItem = self.buildCurve(kObject, buildName)
-
-        elif kObject.isTypeOf('AttributeGroup'):
-            if phase == self._buildPhase_3DObjectsAttributes:
-                dccSceneItem = self.buildAttributeGroup(kObject)
-
-        elif kObject.isTypeOf("BoolAttribute"):
-            if phase == self._buildPhase_3DObjectsAttributes:
-                dccSceneItem = self.buildBoolAttribute(kObject)
-            elif phase == self._buildPhase_AttributeConnections:
-                self.connectAttribute(kObject)
-
-        elif kObject.isTypeOf("ScalarAttribute"):
-            if phase == self._buildPhase_3DObjectsAttributes:
-                dccSceneItem = self.buildScalarAttribute(kObject)
-            elif phase == self._buildPhase_AttributeConnections:
-                self.connectAttribute(kObject)
-
-        elif kObject.isTypeOf("IntegerAttribute"):
-            if phase == self._buildPhase_3DObjectsAttributes:
-                dccSceneItem = self.buildIntegerAttribute(kObject)
-            elif phase == self._buildPhase_AttributeConnections:
-                self.connectAttribute(kObject)
-
-        elif kObject.isTypeOf("StringAttribute"):
-            if phase == self._buildPhase_3DObjectsAttributes:
-                dccSceneItem = self.buildStringAttribute(kObject)
-            elif phase == self._buildPhase_AttributeConnections:
-                self.connectAttribute(kObject)
-
-        elif kObject.isTypeOf("OrientationConstraint"):
-            if phase == self._buildPhase_ConstraintsOperators:
-                dccSceneItem = self.buildOrientationConstraint(kObject)
-
-        elif kObject.isTypeOf("PoseConstraint"):
-            if phase == self._buildPhase_ConstraintsOperators:
-                dccSceneItem = self.buildPoseConstraint(kObject)
-
-        elif kObject.isTypeOf("PositionConstraint"):
-            if phase == self._buildPhase_ConstraintsOperators:
-                dccSceneItem = self.buildPositionConstraint(kObject)
-
-        elif kObject.isTypeOf("ScaleConstraint"):
-            if phase == self._buildPhase_ConstraintsOperators:
-                dccSceneItem = self.buildScaleConstraint(kObject)
-
-        elif kObject.isTypeOf("KLOperator"):
-            if phase == self._buildPhase_ConstraintsOperators:
-                dccSceneItem = self.buildKLOperator(kObject)
-
-        elif kObject.isTypeOf("CanvasOperator"):
-            if phase == self._buildPhase_ConstraintsOperators:
-                dccSceneItem = self.buildCanvasOperator(kObject)
-
-        # Important Note: The order of these tests is important.
-        # New classes should be added above the classes they are derrived from.
-        # No new types should be added below SceneItem here.
-        elif kObject.isTypeOf("SceneItem"):
-            if phase == 0:
-                dccSceneItem = self.buildLocator(kObject, buildName)
+        if self._logBuildSteps:
+            logger.debug("building(%d): %s as: %s type: %s", phase,
+                         kObject.getPath(), buildName, kObject.getTypeName())
 
-        else:
+        # Build Object
+        typeHandlers = self.__getBuildHandlers(type(kObject))
+        if typeHandlers is None:
             raise NotImplementedError(kObject.getName() +
                                       ' has an unsupported type: ' +
                                       str(type(kObject)))
 
+        handler = typeHandlers.get(phase, None)
+        if handler is not None:
+            if self._buildEvents is not None:
+                start = self._buildEvents.getTime()
+                dccSceneItem = handler(self, kObject, buildName)
+                self._buildEvents.emit(kObject, phase, start)
+            else:
+                dccSceneItem = handler(self, kObject, buildName)
+
         if dccSceneItem is not None:
             self._sceneItemsById[kObject.getId()] = dccSceneItem
         else:
@@ -649,7 +788,6 @@ class Builder(object):
         for kObject in kObjects:
             self.__buildSceneItem(kObject, phase)
 
-
     def build(self, kSceneItem):
         """Builds a rig object.
 
@@ -666,6 +804,15 @@ class Builder(object):
 
         Profiler.getInstance().push("build:" + kSceneItem.getName())
 
+        self._previousBuild = None
+
+        # Check the log level and the event listeners once per build rather
+        # than for each item.
+        self._logBuildSteps = logger.isEnabledFor(logging.DEBUG)
+        self._buildEvents = BuildEventStream.getInstance()
+        if not self._buildEvents.hasListeners():
+            self._buildEvents = None
+
         traverser = Traverser('Children')
         traverser.addRootItem(kSceneItem)
 
@@ -678,12 +825,18 @@ class Builder(object):
             traverser.addRootItem(rootItem)
         traverser.traverse()
 
+        # The scene is not edited during the build, so evaluated transforms
+        # can be shared between all the objects reading them.
+        evaluationCache = EvaluationCache.getInstance()
+        evaluationCache.resetCounters()
+        evaluationCache.enable()
+
         try:
             self._preBuild(kSceneItem)
 
-            objects3d = traverser.getItemsOfType('Object3D')
-            attributeGroups = traverser.getItemsOfType(['AttributeGroup'])
-            attributes = traverser.getItemsOfType(['Attribute'])
+            objects3d = traverser.objects3d
+            attributeGroups = traverser.attributeGroups
+            attributes = traverser.attributes
 
             # build all 3D objects and attributes
             self.__buildSceneItemList(objects3d,
@@ -703,9 +856,16 @@ class Builder(object):
             self.__buildSceneItemList(traverser.items,
                                       self._buildPhase_ConstraintsOperators)
 
+            self.__setPreviousBuild(kSceneItem)
+
         finally:
             self._postBuild()
 
+            evaluationCache.disable()
+            counters = evaluationCache.getCounters()
+            logger.debug("Evaluation cache: %d hits, %d misses",
+                         counters['hits'], counters['misses'])
+
             # Clear Config when finished.
             self.config.clearInstance()
 
@@ -713,6 +873,238 @@ class Builder(object):
 
         return self.getDCCSceneItem(kSceneItem)
 
+    # ===========================
+    # Incremental Build Methods
+    # ===========================
+    def __setPreviousBuild(self, kSceneItem):
+        """Stores what is needed to rebuild an item over its build.
+
+        Args:
+            kSceneItem (object): The item that was built.
+
+        """
+
+        if not hasattr(kSceneItem, 'getComponentBuildHashes'):
+            self._buildReport = {}
+            return
+
+        buildHashes = kSceneItem.getComponentBuildHashes()
+        self._previousBuild = {
+            'path': kSceneItem.getDecoratedPath(),
+            'config': type(self.config),
+            'hashes': buildHashes
+        }
+
+        self._buildReport = {
+            'rebuilt': sorted(buildHashes.keys()),
+            'reconnected': [],
+            'reused': [],
+            'removed': []
+        }
+
+    def __getOwnerComponentName(self, kObject):
+        """Returns the decorated name of the component an object belongs to.
+
+        Args:
+            kObject (object): kraken object to get the component of.
+
+        Returns:
+            str: The decorated name of the component, None if the object
+                doesn't belong to a component.
+
+        """
+
+        item = kObject
+        while item is not None:
+            if isinstance(item, Component):
+                return item.getDecoratedName()
+
+            component = item.getComponent()
+            if isinstance(component, Component):
+                return component.getDecoratedName()
+
+            item = item.getParent()
+
+        return None
+
+    def __isDrivenByComponents(self, kObject, componentNames):
+        """Returns whether any of the sources of an object belongs to one of
+        the given components.
+
+        Args:
+            kObject (object): kraken object to test.
+            componentNames (set): Decorated names of the components.
+
+        Returns:
+            bool: True if the object is driven by one of the components.
+
+        """
+
+        for source in kObject.getSources():
+            if self.__getOwnerComponentName(source) in componentNames:
+                return True
+
+        return False
+
+    def __reuseSceneItem(self, kObject, phase, buildName, reusable):
+        """Pairs an object with the dcc scene item built for it by the
+        previous build instead of building it.
+
+        Attributes driven by rebuilt components are connected again.
+
+        Args:
+            kObject (object): kraken object to pair.
+            phase (int): The build phase.
+            buildName (str): The build name of the object.
+            reusable (dict): The dcc scene item of the previous build and
+                whether the object has to be connected again.
+
+        Returns:
+            object: The reused DCC object.
+
+        """
+
+        dccSceneItem = reusable['tgt']
+        if kObject.getId() not in self._sceneItemsById:
+            self._sceneItemsById[kObject.getId()] = dccSceneItem
+            self._registerSceneItemPair(kObject, dccSceneItem)
+            reusable['reused'] = True
+
+        if reusable['reconnect'] and \
+                phase == self._buildPhase_AttributeConnections:
+            typeHandlers = self.__getBuildHandlers(type(kObject))
+            handler = typeHandlers.get(phase, None)
+            if handler is not None:
+                handler(self, kObject, buildName)
+
+        return dccSceneItem
+
+    def canRebuild(self, kSceneItem):
+        """Returns whether an item can be incrementally rebuilt over the
+        previous build of this builder.
+
+        Args:
+            kSceneItem (object): The item to rebuild.
+
+        Returns:
+            bool: True if the item can be rebuilt incrementally.
+
+        """
+
+        if not self._supportsIncrementalBuild or self._previousBuild is None:
+            return False
+
+        if not hasattr(kSceneItem, 'getComponentBuildHashes'):
+            return False
+
+        if self._previousBuild['path'] != kSceneItem.getDecoratedPath():
+            return False
+
+        return self._previousBuild['config'] is type(Config.getInstance())
+
+    def rebuild(self, kSceneItem):
+        """Rebuilds a rig over the previous build of this builder.
+
+        The build hashes of the rig components are compared with the ones of
+        the previous build. Only the components whose hash changed are deleted
+        and built again, along with the constraints, operators and attribute
+        connections of the other components driven by them. The dcc scene
+        items of the other components are reused.
+
+        The whole rig is deleted and built again when it can't be rebuilt
+        incrementally, see canRebuild.
+
+        Args:
+            kSceneItem (Rig): The rig to be built.
+
+        Returns:
+            object: DCC Scene Item that is created.
+
+        """
+
+        self.config = Config.getInstance()
+
+        if not self.canRebuild(kSceneItem):
+            self.deleteBuildElements()
+            return self.build(kSceneItem)
+
+        previousHashes = self._previousBuild['hashes']
+        buildHashes = kSceneItem.getComponentBuildHashes()
+
+        dirtyComponents = set()
+        for decoratedName in set(previousHashes.keys()) | set(buildHashes.keys()):
+            if previousHashes.get(decoratedName, None) != buildHashes.get(decoratedName, None):
+                dirtyComponents.add(decoratedName)
+
+        # Delete the elements of the dirty components and the constraints and
+        # operators driven by them, the other ones are reused.
+        deletedElements = []
+        reconnectedComponents = set()
+        reusableElements = {}
+        for pairing in self._buildElements:
+            kObject = pairing['src']
+            ownerName = self.__getOwnerComponentName(kObject)
+            if ownerName in dirtyComponents:
+                deletedElements.append(pairing)
+                continue
+
+            reconnect = False
+            if not isinstance(kObject, Object3D) and \
+                    self.__isDrivenByComponents(kObject, dirtyComponents):
+                if ownerName is not None:
+                    reconnectedComponents.add(ownerName)
+
+                if not kObject.isTypeOf('Attribute'):
+                    deletedElements.append(pairing)
+                    continue
+
+                reconnect = True
+
+            reusableElements.setdefault(kObject.getDecoratedPath(), {
+                'src': kObject,
+                'tgt': pairing['tgt'],
+                'reconnect': reconnect,
+                'reused': False
+            })
+
+        self._deleteBuildElements(deletedElements)
+        self._clearBuildElements()
+        self._sceneItemsById = {}
+
+        self._reusableBuildElements = reusableElements
+        try:
+            dccSceneItem = self.build(kSceneItem)
+        finally:
+            self._reusableBuildElements = None
+
+        # Delete the elements which are not part of the rig anymore.
+        self._deleteBuildElements(
+            [x for x in reusableElements.itervalues() if not x['reused']])
+
+        self._buildReport = {
+            'rebuilt': sorted(dirtyComponents.intersection(buildHashes.keys())),
+            'reconnected': sorted(reconnectedComponents),
+            'reused': sorted(set(buildHashes.keys()) - dirtyComponents),
+            'removed': sorted(dirtyComponents.difference(buildHashes.keys()))
+        }
+
+        logger.info("Rebuilt components: %s. Reused components: %s",
+                    ', '.join(self._buildReport['rebuilt']),
+                    ', '.join(self._buildReport['reused']))
+
+        return dccSceneItem
+
+    def getBuildReport(self):
+        """Returns the report of the last rig build.
+
+        Returns:
+            dict: The decorated names of the 'rebuilt', 'reconnected', 'reused'
+                and 'removed' components.
+
+        """
+
+        return self._buildReport
+
     # ==================
     # Parameter Methods
     # ==================
@@ -871,3 +1263,109 @@ class Builder(object):
         """
 
         return True
+
+
+# =======================
+# Default Build Handlers
+# =======================
+def _objectBuildHandler(methodName):
+    """Returns a build handler calling a builder method with the object and its
+    build name.
+
+    Args:
+        methodName (str): Name of the builder method to call.
+
+    Returns:
+        function: The build handler.
+
+    """
+
+    def handler(builder, kObject, buildName):
+        return getattr(builder, methodName)(kObject, buildName)
+
+    return handler
+
+
+def _itemBuildHandler(methodName):
+    """Returns a build handler calling a builder method with the object.
+
+    Args:
+        methodName (str): Name of the builder method to call.
+
+    Returns:
+        function: The build handler.
+
+    """
+
+    def handler(builder, kObject, buildName):
+        return getattr(builder, methodName)(kObject)
+
+    return handler
+
+
+def _connectionBuildHandler(methodName):
+    """Returns a build handler calling a builder method connecting the object.
+    Connections don't create DCC scene items.
+
+    Args:
+        methodName (str): Name of the builder method to call.
+
+    Returns:
+        function: The build handler.
+
+    """
+
+    def handler(builder, kObject, buildName):
+        getattr(builder, methodName)(kObject)
+
+        return None
+
+    return handler
+
+
+for typeName, methodName in [('Rig', 'buildContainer'),
+                             ('Layer', 'buildLayer'),
+                             ('ComponentGroup', 'buildGroup'),
+                             ('HierarchyGroup', 'buildHierarchyGroup'),
+                             ('CtrlSpace', 'buildGroup'),
+                             ('Transform', 'buildGroup'),
+                             ('Locator', 'buildLocator'),
+                             ('Joint', 'buildJoint'),
+                             ('Control', 'buildControl'),
+                             ('Curve', 'buildCurve')]:
+    Builder.registerBuildHandler(typeName,
+                                 Builder._buildPhase_3DObjectsAttributes,
+                                 _objectBuildHandler(methodName))
+
+Builder.registerBuildHandler('AttributeGroup',
+                             Builder._buildPhase_3DObjectsAttributes,
+                             _itemBuildHandler('buildAttributeGroup'))
+
+for typeName, methodName in [('BoolAttribute', 'buildBoolAttribute'),
+                             ('ScalarAttribute', 'buildScalarAttribute'),
+                             ('IntegerAttribute', 'buildIntegerAttribute'),
+                             ('StringAttribute', 'buildStringAttribute')]:
+    Builder.registerBuildHandler(typeName,
+                                 Builder._buildPhase_3DObjectsAttributes,
+                                 _itemBuildHandler(methodName))
+    Builder.registerBuildHandler(typeName,
+                                 Builder._buildPhase_AttributeConnections,
+                                 _connectionBuildHandler('connectAttribute'))
+
+for typeName, methodName in [('OrientationConstraint', 'buildOrientationConstraint'),
+                             ('PoseConstraint', 'buildPoseConstraint'),
+                             ('PositionConstraint', 'buildPositionConstraint'),
+                             ('ScaleConstraint', 'buildScaleConstraint'),
+                             ('KLOperator', 'buildKLOperator'),
+                             ('CanvasOperator', 'buildCanvasOperator')]:
+    Builder.registerBuildHandler(typeName,
+                                 Builder._buildPhase_ConstraintsOperators,
+                                 _itemBuildHandler(methodName))
+
+# Components are not built, their items are.
+Builder.registerBuildHandler('Component')
+
+# Any other scene item is built as a locator.
+Builder.registerBuildHandler('SceneItem',
+                             Builder._buildPhase_3DObjectsAttributes,
+                             _objectBuildHandler('buildLocator'))
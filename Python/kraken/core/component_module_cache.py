@@ -0,0 +1,226 @@
+"""Kraken - core.component_module_cache module.
+
+Classes:
+ComponentModuleCache - Persistent registry of the classes defined by the
+component modules.
+
+"""
+
+import os
+import json
+import hashlib
+
+from kraken.log import getLogger
+
+logger = getLogger('kraken')
+
+
+class ComponentModuleCache(object):
+    """Persistent registry of the component and config classes registered by
+    each module found in the Kraken paths.
+
+    Entries are keyed on the module file paths and are valid as long as the
+    file modification time and size are unchanged, or its content hash when
+    only the modification time changed. Modules with a valid entry don't need
+    to be imported to know which classes they provide.
+
+    The cache file defaults to ~/.kraken/componentModuleCache.json and can be
+    set with the 'KRAKEN_COMPONENT_CACHE' environment variable. Setting the
+    variable to an empty string disables the cache.
+
+    """
+
+    version = 1
+
+
+    def __init__(self, filepath=None):
+        super(ComponentModuleCache, self).__init__()
+
+        if filepath is None:
+            filepath = os.environ.get('KRAKEN_COMPONENT_CACHE', None)
+            if filepath is None:
+                filepath = os.path.join(os.path.expanduser('~'), '.kraken',
+                                        'componentModuleCache.json')
+
+        self._filepath = filepath
+        self._entries = {}
+        self._modified = False
+
+
+    def isEnabled(self):
+        """Returns whether the cache has a file to persist its entries to.
+
+        Returns:
+            bool: True if the cache is enabled.
+
+        """
+
+        return bool(self._filepath)
+
+
+    def load(self):
+        """Loads the cached entries from the cache file.
+
+        Returns:
+            bool: True if entries were loaded.
+
+        """
+
+        self._entries = {}
+        self._modified = False
+
+        if not self.isEnabled() or not os.path.exists(self._filepath):
+            return False
+
+        try:
+            with open(self._filepath) as cacheFile:
+                data = json.load(cacheFile)
+        except (IOError, ValueError):
+            logger.warning("Unable to read component module cache: " +
+                           self._filepath)
+            return False
+
+        if data.get('version', None) != self.version:
+            return False
+
+        self._entries = data.get('modules', {})
+
+        return True
+
+
+    def save(self):
+        """Writes the entries to the cache file if they were modified.
+
+        Returns:
+            bool: True if the cache file is up to date.
+
+        """
+
+        if not self.isEnabled():
+            return False
+
+        if not self._modified:
+            return True
+
+        data = {
+            'version': self.version,
+            'modules': self._entries
+        }
+
+        try:
+            cacheDir = os.path.dirname(self._filepath)
+            if cacheDir and not os.path.exists(cacheDir):
+                os.makedirs(cacheDir)
+
+            with open(self._filepath, 'w') as cacheFile:
+                cacheFile.write(json.dumps(data, indent=2))
+        except (IOError, OSError):
+            logger.warning("Unable to write component module cache: " +
+                           self._filepath)
+            return False
+
+        self._modified = False
+
+        return True
+
+
+    def __getFileHash(self, filepath):
+        """Returns the hash of the content of a file.
+
+        Args:
+            filepath (str): Path of the file.
+
+        Returns:
+            str: The md5 hex digest of the file content.
+
+        """
+
+        with open(filepath, 'rb') as moduleFile:
+            return hashlib.md5(moduleFile.read()).hexdigest()
+
+
+    def getEntry(self, filepath, modulePath):
+        """Returns the cached entry of a module if it is still valid.
+
+        Args:
+            filepath (str): Path of the module file.
+            modulePath (str): Python path of the module.
+
+        Returns:
+            dict: The 'components' (class path to component type) and 'configs'
+                (class paths) of the module, None if the entry is invalid.
+
+        """
+
+        if not self.isEnabled():
+            return None
+
+        entry = self._entries.get(filepath, None)
+        if entry is None or entry['module'] != modulePath:
+            return None
+
+        stat = os.stat(filepath)
+        if entry['size'] != stat.st_size:
+            return None
+
+        if entry['mtime'] != stat.st_mtime:
+            # The file was touched, it is still valid if its content didn't
+            # change.
+            if entry['hash'] != self.__getFileHash(filepath):
+                return None
+
+            entry['mtime'] = stat.st_mtime
+            self._modified = True
+
+        return entry
+
+
+    def setEntry(self, filepath, modulePath, components, configs):
+        """Stores the classes registered by a module.
+
+        Args:
+            filepath (str): Path of the module file.
+            modulePath (str): Python path of the module.
+            components (dict): Component type of each registered component class
+                path.
+            configs (list): Registered config class paths.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        if not self.isEnabled():
+            return False
+
+        stat = os.stat(filepath)
+        self._entries[filepath] = {
+            'module': modulePath,
+            'mtime': stat.st_mtime,
+            'size': stat.st_size,
+            'hash': self.__getFileHash(filepath),
+            'components': components,
+            'configs': configs
+        }
+        self._modified = True
+
+        return True
+
+
+    def removeEntry(self, filepath):
+        """Removes the entry of a module.
+
+        Args:
+            filepath (str): Path of the module file.
+
+        Returns:
+            bool: True if an entry was removed.
+
+        """
+
+        if self._entries.pop(filepath, None) is None:
+            return False
+
+        self._modified = True
+
+        return True
@@ -5,11 +5,14 @@ Config -- Base config object used to configure builders.
 
 """
 
+from kraken.core.objects.curve_data import ShapeLibrary
+
 
 class Config(object):
     """Base Configuration for Kraken builders."""
 
     __instance = None
+    __controlShapeLibraries = {}
 
     def __init__(self):
         super(Config, self).__init__()
@@ -24,7 +27,7 @@ class Config(object):
         self._colors = self.initColors()
         self._colorMap = self.initColorMap()
         self._nameTemplate = self.initNameTemplate()
-        self._controlShapes = self.initControlShapes()
+        self._controlShapes = self.__getControlShapeLibrary()
         self._metaData = {}
 
 
@@ -944,11 +947,31 @@ class Config(object):
 
         return controlShapes
 
+    def __getControlShapeLibrary(self):
+        """Returns the control shape library of this class of config.
+
+        The shapes returned by initControlShapes are packed once per config
+        class and shared by all the instances and controls.
+
+        Returns:
+            ShapeLibrary: The read-only control shapes.
+
+        """
+
+        configClass = type(self)
+        library = Config.__controlShapeLibraries.get(configClass, None)
+        if library is None:
+            library = ShapeLibrary(self.initControlShapes())
+            Config.__controlShapeLibraries[configClass] = library
+
+        return library
+
     def getControlShapes(self):
         """Returns the control shapes for this configuration.
 
         Returns:
-            dict: control shapes.
+            ShapeLibrary: Read-only control shapes, the SubCurves of each
+                shape name.
 
         """
 
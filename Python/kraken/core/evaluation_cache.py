@@ -0,0 +1,190 @@
+"""Kraken - core.evaluation_cache module.
+
+Classes:
+EvaluationCache - Dependency aware cache of evaluated scene item values.
+
+"""
+
+
+class EvaluationCache(object):
+    """Caches the evaluated global transforms of scene items.
+
+    Values are keyed on the scene item ids. When a value is computed, the
+    item is registered as a dependent of its sources and of every item
+    evaluated while computing it. Invalidating an item removes the cached
+    values of the item and of everything downstream of it.
+
+    The cache only holds values while it is enabled, e.g. for the duration of
+    a build. Values are not tracked when math objects are modified in place
+    (obj.xfo.tr = ...), only through the scene item setters, so the scene
+    should not be edited that way while the cache is enabled.
+
+    """
+
+    __instance = None
+
+
+    def __init__(self):
+        super(EvaluationCache, self).__init__()
+
+        self.__enableCount = 0
+        self.__values = {}
+        self.__dependents = {}
+        self.__evaluationStack = []
+        self.resetCounters()
+
+
+    # ================
+    # Enable Methods
+    # ================
+    def enable(self):
+        """Enables the cache. Calls can be nested, every call to enable must
+        be matched by a call to disable."""
+
+        self.__enableCount += 1
+
+
+    def disable(self):
+        """Disables the cache and clears the cached values once all the calls
+        to enable have been matched."""
+
+        if self.__enableCount == 0:
+            raise Exception("Unable to disable the evaluation cache. Disable " +
+                            "has been called more times than enable.")
+
+        self.__enableCount -= 1
+        if self.__enableCount == 0:
+            self.clear()
+
+
+    def isEnabled(self):
+        """Returns whether the cache is enabled.
+
+        Returns:
+            bool: True if the cache is enabled.
+
+        """
+
+        return self.__enableCount > 0
+
+
+    def clear(self):
+        """Removes all the cached values and dependencies."""
+
+        self.__values = {}
+        self.__dependents = {}
+
+
+    # ====================
+    # Evaluation Methods
+    # ====================
+    def evaluate(self, sceneItem, computeFn):
+        """Returns the cached value of a scene item, computing it if needed.
+
+        Args:
+            sceneItem (SceneItem): Item the value belongs to.
+            computeFn (function): Function computing the value of the item.
+
+        Returns:
+            object: The value of the item.
+
+        """
+
+        if self.__enableCount == 0:
+            return computeFn()
+
+        itemId = sceneItem.getId()
+        if len(self.__evaluationStack) > 0:
+            self.__addDependent(itemId, self.__evaluationStack[-1])
+
+        if itemId in self.__values:
+            self.__hits += 1
+            return self.__values[itemId]
+
+        self.__misses += 1
+        for source in sceneItem.getSources():
+            self.__addDependent(source.getId(), itemId)
+
+        self.__evaluationStack.append(itemId)
+        try:
+            value = computeFn()
+        finally:
+            self.__evaluationStack.pop()
+
+        self.__values[itemId] = value
+
+        return value
+
+
+    def __addDependent(self, itemId, dependentId):
+        """Registers an item as depending on the value of another one.
+
+        Args:
+            itemId (int): Id of the item depended on.
+            dependentId (int): Id of the dependent item.
+
+        """
+
+        if itemId == dependentId:
+            return
+
+        if itemId not in self.__dependents:
+            self.__dependents[itemId] = set()
+
+        self.__dependents[itemId].add(dependentId)
+
+
+    def invalidate(self, sceneItem):
+        """Removes the cached values of an item and of all of its dependents.
+
+        Args:
+            sceneItem (SceneItem): Item whose value changed.
+
+        """
+
+        pending = [sceneItem.getId()]
+        while len(pending) > 0:
+            itemId = pending.pop()
+            self.__values.pop(itemId, None)
+            pending.extend(self.__dependents.pop(itemId, ()))
+
+
+    # ==================
+    # Counter Methods
+    # ==================
+    def resetCounters(self):
+        """Resets the hit and miss counters."""
+
+        self.__hits = 0
+        self.__misses = 0
+
+
+    def getCounters(self):
+        """Returns the number of cache hits and misses since the counters were
+        last reset.
+
+        Returns:
+            dict: The 'hits' and 'misses' counts.
+
+        """
+
+        return {
+            'hits': self.__hits,
+            'misses': self.__misses
+        }
+
+
+    @classmethod
+    def getInstance(cls):
+        """This class method returns the singleton instance for the
+        EvaluationCache.
+
+        Returns:
+            object: The singleton evaluation cache instance.
+
+        """
+
+        if cls.__instance is None:
+            cls.__instance = EvaluationCache()
+
+        return cls.__instance
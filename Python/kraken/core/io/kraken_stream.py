@@ -0,0 +1,592 @@
+"""KrakenStream - io.kraken_stream module.
+
+Compact binary rig definition format (.krb).
+
+The file starts with a magic string followed by a stream of length prefixed
+records, each encoded in the MessagePack format:
+
+    ['header', {...}]      Top level data of the rig (name, metaData...).
+    ['component', {...}]   One record per component.
+    ['connections', [...]] The connections between the components.
+
+Math values are stored as MessagePack extension types holding packed doubles,
+and lists of floats as packed double arrays, instead of the verbose
+'__mathObjectClass__' dictionaries of the JSON (.krg) format.
+
+Classes:
+KrakenStreamWriter - Writes the records of a rig definition stream.
+KrakenStreamReader - Reads the records of a rig definition stream.
+
+Functions:
+encodeValue - Encodes a value in the MessagePack format.
+decodeValue - Decodes a value from the MessagePack format.
+convertRigDefinitionFile - Converts rig definition files between formats.
+
+"""
+
+import json
+import os
+import struct
+
+from kraken.core.maths.math_object import MathObject
+from kraken.core.maths.vec2 import Vec2
+from kraken.core.maths.vec3 import Vec3
+from kraken.core.maths.vec4 import Vec4
+from kraken.core.maths.quat import Quat
+from kraken.core.maths.euler import Euler
+from kraken.core.maths.xfo import Xfo
+from kraken.core.maths.mat33 import Mat33
+from kraken.core.maths.mat44 import Mat44
+from kraken.core.maths.rotation_order import RotationOrder
+
+
+STREAM_MAGIC = 'KRB\x01'
+STREAM_EXTENSION = '.krb'
+
+_recordLength = struct.Struct('>I')
+
+# Extension type code used for packed float arrays.
+_floatArrayExtType = 16
+
+# Math types stored as extension types. Each layout lists the attribute paths
+# of the packed values, in the order they are stored.
+_vec3Layout = [('x',), ('y',), ('z',)]
+_vec4Layout = [('x',), ('y',), ('z',), ('t',)]
+_quatLayout = [('v', 'x'), ('v', 'y'), ('v', 'z'), ('w',)]
+
+_mathLayouts = {
+    'Vec2': (1, [('x',), ('y',)]),
+    'Vec3': (2, _vec3Layout),
+    'Vec4': (3, _vec4Layout),
+    'Quat': (4, _quatLayout),
+    'Euler': (5, _vec3Layout + [('ro', 'order')]),
+    'Xfo': (6, [('tr',) + path for path in _vec3Layout] +
+               [('ori',) + path for path in _quatLayout] +
+               [('sc',) + path for path in _vec3Layout]),
+    'Mat33': (7, [(row,) + path for row in ('row0', 'row1', 'row2')
+                  for path in _vec3Layout]),
+    'Mat44': (8, [(row,) + path for row in ('row0', 'row1', 'row2', 'row3')
+                  for path in _vec4Layout]),
+    'RotationOrder': (9, [('order',)])
+}
+
+_mathTypeNames = dict([(extType, typeName) for typeName, (extType, layout)
+                       in _mathLayouts.iteritems()])
+
+# Class names of the nested math values found in the JSON representation.
+_nestedMathTypeNames = {
+    'Quat': {('v',): 'Vec3'},
+    'Euler': {('ro',): 'RotationOrder'},
+    'Xfo': {('tr',): 'Vec3', ('ori',): 'Quat', ('ori', 'v'): 'Vec3',
+            ('sc',): 'Vec3'},
+    'Mat33': {('row0',): 'Vec3', ('row1',): 'Vec3', ('row2',): 'Vec3'},
+    'Mat44': {('row0',): 'Vec4', ('row1',): 'Vec4', ('row2',): 'Vec4',
+              ('row3',): 'Vec4'}
+}
+
+
+# ==================
+# Encoding Methods
+# ==================
+def _packExt(extType, data, chunks):
+    """Appends a MessagePack extension value to the encoded chunks.
+
+    Args:
+        extType (int): Extension type code.
+        data (str): Packed extension data.
+        chunks (list): Encoded chunks.
+
+    """
+
+    chunks.append(struct.pack('>BIb', 0xc9, len(data), extType))
+    chunks.append(data)
+
+
+def _getMathValues(value, layout, isJSON):
+    """Returns the values of a math object, or of its JSON representation, in
+    the order of a layout.
+
+    Args:
+        value (object): Math object or JSON dictionary.
+        layout (list): Attribute paths of the values.
+        isJSON (bool): Whether the value is a JSON dictionary.
+
+    Returns:
+        list: The float values.
+
+    """
+
+    values = []
+    for path in layout:
+        item = value
+        for name in path:
+            if isJSON:
+                item = item[name]
+            else:
+                item = getattr(item, name)
+
+        values.append(float(item))
+
+    return values
+
+
+def _encode(value, chunks):
+    """Appends the encoded value to the chunks.
+
+    Args:
+        value (object): Value to encode.
+        chunks (list): Encoded chunks.
+
+    """
+
+    # Subclasses of the builtin types (OrderedDict...) are encoded as their
+    # base types, like the json module does.
+    if value is None:
+        chunks.append('\xc0')
+
+    elif isinstance(value, bool):
+        chunks.append('\xc3' if value else '\xc2')
+
+    elif isinstance(value, (int, long)):
+        if 0 <= value < 128:
+            chunks.append(chr(value))
+        else:
+            chunks.append(struct.pack('>Bq', 0xd3, value))
+
+    elif isinstance(value, float):
+        chunks.append(struct.pack('>Bd', 0xcb, value))
+
+    elif isinstance(value, basestring):
+        if isinstance(value, unicode):
+            value = value.encode('utf-8')
+        chunks.append(struct.pack('>BI', 0xdb, len(value)))
+        chunks.append(value)
+
+    elif isinstance(value, (list, tuple)):
+        if len(value) > 1 and all([isinstance(item, float) for item in value]):
+            _packExt(_floatArrayExtType,
+                     struct.pack('>%dd' % len(value), *value), chunks)
+        else:
+            chunks.append(struct.pack('>BI', 0xdd, len(value)))
+            for item in value:
+                _encode(item, chunks)
+
+    elif isinstance(value, dict):
+        mathTypeName = value.get('__mathObjectClass__', None)
+        if mathTypeName in _mathLayouts:
+            extType, layout = _mathLayouts[mathTypeName]
+            values = _getMathValues(value, layout, True)
+            _packExt(extType, struct.pack('>%dd' % len(values), *values), chunks)
+        else:
+            chunks.append(struct.pack('>BI', 0xdf, len(value)))
+            for key, item in value.iteritems():
+                _encode(key, chunks)
+                _encode(item, chunks)
+
+    elif isinstance(value, MathObject):
+        mathTypeName = value.__class__.__name__
+        if mathTypeName in _mathLayouts:
+            extType, layout = _mathLayouts[mathTypeName]
+            values = _getMathValues(value, layout, False)
+            _packExt(extType, struct.pack('>%dd' % len(values), *values), chunks)
+        else:
+            _encode(value.jsonEncode(), chunks)
+
+    else:
+        raise TypeError("Unable to encode value of type: " + str(type(value)))
+
+
+def encodeValue(value):
+    """Encodes a value in the MessagePack format.
+
+    Math objects and their JSON representations are both encoded as math
+    extension types.
+
+    Args:
+        value (object): Value to encode.
+
+    Returns:
+        str: The encoded value.
+
+    """
+
+    chunks = []
+    _encode(value, chunks)
+
+    return ''.join(chunks)
+
+
+# ==================
+# Decoding Methods
+# ==================
+def _buildMathObject(typeName, values):
+    """Returns a new math object constructed from its packed values.
+
+    Args:
+        typeName (str): Name of the math type.
+        values (tuple): Packed values, in the order of the type layout.
+
+    Returns:
+        object: The math object.
+
+    """
+
+    if typeName == 'Vec2':
+        return Vec2(values[0], values[1])
+    elif typeName == 'Vec3':
+        return Vec3(values[0], values[1], values[2])
+    elif typeName == 'Vec4':
+        return Vec4(values[0], values[1], values[2], values[3])
+    elif typeName == 'Quat':
+        return Quat(Vec3(values[0], values[1], values[2]), values[3])
+    elif typeName == 'Euler':
+        return Euler(values[0], values[1], values[2], int(values[3]))
+    elif typeName == 'Xfo':
+        return Xfo(tr=_buildMathObject('Vec3', values[0:3]),
+                   ori=_buildMathObject('Quat', values[3:7]),
+                   sc=_buildMathObject('Vec3', values[7:10]))
+    elif typeName == 'Mat33':
+        return Mat33(*[_buildMathObject('Vec3', values[i:i + 3])
+                       for i in xrange(0, 9, 3)])
+    elif typeName == 'Mat44':
+        return Mat44(*[_buildMathObject('Vec4', values[i:i + 4])
+                       for i in xrange(0, 16, 4)])
+    elif typeName == 'RotationOrder':
+        return RotationOrder(int(values[0]))
+
+    raise Exception("Unsupported Math type:" + typeName)
+
+
+def _buildMathJSON(typeName, values):
+    """Returns the JSON representation of a math value from its packed values.
+
+    The dictionaries match the ones produced by MathObject.jsonEncode.
+
+    Args:
+        typeName (str): Name of the math type.
+        values (tuple): Packed values, in the order of the type layout.
+
+    Returns:
+        dict: The JSON representation of the math value.
+
+    """
+
+    layout = _mathLayouts[typeName][1]
+    nestedTypeNames = _nestedMathTypeNames.get(typeName, {})
+
+    jsonData = {'__mathObjectClass__': typeName}
+    for path, value in zip(layout, values):
+        item = jsonData
+        for i in xrange(len(path) - 1):
+            if path[i] not in item:
+                item[path[i]] = {
+                    '__mathObjectClass__': nestedTypeNames[path[:i + 1]]
+                }
+            item = item[path[i]]
+
+        if path[-1] == 'order':
+            value = int(value)
+
+        item[path[-1]] = value
+
+    return jsonData
+
+
+def _decode(data, offset, mathObjects):
+    """Decodes the value found at an offset of the data.
+
+    Args:
+        data (str): Encoded data.
+        offset (int): Offset of the value in the data.
+        mathObjects (bool): Whether math values are decoded as math objects or
+            as their JSON representations.
+
+    Returns:
+        tuple: The decoded value and the offset following it.
+
+    """
+
+    tag = ord(data[offset])
+    offset += 1
+
+    if tag < 0x80:
+        return tag, offset
+    elif tag == 0xc0:
+        return None, offset
+    elif tag == 0xc2:
+        return False, offset
+    elif tag == 0xc3:
+        return True, offset
+    elif tag == 0xd3:
+        return struct.unpack_from('>q', data, offset)[0], offset + 8
+    elif tag == 0xcb:
+        return struct.unpack_from('>d', data, offset)[0], offset + 8
+
+    elif tag == 0xdb:
+        length = struct.unpack_from('>I', data, offset)[0]
+        offset += 4
+        return data[offset:offset + length].decode('utf-8'), offset + length
+
+    elif tag == 0xdd:
+        length = struct.unpack_from('>I', data, offset)[0]
+        offset += 4
+        result = []
+        for i in xrange(length):
+            item, offset = _decode(data, offset, mathObjects)
+            result.append(item)
+
+        return result, offset
+
+    elif tag == 0xdf:
+        length = struct.unpack_from('>I', data, offset)[0]
+        offset += 4
+        result = {}
+        for i in xrange(length):
+            key, offset = _decode(data, offset, mathObjects)
+            result[key], offset = _decode(data, offset, mathObjects)
+
+        return result, offset
+
+    elif tag == 0xc9:
+        length, extType = struct.unpack_from('>Ib', data, offset)
+        offset += 5
+        values = struct.unpack_from('>%dd' % (length / 8), data, offset)
+        offset += length
+
+        if extType == _floatArrayExtType:
+            return list(values), offset
+
+        typeName = _mathTypeNames.get(extType, None)
+        if typeName is None:
+            raise Exception("Unsupported extension type: " + str(extType))
+
+        if mathObjects:
+            return _buildMathObject(typeName, values), offset
+
+        return _buildMathJSON(typeName, values), offset
+
+    raise Exception("Invalid data at offset " + str(offset - 1) + ".")
+
+
+def decodeValue(data, mathObjects=True):
+    """Decodes a value from the MessagePack format.
+
+    Args:
+        data (str): Encoded value.
+        mathObjects (bool): Whether math values are decoded as math objects or
+            as their JSON representations.
+
+    Returns:
+        object: The decoded value.
+
+    """
+
+    return _decode(data, 0, mathObjects)[0]
+
+
+# ==================
+# Stream Classes
+# ==================
+class KrakenStreamWriter(object):
+    """Writes the records of a rig definition stream to a file."""
+
+    def __init__(self, filepath):
+        super(KrakenStreamWriter, self).__init__()
+
+        self._file = open(filepath, 'wb')
+        self._file.write(STREAM_MAGIC)
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, excType, excValue, traceback):
+        self.close()
+
+
+    def writeRecord(self, recordType, data):
+        """Encodes a record and writes it to the stream.
+
+        Args:
+            recordType (str): Type of the record, 'header', 'component' or
+                'connections'.
+            data (object): Data of the record.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        encoded = encodeValue([recordType, data])
+        self._file.write(_recordLength.pack(len(encoded)))
+        self._file.write(encoded)
+
+        return True
+
+
+    def close(self):
+        """Closes the stream file."""
+
+        self._file.close()
+
+
+class KrakenStreamReader(object):
+    """Reads the records of a rig definition stream from a file."""
+
+    def __init__(self, filepath, mathObjects=True):
+        super(KrakenStreamReader, self).__init__()
+
+        self._mathObjects = mathObjects
+        self._file = open(filepath, 'rb')
+        if self._file.read(len(STREAM_MAGIC)) != STREAM_MAGIC:
+            self._file.close()
+            raise Exception("Invalid rig stream file: " + filepath)
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, excType, excValue, traceback):
+        self.close()
+
+
+    def __iter__(self):
+        return self.readRecords()
+
+
+    def readRecords(self):
+        """Generator reading the records of the stream one at a time.
+
+        Yields:
+            tuple: The type and data of each record.
+
+        """
+
+        while True:
+            header = self._file.read(_recordLength.size)
+            if len(header) < _recordLength.size:
+                return
+
+            encoded = self._file.read(_recordLength.unpack(header)[0])
+            recordType, data = decodeValue(encoded, self._mathObjects)
+
+            yield recordType, data
+
+
+    def close(self):
+        """Closes the stream file."""
+
+        self._file.close()
+
+
+# ====================
+# Conversion Methods
+# ====================
+def isStreamFile(filepath):
+    """Returns whether a file path uses the rig stream format extension.
+
+    Args:
+        filepath (str): File path to test.
+
+    Returns:
+        bool: True if the path has the .krb extension.
+
+    """
+
+    return os.path.splitext(filepath)[1].lower() == STREAM_EXTENSION
+
+
+def writeStreamData(filepath, jsonData):
+    """Writes a rig definition held in a dictionary to a stream file.
+
+    Args:
+        filepath (str): Path of the stream file to write.
+        jsonData (dict): Rig definition, with math objects or their JSON
+            representations.
+
+    Returns:
+        bool: True if successful.
+
+    """
+
+    header = dict([(key, value) for key, value in jsonData.iteritems()
+                   if key not in ('components', 'connections')])
+
+    with KrakenStreamWriter(filepath) as writer:
+        writer.writeRecord('header', header)
+        for componentData in jsonData.get('components', []):
+            writer.writeRecord('component', componentData)
+
+        if 'connections' in jsonData:
+            writer.writeRecord('connections', jsonData['connections'])
+
+    return True
+
+
+def readStreamData(filepath, mathObjects=True):
+    """Reads a whole stream file into a rig definition dictionary.
+
+    Args:
+        filepath (str): Path of the stream file to read.
+        mathObjects (bool): Whether math values are decoded as math objects or
+            as their JSON representations.
+
+    Returns:
+        dict: The rig definition.
+
+    """
+
+    jsonData = {}
+    with KrakenStreamReader(filepath, mathObjects=mathObjects) as reader:
+        for recordType, data in reader:
+            if recordType == 'header':
+                jsonData.update(data)
+            elif recordType == 'component':
+                jsonData.setdefault('components', []).append(data)
+            elif recordType == 'connections':
+                jsonData['connections'] = data
+
+    return jsonData
+
+
+def convertRigDefinitionFile(sourcePath, targetPath):
+    """Converts a rig definition file between the JSON (.krg) and the stream
+    (.krb) formats, based on the file extensions.
+
+    Math values are converted without constructing math objects, so no math
+    backend is needed.
+
+    Args:
+        sourcePath (str): Path of the file to convert.
+        targetPath (str): Path of the converted file.
+
+    Returns:
+        bool: True if successful.
+
+    """
+
+    if isStreamFile(sourcePath):
+        jsonData = readStreamData(sourcePath, mathObjects=False)
+    else:
+        with open(sourcePath) as sourceFile:
+            jsonData = json.load(sourceFile)
+
+    if isStreamFile(targetPath):
+        writeStreamData(targetPath, jsonData)
+    else:
+        with open(targetPath, 'w') as targetFile:
+            targetFile.write(json.dumps(jsonData, indent=2))
+
+    return True
+
+
+if __name__ == '__main__':
+    import sys
+
+    if len(sys.argv) != 3:
+        print "Usage: kraken_stream.py <source.krg|.krb> <target.krg|.krb>"
+        sys.exit(1)
+
+    convertRigDefinitionFile(sys.argv[1], sys.argv[2])
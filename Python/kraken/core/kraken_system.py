@@ -9,6 +9,7 @@ import logging
 import os
 import sys
 import json
+import time
 import importlib
 from collections import OrderedDict
 
@@ -16,6 +17,7 @@ import FabricEngine.Core
 
 # import kraken
 from kraken.core.profiler import Profiler
+from kraken.core.component_module_cache import ComponentModuleCache
 from kraken.plugins import getFabricClient
 
 from kraken.log import getLogger
@@ -42,8 +44,17 @@ class KrakenSystem(object):
 
         self.registeredConfigs = OrderedDict()
         self.registeredComponents = OrderedDict()
+
+        # Classes of the cached component modules which haven't been imported
+        # yet. See loadComponentModules.
+        self.cachedConfigs = OrderedDict()
+        self.cachedComponents = OrderedDict()
+        self.componentModulesReport = []
         # self.moduleImportManager = ModuleImportManager()
 
+        self.mathBackend = None
+        self.setMathBackend(os.environ.get('KRAKEN_MATH_BACKEND', 'rtval'))
+
 
     def loadCoreClient(self):
         """Loads the Fabric Engine Core Client"""
@@ -120,8 +131,8 @@ class KrakenSystem(object):
         klType = getattr(self.registeredTypes, dataType)
 
         if defaultValue is not None:
-            if hasattr(defaultValue, '_rtval'):
-                return defaultValue._rtval
+            if hasattr(defaultValue, 'getRTVal'):
+                return defaultValue.getRTVal()
 
             typeDesc = self.typeDescs[dataType]
             if 'members' in typeDesc:
@@ -198,6 +209,38 @@ class KrakenSystem(object):
         else:
             return "None"
 
+    # =====================
+    # Math Backend Methods
+    # =====================
+
+    def setMathBackend(self, backend):
+        """Sets the backend used by the math objects constructed from now on.
+
+        The 'rtval' backend wraps a Fabric Engine RTVal in each math object.
+        The 'python' backend stores plain floats and only constructs RTVals
+        when getRTVal() is called.
+
+        Args:
+            backend (str): Name of the backend, 'rtval' or 'python'.
+
+        """
+
+        if backend not in ('rtval', 'python'):
+            raise ValueError("Invalid math backend: '" + str(backend) + "'")
+
+        self.mathBackend = backend
+
+
+    def getMathBackend(self):
+        """Returns the name of the active math backend.
+
+        Returns:
+            str: Name of the backend, 'rtval' or 'python'.
+
+        """
+
+        return self.mathBackend
+
     # ==================
     # Config Methods
     # ==================
@@ -230,6 +273,10 @@ class KrakenSystem(object):
 
         """
 
+        if className not in self.registeredConfigs and \
+                className in self.cachedConfigs:
+            self.__importCachedModule(self.cachedConfigs[className])
+
         if className not in self.registeredConfigs:
             raise Exception("Config with that class not registered:" + className)
 
@@ -244,7 +291,12 @@ class KrakenSystem(object):
 
         """
 
-        return self.registeredConfigs.keys()
+        classNames = self.registeredConfigs.keys()
+        for className in self.cachedConfigs:
+            if className not in self.registeredConfigs:
+                classNames.append(className)
+
+        return classNames
 
     # ==================
     # Component Methods
@@ -277,6 +329,10 @@ class KrakenSystem(object):
 
         """
 
+        if className not in self.registeredComponents and \
+                className in self.cachedComponents:
+            self.__importCachedModule(self.cachedComponents[className]['module'])
+
         if className not in self.registeredComponents:
             raise Exception("Component with that class not registered:" + className)
 
@@ -291,7 +347,93 @@ class KrakenSystem(object):
 
         """
 
-        return self.registeredComponents.keys()
+        classNames = self.registeredComponents.keys()
+        for className in self.cachedComponents:
+            if className not in self.registeredComponents:
+                classNames.append(className)
+
+        return classNames
+
+
+    def isComponentClassRegistered(self, className):
+        """Returns whether a component class is registered, or provided by a
+        cached component module.
+
+        Args:
+            className (str): The name of the Python component class
+
+        Returns:
+            bool: True if the component class is known.
+
+        """
+
+        return className in self.registeredComponents or \
+            className in self.cachedComponents
+
+
+    def getComponentType(self, className):
+        """Returns the type of a component class without importing its module
+        when it is cached.
+
+        Args:
+            className (str): The name of the Python component class
+
+        Returns:
+            str: The component type, e.g. 'Guide' or 'Rig'.
+
+        """
+
+        if className not in self.registeredComponents and \
+                className in self.cachedComponents:
+            return self.cachedComponents[className]['type']
+
+        return self.getComponentClass(className).getComponentType()
+
+
+    def getComponentModuleFile(self, className):
+        """Returns the path of the file defining a component class without
+        importing its module when it is cached.
+
+        Args:
+            className (str): The name of the Python component class
+
+        Returns:
+            str: The path of the module file.
+
+        """
+
+        if className not in self.registeredComponents and \
+                className in self.cachedComponents:
+            return self.cachedComponents[className]['file']
+
+        componentClass = self.getComponentClass(className)
+
+        return sys.modules[componentClass.__module__].__file__
+
+
+    def __importCachedModule(self, modulePath):
+        """Imports a cached component module, registering its classes.
+
+        Args:
+            modulePath (str): Python path of the module.
+
+        """
+
+        logger.debug("Importing cached component module: %s", modulePath)
+        importlib.import_module(modulePath)
+
+
+    def getComponentModulesReport(self):
+        """Returns the report of the last call to loadComponentModules.
+
+        Returns:
+            list: A dict per Kraken path with the 'path', the number of
+                'modules' found, 'imported' and 'cached', the modules which
+                'failed' to import and the 'duration' in seconds.
+
+        """
+
+        return self.componentModulesReport
 
 
     def loadComponentModules(self):
@@ -299,6 +441,11 @@ class KrakenSystem(object):
 
         The kraken_components are loaded at all times.
 
+        The classes registered by each module are stored in a persistent
+        ComponentModuleCache. Modules which haven't changed since they were
+        cached are not imported, their classes are listed from the cache and
+        the modules are imported when one of their classes is first requested.
+
         Returns:
             bool: True if all components loaded, else False.
 
@@ -310,10 +457,20 @@ class KrakenSystem(object):
                 del(sys.modules[componentModulePath])
 
         self.registeredComponents = {}
+        self.cachedComponents = OrderedDict()
+        self.cachedConfigs = OrderedDict()
+        self.componentModulesReport = []
+
+        cache = ComponentModuleCache()
+        cache.load()
+
+        # Module files imported during this load, their registered classes are
+        # cached once all the modules have been loaded.
+        importedModules = {}
 
         logger.info("Loading component modules...")
 
-        def __importDirRecursive(path, parentModulePath=''):
+        def __importDirRecursive(path, report, parentModulePath=''):
             isSuccessful = True
 
             contents = os.listdir(path)
@@ -333,7 +490,7 @@ class KrakenSystem(object):
 
 
             if moduleFilefound:
-                logger.info(" " + path + ":")
+                logger.info(" %s:", path)
                 for i, item in enumerate(contents):
                     if os.path.isfile(os.path.join(path, item)):
 
@@ -347,16 +504,42 @@ class KrakenSystem(object):
 
                         if item.endswith(".py") and item != "__init__.py":
                             module = modulePath + "." + item[:-3]
+                            filePath = os.path.normpath(os.path.join(path, item))
+                            report['modules'] += 1
+
+                            entry = cache.getEntry(filePath, module)
+                            if entry is not None:
+                                logger.info("  %s (cached)", module)
+                                report['cached'] += 1
+
+                                for className, componentType in entry['components'].iteritems():
+                                    self.cachedComponents[className] = {
+                                        'module': module,
+                                        'type': componentType,
+                                        'file': filePath
+                                    }
+
+                                for className in entry['configs']:
+                                    self.cachedConfigs[className] = module
+
+                                continue
+
                             try:
-                                logger.info("  " + module)
+                                logger.info("  %s", module)
                                 importlib.import_module(module)
+                                importedModules[filePath] = module
+                                report['imported'] += 1
 
                             except ImportError, e:
                                 isSuccessful = False
+                                report['failed'].append(module)
+                                cache.removeEntry(filePath)
                                 logging.exception("Error importing '" + module)
 
                             except Exception, e:
                                 isSuccessful = False
+                                report['failed'].append(module)
+                                cache.removeEntry(filePath)
                                 logging.exception("Error Loading Modules'" + module)
 
                 logging.info("")
@@ -365,19 +548,37 @@ class KrakenSystem(object):
             for item in contents:
                 if os.path.isdir(os.path.join(path, item)):
                     if moduleFilefound:
-                        if not __importDirRecursive(os.path.join(path, item), modulePath):
+                        if not __importDirRecursive(os.path.join(path, item), report, modulePath):
                             isSuccessful = False
                     else:
-                        if not __importDirRecursive(os.path.join(path, item)):
+                        if not __importDirRecursive(os.path.join(path, item), report):
                             isSuccessful = False
 
             return isSuccessful
 
 
+        def __importPath(path):
+            report = {
+                'path': path,
+                'modules': 0,
+                'imported': 0,
+                'cached': 0,
+                'failed': [],
+                'duration': 0.0
+            }
+
+            start = time.time()
+            isSuccessful = __importDirRecursive(path, report)
+            report['duration'] = time.time() - start
+
+            self.componentModulesReport.append(report)
+
+            return isSuccessful
+
+
         # find the kraken examples module in the same folder as the kraken module.
-        print os.environ.get('KRAKEN_PATH')
         default_component_path = os.path.normpath(os.path.join(os.environ.get('KRAKEN_PATH'), 'Python', 'kraken_components'))
-        isSuccessful = __importDirRecursive(default_component_path)
+        isSuccessful = __importPath(default_component_path)
 
         pathsVar = os.getenv('KRAKEN_PATHS')
         if pathsVar is not None:
@@ -391,9 +592,31 @@ class KrakenSystem(object):
                     logging.info("Invalid Kraken Path: " + path)
                     continue
 
-                if not __importDirRecursive(path):
+                if not __importPath(path):
                     isSuccessful = False
 
+        # Cache the classes registered by the imported modules.
+        for filePath, module in importedModules.iteritems():
+            components = {}
+            for className, componentClass in self.registeredComponents.iteritems():
+                if componentClass.__module__ == module:
+                    components[className] = componentClass.getComponentType()
+
+            configs = []
+            for className, configClass in self.registeredConfigs.iteritems():
+                if configClass.__module__ == module:
+                    configs.append(className)
+
+            cache.setEntry(filePath, module, components, configs)
+
+        cache.save()
+
+        for report in self.componentModulesReport:
+            logger.info("Component path '%s': %d modules, %d imported, %d cached, %d failed in %.1fms",
+                        report['path'], report['modules'], report['imported'],
+                        report['cached'], len(report['failed']),
+                        report['duration'] * 1000.0)
+
         return isSuccessful
 
 
@@ -11,6 +11,9 @@ from mat33 import Mat33
 from mat44 import Mat44
 from rotation_order import RotationOrder
 from color import Color
+from xfo_array import XfoArray, Mat44Array
+
+import python_backend
 
 
 PI = 3.141592653589793
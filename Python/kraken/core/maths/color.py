@@ -14,6 +14,9 @@ from math_object import MathObject
 class Color(MathObject):
     """Vector 4 object."""
 
+    __slots__ = ()
+
+
     def __init__(self, r=0.0, g=0.0, b=0.0, a=1.0):
         """Initializes r, g b and a values for Color object."""
 
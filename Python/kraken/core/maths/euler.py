@@ -40,6 +40,9 @@ rotationOrderIntToStrMapping = [
 class Euler(MathObject):
     """Euler rotation object."""
 
+    __slots__ = ()
+
+
     def __init__(self, x=None, y=None, z=None, ro=None):
         """Initialize values for x,y,z, and rotation order values."""
 
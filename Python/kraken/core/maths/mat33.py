@@ -12,6 +12,9 @@ from kraken.core.maths.vec3 import Vec3
 class Mat33(MathObject):
     """3x3 Matrix object."""
 
+    __slots__ = ()
+
+
     def __init__(self, row0=None, row1=None, row2=None):
         """Initialize and set values in the 3x3 matrix."""
 
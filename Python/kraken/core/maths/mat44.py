@@ -13,6 +13,9 @@ from mat33 import Mat33
 class Mat44(MathObject):
     """4x4 Matrix object."""
 
+    __slots__ = ()
+
+
     def __init__(self, row0=None, row1=None, row2=None, row3=None):
         """Initialize and set values in the 3x3 matrix."""
 
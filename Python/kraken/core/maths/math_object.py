@@ -5,12 +5,50 @@ MathObject -- A base class for all math types.
 """
 
 import json
-import FabricEngine.Core
+
+from kraken.core.kraken_system import ks
+
+
+# Maps the RTVal backed math classes to their pure Python counterparts. The
+# Python classes are registered by the kraken.core.maths.python_backend
+# package.
+pythonBackendClasses = {}
+
+
+def registerPythonBackendClass(rtvalClass, pythonClass):
+    """Registers the pure Python implementation of a math class.
+
+    When the 'python' math backend is active, constructing the RTVal backed
+    class will return an instance of the registered Python class instead.
+
+    Args:
+        rtvalClass (class): The RTVal backed math class.
+        pythonClass (class): The pure Python subclass to construct instead.
+
+    """
+
+    pythonBackendClasses[rtvalClass] = pythonClass
 
 
 class MathObject(object):
     """MathObject object. A base class for all math types"""
 
+    __slots__ = ('_rtval',)
+
+
+    def __new__(cls, *args, **kwargs):
+        """Constructs the math object using the active math backend.
+
+        Returns:
+            object: New instance of the class or of its Python backend class.
+
+        """
+
+        if ks.mathBackend == 'python':
+            cls = pythonBackendClasses.get(cls, cls)
+
+        return object.__new__(cls)
+
 
     def __init__(self):
         """Initialize the base math object."""
@@ -0,0 +1,38 @@
+"""Kraken - maths.python_backend module.
+
+Pure Python implementations of the Kraken math types. They are constructed in
+place of the RTVal backed types when the 'python' math backend is active, see
+KrakenSystem.setMathBackend(). Color is not ported and always uses RTVals.
+"""
+
+from kraken.core.maths.vec2 import Vec2 as RTValVec2
+from kraken.core.maths.vec3 import Vec3 as RTValVec3
+from kraken.core.maths.vec4 import Vec4 as RTValVec4
+from kraken.core.maths.rotation_order import RotationOrder as RTValRotationOrder
+from kraken.core.maths.euler import Euler as RTValEuler
+from kraken.core.maths.quat import Quat as RTValQuat
+from kraken.core.maths.mat33 import Mat33 as RTValMat33
+from kraken.core.maths.mat44 import Mat44 as RTValMat44
+from kraken.core.maths.xfo import Xfo as RTValXfo
+from kraken.core.maths.math_object import registerPythonBackendClass
+
+from kraken.core.maths.python_backend.vec2 import Vec2
+from kraken.core.maths.python_backend.vec3 import Vec3
+from kraken.core.maths.python_backend.vec4 import Vec4
+from kraken.core.maths.python_backend.rotation_order import RotationOrder
+from kraken.core.maths.python_backend.euler import Euler
+from kraken.core.maths.python_backend.quat import Quat
+from kraken.core.maths.python_backend.mat33 import Mat33
+from kraken.core.maths.python_backend.mat44 import Mat44
+from kraken.core.maths.python_backend.xfo import Xfo
+
+
+registerPythonBackendClass(RTValVec2, Vec2)
+registerPythonBackendClass(RTValVec3, Vec3)
+registerPythonBackendClass(RTValVec4, Vec4)
+registerPythonBackendClass(RTValRotationOrder, RotationOrder)
+registerPythonBackendClass(RTValEuler, Euler)
+registerPythonBackendClass(RTValQuat, Quat)
+registerPythonBackendClass(RTValMat33, Mat33)
+registerPythonBackendClass(RTValMat44, Mat44)
+registerPythonBackendClass(RTValXfo, Xfo)
@@ -0,0 +1,357 @@
+"""Kraken - maths.python_backend.euler module.
+
+Classes:
+Euler -- Euler rotation.
+"""
+
+import math
+
+from kraken.core.kraken_system import ks
+from kraken.core.maths import euler
+from kraken.core.maths.python_backend.math_object import PythonMathObject
+from kraken.core.maths.python_backend.math_object import toScalar
+from kraken.core.maths.python_backend.math_object import dotValues
+from kraken.core.maths.python_backend.math_object import clamp
+from kraken.core.maths.python_backend.math_object import isRTVal
+from kraken.core.maths.python_backend.math_object import PRECISION
+from kraken.core.maths.python_backend.mat33 import Mat33
+from kraken.core.maths.python_backend.rotation_order import RotationOrder
+
+
+# Axis indices of each rotation order, from the left most matrix of the
+# product to the right most one. XYZ builds the matrix Rx * Ry * Rz.
+rotationOrderAxes = [
+    (0, 1, 2),  # XYZ
+    (1, 2, 0),  # YZX
+    (2, 0, 1),  # ZXY
+    (0, 2, 1),  # XZY
+    (2, 1, 0),  # ZYX
+    (1, 0, 2)   # YXZ
+]
+
+
+def axisRotationValues(axis, angle):
+    """Returns the rows of the matrix rotating around a single axis.
+
+    Args:
+        axis (int): Index of the axis, 0 for X, 1 for Y and 2 for Z.
+        angle (float): Angle in radians.
+
+    Returns:
+        tuple: 3 rows of 3 floats each.
+
+    """
+
+    c = toScalar(math.cos(angle))
+    s = toScalar(math.sin(angle))
+
+    if axis == 0:
+        return ((1.0, 0.0, 0.0), (0.0, c, -s), (0.0, s, c))
+    elif axis == 1:
+        return ((c, 0.0, s), (0.0, 1.0, 0.0), (-s, 0.0, c))
+
+    return ((c, -s, 0.0), (s, c, 0.0), (0.0, 0.0, 1.0))
+
+
+def eulerAnglesToMat33Values(angles, order):
+    """Returns the rows of the rotation matrix of the given euler angles.
+
+    The axis matrices are multiplied from left to right like in KL, rounding
+    every operation to a Scalar.
+
+    Args:
+        angles (tuple): X, Y and Z angles in radians.
+        order (int): Rotation order.
+
+    Returns:
+        tuple: 3 rows of 3 floats each.
+
+    """
+
+    result = None
+    for axis in rotationOrderAxes[order]:
+        m = axisRotationValues(axis, angles[axis])
+        if result is None:
+            result = m
+            continue
+
+        columns = zip(*m)
+        result = [[dotValues(row, column) for column in columns] for row in result]
+
+    return result
+
+
+def mat33ValuesToEulerAngles(m, order):
+    """Extracts the euler angles from the rows of a rotation matrix.
+
+    Args:
+        m (tuple): 3 rows of 3 floats each.
+        order (int): Rotation order.
+
+    Returns:
+        list: X, Y and Z angles in radians.
+
+    """
+
+    i, j, k = rotationOrderAxes[order]
+    if (i, j, k) in ((0, 1, 2), (1, 2, 0), (2, 0, 1)):
+        parity = 1.0
+    else:
+        parity = -1.0
+
+    angles = [0.0, 0.0, 0.0]
+    sj = clamp(parity * m[i][k], -1.0, 1.0)
+    cj = toScalar(math.sqrt(dotValues((m[i][i], m[i][j]), (m[i][i], m[i][j]))))
+    angles[j] = math.atan2(sj, cj)
+    if cj > PRECISION:
+        angles[i] = math.atan2(-parity * m[j][k], m[k][k])
+        angles[k] = math.atan2(-parity * m[i][j], m[i][i])
+    else:
+        # Gimbal lock, the first and last rotations share the same axis.
+        angles[i] = math.atan2(parity * m[k][j], m[j][j])
+        angles[k] = 0.0
+
+    return angles
+
+
+class Euler(PythonMathObject, euler.Euler):
+    """Euler rotation object."""
+
+    __slots__ = ('_x', '_y', '_z', '_ro')
+
+
+    def __init__(self, x=None, y=None, z=None, ro=None):
+        """Initialize values for x,y,z, and rotation order values."""
+
+        self._x = 0.0
+        self._y = 0.0
+        self._z = 0.0
+        self._ro = RotationOrder()
+
+        if isRTVal(x):
+            self.setRTVal(x)
+            return
+
+        if x is not None and not isinstance(x, (int, float)) and not isinstance(x, euler.Euler):
+            raise TypeError("Euler: Invalid type for 'x' argument. \
+                            Must be an int or float.")
+
+        if y is not None and not isinstance(y, (int, float)):
+            raise TypeError("Euler: Invalid type for 'y' argument. Must be \
+                            an int or float.")
+
+        if z is not None and not isinstance(z, (int, float)):
+            raise TypeError("Euler: Invalid type for 'z' argument. Must be \
+                            an int or float.")
+
+        if isinstance(x, euler.Euler):
+            self.set(x=x.x, y=x.y, z=x.z, ro=x.ro)
+        elif x is not None and y is not None and z is not None:
+            self.set(x=x, y=y, z=z, ro=ro)
+
+
+    def getRTVal(self):
+        """Returns a new RTVal constructed from the values of this euler.
+
+        Returns:
+            object: RTVal
+
+        """
+
+        rtval = ks.rtVal('Euler')
+        rtval.set('', ks.rtVal('Scalar', self._x), ks.rtVal('Scalar', self._y),
+                  ks.rtVal('Scalar', self._z), self._ro.getRTVal())
+
+        return rtval
+
+
+    def setRTVal(self, rtval):
+        """Sets the values of this euler from an RTVal.
+
+        Args:
+            rtval (object): Euler RTVal to copy the values from.
+
+        """
+
+        self._x = rtval.x.getSimpleType()
+        self._y = rtval.y.getSimpleType()
+        self._z = rtval.z.getSimpleType()
+        self._ro.setRTVal(rtval.ro)
+
+
+    @property
+    def x(self):
+        """X parameter property.
+
+        Returns:
+            float: Value of the X property.
+
+        """
+
+        return self._x
+
+
+    @x.setter
+    def x(self, value):
+        """X parameter setter.
+
+        Args:
+            value (float): X value of the Euler Angles.
+
+        """
+
+        self._x = toScalar(value)
+
+
+    @property
+    def y(self):
+        """Y parameter property.
+
+        Returns:
+            float: Value of the Y property.
+
+        """
+
+        return self._y
+
+
+    @y.setter
+    def y(self, value):
+        """Y parameter setter.
+
+        Args:
+            value (float): Y value of the Euler Angles.
+
+        """
+
+        self._y = toScalar(value)
+
+
+    @property
+    def z(self):
+        """Z parameter property.
+
+        Returns:
+            float: Value of the Z property.
+
+        """
+
+        return self._z
+
+
+    @z.setter
+    def z(self, value):
+        """Z parameter setter.
+
+        Args:
+            value (float): Z value of the Euler Angles.
+
+        """
+
+        self._z = toScalar(value)
+
+
+    @property
+    def ro(self):
+        """Rotation Order parameter property.
+
+        Returns:
+            object: Rotation Order of this Euler.
+
+        """
+
+        return self._ro
+
+
+    @ro.setter
+    def ro(self, value):
+        """Rotation Order setter.
+
+        Args:
+            value (RotationOrder): Rotation Order(ro) value of the Euler Angles.
+
+        """
+
+        if isinstance(value, euler.RotationOrder):
+            self._ro.order = value.order
+        else:
+            self._ro.set(value)
+
+
+    def clone(self):
+        """Returns a clone of the Euler.
+
+        Returns:
+            Euler: The cloned Euler
+
+        """
+
+        return Euler(self)
+
+
+    def set(self, x, y, z, ro=None):
+        """Scalar component setter.
+
+        Args:
+            x (float): x angle in radians.
+            y (float): y angle in radians.
+            z (float): z angle in radians.
+            ro (int): the rotation order to use in the euler angles.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        self._x = toScalar(x)
+        self._y = toScalar(y)
+        self._z = toScalar(z)
+        if ro is not None:
+            self.ro = ro
+
+        return True
+
+
+    def equal(self, other):
+        """Checks equality of this Euler with another.
+
+        Args:
+            other (Euler): Other value to check equality with.
+
+        Returns:
+            bool: True if equal.
+
+        """
+
+        return (self._x == other.x and self._y == other.y and
+                self._z == other.z and self._ro.order == other.ro.order)
+
+
+    def almostEqual(self, other, precision=PRECISION):
+        """Checks almost equality of this Euler with another.
+
+        Args:
+            other (Euler): Other value to check equality with.
+            precision (float): precision value.
+
+        Returns:
+            bool: True if almost equal.
+
+        """
+
+        return (abs(self._x - other.x) < precision and
+                abs(self._y - other.y) < precision and
+                abs(self._z - other.z) < precision and
+                self._ro.order == other.ro.order)
+
+
+    def toMat33(self):
+        """Converts the Euler angles value to a Mat33.
+
+        Returns:
+            Mat33: The Mat33 object representing this Euler.
+
+        """
+
+        return Mat33.fromValues(eulerAnglesToMat33Values((self._x, self._y, self._z),
+                                                         self._ro.order))
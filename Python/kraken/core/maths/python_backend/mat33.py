@@ -0,0 +1,519 @@
+"""Kraken - maths.python_backend.mat33 module.
+
+Classes:
+Mat33 -- Matrix 3 transform object.
+"""
+
+from kraken.core.kraken_system import ks
+from kraken.core.maths import mat33
+from kraken.core.maths.python_backend.math_object import PythonMathObject
+from kraken.core.maths.python_backend.math_object import isRTVal
+from kraken.core.maths.python_backend.math_object import toScalar
+from kraken.core.maths.python_backend.math_object import dotValues
+from kraken.core.maths.python_backend.math_object import PRECISION
+from kraken.core.maths.python_backend.math_object import DIVIDEPRECISION
+from kraken.core.maths.python_backend.vec3 import Vec3
+
+
+class Mat33(PythonMathObject, mat33.Mat33):
+    """3x3 Matrix object."""
+
+    __slots__ = ('_row0', '_row1', '_row2')
+
+
+    def __init__(self, row0=None, row1=None, row2=None):
+        """Initialize and set values in the 3x3 matrix."""
+
+        self._row0 = Vec3(1.0, 0.0, 0.0)
+        self._row1 = Vec3(0.0, 1.0, 0.0)
+        self._row2 = Vec3(0.0, 0.0, 1.0)
+
+        if isinstance(row0, mat33.Mat33):
+            self.setRows(row0.row0, row0.row1, row0.row2)
+        elif isRTVal(row0):
+            self.setRTVal(row0)
+        elif row0 is not None and row1 is not None and row2 is not None:
+            self.setRows(row0, row1, row2)
+
+
+    @classmethod
+    def fromValues(cls, values):
+        """Constructs a matrix from nested row values.
+
+        Args:
+            values (list): 3 rows of 3 floats each.
+
+        Returns:
+            Mat33: The new matrix.
+
+        """
+
+        mat = cls()
+        mat._row0.set(*values[0])
+        mat._row1.set(*values[1])
+        mat._row2.set(*values[2])
+
+        return mat
+
+
+    def getValues(self):
+        """Returns the values of this matrix as nested row tuples.
+
+        Returns:
+            tuple: 3 rows of 3 floats each.
+
+        """
+
+        return ((self._row0.x, self._row0.y, self._row0.z),
+                (self._row1.x, self._row1.y, self._row1.z),
+                (self._row2.x, self._row2.y, self._row2.z))
+
+
+    def getRTVal(self):
+        """Returns a new RTVal constructed from the values of this matrix.
+
+        Returns:
+            object: RTVal
+
+        """
+
+        rtval = ks.rtVal('Mat33')
+        rtval.setRows('', self._row0.getRTVal(), self._row1.getRTVal(),
+                      self._row2.getRTVal())
+
+        return rtval
+
+
+    def setRTVal(self, rtval):
+        """Sets the values of this matrix from an RTVal.
+
+        Args:
+            rtval (object): Mat33 RTVal to copy the values from.
+
+        """
+
+        self._row0.setRTVal(rtval.row0)
+        self._row1.setRTVal(rtval.row1)
+        self._row2.setRTVal(rtval.row2)
+
+
+    @property
+    def row0(self):
+        """Gets row 0 of this matrix.
+
+        Returns:
+            Vec3: Row 0 vector.
+
+        """
+
+        return self._row0
+
+
+    @row0.setter
+    def row0(self, value):
+        """Sets row 0 as the input vector.
+
+        Args:
+            value (Vec3): Vector to set row 0 as.
+
+        """
+
+        self._row0.set(value.x, value.y, value.z)
+
+
+    @property
+    def row1(self):
+        """Gets row 1 of this matrix.
+
+        Returns:
+            Vec3: row 1 vector.
+
+        """
+
+        return self._row1
+
+
+    @row1.setter
+    def row1(self, value):
+        """Sets row 1 as the input vector.
+
+        Args:
+            value (Vec3): Vector to set row 1 as.
+
+        """
+
+        self._row1.set(value.x, value.y, value.z)
+
+
+    @property
+    def row2(self):
+        """Gets row 2 of this matrix.
+
+        Returns:
+            Vec3: row 2 vector.
+
+        """
+
+        return self._row2
+
+
+    @row2.setter
+    def row2(self, value):
+        """Sets row 2 as the input vector.
+
+        Args:
+            value (Vec3): Vector to set row 2 as.
+
+        """
+
+        self._row2.set(value.x, value.y, value.z)
+
+
+    def clone(self):
+        """Returns a clone of the Mat33.
+
+        Returns:
+            Mat33: The cloned Mat33.
+
+        """
+
+        return Mat33(self)
+
+
+    def setRows(self, row0, row1, row2):
+        """Setter from vectors, row-wise.
+
+        Args:
+            row0 (Vec3): Vector to use to set row 0.
+            row1 (Vec3): Vector to use to set row 1.
+            row2 (Vec3): Vector to use to set row 2.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        self._row0.set(row0.x, row0.y, row0.z)
+        self._row1.set(row1.x, row1.y, row1.z)
+        self._row2.set(row2.x, row2.y, row2.z)
+
+        return True
+
+
+    def setColumns(self, col0, col1, col2):
+        """Setter from vectors, column-wise.
+
+        Args:
+            col0 (Vec3): Vector to use to set column 0.
+            col1 (Vec3): Vector to use to set column 1.
+            col2 (Vec3): Vector to use to set column 2.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        self._row0.set(col0.x, col1.x, col2.x)
+        self._row1.set(col0.y, col1.y, col2.y)
+        self._row2.set(col0.z, col1.z, col2.z)
+
+        return True
+
+
+    def setNull(self):
+        """Setting all components of the matrix to 0.0.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        self._row0.setNull()
+        self._row1.setNull()
+        self._row2.setNull()
+
+        return True
+
+
+    def setIdentity(self):
+        """Sets this matrix to the identity matrix.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        self._row0.set(1.0, 0.0, 0.0)
+        self._row1.set(0.0, 1.0, 0.0)
+        self._row2.set(0.0, 0.0, 1.0)
+
+        return True
+
+
+    def setDiagonal(self, v):
+        """Sets the diagonal components of this matrix to a scalar or to the
+        components of a vector.
+
+        Args:
+            v (float, Vec3): Value or vector to set diagonals to.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        if isinstance(v, (int, long, float)):
+            v = Vec3(v, v, v)
+
+        self._row0.x = v.x
+        self._row1.y = v.y
+        self._row2.z = v.z
+
+        return True
+
+
+    def equal(self, other):
+        """Checks equality of this Matrix33 with another.
+
+        Args:
+            other (Mat33): Other matrix to check equality with.
+
+        Returns:
+            bool: True if equal.
+
+        """
+
+        return (self._row0.equal(other.row0) and self._row1.equal(other.row1) and
+                self._row2.equal(other.row2))
+
+
+    def almostEqual(self, other, precision=None):
+        """Checks almost equality of this Matrix33 with another.
+
+        Args:
+            other (Mat33): Other matrix to check equality with.
+            precision (float): precision value.
+
+        Returns:
+            bool: True if almost equal.
+
+        """
+
+        if precision is None:
+            precision = PRECISION
+
+        return (self._row0.almostEqual(other.row0, precision) and
+                self._row1.almostEqual(other.row1, precision) and
+                self._row2.almostEqual(other.row2, precision))
+
+
+    def add(self, other):
+        """Overload method for the add operator.
+
+        Args:
+            other (Mat33): Other matrix to add to this one.
+
+        Returns:
+            Mat33: New Mat33 of the sum of the two Mat33's.
+
+        """
+
+        return Mat33(self._row0.add(other.row0), self._row1.add(other.row1),
+                     self._row2.add(other.row2))
+
+
+    def subtract(self, other):
+        """Overload method for the subtract operator.
+
+        Args:
+            other (Mat33): Other matrix to subtract from this one.
+
+        Returns:
+            Mat33: New Mat33 of the difference of the two Mat33's.
+
+        """
+
+        return Mat33(self._row0.subtract(other.row0),
+                     self._row1.subtract(other.row1),
+                     self._row2.subtract(other.row2))
+
+
+    def multiply(self, other):
+        """Overload method for the multiply operator.
+
+        Args:
+            other (Mat33): Other matrix to multiply from this one.
+
+        Returns:
+            Mat33: New Mat33 of the product of the two Mat33's.
+
+        """
+
+        a = self.getValues()
+        if isinstance(other, Mat33):
+            b = other.getValues()
+        else:
+            b = Mat33(other).getValues()
+
+        columns = zip(*b)
+
+        return Mat33.fromValues([[dotValues(row, column) for column in columns]
+                                 for row in a])
+
+
+    def multiplyScalar(self, other):
+        """Product of this matrix and a scalar.
+
+        Args:
+            other (float): scalar value to multiply this matrix by.
+
+        Returns:
+            Mat33: Product of the multiplication of the scalar and this matrix.
+
+        """
+
+        return Mat33(self._row0.multiplyScalar(other),
+                     self._row1.multiplyScalar(other),
+                     self._row2.multiplyScalar(other))
+
+
+    def multiplyVector(self, other):
+        """Returns the product of this matrix and a vector.
+
+        Args:
+            other (Vec3): Vector to multiply this matrix by.
+
+        Returns:
+            Vec3: product of the multiplication of the Vec3 and this matrix.
+
+        """
+
+        return Vec3(self._row0.dot(other), self._row1.dot(other),
+                    self._row2.dot(other))
+
+
+    def divideScalar(self, other):
+        """Divides this matrix and a scalar.
+
+        Args:
+            other (float): value to divide this matrix by.
+
+        Returns:
+            Mat33: Quotient of the division of the matrix by the scalar.
+
+        """
+
+        return Mat33(self._row0.divideScalar(other),
+                     self._row1.divideScalar(other),
+                     self._row2.divideScalar(other))
+
+
+    def determinant(self):
+        """Gets the determinant of this matrix.
+
+        Returns:
+            float: Determinant of this matrix.
+
+        """
+
+        return determinantValues(self.getValues())
+
+
+    def adjoint(self):
+        """Gets the adjoint matrix of this matrix.
+
+        Returns:
+            Mat33: Adjoint of this matrix.
+
+        """
+
+        m = self.getValues()
+
+        return Mat33.fromValues((
+            (_crossDifference(m[1][1], m[2][2], m[1][2], m[2][1]),
+             _crossDifference(m[0][2], m[2][1], m[0][1], m[2][2]),
+             _crossDifference(m[0][1], m[1][2], m[0][2], m[1][1])),
+            (_crossDifference(m[1][2], m[2][0], m[1][0], m[2][2]),
+             _crossDifference(m[0][0], m[2][2], m[0][2], m[2][0]),
+             _crossDifference(m[0][2], m[1][0], m[0][0], m[1][2])),
+            (_crossDifference(m[1][0], m[2][1], m[1][1], m[2][0]),
+             _crossDifference(m[0][1], m[2][0], m[0][0], m[2][1]),
+             _crossDifference(m[0][0], m[1][1], m[0][1], m[1][0]))))
+
+
+    def inverse(self):
+        """Get the inverse matrix of this matrix.
+
+        Returns:
+            Mat33: Inverse of this matrix.
+
+        """
+
+        return self.adjoint().divideScalar(self.determinant())
+
+
+    def inverse_safe(self):
+        """Get the inverse matrix of this matrix, always checking the
+        determinant value.
+
+        Returns:
+            Mat33: Safe inverse of this matrix.
+
+        """
+
+        det = self.determinant()
+        if abs(det) < DIVIDEPRECISION:
+            return Mat33()
+
+        return self.adjoint().divideScalar(det)
+
+
+    def transpose(self):
+        """Get the transposed matrix of this matrix.
+
+        Returns:
+            Mat33: Transpose of this matrix.
+
+        """
+
+        m = self.getValues()
+
+        return Mat33.fromValues(zip(*m))
+
+
+# ===============
+# Helper Methods
+# ===============
+def _crossDifference(a, b, c, d):
+    """Returns a * b - c * d rounding every operation to a Scalar.
+
+    Args:
+        a (float): First value of the first product.
+        b (float): Second value of the first product.
+        c (float): First value of the second product.
+        d (float): Second value of the second product.
+
+    Returns:
+        float: The difference of the products.
+
+    """
+
+    return toScalar(toScalar(a * b) - toScalar(c * d))
+
+
+def determinantValues(m):
+    """Returns the determinant of a 3x3 matrix given as nested rows.
+
+    Args:
+        m (tuple): 3 rows of 3 floats each.
+
+    Returns:
+        float: Determinant of the matrix.
+
+    """
+
+    first = toScalar(m[0][0] * _crossDifference(m[1][1], m[2][2], m[1][2], m[2][1]))
+    second = toScalar(m[0][1] * _crossDifference(m[1][0], m[2][2], m[1][2], m[2][0]))
+    third = toScalar(m[0][2] * _crossDifference(m[1][0], m[2][1], m[1][1], m[2][0]))
+
+    return toScalar(toScalar(first - second) + third)
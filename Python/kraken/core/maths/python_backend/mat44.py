@@ -0,0 +1,551 @@
+"""Kraken - maths.python_backend.mat44 module.
+
+Classes:
+Mat44 -- Matrix 4 transform object.
+"""
+
+from kraken.core.kraken_system import ks
+from kraken.core.maths import mat44
+from kraken.core.maths.python_backend.math_object import PythonMathObject
+from kraken.core.maths.python_backend.math_object import isRTVal
+from kraken.core.maths.python_backend.math_object import dotValues
+from kraken.core.maths.python_backend.math_object import divide
+from kraken.core.maths.python_backend.math_object import PRECISION
+from kraken.core.maths.python_backend.math_object import DIVIDEPRECISION
+from kraken.core.maths.python_backend.vec3 import Vec3
+from kraken.core.maths.python_backend.vec4 import Vec4
+from kraken.core.maths.python_backend.mat33 import determinantValues
+
+
+class Mat44(PythonMathObject, mat44.Mat44):
+    """4x4 Matrix object."""
+
+    __slots__ = ('_row0', '_row1', '_row2', '_row3')
+
+
+    def __init__(self, row0=None, row1=None, row2=None, row3=None):
+        """Initialize and set values in the 4x4 matrix."""
+
+        self._row0 = Vec4(1.0, 0.0, 0.0, 0.0)
+        self._row1 = Vec4(0.0, 1.0, 0.0, 0.0)
+        self._row2 = Vec4(0.0, 0.0, 1.0, 0.0)
+        self._row3 = Vec4(0.0, 0.0, 0.0, 1.0)
+
+        if isinstance(row0, mat44.Mat44):
+            self.setRows(row0.row0, row0.row1, row0.row2, row0.row3)
+        elif isRTVal(row0):
+            self.setRTVal(row0)
+        elif row0 is not None and row1 is not None and row2 is not None and row3 is not None:
+            self.setRows(row0, row1, row2, row3)
+
+
+    @classmethod
+    def fromValues(cls, values):
+        """Constructs a matrix from nested row values.
+
+        Args:
+            values (list): 4 rows of 4 floats each.
+
+        Returns:
+            Mat44: The new matrix.
+
+        """
+
+        mat = cls()
+        mat._row0.set(*values[0])
+        mat._row1.set(*values[1])
+        mat._row2.set(*values[2])
+        mat._row3.set(*values[3])
+
+        return mat
+
+
+    def getValues(self):
+        """Returns the values of this matrix as nested row tuples.
+
+        Returns:
+            tuple: 4 rows of 4 floats each.
+
+        """
+
+        return tuple([(row._x, row._y, row._z, row._t) for row in
+                      (self._row0, self._row1, self._row2, self._row3)])
+
+
+    def getRTVal(self):
+        """Returns a new RTVal constructed from the values of this matrix.
+
+        Returns:
+            object: RTVal
+
+        """
+
+        rtval = ks.rtVal('Mat44')
+        rtval.setRows('', self._row0.getRTVal(), self._row1.getRTVal(),
+                      self._row2.getRTVal(), self._row3.getRTVal())
+
+        return rtval
+
+
+    def setRTVal(self, rtval):
+        """Sets the values of this matrix from an RTVal.
+
+        Args:
+            rtval (object): Mat44 RTVal to copy the values from.
+
+        """
+
+        self._row0.setRTVal(rtval.row0)
+        self._row1.setRTVal(rtval.row1)
+        self._row2.setRTVal(rtval.row2)
+        self._row3.setRTVal(rtval.row3)
+
+
+    @property
+    def row0(self):
+        """Gets row 0 of this matrix.
+
+        Returns:
+            Vec4: row 0 vector.
+
+        """
+
+        return self._row0
+
+
+    @row0.setter
+    def row0(self, value):
+        """Sets row 0 as the input vector.
+
+        Args:
+            value (Vec4): Vector to set row 0 as.
+
+        """
+
+        self._row0.set(value.x, value.y, value.z, value.t)
+
+
+    @property
+    def row1(self):
+        """Gets row 1 of this matrix.
+
+        Returns:
+            Vec4: row 1 vector.
+
+        """
+
+        return self._row1
+
+
+    @row1.setter
+    def row1(self, value):
+        """Sets row 1 as the input vector.
+
+        Args:
+            value (Vec4): Vector to set row 1 as.
+
+        """
+
+        self._row1.set(value.x, value.y, value.z, value.t)
+
+
+    @property
+    def row2(self):
+        """Gets row 2 of this matrix.
+
+        Returns:
+            Vec4: row 2 vector.
+
+        """
+
+        return self._row2
+
+
+    @row2.setter
+    def row2(self, value):
+        """Sets row 2 as the input vector.
+
+        Args:
+            value (Vec4): Vector to set row 2 as.
+
+        """
+
+        self._row2.set(value.x, value.y, value.z, value.t)
+
+
+    @property
+    def row3(self):
+        """Gets row 3 of this matrix.
+
+        Returns:
+            Vec4: row 3 vector.
+
+        """
+
+        return self._row3
+
+
+    @row3.setter
+    def row3(self, value):
+        """Sets row 3 as the input vector.
+
+        Args:
+            value (Vec4): Vector to set row 3 as.
+
+        """
+
+        self._row3.set(value.x, value.y, value.z, value.t)
+
+
+    def clone(self):
+        """Returns a clone of the Mat44.
+
+        Returns:
+            Mat44: The cloned Mat44.
+
+        """
+
+        return Mat44(self)
+
+
+    def setRows(self, row0, row1, row2, row3):
+        """Set from vectors, row-wise.
+
+        Args:
+            row0 (Vec4): vector to use for row 0.
+            row1 (Vec4): vector to use for row 1.
+            row2 (Vec4): vector to use for row 2.
+            row3 (Vec4): vector to use for row 3.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        self._row0.set(row0.x, row0.y, row0.z, row0.t)
+        self._row1.set(row1.x, row1.y, row1.z, row1.t)
+        self._row2.set(row2.x, row2.y, row2.z, row2.t)
+        self._row3.set(row3.x, row3.y, row3.z, row3.t)
+
+        return True
+
+
+    def setColumns(self, col0, col1, col2, col3):
+        """Setter from vectors, column-wise.
+
+        Args:
+            col0 (Vec4): vector to use for column 0.
+            col1 (Vec4): vector to use for column 1.
+            col2 (Vec4): vector to use for column 2.
+            col3 (Vec4): vector to use for column 3.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        self._row0.set(col0.x, col1.x, col2.x, col3.x)
+        self._row1.set(col0.y, col1.y, col2.y, col3.y)
+        self._row2.set(col0.z, col1.z, col2.z, col3.z)
+        self._row3.set(col0.t, col1.t, col2.t, col3.t)
+
+        return True
+
+
+    def setNull(self):
+        """Setting all components of the matrix to 0.0.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        self._row0.setNull()
+        self._row1.setNull()
+        self._row2.setNull()
+        self._row3.setNull()
+
+        return True
+
+
+    def setIdentity(self):
+        """Sets this matrix to the identity matrix.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        self._row0.set(1.0, 0.0, 0.0, 0.0)
+        self._row1.set(0.0, 1.0, 0.0, 0.0)
+        self._row2.set(0.0, 0.0, 1.0, 0.0)
+        self._row3.set(0.0, 0.0, 0.0, 1.0)
+
+        return True
+
+
+    def setDiagonal(self, v):
+        """Sets the diagonal components of this matrix to a scalar or to the
+        components of a vector.
+
+        Args:
+            v (float, Vec3): Value or vector to set diagonals to.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        if isinstance(v, (int, long, float)):
+            self._row0.x = v
+            self._row1.y = v
+            self._row2.z = v
+            self._row3.t = v
+        else:
+            self._row0.x = v.x
+            self._row1.y = v.y
+            self._row2.z = v.z
+
+        return True
+
+
+    def equal(self, other):
+        """Checks equality of this Matrix44 with another.
+
+        Args:
+            other (Mat44): other matrix to check equality with.
+
+        Returns:
+            bool: True if equal.
+
+        """
+
+        return (self._row0.equal(other.row0) and self._row1.equal(other.row1) and
+                self._row2.equal(other.row2) and self._row3.equal(other.row3))
+
+
+    def almostEqual(self, other, precision=None):
+        """Checks almost equality of this Matrix44 with another.
+
+        Args:
+            other (Mat44): other matrix to check equality with.
+            precision (float): precision value.
+
+        Returns:
+            bool: True if almost equal.
+
+        """
+
+        if precision is None:
+            precision = PRECISION
+
+        return (self._row0.almostEqual(other.row0, precision) and
+                self._row1.almostEqual(other.row1, precision) and
+                self._row2.almostEqual(other.row2, precision) and
+                self._row3.almostEqual(other.row3, precision))
+
+
+    def add(self, other):
+        """Overload method for the add operator.
+
+        Args:
+            other (Mat44): other matrix to add to this one.
+
+        Returns:
+            Mat44: new Mat44 of the sum of the two Mat44's.
+
+        """
+
+        return Mat44(self._row0.add(other.row0), self._row1.add(other.row1),
+                     self._row2.add(other.row2), self._row3.add(other.row3))
+
+
+    def subtract(self, other):
+        """Overload method for the subtract operator.
+
+        Args:
+            other (Mat44): other matrix to subtract from this one.
+
+        Returns:
+            Mat44: new Mat44 of the difference of the two Mat44's.
+
+        """
+
+        return Mat44(self._row0.subtract(other.row0),
+                     self._row1.subtract(other.row1),
+                     self._row2.subtract(other.row2),
+                     self._row3.subtract(other.row3))
+
+
+    def multiply(self, other):
+        """Overload method for the multiply operator.
+
+        Args:
+            other (Mat44): other matrix to multiply from this one.
+
+        Returns:
+            Mat44: new Mat44 of the product of the two Mat44's.
+
+        """
+
+        a = self.getValues()
+        if isinstance(other, Mat44):
+            b = other.getValues()
+        else:
+            b = Mat44(other).getValues()
+
+        columns = zip(*b)
+
+        return Mat44.fromValues([[dotValues(row, column) for column in columns]
+                                 for row in a])
+
+
+    def multiplyScalar(self, other):
+        """Product of this matrix and a scalar.
+
+        Args:
+            other (float): scalar value to multiply this matrix by.
+
+        Returns:
+            Mat44: product of the multiplication of the scalar and this matrix.
+
+        """
+
+        return Mat44(self._row0.multiplyScalar(other),
+                     self._row1.multiplyScalar(other),
+                     self._row2.multiplyScalar(other),
+                     self._row3.multiplyScalar(other))
+
+
+    def multiplyVector(self, other):
+        """Returns the product of this matrix and a vector.
+
+        Args:
+            other (Vec3): vector to multiply this matrix by.
+
+        Returns:
+            Vec3: product of the multiplication of the Vec3 and this matrix.
+
+        """
+
+        vec = (other.x, other.y, other.z, 1.0)
+        result = [dotValues(row, vec) for row in self.getValues()]
+        w = result[3]
+        if w != 1.0:
+            return Vec3(divide(result[0], w), divide(result[1], w),
+                        divide(result[2], w))
+
+        return Vec3(result[0], result[1], result[2])
+
+
+    def divideScalar(self, other):
+        """Divides this matrix and a scalar.
+
+        Args:
+            other (float): Value to divide this matrix by
+
+        Returns:
+            Mat44: Quotient of the division of the matrix by the scalar.
+
+        """
+
+        return Mat44(self._row0.divideScalar(other),
+                     self._row1.divideScalar(other),
+                     self._row2.divideScalar(other),
+                     self._row3.divideScalar(other))
+
+
+    def determinant(self):
+        """Gets the determinant of this matrix.
+
+        Returns:
+            float: Determinant of this matrix.
+
+        """
+
+        m = self.getValues()
+        cofactors = _cofactorValues(m)
+
+        return dotValues(m[0], cofactors[0])
+
+
+    def adjoint(self):
+        """Gets the adjoint matrix of this matrix.
+
+        Returns:
+            Mat44: Adjoint of this matrix.
+
+        """
+
+        cofactors = _cofactorValues(self.getValues())
+
+        return Mat44.fromValues(zip(*cofactors))
+
+
+    def inverse(self):
+        """Get the inverse matrix of this matrix.
+
+        Returns:
+            Mat44: Inverse of this matrix.
+
+        """
+
+        return self.adjoint().divideScalar(self.determinant())
+
+
+    def inverse_safe(self):
+        """Get the inverse matrix of this matrix, always checking the
+        determinant value.
+
+        Returns:
+            Mat44: Safe inverse of this matrix.
+
+        """
+
+        det = self.determinant()
+        if abs(det) < DIVIDEPRECISION:
+            return Mat44()
+
+        return self.adjoint().divideScalar(det)
+
+
+    def transpose(self):
+        """Get the transposed matrix of this matrix.
+
+        Returns:
+            Mat44: Transpose of this matrix.
+
+        """
+
+        return Mat44.fromValues(zip(*self.getValues()))
+
+
+# ===============
+# Helper Methods
+# ===============
+def _cofactorValues(m):
+    """Returns the cofactor matrix of a 4x4 matrix given as nested rows.
+
+    Args:
+        m (tuple): 4 rows of 4 floats each.
+
+    Returns:
+        list: 4 rows of 4 cofactors each.
+
+    """
+
+    result = []
+    for i in xrange(4):
+        rows = [m[r] for r in xrange(4) if r != i]
+        cofactorRow = []
+        for j in xrange(4):
+            minor = determinantValues([[row[c] for c in xrange(4) if c != j]
+                                       for row in rows])
+            if (i + j) % 2:
+                minor = -minor
+
+            cofactorRow.append(minor)
+
+        result.append(cofactorRow)
+
+    return result
@@ -0,0 +1,180 @@
+"""Kraken - maths.python_backend.math_object module.
+
+Classes:
+PythonMathObject -- A base class for the pure Python math types.
+"""
+
+import math
+import struct
+
+from kraken.core.kraken_system import ks
+
+
+PRECISION = 1.0e-5
+DIVIDEPRECISION = 1.0e-5
+
+_float32 = struct.Struct('f')
+
+
+def toScalar(value):
+    """Rounds a number to the precision of a KL Scalar (32 bit float).
+
+    Args:
+        value (float): Value to round.
+
+    Returns:
+        float: The value at 32 bit float precision.
+
+    """
+
+    try:
+        return _float32.unpack(_float32.pack(value))[0]
+    except OverflowError:
+        return math.copysign(float('inf'), value)
+
+
+def dotValues(a, b):
+    """Returns the sum of the products of two sequences of numbers.
+
+    Each product and each partial sum is rounded to a KL Scalar, from left to
+    right, so the result is the one KL computes with 32 bit floats.
+
+    Args:
+        a (sequence): Left hand values.
+        b (sequence): Right hand values.
+
+    Returns:
+        float: The sum of the products at 32 bit float precision.
+
+    """
+
+    result = toScalar(a[0] * b[0])
+    for i in xrange(1, len(a)):
+        result = toScalar(result + toScalar(a[i] * b[i]))
+
+    return result
+
+
+def divide(a, b):
+    """Divides two numbers using IEEE semantics for a zero divisor.
+
+    KL does not raise on a division by zero, it returns inf or nan, so the
+    Python backend does the same to keep results identical.
+
+    Args:
+        a (float): Dividend.
+        b (float): Divisor.
+
+    Returns:
+        float: Quotient of the division.
+
+    """
+
+    if b == 0.0:
+        if a == 0.0 or a != a:
+            return float('nan')
+
+        return math.copysign(float('inf'), a) * math.copysign(1.0, b)
+
+    return a / b
+
+
+def clamp(value, minValue, maxValue):
+    """Clamps a number between a minimum and a maximum value.
+
+    Args:
+        value (float): Value to clamp.
+        minValue (float): Minimum value.
+        maxValue (float): Maximum value.
+
+    Returns:
+        float: The clamped value.
+
+    """
+
+    if value < minValue:
+        return minValue
+
+    if value > maxValue:
+        return maxValue
+
+    return value
+
+
+class PythonMathObject(object):
+    """Base class for the math objects of the pure Python backend.
+
+    The values are stored as plain floats in __slots__ and an RTVal is only
+    constructed when getRTVal() is called.
+
+    """
+
+    __slots__ = ()
+
+
+    @property
+    def _rtval(self):
+        """Gets a new RTVal constructed from the values of this object.
+
+        This keeps the methods of the RTVal backed classes working on Python
+        backend objects.
+
+        Returns:
+            object: RTVal
+
+        """
+
+        return self.getRTVal()
+
+
+    @_rtval.setter
+    def _rtval(self, rtval):
+        """Sets the values of this object from an RTVal.
+
+        Args:
+            rtval (object): RTVal to copy the values from.
+
+        """
+
+        self.setRTVal(rtval)
+
+
+    def getRTVal(self):
+        """Returns a new RTVal constructed from the values of this object.
+
+        Changes made to the returned RTVal are not reflected on this object.
+
+        Returns:
+            object: RTVal
+
+        """
+
+        raise NotImplementedError()
+
+
+    def setRTVal(self, rtval):
+        """Sets the values of this object from an RTVal.
+
+        Args:
+            rtval (object): RTVal to copy the values from.
+
+        """
+
+        raise NotImplementedError()
+
+
+def isRTVal(value):
+    """Returns true if the given value is an RTVal.
+
+    Args:
+        value (value): Value to test.
+
+    Returns:
+        bool: True if the value is an RTVal.
+
+    """
+
+    if value is None or isinstance(value, (int, long, float, basestring, PythonMathObject)):
+        return False
+
+    return ks.isRTVal(value)
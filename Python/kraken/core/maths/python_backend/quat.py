@@ -0,0 +1,1000 @@
+"""Kraken - maths.python_backend.quat module.
+
+Classes:
+Quat -- Quaternion rotation.
+"""
+
+import math
+
+from kraken.core.kraken_system import ks
+from kraken.core.maths import quat
+from kraken.core.maths.python_backend.math_object import PythonMathObject
+from kraken.core.maths.python_backend.math_object import toScalar
+from kraken.core.maths.python_backend.math_object import dotValues
+from kraken.core.maths.python_backend.math_object import divide
+from kraken.core.maths.python_backend.math_object import clamp
+from kraken.core.maths.python_backend.math_object import isRTVal
+from kraken.core.maths.python_backend.math_object import PRECISION
+from kraken.core.maths.python_backend.math_object import DIVIDEPRECISION
+from kraken.core.maths.python_backend.vec3 import Vec3
+from kraken.core.maths.python_backend.euler import Euler
+from kraken.core.maths.python_backend.euler import rotationOrderAxes
+from kraken.core.maths.python_backend.euler import mat33ValuesToEulerAngles
+from kraken.core.maths.python_backend.mat33 import Mat33
+from kraken.core.maths.python_backend.rotation_order import RotationOrder
+
+
+class Quat(PythonMathObject, quat.Quat):
+    """Quaternion Rotation object."""
+
+    __slots__ = ('_v', '_w')
+
+
+    def __init__(self, v=None, w=None):
+        """Initializes the Quaternion."""
+
+        if isRTVal(v):
+            self._v = Vec3()
+            self._w = 1.0
+            self.setRTVal(v)
+            return
+
+        if v is not None and not isinstance(v, (quat.Vec3, quat.Euler, quat.Quat)):
+            raise TypeError("Quat: Invalid type for 'v' argument. Must be a Vec3.")
+
+        if w is not None and not isinstance(w, (int, float)):
+            raise TypeError("Quat: Invalid type for 'w' argument. Must be a int or float.")
+
+        self._v = Vec3()
+        self._w = 1.0
+        if isinstance(v, quat.Quat):
+            self.set(v=v.v, w=v.w)
+        elif isinstance(v, quat.Euler):
+            self.setFromEuler(v)
+        elif v is not None and w is not None:
+            self.set(v=v, w=w)
+
+
+    def getRTVal(self):
+        """Returns a new RTVal constructed from the values of this quaternion.
+
+        Returns:
+            object: RTVal
+
+        """
+
+        rtval = ks.rtVal('Quat')
+        rtval.set('', self._v.getRTVal(), ks.rtVal('Scalar', self._w))
+
+        return rtval
+
+
+    def setRTVal(self, rtval):
+        """Sets the values of this quaternion from an RTVal.
+
+        Args:
+            rtval (object): Quat RTVal to copy the values from.
+
+        """
+
+        self._v.setRTVal(rtval.v)
+        self._w = rtval.w.getSimpleType()
+
+
+    def _setValues(self, x, y, z, w):
+        """Sets the vector and scalar values of this quaternion.
+
+        Args:
+            x (float): X value of the vector.
+            y (float): Y value of the vector.
+            z (float): Z value of the vector.
+            w (float): Scalar value.
+
+        Returns:
+            Quat: This quaternion.
+
+        """
+
+        self._v.set(x, y, z)
+        self._w = toScalar(w)
+
+        return self
+
+
+    @property
+    def v(self):
+        """Gets vector of this quaternion.
+
+        Returns:
+            Vec3: Vector of the quaternion.
+
+        """
+
+        return self._v
+
+
+    @v.setter
+    def v(self, value):
+        """Sets vector property from the input vector.
+
+        Args:
+            value (Vec3): vector to set quaternion vector as.
+
+        """
+
+        self._v.set(value.x, value.y, value.z)
+
+
+    @property
+    def w(self):
+        """Gets scalar of this quaternion.
+
+        Returns:
+            float: Scalar value of the quaternion.
+
+        """
+
+        return self._w
+
+
+    @w.setter
+    def w(self, value):
+        """Sets scalar property from the input scalar.
+
+        Args:
+            value -- Scalar, value to set quaternion scalar as.
+
+        """
+
+        self._w = toScalar(value)
+
+
+    def clone(self):
+        """Returns a clone of the Quat.
+
+        Returns:
+            Quat: The cloned Quaternion.
+
+        """
+
+        return Quat(self)
+
+
+    def set(self, v, w):
+        """Sets the quaternion from vector and scalar values.
+
+        Args:
+            v (Vec3): vector value.
+            w (float): scalar value.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        self._v.set(v.x, v.y, v.z)
+        self._w = toScalar(w)
+
+        return True
+
+
+    def setIdentity(self):
+        """Sets this quaternion to the identity.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        self._setValues(0.0, 0.0, 0.0, 1.0)
+
+        return True
+
+
+    def setFromEuler(self, e):
+        """Sets the quaternion from a euler rotation.
+
+        Args:
+            e (Euler): Euler rotation used to set the quaternion.
+
+        Returns:
+            Quat: This quaternion set from the euler argument.
+
+        """
+
+        return self.setFromEulerAnglesWithRotOrder(Vec3(e.x, e.y, e.z), e.ro)
+
+
+    def setFromEulerAnglesWithRotOrder(self, angles, ro):
+        """Sets this quat to a given angles vector (in radians) and a rotation
+        order.
+
+        Args:
+            angles (Vec3): Angle vector.
+            ro (RotationOrder): Rotation order to use.
+
+        Returns:
+            Quat: This quaternion set from angles vector and rotation order.
+
+        """
+
+        # Closed form of the product of the quaternions of each axis, from the
+        # first axis of the rotation order to the last one, computed in the
+        # same order as KL so the rounding of the Scalars is identical.
+        values = (angles.x, angles.y, angles.z)
+        first, second, third = rotationOrderAxes[RotationOrder(ro).order]
+        if (first, second, third) in ((0, 1, 2), (1, 2, 0), (2, 0, 1)):
+            parity = -1.0
+        else:
+            parity = 1.0
+
+        ti = toScalar(values[third] * 0.5)
+        tj = toScalar(values[second] * parity * 0.5)
+        th = toScalar(values[first] * 0.5)
+        ci = toScalar(math.cos(ti))
+        cj = toScalar(math.cos(tj))
+        ch = toScalar(math.cos(th))
+        si = toScalar(math.sin(ti))
+        sj = toScalar(math.sin(tj))
+        sh = toScalar(math.sin(th))
+        cc = toScalar(ci * ch)
+        cs = toScalar(ci * sh)
+        sc = toScalar(si * ch)
+        ss = toScalar(si * sh)
+
+        result = [0.0, 0.0, 0.0, 0.0]
+        result[third] = toScalar(toScalar(cj * sc) - toScalar(sj * cs))
+        result[second] = parity * toScalar(toScalar(cj * ss) + toScalar(sj * cc))
+        result[first] = toScalar(toScalar(cj * cs) - toScalar(sj * sc))
+        result[3] = toScalar(toScalar(cj * cc) + toScalar(sj * ss))
+
+        return self._setValues(*result)
+
+
+    def setFromEulerAngles(self, angles):
+        """Sets this quat to a given angles vector (in radians) using
+        the default XYZ rotation order.
+
+        Args:
+            angles (Vec3): angle vector.
+
+        Returns:
+            Quat: This quaternion set from angles vector.
+
+        """
+
+        return self.setFromEulerAnglesWithRotOrder(angles, RotationOrder())
+
+
+    def setFromAxisAndAngle(self, axis, angle):
+        """Set this quat to a rotation defined by an axis and an angle
+        (in radians).
+
+        Args:
+            axis (Vec3): vector axis.
+            angle (float): angle value.
+
+        Returns:
+            Quat: This quaternion set from axis and angle values.
+
+        """
+
+        halfAngle = toScalar(angle * 0.5)
+        unitAxis = Vec3(axis).unit()
+        sinHalfAngle = toScalar(math.sin(halfAngle))
+
+        return self._setValues(unitAxis.x * sinHalfAngle,
+                               unitAxis.y * sinHalfAngle,
+                               unitAxis.z * sinHalfAngle,
+                               math.cos(halfAngle))
+
+
+    def setFromMat33(self, mat):
+        """Set this quat to the rotation described by a 3x3 rotation matrix.
+
+        Args:
+            mat (Mat33): 3x3 matrix to set the quaternion from.
+
+        Returns:
+            Quat: This quaternion set from input Mat33.
+
+        """
+
+        m = Mat33(mat).getValues()
+        trace = toScalar(toScalar(m[0][0] + m[1][1]) + m[2][2])
+        if trace > 0.0:
+            s = toScalar(2.0 * toScalar(math.sqrt(toScalar(trace + 1.0))))
+            w = toScalar(0.25 * s)
+            x = toScalar(toScalar(m[2][1] - m[1][2]) / s)
+            y = toScalar(toScalar(m[0][2] - m[2][0]) / s)
+            z = toScalar(toScalar(m[1][0] - m[0][1]) / s)
+        elif m[0][0] > m[1][1] and m[0][0] > m[2][2]:
+            s = _diagonalScale(m[0][0], m[1][1], m[2][2])
+            w = toScalar(toScalar(m[2][1] - m[1][2]) / s)
+            x = toScalar(0.25 * s)
+            y = toScalar(toScalar(m[0][1] + m[1][0]) / s)
+            z = toScalar(toScalar(m[0][2] + m[2][0]) / s)
+        elif m[1][1] > m[2][2]:
+            s = _diagonalScale(m[1][1], m[0][0], m[2][2])
+            w = toScalar(toScalar(m[0][2] - m[2][0]) / s)
+            x = toScalar(toScalar(m[0][1] + m[1][0]) / s)
+            y = toScalar(0.25 * s)
+            z = toScalar(toScalar(m[1][2] + m[2][1]) / s)
+        else:
+            s = _diagonalScale(m[2][2], m[0][0], m[1][1])
+            w = toScalar(toScalar(m[1][0] - m[0][1]) / s)
+            x = toScalar(toScalar(m[0][2] + m[2][0]) / s)
+            y = toScalar(toScalar(m[1][2] + m[2][1]) / s)
+            z = toScalar(0.25 * s)
+
+        self._setValues(x, y, z, w)
+        self.setUnit()
+
+        return self
+
+
+    def setFrom2Vectors(self, sourceDirVec, destDirVec, arbitraryIfAmbiguous=True):
+        """Set the quaternion to the rotation required to rotate the source
+        vector to the destination vector.
+
+        Function taken from the 'Game Programming Gems' article
+        'The Shortest Arc Quat' by Stan Melax, both vectors must be units.
+
+        Args:
+            sourceDirVec (Vec3): Source vector.
+            destDirVec (Vec3): Destination vector.
+            arbitraryIfAmbiguous (bool): Arbitrary if ambiguous.
+
+        Returns:
+            Quat: This quaternion set from 2 vectors.
+
+        """
+
+        sourceDirVec = Vec3(sourceDirVec)
+        val = toScalar(sourceDirVec.dot(destDirVec) + 1.0)
+        if val <= PRECISION:
+            # The vectors point in opposite directions, any axis that is
+            # perpendicular to the source vector is a valid answer.
+            if arbitraryIfAmbiguous:
+                swapped = Vec3(sourceDirVec.y, sourceDirVec.z, sourceDirVec.x)
+                crossed = swapped.cross(sourceDirVec).unit_safe()
+                return self._setValues(crossed.x, crossed.y, crossed.z, 0.0)
+
+            return self._setValues(0.0, 0.0, 0.0, 1.0)
+
+        val = toScalar(math.sqrt(toScalar(2.0 * val)))
+        crossed = sourceDirVec.cross(destDirVec).divideScalar(val)
+
+        return self._setValues(crossed.x, crossed.y, crossed.z, val / 2.0)
+
+
+    def setFromDirectionAndUpvector(self, direction, upvector):
+        """Set the quat to represent the direction as the Z axis and the
+        upvector pointing along the XY plane.
+
+        Args:
+            direction (Vec3): Direction vector.
+            upvector (Vec3): Up direction vector.
+
+        Returns:
+            Quat: This quaternion set from direction and up vector.
+
+        """
+
+        zaxis = Vec3(direction).unit_safe()
+        yaxis = Vec3(upvector).unit_safe()
+        xaxis = yaxis.cross(zaxis).unit_safe()
+        yaxis = zaxis.cross(xaxis).unit_safe()
+
+        mat = Mat33()
+        mat.setColumns(xaxis, yaxis, zaxis)
+
+        return self.setFromMat33(mat)
+
+
+    def equal(self, other):
+        """Checks equality of this Quat with another.
+
+        Args:
+            other (Quat): other quaternion to check equality with.
+
+        Returns:
+            bool: True if equal.
+
+        """
+
+        return self._v.equal(other.v) and self._w == other.w
+
+
+    def almostEqualWithPrecision(self, other, precision):
+        """Checks almost equality of this Quat with another using a custom
+        precision value.
+
+        Args:
+            other (Quat): other quaternion to check equality with.
+            precision (float): precision value.
+
+        Returns:
+            bool: True if almost equal.
+
+        """
+
+        return self._v.almostEqual(other.v, precision) and abs(self._w - other.w) < precision
+
+
+    def almostEqual(self, other):
+        """Checks almost equality of this Quat with another
+        (using a default precision).
+
+        Args:
+            other (Quat): other quaternion to check equality with.
+
+        Returns:
+            bool: True if almost equal.
+
+        """
+
+        return self.almostEqualWithPrecision(other, PRECISION)
+
+
+    def add(self, other):
+        """Overload method for the add operator.
+
+        Args:
+            other (Quat): Other quaternion to add to this one.
+
+        Returns:
+            Quat: New Quat of the sum of the two Quat's.
+
+        """
+
+        return Quat(self._v.add(other.v), self._w + other.w)
+
+
+    def subtract(self, other):
+        """Overload method for the subtract operator.
+
+        Args:
+            other (Quat): Other quaternion to subtract from this one.
+
+        Returns:
+            Quat: New Quat of the difference of the two Quat's.
+
+        """
+
+        return Quat(self._v.subtract(other.v), self._w - other.w)
+
+
+    def multiply(self, other):
+        """Overload method for the multiply operator.
+
+        Args:
+            other (Quat): Other quaternion to multiply this one by.
+
+        Returns:
+            Quat: New Quat of the product of the two Quat's.
+
+        """
+
+        return Quat()._setValues(*_multiplyValues(self.getValues(), _getValues(other)))
+
+
+    def divide(self, other):
+        """Divides this quaternion by another.
+
+        Args:
+            other (Quat): Quaternion to divide this quaternion by.
+
+        Returns:
+            Quat: Quotient of the division of the quaternion by the other quaternion.
+
+        """
+
+        ox, oy, oz, ow = _getValues(other)
+
+        return Quat()._setValues(*_multiplyValues(self.getValues(), (-ox, -oy, -oz, ow)))
+
+
+    def multiplyScalar(self, other):
+        """Product of this quaternion and a scalar.
+
+        Args:
+            other (float): scalar value to multiply this quaternion by.
+
+        Returns:
+            Quat: Product of the multiplication of the scalar and this quaternion.
+
+        """
+
+        return Quat(self._v.multiplyScalar(other), self._w * other)
+
+
+    def divideScalar(self, other):
+        """Divides this quaternion and a scalar.
+
+        Args:
+            other (float): value to divide this quaternion by.
+
+        Returns:
+            Quat: Quotient of the division of the quaternion by the scalar.
+
+        """
+
+        return Quat(self._v.divideScalar(other), divide(self._w, other))
+
+
+    def rotateVector(self, v):
+        """Rotates a vector by this quaterion.
+        Don't forget to normalize the quaternion unless you want axial
+        translation as well as rotation..
+
+        Args:
+            v (Vec3): vector to rotate.
+
+        Returns:
+            Vec3: New vector rotated by this quaternion.
+
+        """
+
+        q = self.getValues()
+        temp = _multiplyValues(q, (v.x, v.y, v.z, 0.0))
+        result = _multiplyValues(temp, (-q[0], -q[1], -q[2], q[3]))
+
+        return Vec3(result[0], result[1], result[2])
+
+
+    def dot(self, other):
+        """Gets the dot product of this quaternion and another.
+
+        Args:
+            other (Quat): Other quaternion.
+
+        Returns:
+            float: Dot product.
+
+        """
+
+        return dotValues(self.getValues(), _getValues(other))
+
+
+    def conjugate(self):
+        """Get the conjugate of this quaternion.
+
+        Returns:
+            Quat: Conjugate of this quaternion.
+
+        """
+
+        return Quat(self._v.negate(), self._w)
+
+
+    def lengthSquared(self):
+        """Get the squared lenght of this quaternion.
+
+        Returns:
+            float: Squared length oft his quaternion.
+
+        """
+
+        values = self.getValues()
+
+        return dotValues(values, values)
+
+
+    def length(self):
+        """Gets the length of this quaternion.
+
+        Returns:
+            float: Length of this quaternion.
+
+        """
+
+        return toScalar(math.sqrt(self.lengthSquared()))
+
+
+    def unit(self):
+        """Gets a unit quaternion of this one.
+
+        Returns:
+            Quat: New unit quaternion from this one.
+
+        """
+
+        return self.divideScalar(self.length())
+
+
+    def unit_safe(self):
+        """Gets a unit quaternion of this one, no error reported if cannot be
+        made unit.
+
+        Returns:
+            Quat: New unit quaternion.
+
+        """
+
+        length = self.length()
+        if length < DIVIDEPRECISION:
+            return Quat()
+
+        return self.divideScalar(length)
+
+
+    def setUnit(self):
+        """Sets this quaternion to a unit quaternion and returns the previous
+        length.
+
+        Returns:
+            float: Previous length of this quaternion.
+
+        """
+
+        length = self.length()
+        x, y, z, w = self.getValues()
+        self._setValues(divide(x, length), divide(y, length), divide(z, length),
+                        divide(w, length))
+
+        return length
+
+
+    def inverse(self):
+        """Gets an inverse quaternion of this one.
+
+        Returns:
+            Quat: Inverse quaternion to this one.
+
+        """
+
+        return self.conjugate().divideScalar(self.lengthSquared())
+
+
+    def alignWith(self, other):
+        """Aligns this quaternion with another one ensuring that the delta
+        between the Quat values is the shortest path over the hypersphere.
+
+        Args:
+            other (Quat): Quaternion to align this one with.
+
+        Returns:
+            Quat: This quaternion aligned to the other.
+
+        """
+
+        if self.dot(other) < 0.0:
+            x, y, z, w = self.getValues()
+            self._setValues(-x, -y, -z, -w)
+
+        return self
+
+
+    def getAngle(self):
+        """Gets the angle of this quaternion (in radians).
+
+        Returns:
+            float: Angle of this quaternion (in radians).
+
+        """
+
+        return toScalar(toScalar(math.acos(clamp(self._w, -1.0, 1.0))) * 2.0)
+
+
+    def getXaxis(self):
+        """Gets the X axis of this quaternion.
+
+        Returns:
+            Vec3: X axis of this quaternion.
+
+        """
+
+        return self.toMat33().transpose().row0
+
+
+    def getYaxis(self):
+        """Gets the Y axis of this quaternion.
+
+        Returns:
+            Vec3: Y axis of this quaternion.
+
+        """
+
+        return self.toMat33().transpose().row1
+
+
+    def getZaxis(self):
+        """Gets the Z axis of this quaternion.
+
+        Returns:
+            Vec3: Z axis of this quaternion.
+
+        """
+
+        return self.toMat33().transpose().row2
+
+
+    def mirror(self, axisIndex):
+        """Reflects this Quaternion according to the axis provided.
+
+        Args:
+            axisIndex (int): 0 for the X axis, 1 for the Y axis, and 2 for the Z axis.
+
+        Returns:
+            Quat: This mirrored quaternion.
+
+        """
+
+        x, y, z, w = self.getValues()
+        if axisIndex == 0:
+            self._setValues(w, z, -y, -x)
+        elif axisIndex == 1:
+            self._setValues(-z, w, x, -y)
+        elif axisIndex == 2:
+            self._setValues(-y, x, w, -z)
+
+        return self
+
+
+    def toMat33(self):
+        """Gets this quaternion as a 3x3 matrix.
+
+        Returns:
+            Mat33: Matrix derived from this quaternion.
+
+        """
+
+        return Mat33.fromValues(_toMat33Values(self.getValues()))
+
+
+    def toEuler(self, ro):
+        """Returns this quaternion as a Euler rotation giving a rotation order.
+
+        Args:
+            ro (RotationOrder): rotation order to use to derive the euler by.
+
+        Returns:
+            Euler: Euler rotation derived from this quaternion.
+
+        """
+
+        ro = RotationOrder(ro)
+        angles = mat33ValuesToEulerAngles(_toMat33Values(self.getValues()), ro.order)
+
+        return Euler(angles[0], angles[1], angles[2], ro)
+
+
+    def toEulerAnglesWithRotOrder(self, ro):
+        """Gets this quaternion as Euler angles using the specified rotation
+        order.
+
+        Args:
+            ro (RotationOrder): rotation order used to derive the
+                euler angles.
+
+        Returns:
+            Vec3: Euler angles derived from this quaternion.
+
+        """
+
+        angles = mat33ValuesToEulerAngles(_toMat33Values(self.getValues()),
+                                          RotationOrder(ro).order)
+
+        return Vec3(angles[0], angles[1], angles[2])
+
+
+    def toEulerAngles(self):
+        """Gets this quaternion as a Euler angles using the rotationorder XYZ.
+
+        Returns:
+            Vec3: Euler angles derived from this quaternion.
+
+        """
+
+        return self.toEulerAnglesWithRotOrder(RotationOrder())
+
+
+    def sphericalLinearInterpolate(self, q2, t):
+        """Interpolates two quaternions spherically (slerp) given a scalar blend
+        value (0.0 to 1.0).
+
+        Note: This and q2 should be unit Quaternions.
+
+        Args:
+            q2 (Quat): Quaternion to blend to.
+            t (float): blend value.
+
+        Returns:
+            Quat: New quaternion blended between this and the input quaternion.
+
+        """
+
+        return Quat()._setValues(*slerpValues(self.getValues(), _getValues(q2), t))
+
+
+    def linearInterpolate(self, other, t):
+        """Interpolates two quaternions lineally (lerp) with a given blend value
+        (0.0 to 1.0).
+
+        Note: The interpolation of the 2 quaternions will result acceleration
+        and deceleration. Use `sphericalLinearInterpolate` for an
+        interpolation that does not introduce acceleration..
+
+        Args:
+            other (Quat): Quaternion to blend to.
+            t (float): blend value.
+
+        Returns:
+            Quat: New quaternion blended between this and the input quaternion.
+
+        """
+
+        return Quat()._setValues(*_linearInterpolateValues(self.getValues(),
+                                                           _getValues(other), t))
+
+
+    def getValues(self):
+        """Returns the values of this quaternion as a tuple.
+
+        Returns:
+            tuple: The x, y, z and w values.
+
+        """
+
+        v = self._v
+
+        return (v._x, v._y, v._z, self._w)
+
+
+# ===============
+# Helper Methods
+# ===============
+def _getValues(q):
+    """Returns the x, y, z and w values of a quaternion of any backend.
+
+    Args:
+        q (Quat): Quaternion to get the values from.
+
+    Returns:
+        tuple: The x, y, z and w values.
+
+    """
+
+    if isinstance(q, Quat):
+        return q.getValues()
+
+    v = q.v
+
+    return (v.x, v.y, v.z, q.w)
+
+
+def _multiplyValues(a, b):
+    """Multiplies two quaternions given as (x, y, z, w) tuples.
+
+    Args:
+        a (tuple): Left hand quaternion.
+        b (tuple): Right hand quaternion.
+
+    Returns:
+        tuple: The product as a (x, y, z, w) tuple.
+
+    """
+
+    ax, ay, az, aw = a
+    bx, by, bz, bw = b
+
+    # KL computes a.w * b.v + b.w * a.v + a.v.cross(b.v) for the vector and
+    # a.w * b.w - a.v.dot(b.v) for the scalar.
+    return (toScalar(toScalar(toScalar(aw * bx) + toScalar(bw * ax)) +
+                     toScalar(toScalar(ay * bz) - toScalar(az * by))),
+            toScalar(toScalar(toScalar(aw * by) + toScalar(bw * ay)) +
+                     toScalar(toScalar(az * bx) - toScalar(ax * bz))),
+            toScalar(toScalar(toScalar(aw * bz) + toScalar(bw * az)) +
+                     toScalar(toScalar(ax * by) - toScalar(ay * bx))),
+            toScalar(toScalar(aw * bw) - dotValues(a[:3], b[:3])))
+
+
+def _toMat33Values(q):
+    """Returns the rows of the rotation matrix of a (x, y, z, w) tuple.
+
+    Args:
+        q (tuple): Quaternion values.
+
+    Returns:
+        tuple: 3 rows of 3 floats each.
+
+    """
+
+    x, y, z, w = q
+    xx = toScalar(x * x)
+    yy = toScalar(y * y)
+    zz = toScalar(z * z)
+    xy = toScalar(x * y)
+    xz = toScalar(x * z)
+    yz = toScalar(y * z)
+    wx = toScalar(w * x)
+    wy = toScalar(w * y)
+    wz = toScalar(w * z)
+
+    def diagonal(a, b):
+        return toScalar(1.0 - toScalar(2.0 * toScalar(a + b)))
+
+    def twice(value):
+        return toScalar(2.0 * toScalar(value))
+
+    return ((diagonal(yy, zz), twice(xy - wz), twice(xz + wy)),
+            (twice(xy + wz), diagonal(xx, zz), twice(yz - wx)),
+            (twice(xz - wy), twice(yz + wx), diagonal(xx, yy)))
+
+
+def _diagonalScale(a, b, c):
+    """Returns 2 * sqrt(1 + a - b - c) rounded like KL, used to extract a
+    quaternion from a matrix with a diagonal value larger than the trace.
+
+    Args:
+        a (float): Largest diagonal value.
+        b (float): Second diagonal value.
+        c (float): Third diagonal value.
+
+    Returns:
+        float: The scale of the quaternion values.
+
+    """
+
+    value = toScalar(toScalar(toScalar(1.0 + a) - b) - c)
+
+    return toScalar(2.0 * toScalar(math.sqrt(value)))
+
+
+def _linearInterpolateValues(a, b, t):
+    """Linearly interpolates two quaternions given as (x, y, z, w) tuples and
+    returns the unit quaternion of the result.
+
+    Args:
+        a (tuple): Quaternion to blend from.
+        b (tuple): Quaternion to blend to.
+        t (float): Blend value.
+
+    Returns:
+        tuple: The blended quaternion as a (x, y, z, w) tuple.
+
+    """
+
+    if dotValues(a, b) < 0.0:
+        b = (-b[0], -b[1], -b[2], -b[3])
+
+    result = [toScalar(a[i] + toScalar(toScalar(b[i] - a[i]) * t)) for i in xrange(4)]
+    length = toScalar(math.sqrt(dotValues(result, result)))
+
+    return tuple([toScalar(divide(value, length)) for value in result])
+
+
+def slerpValues(a, b, t):
+    """Spherically interpolates two quaternions given as (x, y, z, w) tuples.
+
+    Args:
+        a (tuple): Quaternion to blend from.
+        b (tuple): Quaternion to blend to.
+        t (float): Blend value.
+
+    Returns:
+        tuple: The blended quaternion as a (x, y, z, w) tuple.
+
+    """
+
+    cosAngle = dotValues(a, b)
+    if cosAngle < 0.0:
+        cosAngle = -cosAngle
+        b = (-b[0], -b[1], -b[2], -b[3])
+
+    if cosAngle > 1.0 - PRECISION:
+        # The quaternions are nearly parallel, a linear blend is accurate.
+        return _linearInterpolateValues(a, b, t)
+
+    angle = toScalar(math.acos(cosAngle))
+    invSinAngle = toScalar(divide(1.0, toScalar(math.sin(angle))))
+    weightA = toScalar(toScalar(math.sin(toScalar(toScalar(1.0 - t) * angle))) * invSinAngle)
+    weightB = toScalar(toScalar(math.sin(toScalar(t * angle))) * invSinAngle)
+
+    # KL returns the unit quaternion of the weighted sum.
+    result = [toScalar(toScalar(a[i] * weightA) + toScalar(b[i] * weightB))
+              for i in xrange(4)]
+    length = toScalar(math.sqrt(dotValues(result, result)))
+
+    return tuple([toScalar(divide(value, length)) for value in result])
@@ -0,0 +1,132 @@
+"""Kraken - maths.python_backend.rotation_order module.
+
+Classes:
+RotationOrder -- Rotation Order.
+"""
+
+from kraken.core.kraken_system import ks
+from kraken.core.maths import rotation_order
+from kraken.core.maths.python_backend.math_object import PythonMathObject
+from kraken.core.maths.python_backend.math_object import isRTVal
+
+
+rotationOrderStrToIntMapping = {
+    'xyz': 0,
+    'yzx': 1,
+    'zxy': 2,
+    'xzy': 3,
+    'zyx': 4,
+    'yxz': 5
+}
+
+
+class RotationOrder(PythonMathObject, rotation_order.RotationOrder):
+    """RotationOrder rotation object."""
+
+    __slots__ = ('_order',)
+
+
+    def __init__(self, order=0):
+        """Initialize rotation order."""
+
+        self._order = 0
+        if isinstance(order, rotation_order.RotationOrder):
+            self._order = order.order
+        elif isRTVal(order):
+            self.setRTVal(order)
+        else:
+            self.set(order=order)
+
+
+    def getRTVal(self):
+        """Returns a new RTVal constructed from this rotation order.
+
+        Returns:
+            object: RTVal
+
+        """
+
+        rtval = ks.rtVal('RotationOrder')
+        rtval.order = ks.rtVal('Integer', self._order)
+
+        return rtval
+
+
+    def setRTVal(self, rtval):
+        """Sets this rotation order from an RTVal.
+
+        Args:
+            rtval (object): RotationOrder RTVal to copy the order from.
+
+        """
+
+        self._order = rtval.order.getSimpleType()
+
+
+    @property
+    def order(self):
+        """Gets order value of this Rotation Order.
+
+        Returns:
+            float: Order value of this Rotation Order.
+
+        """
+
+        return self._order
+
+
+    @order.setter
+    def order(self, value):
+        """Sets order value from the input value.
+
+        Args:
+            value (int, str): Value to set the order property as.
+
+        """
+
+        self._order = int(value)
+
+
+    def clone(self):
+        """Returns a clone of the RotationOrder.
+
+        Returns:
+            RotationOrder: The cloned RotationOrder.
+
+        """
+
+        return RotationOrder(self)
+
+
+    def set(self, order):
+        """Sets the order value from the input values.
+
+        Args:
+            order (int, str): Value to set the order property as.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        newOrder = 0
+
+        if type(order) == str:
+            if order.lower() in rotationOrderStrToIntMapping:
+                newOrder = rotationOrderStrToIntMapping[order.lower()]
+            else:
+                print "Invalid rotation order '" + order + "', using default 0 (XYZ)."
+                newOrder = 0
+
+        elif type(order) == int:
+            if order < 0 or order > 5:
+                print "Invalid rotation order: '" + str(order) + "', using default 0 (XYZ)."
+                newOrder = 0
+            else:
+                newOrder = order
+        else:
+            raise NotImplementedError("Cannot set rotation order with type: " + str(type(order)))
+
+        self._order = newOrder
+
+        return True
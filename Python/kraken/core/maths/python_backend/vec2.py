@@ -0,0 +1,547 @@
+"""Kraken - maths.python_backend.vec2 module.
+
+Classes:
+Vec2 -- Vector 2 object.
+"""
+
+import math
+
+from kraken.core.kraken_system import ks
+from kraken.core.maths import vec2
+from kraken.core.maths.python_backend.math_object import PythonMathObject
+from kraken.core.maths.python_backend.math_object import toScalar
+from kraken.core.maths.python_backend.math_object import divide
+from kraken.core.maths.python_backend.math_object import dotValues
+from kraken.core.maths.python_backend.math_object import clamp
+from kraken.core.maths.python_backend.math_object import isRTVal
+from kraken.core.maths.python_backend.math_object import PRECISION
+from kraken.core.maths.python_backend.math_object import DIVIDEPRECISION
+
+
+class Vec2(PythonMathObject, vec2.Vec2):
+    """Vector 2 object."""
+
+    __slots__ = ('_x', '_y')
+
+
+    def __init__(self, x=0.0, y=0.0):
+        """Initializes x, y values for Vec2 object."""
+
+        if isinstance(x, vec2.Vec2):
+            self._x = x.x
+            self._y = x.y
+        elif isRTVal(x):
+            self.setRTVal(x)
+        else:
+            self._x = toScalar(x)
+            self._y = toScalar(y)
+
+
+    def getRTVal(self):
+        """Returns a new RTVal constructed from the values of this vector.
+
+        Returns:
+            object: RTVal
+
+        """
+
+        rtval = ks.rtVal('Vec2')
+        rtval.set('', ks.rtVal('Scalar', self._x), ks.rtVal('Scalar', self._y))
+
+        return rtval
+
+
+    def setRTVal(self, rtval):
+        """Sets the values of this vector from an RTVal.
+
+        Args:
+            rtval (object): Vec2 RTVal to copy the values from.
+
+        """
+
+        self._x = rtval.x.getSimpleType()
+        self._y = rtval.y.getSimpleType()
+
+
+    @property
+    def x(self):
+        """Gets x value of this vector.
+
+        Returns:
+            float: X value of this vector.
+
+        """
+
+        return self._x
+
+
+    @x.setter
+    def x(self, value):
+        """Sets x value from the input value.
+
+        Args:
+            value (float): Value to set the x property as.
+
+        """
+
+        self._x = toScalar(value)
+
+
+    @property
+    def y(self):
+        """Gets y value of this vector.
+
+        Returns:
+            float: Y value of this vector.
+
+        """
+
+        return self._y
+
+
+    @y.setter
+    def y(self, value):
+        """Sets y value from the input value.
+
+        Args:
+            value (float): Value to set the y property as.
+
+        """
+
+        self._y = toScalar(value)
+
+
+    def clone(self):
+        """Returns a clone of the Vec2.
+
+        Returns:
+            Vec2: The cloned Vec2
+
+        """
+
+        return Vec2(self)
+
+
+    def set(self, x, y):
+        """Sets the x and y value from the input values.
+
+        Args:
+            x (float): Value to set the x property as.
+            y (float): Value to set the x property as.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        self._x = toScalar(x)
+        self._y = toScalar(y)
+
+        return True
+
+
+    def setNull(self):
+        """Setting all components of the vec2 to 0.0.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        self._x = 0.0
+        self._y = 0.0
+
+        return True
+
+
+    def equal(self, other):
+        """Checks equality of this vec2 with another.
+
+        Args:
+            other (Vec2): other vector to check equality with.
+
+        Returns:
+            bool: True if equal.
+
+        """
+
+        return self._x == other.x and self._y == other.y
+
+
+    def almostEqual(self, other, precision=PRECISION):
+        """Checks almost equality of this Vec2 with another.
+
+        Args:
+            other (Vec2): other matrix to check equality with.
+            precision (float): Precision value.
+
+        Returns:
+            bool: True if almost equal.
+
+        """
+
+        return abs(self._x - other.x) < precision and abs(self._y - other.y) < precision
+
+
+    def component(self, i):
+        """Gets the component of this Vec2 by index.
+
+        Args:
+            i (int): index of the component to return.
+
+        Returns:
+            float: Component of this Vec2.
+
+        """
+
+        return (self._x, self._y)[i]
+
+
+    def setComponent(self, i, v):
+        """Sets the component of this Vec2 by index.
+
+        Args:
+            i (int): index of the component to set.
+            v (float): Value to set component as.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        setattr(self, ('_x', '_y')[i], toScalar(v))
+
+        return True
+
+
+    def add(self, other):
+        """Overload method for the add operator.
+
+        Args:
+            other (Vec2): other vector to add to this one.
+
+        Returns:
+            Vec2: New Vec2 of the sum of the two Vec2's.
+
+        """
+
+        return Vec2(self._x + other.x, self._y + other.y)
+
+
+    def subtract(self, other):
+        """Overload method for the subtract operator.
+
+        Args:
+            other (Vec2): other vector to subtract from this one.
+
+        Returns:
+            Vec2: New Vec2 of the difference of the two Vec2's.
+
+        """
+
+        return Vec2(self._x - other.x, self._y - other.y)
+
+
+    def multiply(self, other):
+        """Overload method for the multiply operator.
+
+        Args:
+            other (Vec2): other vector to multiply from this one.
+
+        Returns:
+            Vec2: New Vec2 of the product of the two Vec2's.
+
+        """
+
+        return Vec2(self._x * other.x, self._y * other.y)
+
+
+    def divide(self, other):
+        """Divides this vector and an other.
+
+        Args:
+            other (Vec2): other vector to divide by.
+
+        Returns:
+            Vec2: Quotient of the division of this vector by the other.
+
+        """
+
+        return Vec2(divide(self._x, other.x), divide(self._y, other.y))
+
+
+    def multiplyScalar(self, other):
+        """Product of this vector and a scalar.
+
+        Args:
+            other (float): Scalar value to multiply this vector by.
+
+        Returns:
+            Vec2: Product of the multiplication of the scalar and this vector.
+
+        """
+
+        return Vec2(self._x * other, self._y * other)
+
+
+    def divideScalar(self, other):
+        """Divides this vector and a scalar.
+
+        Args:
+            other (float): Value to divide this vector by.
+
+        Returns:
+            Vec2: Quotient of the division of the vector by the scalar.
+
+        """
+
+        return Vec2(divide(self._x, other), divide(self._y, other))
+
+
+    def negate(self):
+        """Gets the negated version of this vector.
+
+        Returns:
+            Vec2: Negation of this vector.
+
+        """
+
+        return Vec2(-self._x, -self._y)
+
+
+    def inverse(self):
+        """Get the inverse vector of this vector.
+
+        Returns:
+            Vec2: Inverse of this vector.
+
+        """
+
+        return Vec2(divide(1.0, self._x), divide(1.0, self._y))
+
+
+    def dot(self, other):
+        """Gets the dot product of this vector and another.
+
+        Args:
+            other (Vec2): Other vector.
+
+        Returns:
+            float: Dot product.
+
+        """
+
+        return dotValues((self._x, self._y), (other.x, other.y))
+
+
+    def cross(self, other):
+        """Gets the cross product of this vector and another.
+
+        Args:
+            other (Vec2): Other vector.
+
+        Returns:
+            float: Cross product.
+
+        """
+
+        return toScalar(toScalar(self._x * other.y) - toScalar(self._y * other.x))
+
+
+    def lengthSquared(self):
+        """Get the squared length of this vector.
+
+        Returns:
+            float: Squared length oft his vector.
+
+        """
+
+        return dotValues((self._x, self._y), (self._x, self._y))
+
+
+    def length(self):
+        """Gets the length of this vector.
+
+        Returns:
+            float: Length of this vector.
+
+        """
+
+        return toScalar(math.sqrt(self.lengthSquared()))
+
+
+    def unit(self):
+        """Gets a unit vector of this one.
+
+        Returns:
+            Vec2: New unit vector from this one.
+
+        """
+
+        return self.divideScalar(self.length())
+
+
+    def unit_safe(self):
+        """Gets a unit vector of this one, no error reported if cannot be
+        made unit.
+
+        Returns:
+            Vec2: New unit vector.
+
+        """
+
+        length = self.length()
+        if length < DIVIDEPRECISION:
+            return Vec2()
+
+        return self.divideScalar(length)
+
+
+    def setUnit(self):
+        """Sets this vector to a unit vector and returns the previous
+        length.
+
+        Returns:
+            float: This vector.
+
+        """
+
+        length = self.length()
+        self.set(divide(self._x, length), divide(self._y, length))
+
+        return length
+
+
+    def normalize(self):
+        """Gets a normalized vector from this vector.
+
+        Returns:
+            float: Previous length.
+
+        """
+
+        return self.setUnit()
+
+
+    def clamp(self, min, max):
+        """Clamps this vector per component by a min and max vector.
+
+        Args:
+            min (float): Minimum value.
+            max (float): Maximum value.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        return Vec2(clamp(self._x, min.x, max.x), clamp(self._y, min.y, max.y))
+
+
+    def unitsAngleTo(self, other):
+        """Gets the angle (self, in radians) of this vector to another one
+        note expects both vectors to be units (else use angleTo)
+
+        Args:
+            other (Vec2): other vector to get angle to.
+
+        Returns:
+            float: Angle.
+
+        """
+
+        return toScalar(math.acos(clamp(self.dot(other), -1.0, 1.0)))
+
+
+    def angleTo(self, other):
+        """Gets the angle (self, in radians) of this vector to another one.
+
+        Args:
+            other (Vec2): other vector to get angle to.
+
+        Returns:
+            float: Angle.
+
+        """
+
+        return self.unit().unitsAngleTo(Vec2(other).unit())
+
+
+    def distanceTo(self, other):
+        """Returns the distance of this vector to another one.
+
+        Args:
+            other (Vec2): the other vector to measure the distance to.
+
+        Returns:
+            float: Distance to the other vector.
+
+        """
+
+        return self.subtract(other).length()
+
+
+    def linearInterpolate(self, other, t):
+        """Linearly interpolates this vector with another one based on a scalar
+        blend value (0.0 to 1.0).
+
+        Args:
+            other (Vec2): vector to blend to.
+            t (float): Blend value.
+
+        Returns:
+            Vec2: New vector blended between this and the input vector.
+
+        """
+
+        return Vec2(self._x + toScalar(toScalar(other.x - self._x) * t),
+                    self._y + toScalar(toScalar(other.y - self._y) * t))
+
+
+    def distanceToLine(self, lineP0, lineP1):
+        """Returns the distance of this vector to a line defined by two points
+        on the line.
+
+        Args:
+            lineP0 (Vec2): point 1 of the line.
+            lineP1 (Vec2): point 2 of the line.
+
+        Returns:
+            float: Distance to the line.
+
+        """
+
+        v = Vec2(lineP1).subtract(lineP0)
+        w = self.subtract(lineP0)
+        c1 = w.dot(v)
+        c2 = v.dot(v)
+        if c2 < DIVIDEPRECISION:
+            return self.distanceTo(lineP0)
+
+        return self.distanceTo(Vec2(lineP0).add(v.multiplyScalar(toScalar(c1 / c2))))
+
+
+    def distanceToSegment(self, segmentP0, segmentP1):
+        """Returns the distance of this vector to a line segment defined by the
+        start and end points of the line segment
+
+        Args:
+            segmentP0 (Vec2): point 1 of the segment.
+            segmentP1 (Vec2): point 2 of the segment.
+
+        Returns:
+            float: Distance to the segment.
+
+        """
+
+        v = Vec2(segmentP1).subtract(segmentP0)
+        w = self.subtract(segmentP0)
+        c1 = w.dot(v)
+        if c1 <= 0.0:
+            return self.distanceTo(segmentP0)
+
+        c2 = v.dot(v)
+        if c2 <= c1:
+            return self.distanceTo(segmentP1)
+
+        return self.distanceTo(Vec2(segmentP0).add(v.multiplyScalar(toScalar(c1 / c2))))
@@ -0,0 +1,561 @@
+"""Kraken - maths.python_backend.vec4 module.
+
+Classes:
+Vec4 -- Vector 4 object.
+"""
+
+import math
+
+from kraken.core.kraken_system import ks
+from kraken.core.maths import vec4
+from kraken.core.maths.python_backend.math_object import PythonMathObject
+from kraken.core.maths.python_backend.math_object import toScalar
+from kraken.core.maths.python_backend.math_object import divide
+from kraken.core.maths.python_backend.math_object import dotValues
+from kraken.core.maths.python_backend.math_object import clamp
+from kraken.core.maths.python_backend.math_object import isRTVal
+from kraken.core.maths.python_backend.math_object import PRECISION
+from kraken.core.maths.python_backend.math_object import DIVIDEPRECISION
+
+
+class Vec4(PythonMathObject, vec4.Vec4):
+    """Vector 4 object."""
+
+    __slots__ = ('_x', '_y', '_z', '_t')
+
+
+    def __init__(self, x=0.0, y=0.0, z=0.0, t=0.0):
+        """Initializes x, y z and t values for Vec4 object."""
+
+        if isinstance(x, vec4.Vec4):
+            self._x = x.x
+            self._y = x.y
+            self._z = x.z
+            self._t = x.t
+        elif isRTVal(x):
+            self.setRTVal(x)
+        else:
+            self._x = toScalar(x)
+            self._y = toScalar(y)
+            self._z = toScalar(z)
+            self._t = toScalar(t)
+
+
+    def getRTVal(self):
+        """Returns a new RTVal constructed from the values of this vector.
+
+        Returns:
+            object: RTVal
+
+        """
+
+        rtval = ks.rtVal('Vec4')
+        rtval.set('', ks.rtVal('Scalar', self._x), ks.rtVal('Scalar', self._y),
+                  ks.rtVal('Scalar', self._z), ks.rtVal('Scalar', self._t))
+
+        return rtval
+
+
+    def setRTVal(self, rtval):
+        """Sets the values of this vector from an RTVal.
+
+        Args:
+            rtval (object): Vec4 RTVal to copy the values from.
+
+        """
+
+        self._x = rtval.x.getSimpleType()
+        self._y = rtval.y.getSimpleType()
+        self._z = rtval.z.getSimpleType()
+        self._t = rtval.t.getSimpleType()
+
+
+    @property
+    def x(self):
+        """Gets x value of this vector.
+
+        Returns:
+            float: X value of this vector.
+
+        """
+
+        return self._x
+
+
+    @x.setter
+    def x(self, value):
+        """Sets x value from the input value.
+
+        Args:
+            value (float): Value to set the x property as.
+
+        """
+
+        self._x = toScalar(value)
+
+
+    @property
+    def y(self):
+        """Gets y value of this vector.
+
+        Returns:
+            float: Y value of this vector.
+
+        """
+
+        return self._y
+
+
+    @y.setter
+    def y(self, value):
+        """Sets y value from the input value.
+
+        Args:
+            value (float): Value to set the y property as.
+
+        """
+
+        self._y = toScalar(value)
+
+
+    @property
+    def z(self):
+        """Gets z value of this vector.
+
+        Returns:
+            float: Z value of this vector.
+
+        """
+
+        return self._z
+
+
+    @z.setter
+    def z(self, value):
+        """Sets z value from the input value.
+
+        Args:
+            value (float): Value to set the z property as.
+
+        """
+
+        self._z = toScalar(value)
+
+
+    @property
+    def t(self):
+        """Gets t value of this vector.
+
+        Returns:
+            float: T value of this vector.
+
+        """
+
+        return self._t
+
+
+    @t.setter
+    def t(self, value):
+        """Sets t value from the input value.
+
+        Args:
+            value (float): Value to set the t property as.
+
+        """
+
+        self._t = toScalar(value)
+
+
+    def clone(self):
+        """Returns a clone of the Vec4.
+
+        Returns:
+            Vec4: The cloned Vec4
+
+        """
+
+        return Vec4(self)
+
+
+    def set(self, x, y, z, t):
+        """Sets the x, y, z, and t value from the input values.
+
+        Args:
+            x (float): Value to set the x property as.
+            y (float): Value to set the x property as.
+            z (float): Value to set the z property as.
+            t (float): Value to set the t property as.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        self._x = toScalar(x)
+        self._y = toScalar(y)
+        self._z = toScalar(z)
+        self._t = toScalar(t)
+
+        return True
+
+
+    def setNull(self):
+        """Setting all components of the vec4 to 0.0.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        self._x = 0.0
+        self._y = 0.0
+        self._z = 0.0
+        self._t = 0.0
+
+        return True
+
+
+    def equal(self, other):
+        """Checks equality of this vec4 with another.
+
+        Args:
+            other (Vec4): other vector to check equality with.
+
+        Returns:
+            bool: True if equal.
+
+        """
+
+        return (self._x == other.x and self._y == other.y and
+                self._z == other.z and self._t == other.t)
+
+
+    def almostEqual(self, other, precision=PRECISION):
+        """Checks almost equality of this Vec4 with another.
+
+        Args:
+            other (Vec4): other matrix to check equality with.
+            precision (float): Precision value.
+
+        Returns:
+            bool: True if almost equal.
+
+        """
+
+        return (abs(self._x - other.x) < precision and
+                abs(self._y - other.y) < precision and
+                abs(self._z - other.z) < precision and
+                abs(self._t - other.t) < precision)
+
+
+    def component(self, i):
+        """Gets the component of this Vec4 by index.
+
+        Args:
+            i (int): index of the component to return.
+
+        Returns:
+            float: Component of this Vec4.
+
+        """
+
+        return (self._x, self._y, self._z, self._t)[i]
+
+
+    def setComponent(self, i, v):
+        """Sets the component of this Vec4 by index.
+
+        Args:
+            i (int): index of the component to set.
+            v (float): Value to set component as.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        setattr(self, ('_x', '_y', '_z', '_t')[i], toScalar(v))
+
+        return True
+
+
+    def add(self, other):
+        """Overload method for the add operator.
+
+        Args:
+            other (Vec4): other vector to add to this one.
+
+        Returns:
+            Vec4: New Vec4 of the sum of the two Vec4's.
+
+        """
+
+        return Vec4(self._x + other.x, self._y + other.y,
+                    self._z + other.z, self._t + other.t)
+
+
+    def subtract(self, other):
+        """Overload method for the subtract operator.
+
+        Args:
+            other (Vec4): other vector to subtract from this one.
+
+        Returns:
+            Vec4: New Vec4 of the difference of the two Vec4's.
+
+        """
+
+        return Vec4(self._x - other.x, self._y - other.y,
+                    self._z - other.z, self._t - other.t)
+
+
+    def multiply(self, other):
+        """Overload method for the multiply operator.
+
+        Args:
+            other (Vec4): other vector to multiply from this one.
+
+        Returns:
+            Vec4: New Vec4 of the product of the two Vec4's.
+
+        """
+
+        return Vec4(self._x * other.x, self._y * other.y,
+                    self._z * other.z, self._t * other.t)
+
+
+    def divide(self, other):
+        """Divides this vector and an other.
+
+        Args:
+            other (Vec4): other vector to divide by.
+
+        Returns:
+            Vec4: Quotient of the division of this vector by the other.
+
+        """
+
+        return Vec4(divide(self._x, other.x), divide(self._y, other.y),
+                    divide(self._z, other.z), divide(self._t, other.t))
+
+
+    def multiplyScalar(self, other):
+        """Product of this vector and a scalar.
+
+        Args:
+            other (float): Scalar value to multiply this vector by.
+
+        Returns:
+            Vec4: Product of the multiplication of the scalar and this vector.
+
+        """
+
+        return Vec4(self._x * other, self._y * other, self._z * other,
+                    self._t * other)
+
+
+    def divideScalar(self, other):
+        """Divides this vector and a scalar.
+
+        Args:
+            other (float): Value to divide this vector by.
+
+        Returns:
+            Vec4: Quotient of the division of the vector by the scalar.
+
+        """
+
+        return Vec4(divide(self._x, other), divide(self._y, other),
+                    divide(self._z, other), divide(self._t, other))
+
+
+    def negate(self):
+        """Gets the negated version of this vector.
+
+        Returns:
+            Vec4: Negation of this vector.
+
+        """
+
+        return Vec4(-self._x, -self._y, -self._z, -self._t)
+
+
+    def inverse(self):
+        """Get the inverse vector of this vector.
+
+        Returns:
+            Vec4: Inverse of this vector.
+
+        """
+
+        return Vec4(divide(1.0, self._x), divide(1.0, self._y),
+                    divide(1.0, self._z), divide(1.0, self._t))
+
+
+    def dot(self, other):
+        """Gets the dot product of this vector and another.
+
+        Args:
+            other (Vec4): Other vector.
+
+        Returns:
+            float: Dot product.
+
+        """
+
+        return dotValues((self._x, self._y, self._z, self._t),
+                         (other.x, other.y, other.z, other.t))
+
+
+    def lengthSquared(self):
+        """Get the squared length of this vector.
+
+        Returns:
+            float: Squared length oft his vector.
+
+        """
+
+        return self.dot(self)
+
+
+    def length(self):
+        """Gets the length of this vector.
+
+        Returns:
+            float: Length of this vector.
+
+        """
+
+        return toScalar(math.sqrt(self.lengthSquared()))
+
+
+    def unit(self):
+        """Gets a unit vector of this one.
+
+        Returns:
+            Vec4: New unit vector from this one.
+
+        """
+
+        return self.divideScalar(self.length())
+
+
+    def unit_safe(self):
+        """Gets a unit vector of this one, no error reported if cannot be
+        made unit.
+
+        Returns:
+            Vec4: New unit vector.
+
+        """
+
+        length = self.length()
+        if length < DIVIDEPRECISION:
+            return Vec4()
+
+        return self.divideScalar(length)
+
+
+    def setUnit(self):
+        """Sets this vector to a unit vector and returns the previous
+        length.
+
+        Returns:
+            float: This vector.
+
+        """
+
+        length = self.length()
+        self.set(divide(self._x, length), divide(self._y, length),
+                 divide(self._z, length), divide(self._t, length))
+
+        return length
+
+
+    def normalize(self):
+        """Gets a normalized vector from this vector.
+
+        Returns:
+            float: Previous length.
+
+        """
+
+        return self.setUnit()
+
+
+    def clamp(self, min, max):
+        """Clamps this vector per component by a min and max vector.
+
+        Args:
+            min (float): Minimum value.
+            max (float): Maximum value.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        return Vec4(clamp(self._x, min.x, max.x), clamp(self._y, min.y, max.y),
+                    clamp(self._z, min.z, max.z), clamp(self._t, min.t, max.t))
+
+
+    def unitsAngleTo(self, other):
+        """Gets the angle (self, in radians) of this vector to another one
+        note expects both vectors to be units (else use angleTo)
+
+        Args:
+            other (Vec4): other vector to get angle to.
+
+        Returns:
+            float: Angle.
+
+        """
+
+        return toScalar(math.acos(clamp(self.dot(other), -1.0, 1.0)))
+
+
+    def angleTo(self, other):
+        """Gets the angle (self, in radians) of this vector to another one.
+
+        Args:
+            other (Vec4): other vector to get angle to.
+
+        Returns:
+            float: Angle.
+
+        """
+
+        return self.unit().unitsAngleTo(Vec4(other).unit())
+
+
+    def distanceTo(self, other):
+        """Returns the distance of this vector to another one.
+
+        Args:
+            other (Vec4): the other vector to measure the distance to.
+
+        Returns:
+            float: Distance to the other vector.
+
+        """
+
+        return self.subtract(other).length()
+
+
+    def linearInterpolate(self, other, t):
+        """Linearly interpolates this vector with another one based on a scalar
+        blend value (0.0 to 1.0).
+
+        Args:
+            other (Vec4): vector to blend to.
+            t (float): Blend value.
+
+        Returns:
+            Vec4: New vector blended between this and the input vector.
+
+        """
+
+        return Vec4(self._x + toScalar(toScalar(other.x - self._x) * t),
+                    self._y + toScalar(toScalar(other.y - self._y) * t),
+                    self._z + toScalar(toScalar(other.z - self._z) * t),
+                    self._t + toScalar(toScalar(other.t - self._t) * t))
@@ -0,0 +1,349 @@
+"""Kraken - maths.python_backend.xfo module.
+
+Classes:
+Xfo -- Transform.
+"""
+
+import math
+
+from kraken.core.kraken_system import ks
+from kraken.core.maths import xfo
+from kraken.core.maths.python_backend.math_object import PythonMathObject
+from kraken.core.maths.python_backend.math_object import toScalar
+from kraken.core.maths.python_backend.math_object import dotValues
+from kraken.core.maths.python_backend.math_object import divide
+from kraken.core.maths.python_backend.math_object import isRTVal
+from kraken.core.maths.python_backend.vec3 import Vec3
+from kraken.core.maths.python_backend.quat import Quat
+from kraken.core.maths.python_backend.mat33 import Mat33
+from kraken.core.maths.python_backend.mat44 import Mat44
+
+
+class Xfo(PythonMathObject, xfo.Xfo):
+    """Transform object."""
+
+    __slots__ = ('_tr', '_ori', '_sc')
+
+
+    def __init__(self, tr=None, ori=None, sc=None):
+        """Initializes tr, ori and sc values for Xfo object."""
+
+        self._tr = Vec3()
+        self._ori = Quat()
+        self._sc = Vec3(1.0, 1.0, 1.0)
+
+        if isRTVal(tr):
+            self.setRTVal(tr)
+        elif isinstance(tr, xfo.Xfo):
+            self.set(tr=tr.tr, ori=tr.ori, sc=tr.sc)
+        else:
+            if tr is not None:
+                self.tr = tr
+            if ori is not None:
+                self.ori = ori
+            if sc is not None:
+                self.sc = sc
+
+
+    def getRTVal(self):
+        """Returns a new RTVal constructed from the values of this transform.
+
+        Returns:
+            object: RTVal
+
+        """
+
+        rtval = ks.rtVal('Xfo')
+        rtval.set('', self._tr.getRTVal(), self._ori.getRTVal(),
+                  self._sc.getRTVal())
+
+        return rtval
+
+
+    def setRTVal(self, rtval):
+        """Sets the values of this transform from an RTVal.
+
+        Args:
+            rtval (object): Xfo RTVal to copy the values from.
+
+        """
+
+        self._tr.setRTVal(rtval.tr)
+        self._ori.setRTVal(rtval.ori)
+        self._sc.setRTVal(rtval.sc)
+
+
+    @property
+    def tr(self):
+        """Gets translation property of this transform.
+
+        Returns:
+            Vec3: Translation property of this transform.
+
+        """
+
+        return self._tr
+
+
+    @tr.setter
+    def tr(self, value):
+        """Sets translation of this transform.
+
+        Args:
+            value (Vec3): Vector to set the translation by.
+
+        """
+
+        self._tr.set(value.x, value.y, value.z)
+
+
+    @property
+    def ori(self):
+        """Gets orientation property of this transform.
+
+        Returns:
+            Quat: Orientation property of this transform.
+
+        """
+
+        return self._ori
+
+
+    @ori.setter
+    def ori(self, value):
+        """Sets orientation of this transform.
+
+        Args:
+            value (Quat): Quaternion to set the orientation by.
+
+        """
+
+        self._ori.set(value.v, value.w)
+
+
+    @property
+    def sc(self):
+        """Gets scaling property of this transform.
+
+        Returns:
+            Vec3: Scaling property of this transform.
+
+        """
+
+        return self._sc
+
+
+    @sc.setter
+    def sc(self, value):
+        """Sets scaling of this transform.
+
+        Args:
+            value (Vec3): Vector to set the scaling by.
+
+        """
+
+        self._sc.set(value.x, value.y, value.z)
+
+
+    def clone(self):
+        """Returns a clone of the Xfo.
+
+        Returns:
+            Xfo: The cloned Xfo
+
+        """
+
+        return Xfo(self)
+
+
+    def set(self, tr, ori, sc):
+        """Setter from the translation, rotation and scaling.
+
+        Args:
+            tr (Vec3): Vector to set the translation by.
+            ori (Quat): Quaternion to set the orientation by.
+            sc (Vec3): Vector to set the scaling by.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        self.tr = tr
+        self.ori = ori
+        self.sc = sc
+
+        return True
+
+
+    def setIdentity(self):
+        """Sets this transform to the identity.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        self._tr.set(0.0, 0.0, 0.0)
+        self._ori.setIdentity()
+        self._sc.set(1.0, 1.0, 1.0)
+
+        return True
+
+
+    def setFromMat44(self, m):
+        """Sets this transform from the supplied matrix.
+
+        Args:
+            m (Mat44): 4x4 matrix to set the transform from.
+
+        Returns:
+            Xfo: This transform set from input Mat44.
+
+        """
+
+        m = Mat44(m).getValues()
+        self._tr.set(m[0][3], m[1][3], m[2][3])
+
+        columns = [[m[0][i], m[1][i], m[2][i]] for i in xrange(3)]
+        scale = [toScalar(math.sqrt(dotValues(c, c))) for c in columns]
+
+        rotation = Mat33.fromValues([row[:3] for row in m[:3]])
+        if rotation.determinant() < 0.0:
+            # Mirrored matrices are decomposed as a negative scaling.
+            scale = [-value for value in scale]
+
+        self._sc.set(*scale)
+
+        columns = [[divide(value, scale[i]) for value in columns[i]] for i in xrange(3)]
+        rotation.setColumns(Vec3(*columns[0]), Vec3(*columns[1]), Vec3(*columns[2]))
+        self._ori.setFromMat33(rotation)
+
+        return self
+
+
+    def toMat44(self):
+        """Gets a Mat44 from this xfo.
+
+        Returns:
+            Mat44: Matrix from this transform.
+
+        """
+
+        r = self._ori.toMat33().getValues()
+        sc = (self._sc.x, self._sc.y, self._sc.z)
+        tr = (self._tr.x, self._tr.y, self._tr.z)
+
+        return Mat44.fromValues([[r[i][0] * sc[0], r[i][1] * sc[1], r[i][2] * sc[2], tr[i]]
+                                 for i in xrange(3)] + [(0.0, 0.0, 0.0, 1.0)])
+
+
+    def multiply(self, xfo):
+        """Overload method for the multiply operator.
+
+        Args:
+            xfo (Xfo): Other transform to multiply this one by.
+
+        Returns:
+            Xfo: New Xfo of the product of the two Xfo's.
+
+        """
+
+        result = Xfo()
+        result.tr = self._tr.add(self._ori.rotateVector(self._sc.multiply(xfo.tr)))
+        result.ori = self._ori.multiply(xfo.ori)
+        result.sc = self._sc.multiply(xfo.sc)
+
+        return result
+
+
+    def transformVector(self, v):
+        """Transforms a vector by this transform.
+
+        Args:
+            v (Vec3): Vector to transform.
+
+        Returns:
+            Vec3: New vector transformed by this transform.
+
+        """
+
+        return self._tr.add(self._ori.rotateVector(self._sc.multiply(v)))
+
+
+    def inverse(self):
+        """Get the inverse transform of this transform.
+
+        Returns:
+            Xfo: Inverse of this transform.
+
+        """
+
+        result = Xfo()
+        result.sc = self._sc.inverse()
+        result.ori = self._ori.inverse()
+        result.tr = result.sc.multiply(result.ori.rotateVector(self._tr.negate()))
+
+        return result
+
+
+    def inverseTransformVector(self, vec):
+        """Transforms a vector with this xfo inversely
+
+        Note: We have 'inverseTransformVector' because Xfos with non-uniform
+        scaling cannot be inverted as Xfos.
+
+        Args:
+            vec (Vec3): Vector to be inversely transformed.
+
+        Returns:
+            Vec3: Inversely transformed vector.
+
+        """
+
+        rotated = self._ori.inverse().rotateVector(Vec3(vec).subtract(self._tr))
+
+        return rotated.multiply(self._sc.inverse())
+
+
+    def linearInterpolate(self, other, t):
+        """Linearly interpolates this transform with another one based on a
+        scalar blend value (0.0 to 1.0).
+
+        Args:
+            other (Xfo): Transform to blend to.
+            t (float): Blend value.
+
+        Returns:
+            Xfo: New transform blended between this and the input transform.
+
+        """
+
+        result = Xfo()
+        result.tr = self._tr.linearInterpolate(other.tr, t)
+        result.ori = self._ori.sphericalLinearInterpolate(other.ori, t)
+        result.sc = self._sc.linearInterpolate(other.sc, t)
+
+        return result
+
+
+    def setFromVectors(self, inVec1, inVec2, inVec3, translation):
+        """Set Xfo values from 3 axis vectors and a translation vector.
+
+        Args:
+            inVec1 (Vec3): X axis vector.
+            inVec2 (Vec3): Y axis vector.
+            inVec3 (Vec3): Z axis vector.
+            translation (Vec3): Translation vector.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        mat33 = Mat33()
+        mat33.setColumns(inVec1, inVec2, inVec3)
+        self._ori.setFromMat33(mat33)
+        self.tr = translation
+
+        return True
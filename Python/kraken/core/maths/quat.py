@@ -17,6 +17,9 @@ from kraken.core.maths.mat33 import Mat33
 class Quat(MathObject):
     """Quaternion Rotation object."""
 
+    __slots__ = ()
+
+
     def __init__(self, v=None, w=None):
         """Initializes the Quaternion."""
 
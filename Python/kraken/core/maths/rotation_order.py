@@ -13,6 +13,9 @@ from kraken.core.maths.math_object import MathObject
 class RotationOrder(MathObject):
     """RotationOrder rotation object."""
 
+    __slots__ = ()
+
+
     def __init__(self, order=0):
         """Initialize rotation order."""
 
@@ -12,6 +12,9 @@ from math_object import MathObject
 class Vec2(MathObject):
     """Vector 2 object."""
 
+    __slots__ = ()
+
+
     def __init__(self, x=0.0, y=0.0):
         """Initializes x, y values for Vec2 object."""
 
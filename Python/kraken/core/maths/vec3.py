@@ -12,6 +12,9 @@ from math_object import MathObject
 class Vec3(MathObject):
     """Vector 3 object."""
 
+    __slots__ = ()
+
+
     def __init__(self, x=0.0, y=0.0, z=0.0):
         """Initializes x, y, z values for Vec3 object."""
 
@@ -12,6 +12,9 @@ from math_object import MathObject
 class Vec4(MathObject):
     """Vector 4 object."""
 
+    __slots__ = ()
+
+
     def __init__(self, x=0.0, y=0.0, z=0.0, t=0.0):
         """Initializes x, y z and t values for Vec4 object."""
 
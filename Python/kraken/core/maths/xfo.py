@@ -15,6 +15,9 @@ from mat44 import Mat44
 class Xfo(MathObject):
     """Transform object."""
 
+    __slots__ = ()
+
+
     def __init__(self, tr=None, ori=None, sc=None):
         """Initializes tr, ori and sc values for Xfo object."""
 
@@ -0,0 +1,833 @@
+"""Kraken - maths.xfo_array module.
+
+Classes:
+XfoArray -- Array of transforms stored in contiguous NumPy arrays.
+XfoArrayElement -- Proxy to a single transform of an XfoArray.
+Mat44Array -- Array of 4x4 matrices stored in a contiguous NumPy array.
+"""
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from vec3 import Vec3
+from vec4 import Vec4
+from quat import Quat
+from xfo import Xfo
+from mat44 import Mat44
+
+
+def isNumpyAvailable():
+    """Returns whether NumPy can be imported, the array types require it.
+
+    Returns:
+        bool: True if NumPy is available.
+
+    """
+
+    return numpy is not None
+
+
+def _checkNumpy(typeName):
+    """Raises an ImportError if NumPy is not available.
+
+    Args:
+        typeName (str): Name of the type requiring NumPy.
+
+    """
+
+    if numpy is None:
+        raise ImportError(typeName + " requires NumPy which could not be imported.")
+
+
+# ===============
+# Helper Methods
+# ===============
+def _quatMultiply(a, b):
+    """Multiplies two arrays of quaternions stored as (x, y, z, w) rows.
+
+    Args:
+        a (numpy.ndarray): Nx4 array of left hand quaternions.
+        b (numpy.ndarray): Nx4 array of right hand quaternions.
+
+    Returns:
+        numpy.ndarray: Nx4 array of products.
+
+    """
+
+    av = a[..., :3]
+    aw = a[..., 3:]
+    bv = b[..., :3]
+    bw = b[..., 3:]
+
+    result = numpy.empty(numpy.broadcast(a, b).shape)
+    result[..., :3] = aw * bv + bw * av + numpy.cross(av, bv)
+    result[..., 3] = aw[..., 0] * bw[..., 0] - numpy.sum(av * bv, axis=-1)
+
+    return result
+
+
+def _quatConjugate(q):
+    """Returns the conjugates of an array of quaternions.
+
+    Args:
+        q (numpy.ndarray): Nx4 array of quaternions.
+
+    Returns:
+        numpy.ndarray: Nx4 array of conjugated quaternions.
+
+    """
+
+    result = q.copy()
+    result[..., :3] *= -1.0
+
+    return result
+
+
+def _quatRotateVectors(q, v):
+    """Rotates an array of vectors by an array of unit quaternions.
+
+    Args:
+        q (numpy.ndarray): Nx4 array of quaternions.
+        v (numpy.ndarray): Nx3 array of vectors.
+
+    Returns:
+        numpy.ndarray: Nx3 array of rotated vectors.
+
+    """
+
+    qv = q[..., :3]
+    qw = q[..., 3:]
+    t = 2.0 * numpy.cross(qv, v)
+
+    return v + qw * t + numpy.cross(qv, t)
+
+
+def _quatToMat33(q):
+    """Converts an array of quaternions to rotation matrices.
+
+    Args:
+        q (numpy.ndarray): Nx4 array of quaternions.
+
+    Returns:
+        numpy.ndarray: Nx3x3 array of matrices.
+
+    """
+
+    x = q[:, 0]
+    y = q[:, 1]
+    z = q[:, 2]
+    w = q[:, 3]
+
+    result = numpy.empty((len(q), 3, 3))
+    result[:, 0, 0] = 1.0 - 2.0 * (y * y + z * z)
+    result[:, 0, 1] = 2.0 * (x * y - w * z)
+    result[:, 0, 2] = 2.0 * (x * z + w * y)
+    result[:, 1, 0] = 2.0 * (x * y + w * z)
+    result[:, 1, 1] = 1.0 - 2.0 * (x * x + z * z)
+    result[:, 1, 2] = 2.0 * (y * z - w * x)
+    result[:, 2, 0] = 2.0 * (x * z - w * y)
+    result[:, 2, 1] = 2.0 * (y * z + w * x)
+    result[:, 2, 2] = 1.0 - 2.0 * (x * x + y * y)
+
+    return result
+
+
+def _mat33ToQuat(m):
+    """Converts an array of rotation matrices to unit quaternions.
+
+    Each matrix uses the branch of Shoemake's algorithm with the largest
+    divisor, the same branch Quat.setFromMat33 takes.
+
+    Args:
+        m (numpy.ndarray): Nx3x3 array of rotation matrices.
+
+    Returns:
+        numpy.ndarray: Nx4 array of quaternions.
+
+    """
+
+    m00 = m[:, 0, 0]
+    m11 = m[:, 1, 1]
+    m22 = m[:, 2, 2]
+    trace = m00 + m11 + m22
+
+    # The squared, 4 times scaled magnitude of each quaternion component.
+    candidates = numpy.stack([1.0 + m00 - m11 - m22,
+                              1.0 + m11 - m00 - m22,
+                              1.0 + m22 - m00 - m11,
+                              1.0 + trace], axis=-1)
+    branch = numpy.argmax(candidates, axis=-1)
+    s = 2.0 * numpy.sqrt(numpy.maximum(candidates[numpy.arange(len(m)), branch], 0.0))
+
+    zy = m[:, 2, 1] - m[:, 1, 2]
+    xz = m[:, 0, 2] - m[:, 2, 0]
+    yx = m[:, 1, 0] - m[:, 0, 1]
+    xy = m[:, 0, 1] + m[:, 1, 0]
+    xzSum = m[:, 0, 2] + m[:, 2, 0]
+    yz = m[:, 1, 2] + m[:, 2, 1]
+
+    result = numpy.empty((len(m), 4))
+    branchValues = [
+        (0.25 * s, xy / s, xzSum / s, zy / s),
+        (xy / s, 0.25 * s, yz / s, xz / s),
+        (xzSum / s, yz / s, 0.25 * s, yx / s),
+        (zy / s, xz / s, yx / s, 0.25 * s)
+    ]
+    for index, values in enumerate(branchValues):
+        mask = branch == index
+        for component in xrange(4):
+            result[mask, component] = values[component][mask]
+
+    return result / numpy.linalg.norm(result, axis=-1)[:, None]
+
+
+def _quatSlerp(a, b, t):
+    """Spherically interpolates two arrays of unit quaternions.
+
+    Args:
+        a (numpy.ndarray): Nx4 array of quaternions to blend from.
+        b (numpy.ndarray): Nx4 array of quaternions to blend to.
+        t (numpy.ndarray): Blend values, scalar or one per quaternion.
+
+    Returns:
+        numpy.ndarray: Nx4 array of blended quaternions.
+
+    """
+
+    t = numpy.broadcast_to(numpy.asarray(t, dtype=numpy.float64), (len(a),))[:, None]
+
+    cosAngle = numpy.sum(a * b, axis=-1)
+    b = numpy.where((cosAngle < 0.0)[:, None], -b, b)
+    cosAngle = numpy.abs(cosAngle)[:, None]
+
+    # Nearly parallel quaternions fall back to a normalized linear blend.
+    linear = cosAngle > 1.0 - 1.0e-5
+    angle = numpy.arccos(numpy.clip(cosAngle, -1.0, 1.0))
+    sinAngle = numpy.where(linear, 1.0, numpy.sin(angle))
+    weightA = numpy.where(linear, 1.0 - t, numpy.sin((1.0 - t) * angle) / sinAngle)
+    weightB = numpy.where(linear, t, numpy.sin(t * angle) / sinAngle)
+
+    result = a * weightA + b * weightB
+
+    return result / numpy.linalg.norm(result, axis=-1)[:, None]
+
+
+class XfoArrayElement(object):
+    """Proxy to a single transform of an XfoArray.
+
+    The proxy does not copy the transform, reading a component builds the
+    math object from the arrays and assigning a component writes it back.
+    Changing a member of a returned component (e.g. element.tr.x = 1.0)
+    does not write back, assign the whole component instead.
+
+    """
+
+    __slots__ = ('_array', '_index')
+
+
+    def __init__(self, array, index):
+        """Initializes the proxy for the given array and index."""
+
+        super(XfoArrayElement, self).__init__()
+        self._array = array
+        self._index = index
+
+
+    def __str__(self):
+        """String representation of Transform.
+
+        Returns:
+            str: String representation of Transform.
+
+        """
+
+        return str(self.toXfo())
+
+
+    @property
+    def tr(self):
+        """Gets translation of this transform.
+
+        Returns:
+            Vec3: Translation of this transform.
+
+        """
+
+        x, y, z = self._array.tr[self._index]
+
+        return Vec3(float(x), float(y), float(z))
+
+
+    @tr.setter
+    def tr(self, value):
+        """Sets translation of this transform.
+
+        Args:
+            value (Vec3): Vector to set the translation by.
+
+        """
+
+        self._array.tr[self._index] = (value.x, value.y, value.z)
+
+
+    @property
+    def ori(self):
+        """Gets orientation of this transform.
+
+        Returns:
+            Quat: Orientation of this transform.
+
+        """
+
+        x, y, z, w = self._array.ori[self._index]
+
+        return Quat(Vec3(float(x), float(y), float(z)), float(w))
+
+
+    @ori.setter
+    def ori(self, value):
+        """Sets orientation of this transform.
+
+        Args:
+            value (Quat): Quaternion to set the orientation by.
+
+        """
+
+        v = value.v
+        self._array.ori[self._index] = (v.x, v.y, v.z, value.w)
+
+
+    @property
+    def sc(self):
+        """Gets scaling of this transform.
+
+        Returns:
+            Vec3: Scaling of this transform.
+
+        """
+
+        x, y, z = self._array.sc[self._index]
+
+        return Vec3(float(x), float(y), float(z))
+
+
+    @sc.setter
+    def sc(self, value):
+        """Sets scaling of this transform.
+
+        Args:
+            value (Vec3): Vector to set the scaling by.
+
+        """
+
+        self._array.sc[self._index] = (value.x, value.y, value.z)
+
+
+    def toXfo(self):
+        """Returns a copy of this transform as an Xfo.
+
+        Returns:
+            Xfo: New Xfo with the values of this transform.
+
+        """
+
+        return Xfo(tr=self.tr, ori=self.ori, sc=self.sc)
+
+
+    def setFromXfo(self, xfo):
+        """Sets this transform from an Xfo.
+
+        Args:
+            xfo (Xfo): Transform to copy the values from.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        self.tr = xfo.tr
+        self.ori = xfo.ori
+        self.sc = xfo.sc
+
+        return True
+
+
+class XfoArray(object):
+    """Array of transforms stored as contiguous NumPy arrays.
+
+    Translations and scalings are stored as Nx3 arrays and orientations as an
+    Nx4 array of (x, y, z, w) quaternions. The operations are vectorized and
+    match the math of the Xfo methods of the same name.
+
+    """
+
+    __slots__ = ('_tr', '_ori', '_sc')
+
+
+    def __init__(self, count=0, tr=None, ori=None, sc=None):
+        """Initializes the array with identity transforms or given values.
+
+        Args:
+            count (int): Number of transforms when no values are given.
+            tr (array): Nx3 translations.
+            ori (array): Nx4 quaternions as (x, y, z, w).
+            sc (array): Nx3 scalings.
+
+        """
+
+        super(XfoArray, self).__init__()
+        _checkNumpy('XfoArray')
+
+        if tr is not None:
+            count = len(tr)
+        elif ori is not None:
+            count = len(ori)
+        elif sc is not None:
+            count = len(sc)
+
+        self._tr = self.__toArray(tr, (count, 3), 0.0)
+        self._ori = self.__toArray(ori, (count, 4), 0.0)
+        if ori is None:
+            self._ori[:, 3] = 1.0
+        self._sc = self.__toArray(sc, (count, 3), 1.0)
+
+
+    def __toArray(self, values, shape, default):
+        """Returns a contiguous float array of the given shape.
+
+        Args:
+            values (array): Values of the array, None to use the default.
+            shape (tuple): Shape of the array.
+            default (float): Value to fill the array with.
+
+        Returns:
+            numpy.ndarray: The array.
+
+        """
+
+        if values is None:
+            return numpy.full(shape, default, dtype=numpy.float64)
+
+        array = numpy.array(values, dtype=numpy.float64, order='C')
+        if array.shape != shape:
+            raise ValueError("XfoArray: Invalid shape " + str(array.shape) +
+                             ", expected " + str(shape) + ".")
+
+        return array
+
+
+    def __len__(self):
+        return len(self._tr)
+
+    def __getitem__(self, index):
+        return XfoArrayElement(self, index)
+
+    def __setitem__(self, index, value):
+        self._tr[index] = (value.tr.x, value.tr.y, value.tr.z)
+        self._ori[index] = (value.ori.v.x, value.ori.v.y, value.ori.v.z, value.ori.w)
+        self._sc[index] = (value.sc.x, value.sc.y, value.sc.z)
+
+    def __iter__(self):
+        for index in xrange(len(self)):
+            yield XfoArrayElement(self, index)
+
+    def __mul__(self, other):
+        return self.multiply(other)
+
+
+    # ==================
+    # Property Methods
+    # ==================
+    @property
+    def tr(self):
+        """Gets the translations of this array.
+
+        Returns:
+            numpy.ndarray: Nx3 array of translations.
+
+        """
+
+        return self._tr
+
+
+    @property
+    def ori(self):
+        """Gets the orientations of this array.
+
+        Returns:
+            numpy.ndarray: Nx4 array of (x, y, z, w) quaternions.
+
+        """
+
+        return self._ori
+
+
+    @property
+    def sc(self):
+        """Gets the scalings of this array.
+
+        Returns:
+            numpy.ndarray: Nx3 array of scalings.
+
+        """
+
+        return self._sc
+
+
+    # ===================
+    # Conversion Methods
+    # ===================
+    @classmethod
+    def fromXfos(cls, xfos):
+        """Creates an array from a list of transforms.
+
+        Args:
+            xfos (list): Xfo objects to copy the values from.
+
+        Returns:
+            XfoArray: New array holding the transforms.
+
+        """
+
+        array = cls(len(xfos))
+        for index, xfo in enumerate(xfos):
+            array[index] = xfo
+
+        return array
+
+
+    def toXfos(self):
+        """Returns the transforms of this array as a list of new Xfo objects.
+
+        Returns:
+            list: Xfo objects.
+
+        """
+
+        return [element.toXfo() for element in self]
+
+
+    def clone(self):
+        """Returns a clone of the XfoArray.
+
+        Returns:
+            XfoArray: The cloned array.
+
+        """
+
+        return XfoArray(tr=self._tr, ori=self._ori, sc=self._sc)
+
+
+    def setFromMat44(self, m):
+        """Sets the transforms of this array from an array of matrices.
+
+        Args:
+            m (Mat44Array): Matrices to set the transforms from.
+
+        Returns:
+            XfoArray: This array.
+
+        """
+
+        values = m.values
+        self._tr = numpy.ascontiguousarray(values[:, :3, 3])
+
+        rotation = values[:, :3, :3].copy()
+        scale = numpy.linalg.norm(rotation, axis=1)
+        mirrored = numpy.linalg.det(rotation) < 0.0
+        scale[mirrored] *= -1.0
+        self._sc = scale
+
+        rotation /= numpy.where(scale == 0.0, 1.0, scale)[:, None, :]
+        self._ori = _mat33ToQuat(rotation)
+
+        return self
+
+
+    def toMat44(self):
+        """Gets the transforms of this array as an array of matrices.
+
+        Returns:
+            Mat44Array: Matrices of the transforms.
+
+        """
+
+        values = numpy.zeros((len(self), 4, 4))
+        values[:, :3, :3] = _quatToMat33(self._ori) * self._sc[:, None, :]
+        values[:, :3, 3] = self._tr
+        values[:, 3, 3] = 1.0
+
+        return Mat44Array(values=values)
+
+
+    # ============
+    # Xfo Methods
+    # ============
+    def __getOperand(self, other):
+        """Returns the arrays of an XfoArray or a single broadcasted Xfo.
+
+        Args:
+            other (XfoArray, Xfo): Transforms to get the arrays of.
+
+        Returns:
+            tuple: The translation, orientation and scaling arrays.
+
+        """
+
+        if isinstance(other, XfoArray):
+            return other.tr, other.ori, other.sc
+
+        array = XfoArray(1)
+        array[0] = other
+
+        return array.tr, array.ori, array.sc
+
+
+    def multiply(self, other):
+        """Multiplies each transform of this array by another transform.
+
+        Args:
+            other (XfoArray, Xfo): Transforms of the same length or a single
+                Xfo to multiply all the transforms by.
+
+        Returns:
+            XfoArray: New array of the products.
+
+        """
+
+        tr, ori, sc = self.__getOperand(other)
+
+        resultOri = _quatMultiply(self._ori, ori)
+        resultOri /= numpy.linalg.norm(resultOri, axis=-1)[:, None]
+
+        resultTr = self._tr + _quatRotateVectors(self._ori, self._sc * tr)
+
+        return XfoArray(tr=resultTr, ori=resultOri,
+                        sc=numpy.broadcast_to(self._sc * sc, resultTr.shape))
+
+
+    def inverse(self):
+        """Gets the inverse transforms of this array.
+
+        Returns:
+            XfoArray: New array of the inverse transforms.
+
+        """
+
+        lengthSquared = numpy.sum(self._ori * self._ori, axis=-1)[:, None]
+        ori = _quatConjugate(self._ori) / lengthSquared
+        sc = 1.0 / self._sc
+
+        return XfoArray(tr=sc * _quatRotateVectors(ori, -self._tr), ori=ori, sc=sc)
+
+
+    def transformVectors(self, vectors):
+        """Transforms a vector by each transform of this array.
+
+        Args:
+            vectors (array): Nx3 vectors, or a single Vec3 for all transforms.
+
+        Returns:
+            numpy.ndarray: Nx3 array of transformed vectors.
+
+        """
+
+        if isinstance(vectors, Vec3):
+            vectors = (vectors.x, vectors.y, vectors.z)
+
+        vectors = numpy.asarray(vectors, dtype=numpy.float64)
+
+        return self._tr + _quatRotateVectors(self._ori, self._sc * vectors)
+
+
+    def mirror(self, axisIndex):
+        """Reflects the transforms of this array across a plane.
+
+        Matches the mirroring of guide data, the translation is negated along
+        the axis and the orientation is mirrored with Quat.mirror.
+
+        Args:
+            axisIndex (int): 0 for the X axis, 1 for the Y axis, and 2 for the Z axis.
+
+        Returns:
+            XfoArray: New array of mirrored transforms.
+
+        """
+
+        tr = self._tr.copy()
+        tr[:, axisIndex] *= -1.0
+
+        x, y, z, w = self._ori.T
+        if axisIndex == 0:
+            ori = numpy.stack([w, z, -y, -x], axis=-1)
+        elif axisIndex == 1:
+            ori = numpy.stack([-z, w, x, -y], axis=-1)
+        else:
+            ori = numpy.stack([-y, x, w, -z], axis=-1)
+
+        return XfoArray(tr=tr, ori=ori, sc=self._sc)
+
+
+    def linearInterpolate(self, other, t):
+        """Interpolates the transforms of this array with other transforms.
+
+        Translations and scalings are blended linearly and orientations are
+        blended spherically (slerp), as in Xfo.linearInterpolate.
+
+        Args:
+            other (XfoArray, Xfo): Transforms to blend to.
+            t (float, array): Blend value, or one blend value per transform.
+
+        Returns:
+            XfoArray: New array of blended transforms.
+
+        """
+
+        tr, ori, sc = self.__getOperand(other)
+        ori = numpy.broadcast_to(ori, self._ori.shape)
+        weights = numpy.broadcast_to(numpy.asarray(t, dtype=numpy.float64), (len(self),))[:, None]
+
+        return XfoArray(tr=self._tr + (tr - self._tr) * weights,
+                        ori=_quatSlerp(self._ori, ori, t),
+                        sc=self._sc + (sc - self._sc) * weights)
+
+
+class Mat44Array(object):
+    """Array of 4x4 matrices stored as a contiguous Nx4x4 NumPy array."""
+
+    __slots__ = ('_values',)
+
+
+    def __init__(self, count=0, values=None):
+        """Initializes the array with identity matrices or given values.
+
+        Args:
+            count (int): Number of matrices when no values are given.
+            values (array): Nx4x4 matrix values, row major.
+
+        """
+
+        super(Mat44Array, self).__init__()
+        _checkNumpy('Mat44Array')
+
+        if values is None:
+            self._values = numpy.tile(numpy.identity(4), (count, 1, 1))
+        else:
+            self._values = numpy.array(values, dtype=numpy.float64, order='C')
+            if self._values.ndim != 3 or self._values.shape[1:] != (4, 4):
+                raise ValueError("Mat44Array: Invalid shape " + str(self._values.shape) +
+                                 ", expected (N, 4, 4).")
+
+
+    def __len__(self):
+        return len(self._values)
+
+    def __getitem__(self, index):
+        rows = [Vec4(*[float(value) for value in row]) for row in self._values[index]]
+        return Mat44(*rows)
+
+    def __setitem__(self, index, value):
+        self._values[index] = [(row.x, row.y, row.z, row.t) for row in
+                               (value.row0, value.row1, value.row2, value.row3)]
+
+    def __iter__(self):
+        for index in xrange(len(self)):
+            yield self[index]
+
+    def __mul__(self, other):
+        return self.multiply(other)
+
+
+    @property
+    def values(self):
+        """Gets the values of this array.
+
+        Returns:
+            numpy.ndarray: Nx4x4 array of row major matrices.
+
+        """
+
+        return self._values
+
+
+    @classmethod
+    def fromMat44s(cls, matrices):
+        """Creates an array from a list of matrices.
+
+        Args:
+            matrices (list): Mat44 objects to copy the values from.
+
+        Returns:
+            Mat44Array: New array holding the matrices.
+
+        """
+
+        array = cls(len(matrices))
+        for index, matrix in enumerate(matrices):
+            array[index] = matrix
+
+        return array
+
+
+    def toMat44s(self):
+        """Returns the matrices of this array as a list of new Mat44 objects.
+
+        Returns:
+            list: Mat44 objects.
+
+        """
+
+        return list(self)
+
+
+    def toXfoArray(self):
+        """Gets the matrices of this array as an array of transforms.
+
+        Returns:
+            XfoArray: Transforms of the matrices.
+
+        """
+
+        return XfoArray().setFromMat44(self)
+
+
+    def multiply(self, other):
+        """Multiplies each matrix of this array by another matrix.
+
+        Args:
+            other (Mat44Array, Mat44): Matrices of the same length or a single
+                Mat44 to multiply all the matrices by.
+
+        Returns:
+            Mat44Array: New array of the products.
+
+        """
+
+        if isinstance(other, Mat44):
+            other = Mat44Array.fromMat44s([other])
+
+        return Mat44Array(values=numpy.matmul(self._values, other.values))
+
+
+    def inverse(self):
+        """Gets the inverse matrices of this array.
+
+        Returns:
+            Mat44Array: New array of the inverse matrices.
+
+        """
+
+        return Mat44Array(values=numpy.linalg.inv(self._values))
+
+
+    def transpose(self):
+        """Gets the transposed matrices of this array.
+
+        Returns:
+            Mat44Array: New array of the transposed matrices.
+
+        """
+
+        return Mat44Array(values=self._values.transpose(0, 2, 1))
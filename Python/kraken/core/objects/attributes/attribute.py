@@ -5,6 +5,7 @@ Attribute - Base Attribute.
 
 """
 
+from kraken.core.evaluation_cache import EvaluationCache
 from kraken.core.objects.scene_item import SceneItem
 
 
@@ -52,6 +53,7 @@ class Attribute(SceneItem):
         """
 
         self._value = value
+        EvaluationCache.getInstance().invalidate(self)
 
         if self._callback is not None:
             self._callback(value)
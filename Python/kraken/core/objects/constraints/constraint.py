@@ -6,6 +6,7 @@ Constraint - Base Constraint.
 """
 
 from kraken.core.kraken_system import ks
+from kraken.core.evaluation_cache import EvaluationCache
 from kraken.core.objects.scene_item import SceneItem
 from kraken.core.maths.xfo import Xfo
 from kraken.core.maths.mat44 import Mat44
@@ -60,6 +61,7 @@ class Constraint(SceneItem):
         """
 
         self._maintainOffset = value
+        EvaluationCache.getInstance().invalidate(self)
 
 
     def setConstrainee(self, constrainee):
@@ -130,6 +132,7 @@ class Constraint(SceneItem):
                             kObject3D.getName() + "'.")
 
         self._constrainers[index] = kObject3D
+        EvaluationCache.getInstance().invalidate(self)
 
         return True
 
@@ -12,6 +12,9 @@ from kraken.core.objects.curve import Curve
 from kraken.core.objects.ctrlSpace import CtrlSpace
 
 
+IDENTITY_ROWS = ((1.0, 0.0, 0.0), (0.0, 1.0, 0.0), (0.0, 0.0, 1.0))
+
+
 class Control(Curve):
     """Base Control object."""
 
@@ -43,7 +46,8 @@ class Control(Curve):
         return self.shape
 
     def setShape(self, shape):
-        """Sets the shape of the control to the one specified.
+        """Sets the shape of the control to the one specified. The shape data
+        is shared with the config until the control points are modified.
 
         Args:
             shape (str): the desired shape of the control.
@@ -55,7 +59,7 @@ class Control(Curve):
 
         config = Config.getInstance()
         configShapes = config.getControlShapes()
-        if shape not in configShapes.keys():
+        if shape not in configShapes:
             raise KeyError("'" + shape + "' is not a valid shape in the loaded config of class [" + config.__class__.__name__ + "]")
 
         self.setCurveData(configShapes[shape])
@@ -77,33 +81,7 @@ class Control(Curve):
 
         """
 
-        furthest = 0.0
-
-        curveData = list(self.getCurveData())
-
-        for eachSubCurve in curveData:
-            for eachPoint in eachSubCurve["points"]:
-
-                if negative is False:
-
-                    if eachPoint[0] < furthest:
-                        furthest = eachPoint[0]
-
-                else:
-
-                    if eachPoint[0] > furthest:
-                        furthest = eachPoint[0]
-
-
-        offset = 0.0 - furthest
-
-        for eachSubCurve in curveData:
-            for eachPoint in eachSubCurve["points"]:
-                eachPoint[0] += offset
-
-        self.setCurveData(curveData)
-
-        return True
+        return self.__alignOnAxis(0, negative)
 
     def alignOnYAxis(self, negative=False):
         """Aligns the control shape on the Y axis.
@@ -116,32 +94,7 @@ class Control(Curve):
 
         """
 
-        furthest = 0.0
-
-        curveData = list(self.getCurveData())
-
-        for eachSubCurve in curveData:
-            for eachPoint in eachSubCurve["points"]:
-
-                if negative is False:
-
-                    if eachPoint[1] < furthest:
-                        furthest = eachPoint[1]
-
-                else:
-
-                    if eachPoint[1] > furthest:
-                        furthest = eachPoint[1]
-
-        offset = 0.0 - furthest
-
-        for eachSubCurve in curveData:
-            for eachPoint in eachSubCurve["points"]:
-                eachPoint[1] += offset
-
-        self.setCurveData(curveData)
-
-        return True
+        return self.__alignOnAxis(1, negative)
 
     def alignOnZAxis(self, negative=False):
         """Aligns the control shape on the Z axis.
@@ -154,32 +107,35 @@ class Control(Curve):
 
         """
 
-        furthest = 0.0
-
-        curveData = list(self.getCurveData())
+        return self.__alignOnAxis(2, negative)
 
-        for eachSubCurve in curveData:
-            for eachPoint in eachSubCurve["points"]:
+    def __alignOnAxis(self, axis, negative):
+        """Offsets the control shape so it lies on one side of an axis.
 
-                if negative is False:
+        Args:
+            axis (int): Index of the axis, 0 for X, 1 for Y and 2 for Z.
+            negative (bool): Whether to align the control on the negative side.
 
-                    if eachPoint[2] < furthest:
-                        furthest = eachPoint[2]
+        Returns:
+            bool: True if successful.
 
-                else:
+        """
 
-                    if eachPoint[2] > furthest:
-                        furthest = eachPoint[2]
+        furthest = 0.0
+        for subCurve in self.getPackedCurveData():
+            axisRange = subCurve.getAxisRange(axis)
+            if axisRange is None:
+                continue
 
-        offset = 0.0 - furthest
+            if negative is False:
+                furthest = min(furthest, axisRange[0])
+            else:
+                furthest = max(furthest, axisRange[1])
 
-        for eachSubCurve in curveData:
-            for eachPoint in eachSubCurve["points"]:
-                eachPoint[2] += offset
+        offset = [0.0, 0.0, 0.0]
+        offset[axis] = 0.0 - furthest
 
-        self.setCurveData(curveData)
-
-        return True
+        return self.transformCurveData(IDENTITY_ROWS, offset)
 
 
     # ==============
@@ -225,17 +181,11 @@ class Control(Curve):
 
         """
 
-        curveData = list(self.getCurveData())
-
-        for eachSubCurve in curveData:
-            for eachPoint in eachSubCurve["points"]:
-                eachPoint[0] *= scaleVec.x
-                eachPoint[1] *= scaleVec.y
-                eachPoint[2] *= scaleVec.z
-
-        self.setCurveData(curveData)
+        rows = ((scaleVec.x, 0.0, 0.0),
+                (0.0, scaleVec.y, 0.0),
+                (0.0, 0.0, scaleVec.z))
 
-        return True
+        return self.transformCurveData(rows)
 
 
     # ===============
@@ -254,24 +204,17 @@ class Control(Curve):
 
         """
 
-        curveData = list(self.getCurveData())
-
         quatRot = Quat()
         quatRot.setFromEuler(Euler(Math_degToRad(xRot), Math_degToRad(yRot),
                                    Math_degToRad(zRot)))
 
-        for eachSubCurve in curveData:
+        # The rotated axes are the columns of the rotation matrix.
+        axes = [quatRot.rotateVector(Vec3(*x)) for x in IDENTITY_ROWS]
+        rows = ((axes[0].x, axes[1].x, axes[2].x),
+                (axes[0].y, axes[1].y, axes[2].y),
+                (axes[0].z, axes[1].z, axes[2].z))
 
-            for eachPoint in eachSubCurve["points"]:
-                pointVec = Vec3(eachPoint[0], eachPoint[1], eachPoint[2])
-                rotVec = quatRot.rotateVector(pointVec)
-                eachPoint[0] = rotVec.x
-                eachPoint[1] = rotVec.y
-                eachPoint[2] = rotVec.z
-
-        self.setCurveData(curveData)
-
-        return True
+        return self.transformCurveData(rows)
 
 
     # ==================
@@ -288,17 +231,9 @@ class Control(Curve):
 
         """
 
-        curveData = list(self.getCurveData())
-
-        for eachSubCurve in curveData:
-            for eachPoint in eachSubCurve["points"]:
-                eachPoint[0] += translateVec.x
-                eachPoint[1] += translateVec.y
-                eachPoint[2] += translateVec.z
+        offset = (translateVec.x, translateVec.y, translateVec.z)
 
-        self.setCurveData(curveData)
-
-        return True
+        return self.transformCurveData(IDENTITY_ROWS, offset)
 
 
     # ===============
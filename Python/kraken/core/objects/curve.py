@@ -5,13 +5,18 @@ Curve - Curve.
 
 """
 
-import copy
-
 from kraken.core.objects.object_3d import Object3D
+from kraken.core.objects.curve_data import SubCurve, packCurveData
 
 
 class Curve(Object3D):
-    """Curve object."""
+    """Curve object.
+
+    The curve data is stored as a tuple of immutable SubCurves which can be
+    shared with other curves, e.g. the shapes of the config. Modifying the
+    data replaces the sub-curves of this curve only.
+
+    """
 
     def __init__(self, name, parent=None):
         super(Curve, self).__init__(name, parent=parent)
@@ -30,6 +35,21 @@ class Curve(Object3D):
 
         """
 
+        if self._data is None:
+            return None
+
+        return [x.toDict() for x in self._data]
+
+
+    def getPackedCurveData(self):
+        """Returns the packed data of the curve, it is shared and can't be
+        modified.
+
+        Returns:
+            tuple: The SubCurve of each sub-curve of this curve.
+
+        """
+
         return self._data
 
 
@@ -37,14 +57,35 @@ class Curve(Object3D):
         """Sets the curve data.
 
         Arguments:
-        data (list): Dictionaries defining each sub-curve of this curve.
+        data (list): Dictionaries or SubCurves defining each sub-curve of this
+            curve.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        if data is None:
+            self._data = None
+        else:
+            self._data = packCurveData(data)
+
+        return True
+
+
+    def transformCurveData(self, rows, offset=(0.0, 0.0, 0.0)):
+        """Transforms the points of all the sub-curves.
+
+        Args:
+            rows (tuple): The 3 rows of the 3x3 matrix applied to the points.
+            offset (tuple): The translation applied after the matrix.
 
         Returns:
             bool: True if successful.
 
         """
 
-        self._data = copy.deepcopy(data)
+        self._data = tuple([x.transformed(rows, offset) for x in self._data])
 
         return True
 
@@ -61,7 +102,7 @@ class Curve(Object3D):
 
         """
 
-        self._data += data
+        self._data += packCurveData(data)
 
         return True
 
@@ -77,7 +118,7 @@ class Curve(Object3D):
 
         """
 
-        if index > len(self.getCurveData()):
+        if index > len(self._data):
             raise IndexError("'" + str(index) + "' is out of the range of the 'data' array.")
 
         return True
@@ -91,7 +132,7 @@ class Curve(Object3D):
 
         """
 
-        return len(self.getCurveData())
+        return len(self._data)
 
 
     def getSubCurveClosed(self, index):
@@ -108,7 +149,7 @@ class Curve(Object3D):
         if self.checkSubCurveIndex(index) is not True:
             return False
 
-        return self._data[index]["closed"]
+        return self._data[index].getClosed()
 
 
     def getSubCurveData(self, index):
@@ -125,7 +166,7 @@ class Curve(Object3D):
         if self.checkSubCurveIndex(index) is not True:
             return False
 
-        return self._data[index]
+        return self._data[index].toDict()
 
 
     def setSubCurveData(self, index, data):
@@ -133,7 +174,7 @@ class Curve(Object3D):
 
         Arguments:
             index (int): Index of the sub-curve to get the data for.
-            data (dict): Defining the sub-curve data.
+            data (dict): Defining the sub-curve data, or a SubCurve.
 
         Returns:
             bool: True if successful.
@@ -143,7 +184,10 @@ class Curve(Object3D):
         if self.checkSubCurveIndex(index) is not True:
             return False
 
-        self._data[index] = data
+        if not isinstance(data, SubCurve):
+            data = SubCurve.fromDict(data)
+
+        self._data = self._data[:index] + (data, ) + self._data[index + 1:]
 
         return True
 
@@ -162,6 +206,6 @@ class Curve(Object3D):
         if self.checkSubCurveIndex(index) is not True:
             return False
 
-        del self._data[index]
+        self._data = self._data[:index] + self._data[index + 1:]
 
         return True
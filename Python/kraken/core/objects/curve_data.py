@@ -0,0 +1,241 @@
+"""Kraken - objects.curve_data module.
+
+Classes:
+SubCurve -- Immutable sub-curve with packed point positions.
+ShapeLibrary -- Read-only mapping of shape names to packed curve data.
+
+"""
+
+from array import array
+from itertools import izip
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class SubCurve(object):
+    """Immutable sub-curve definition.
+
+    The point positions are packed in a flat array of doubles (x, y, z for
+    each point). Sub-curves are never modified in place so they can be shared
+    between curves, transforming one returns a new sub-curve.
+
+    """
+
+    __slots__ = ('_points', '_degree', '_closed')
+
+
+    def __init__(self, points, degree=1, closed=False):
+        super(SubCurve, self).__init__()
+
+        if not isinstance(points, array):
+            packed = array('d')
+            for point in points:
+                packed.extend((point[0], point[1], point[2]))
+            points = packed
+
+        self._points = points
+        self._degree = degree
+        self._closed = closed
+
+
+    @classmethod
+    def fromDict(cls, data):
+        """Creates a sub-curve from its dictionary definition.
+
+        Args:
+            data (dict): The 'points', 'degree' and 'closed' of the sub-curve.
+
+        Returns:
+            SubCurve: The new sub-curve.
+
+        """
+
+        return cls(data['points'], degree=data.get('degree', 1),
+                   closed=data.get('closed', False))
+
+
+    def toDict(self):
+        """Returns the dictionary definition of the sub-curve.
+
+        Returns:
+            dict: The 'points', 'degree' and 'closed' of the sub-curve, the
+                points are new lists.
+
+        """
+
+        return {
+            'points': self.getPoints(),
+            'degree': self._degree,
+            'closed': self._closed
+        }
+
+
+    def getPackedPoints(self):
+        """Returns the packed point positions, they must not be modified.
+
+        Returns:
+            array: The x, y, z values of each point.
+
+        """
+
+        return self._points
+
+
+    def getPoints(self):
+        """Returns the point positions.
+
+        Returns:
+            list: A new [x, y, z] list for each point.
+
+        """
+
+        points = self._points
+        return [list(points[i:i + 3]) for i in xrange(0, len(points), 3)]
+
+
+    def getNumPoints(self):
+        """Returns the number of points of the sub-curve.
+
+        Returns:
+            int: Number of points.
+
+        """
+
+        return len(self._points) // 3
+
+
+    def getDegree(self):
+        """Returns the degree of the sub-curve.
+
+        Returns:
+            int: Degree of the sub-curve.
+
+        """
+
+        return self._degree
+
+
+    def getClosed(self):
+        """Returns whether the sub-curve is closed.
+
+        Returns:
+            bool: True if the sub-curve is closed.
+
+        """
+
+        return self._closed
+
+
+    def getAxisRange(self, axis):
+        """Returns the range of the point positions along an axis.
+
+        Args:
+            axis (int): Index of the axis, 0 for X, 1 for Y and 2 for Z.
+
+        Returns:
+            tuple: The minimum and maximum values, None if there are no points.
+
+        """
+
+        values = self._points[axis::3]
+        if len(values) == 0:
+            return None
+
+        return (min(values), max(values))
+
+
+    def transformed(self, rows, offset=(0.0, 0.0, 0.0)):
+        """Returns a copy of the sub-curve with transformed points.
+
+        The points are transformed by the matrix then offset, over the whole
+        array at once.
+
+        Args:
+            rows (tuple): The 3 rows of the 3x3 matrix.
+            offset (tuple): The translation applied after the matrix.
+
+        Returns:
+            SubCurve: The transformed sub-curve.
+
+        """
+
+        points = self._points
+        if numpy is not None:
+            values = numpy.frombuffer(points, dtype=numpy.float64).reshape(-1, 3)
+            values = values.dot(numpy.array(rows, dtype=numpy.float64).T) + offset
+
+            result = array('d')
+            result.fromstring(values.astype(numpy.float64).tostring())
+
+        else:
+            (m00, m01, m02), (m10, m11, m12), (m20, m21, m22) = rows
+            tx, ty, tz = offset
+            xs = points[0::3]
+            ys = points[1::3]
+            zs = points[2::3]
+
+            result = array('d', points)
+            result[0::3] = array('d', [m00 * x + m01 * y + m02 * z + tx
+                                       for x, y, z in izip(xs, ys, zs)])
+            result[1::3] = array('d', [m10 * x + m11 * y + m12 * z + ty
+                                       for x, y, z in izip(xs, ys, zs)])
+            result[2::3] = array('d', [m20 * x + m21 * y + m22 * z + tz
+                                       for x, y, z in izip(xs, ys, zs)])
+
+        return SubCurve(result, degree=self._degree, closed=self._closed)
+
+
+def packCurveData(data):
+    """Packs curve data into immutable sub-curves.
+
+    Args:
+        data (list): Dictionaries or SubCurves defining each sub-curve.
+
+    Returns:
+        tuple: The SubCurve of each sub-curve, existing SubCurves are shared.
+            Tuples of SubCurves are returned as is.
+
+    """
+
+    if isinstance(data, tuple) and \
+            all(isinstance(x, SubCurve) for x in data):
+        return data
+
+    subCurves = []
+    for subCurve in data:
+        if not isinstance(subCurve, SubCurve):
+            subCurve = SubCurve.fromDict(subCurve)
+
+        subCurves.append(subCurve)
+
+    return tuple(subCurves)
+
+
+class ShapeLibrary(dict):
+    """Read-only mapping of shape names to packed curve data.
+
+    The shapes are shared by every curve using them, so the library can't be
+    modified once created.
+
+    """
+
+    def __init__(self, shapes):
+        super(ShapeLibrary, self).__init__()
+
+        for name, data in shapes.iteritems():
+            dict.__setitem__(self, name, packCurveData(data))
+
+
+    def __readOnly(self, *args, **kwargs):
+        raise TypeError("The shape library can't be modified.")
+
+    __setitem__ = __readOnly
+    __delitem__ = __readOnly
+    clear = __readOnly
+    pop = __readOnly
+    popitem = __readOnly
+    setdefault = __readOnly
+    update = __readOnly
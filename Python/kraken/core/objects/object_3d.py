@@ -8,8 +8,10 @@ Object3D - Base Object3D Object.
 import re
 
 from kraken.core.configs.config import Config
+from kraken.core.evaluation_cache import EvaluationCache
 from kraken.core.objects.scene_item import SceneItem
 from kraken.core.maths.xfo import Xfo
+from kraken.core.maths.xfo_array import XfoArray
 from kraken.core.maths.rotation_order import RotationOrder
 from kraken.core.objects.attributes.attribute_group import AttributeGroup
 from kraken.core.objects.attributes.bool_attribute import BoolAttribute
@@ -89,6 +91,13 @@ class Object3D(SceneItem):
 
         self._xfo = value.clone()
 
+        # Operators also read the transforms of their outputs.
+        cache = EvaluationCache.getInstance()
+        cache.invalidate(self)
+        for source in self.getSources():
+            if isinstance(source, Operator):
+                cache.invalidate(source)
+
         return True
 
 
@@ -155,22 +164,75 @@ class Object3D(SceneItem):
     def globalXfo(self):
         """Gets global transform of this Object3D
 
+        While the EvaluationCache is enabled the value is computed once and
+        shared until the item or one of its upstream items changes, it must
+        not be modified in place.
+
+        Returns:
+            Xfo: Global Xfo
+
+        """
+
+        return EvaluationCache.getInstance().evaluate(self, self._computeGlobalXfo)
+
+    def _computeGlobalXfo(self):
+        """Computes the global transform of this Object3D by evaluating the
+        constraint or operator driving it.
+
         Returns:
             Xfo: Global Xfo
 
         """
 
+        cache = EvaluationCache.getInstance()
         for source in self.getSources():
             if isinstance(source, Object3D):
                 continue
             if isinstance(source, Constraint):
                 return source.compute()
             if isinstance(source, Operator):
-                source.evaluate()
+                cache.evaluate(source, source.evaluate)
                 break
 
         return self._xfo
 
+    # ============
+    # Xfo Methods
+    # ============
+    @classmethod
+    def getLocalXfos(cls, objects):
+        """Gets the local transforms of several objects at once.
+
+        The global transforms are gathered once per object and parent, then
+        the parent inverses and products are computed in a single vectorized
+        pass. Requires NumPy.
+
+        Args:
+            objects (list): Object3D instances to get the local transforms of.
+
+        Returns:
+            XfoArray: Local transforms in the order of the objects.
+
+        """
+
+        globalXfos = {}
+
+        def getGlobalXfo(sceneItem):
+            key = id(sceneItem)
+            if key not in globalXfos:
+                globalXfos[key] = sceneItem.globalXfo
+
+            return globalXfos[key]
+
+        objectXfos = XfoArray.fromXfos([getGlobalXfo(obj) for obj in objects])
+        parentXfos = XfoArray(len(objects))
+        for index, obj in enumerate(objects):
+            parent = obj.getParent()
+            if isinstance(parent, SceneItem):
+                parentXfos[index] = getGlobalXfo(parent)
+
+        return parentXfos.inverse().multiply(objectXfos)
+
     # =============
     # Name Methods
     # =============
@@ -487,21 +549,44 @@ class Object3D(SceneItem):
         if nodeList is None:
             nodeList = []
 
-        for child in self._children:
-                if classType is not None:
-                    if inheritedClass is not None and child.isTypeOf(classType):
-                        nodeList.append(child)
-                    elif child.getTypeName() == classType:
-                        nodeList.append(child)
+        nodeList.extend(self.iterDescendents(classType=classType,
+                                             inheritedClass=inheritedClass is not None))
 
-                else:
-                    nodeList.append(child)
+        return nodeList
 
-                child.getDescendents(classType=classType,
-                                     nodeList=nodeList,
-                                     inheritedClass=inheritedClass)
+    def iterDescendents(self, classType=None, inheritedClass=True):
+        """Iterates over the descendents of this object, depth first.
 
-        return nodeList
+        The hierarchy is traversed without recursion so deep hierarchies don't
+        hit the recursion limit.
+
+        Args:
+            classType (str or list): Name of the type of class, or names of the
+                types of classes, to limit the iteration to.
+            inheritedClass (bool): Match nodes that are sub-classes of the
+                types.
+
+        Yields:
+            Object3D: The descendents, each one before its children.
+
+        """
+
+        if isinstance(classType, basestring):
+            classType = (classType, )
+
+        pending = list(reversed(self._children))
+        while len(pending) > 0:
+            child = pending.pop()
+
+            if classType is None:
+                yield child
+            elif inheritedClass is True:
+                if child.isOfAnyType(classType):
+                    yield child
+            elif child.getTypeName() in classType:
+                yield child
+
+            pending.extend(reversed(child.getChildren()))
 
     def getChildren(self):
         """Gets the children of this object.
@@ -12,6 +12,122 @@ from kraken.core.objects.object_3d import Object3D
 from kraken.core.objects.operators.operator import Operator
 from kraken.core.objects.attributes.attribute import Attribute
 from kraken.core.kraken_system import ks
+from kraken.core.solver_arg_schema_cache import SolverArgSchemaCache
+
+
+# =====================
+# Argument Marshaling
+# =====================
+# Conversion functions resolved per value type, see _getRTValFn and
+# _getSetValueFn.
+_rtValFns = {}
+_setValueFns = {}
+
+
+def _object3DInputRTVal(obj):
+    return obj.globalXfo.getRTVal().toMat44('Mat44')
+
+
+def _object3DOutputRTVal(obj):
+    return obj.xfo.getRTVal().toMat44('Mat44')
+
+
+def _xfoRTVal(obj):
+    return obj.getRTVal().toMat44('Mat44')
+
+
+def _objectRTVal(obj):
+    return obj.getRTVal()
+
+
+def _builtinRTVal(obj):
+    return obj
+
+
+def _noneRTVal(obj):
+    return None
+
+
+def _setObject3DValue(obj, rtval):
+    obj.xfo.setFromMat44(Mat44(rtval))
+
+
+def _setXfoValue(obj, rtval):
+    obj.setFromMat44(Mat44(rtval))
+
+
+def _setMat44Value(obj, rtval):
+    obj.setFromMat44(rtval)
+
+
+def _setAttributeValue(obj, rtval):
+    obj.setValue(rtval)
+
+
+def _getRTValFn(objType, asInput):
+    """Returns the function converting values of the given type to the value
+    passed to the solver.
+
+    Args:
+        objType (type): Type of the values to convert.
+        asInput (bool): Whether the values are passed to an input port.
+
+    Returns:
+        function: The conversion function.
+
+    """
+
+    key = (objType, asInput)
+    fn = _rtValFns.get(key, None)
+    if fn is None:
+        if issubclass(objType, Object3D):
+            if asInput:
+                fn = _object3DInputRTVal
+            else:
+                fn = _object3DOutputRTVal
+        elif issubclass(objType, Xfo):
+            fn = _xfoRTVal
+        elif issubclass(objType, (MathObject, Attribute)):
+            fn = _objectRTVal
+        elif objType in (int, float, bool, str):
+            fn = _builtinRTVal
+        else:
+            fn = _noneRTVal
+
+        _rtValFns[key] = fn
+
+    return fn
+
+
+def _getSetValueFn(objType):
+    """Returns the function setting the solver results on values of the given
+    type.
+
+    Args:
+        objType (type): Type of the output values.
+
+    Returns:
+        function: The setter function, None if values of the type can't be
+            set.
+
+    """
+
+    if objType in _setValueFns:
+        return _setValueFns[objType]
+
+    fn = None
+    if issubclass(objType, Object3D):
+        fn = _setObject3DValue
+    elif issubclass(objType, Xfo):
+        fn = _setXfoValue
+    elif issubclass(objType, Mat44):
+        fn = _setMat44Value
+    elif issubclass(objType, Attribute):
+        fn = _setAttributeValue
+
+    _setValueFns[objType] = fn
+
+    return fn
 
 
 class KLOperator(Operator):
@@ -23,27 +139,24 @@ class KLOperator(Operator):
     # an attirbute array called 'klOperators' that contains sets of what we
     # currently have setup.
 
+    # Argument schemas of the solver types, shared by all the operators.
+    _solverArgSchemas = {}
+
     def __init__(self, name, solverTypeName, extension):
         super(KLOperator, self).__init__(name)
 
         self.solverTypeName = solverTypeName
         self.extension = extension
 
-        # Load the Fabric Engine client and construct the RTVal for the Solver
-        ks.loadCoreClient()
-        ks.loadExtension('Kraken')
-        if self.extension != 'Kraken':
-            ks.loadExtension(self.extension)
-        self.solverRTVal = ks.constructRTVal(self.solverTypeName)
-        self.args = self.solverRTVal.getArguments('KrakenSolverArg[]')
+        # The solver RTVal is constructed on first use, see getSolverRTVal.
+        self.solverRTVal = None
+        self.args = None
 
-        # Initialize the inputs and outputs based on the given args.
-        for i in xrange(len(self.args)):
-            arg = self.args[i]
-            argName = arg.name.getSimpleType()
-            argDataType = arg.dataType.getSimpleType()
-            argConnectionType = arg.connectionType.getSimpleType()
+        # Argument vector reused by each evaluation, built on first evaluate.
+        self._argVals = None
 
+        # Initialize the inputs and outputs based on the given args.
+        for argName, argDataType, argConnectionType in self.getSolverArgSchema():
             if argConnectionType == 'In':
                 if argDataType.endswith('[]'):
                     self.inputs[argName] = []
@@ -75,16 +188,78 @@ class KLOperator(Operator):
 
         return self.extension
 
+    def getSolverRTVal(self):
+        """Returns the RTVal of the solver, loading the Fabric Engine client and
+        the extensions the first time.
+
+        Returns:
+            RTVal: The solver of the operator.
+
+        """
+
+        if self.solverRTVal is None:
+            ks.loadCoreClient()
+            ks.loadExtension('Kraken')
+            if self.extension != 'Kraken':
+                ks.loadExtension(self.extension)
+
+            self.solverRTVal = ks.constructRTVal(self.solverTypeName)
+
+        return self.solverRTVal
+
     def getSolverArgs(self):
         """Returns the args array defined by the KL Operator.
 
+        Note:
+            This constructs the solver, use getSolverArgSchema to read the
+            arguments without the Fabric Engine client.
+
         Returns:
             RTValArray: Args array defined by the KL Operator.
 
         """
 
+        if self.args is None:
+            self.args = self.getSolverRTVal().getArguments('KrakenSolverArg[]')
+
         return self.args
 
+    def getSolverArgSchema(self):
+        """Returns the name, data type and connection type of the solver
+        arguments.
+
+        The schema is read once per solver type and shared by all the
+        operators using it. It is read from the SolverArgSchemaCache when it
+        holds a valid entry, and from the solver otherwise.
+
+        Returns:
+            tuple: (name, dataType, connectionType) tuple for each argument.
+
+        """
+
+        key = (self.extension, self.solverTypeName)
+        schema = KLOperator._solverArgSchemas.get(key, None)
+        if schema is None:
+            cache = SolverArgSchemaCache.getInstance()
+            schema = cache.getSchema(self.extension, self.solverTypeName)
+
+            if schema is None:
+                args = self.getSolverArgs()
+
+                schema = []
+                for i in xrange(len(args)):
+                    arg = args[i]
+                    schema.append((arg.name.getSimpleType(),
+                                   arg.dataType.getSimpleType(),
+                                   arg.connectionType.getSimpleType()))
+
+                schema = tuple(schema)
+                cache.setSchema(self.extension, self.solverTypeName, schema)
+
+            KLOperator._solverArgSchemas[key] = schema
+
+        return schema
+
     def generateSourceCode(self, arraySizes={}):
         """Returns the source code for a stub operator that will invoke the KL operator
 
@@ -106,125 +281,119 @@ class KLOperator(Operator):
         opSourceCode += "  if(solver == null)\n"
         opSourceCode += "    solver = " + self.solverTypeName + "();\n"
         opSourceCode += "  solver.solve(\n"
-        for i in xrange(len(self.args)):
-            argName = self.args[i].name.getSimpleType()
-            if i == len(self.args) - 1:
-                opSourceCode += "    " + argName + "\n"
-            else:
-                opSourceCode += "    " + argName + ",\n"
-
+        argNames = [argName for argName, _, _ in self.getSolverArgSchema()]
+        opSourceCode += ",\n".join(["    " + x for x in argNames]) + "\n"
         opSourceCode += "  );\n"
         opSourceCode += "}\n"
 
         return opSourceCode
 
-    def evaluate(self):
-        """Invokes the KL operator causing the output values to be computed.
+    def __validateArg(self, value, argName, argDataType):
+        """Validate argument types when passing built in Python types.
 
-        Returns:
-            bool: True if successful.
+        Args:
+            value (object): Built in Python value passed to the solver.
+            argName (str): Name of the argument being validated.
+            argDataType (str): Type of the argument being validated.
 
         """
 
-        super(KLOperator, self).evaluate()
+        if argDataType in ('Scalar', 'Float32', 'UInt32', 'Integer'):
+            valid = type(value) in (float, int)
+        elif argDataType == 'Boolean':
+            valid = type(value) == bool
+        elif argDataType == 'String':
+            valid = type(value) == str
+        else:
+            valid = True
 
-        def getRTVal(obj, asInput=True):
-            if isinstance(obj, Object3D):
-                if asInput:
-                    return obj.globalXfo.getRTVal().toMat44('Mat44')
-                else:
-                    return obj.xfo.getRTVal().toMat44('Mat44')
-            elif isinstance(obj, Xfo):
-                return obj.getRTVal().toMat44('Mat44')
-            elif isinstance(obj, MathObject):
-                return obj.getRTVal()
-            elif isinstance(obj, Attribute):
-                return obj.getRTVal()
-            elif type(obj) in (int, float, bool, str):
-                return obj
-
-        def validateArg(rtVal, argName, argDataType):
-            """Validate argument types when passing built in Python types.
-
-            Args:
-                rtVal (RTVal): rtValue object.
-                argName (str): Name of the argument being validated.
-                argDataType (str): Type of the argument being validated.
-
-            """
-
-            # Validate types when passing a built in Python type
-            if type(rtVal) in (bool, str, int, float):
-                if argDataType in ('Scalar', 'Float32', 'UInt32', 'Integer'):
-                    if type(rtVal) not in (float, int):
-                        raise TypeError(self.getName() + ".evaluate(): Invalid Argument Value: " + str(rtVal) + " (" + type(rtVal).__name__ + "), for Argument: " + argName + " (" + argDataType + ")")
-
-                elif argDataType == 'Boolean':
-                    if type(rtVal) != bool:
-                        raise TypeError(self.getName() + ".evaluate(): Invalid Argument Value: " + str(rtVal) + " (" + type(rtVal).__name__ + "), for Argument: " + argName + " (" + argDataType + ")")
-
-                elif argDataType == 'String':
-                    if type(rtVal) != str:
-                        raise TypeError(self.getName() + ".evaluate(): Invalid Argument Value: " + str(rtVal) + " (" + type(rtVal).__name__ + "), for Argument: " + argName + " (" + argDataType + ")")
-
-
-        argVals = []
-        debug = []
-        for i in xrange(len(self.args)):
-            arg = self.args[i]
-            argName = arg.name.getSimpleType()
-            argDataType = arg.dataType.getSimpleType()
-            argConnectionType = arg.connectionType.getSimpleType()
-
-            if argDataType == 'EvalContext':
-                argVals.append(ks.constructRTVal(argDataType))
-                continue
-            if argName == 'time':
-                argVals.append(ks.constructRTVal(argDataType))
-                continue
-            if argName == 'frame':
-                argVals.append(ks.constructRTVal(argDataType))
-                continue
+        if not valid:
+            raise TypeError(self.getName() + ".evaluate(): Invalid Argument Value: " + str(value) + " (" + type(value).__name__ + "), for Argument: " + argName + " (" + argDataType + ")")
 
-            if argConnectionType == 'In':
-                if str(argDataType).endswith('[]'):
-                    rtValArray = ks.rtVal(argDataType)
-                    rtValArray.resize(len(self.inputs[argName]))
-                    for j in xrange(len(self.inputs[argName])):
-                        rtVal = getRTVal(self.inputs[argName][j])
+    def __getArgVals(self):
+        """Returns the argument vector passed to the solver.
+
+        The vector is built on the first call. Context arguments and the
+        array RTVals are constructed once and reused by the following
+        evaluations, only the values of the ports are updated.
 
-                        validateArg(rtVal, argName, argDataType[:-2])
+        Returns:
+            list: RTVal, or value, of each argument.
 
-                        rtValArray[j] = rtVal
+        """
 
-                    argVals.append(rtValArray)
+        if self._argVals is None:
+            argVals = []
+            for argName, argDataType, argConnectionType in self.getSolverArgSchema():
+                if argDataType == 'EvalContext' or argName in ('time', 'frame'):
+                    argVals.append(ks.constructRTVal(argDataType))
+                elif argDataType.endswith('[]'):
+                    argVals.append(ks.rtVal(argDataType))
                 else:
-                    rtVal = getRTVal(self.inputs[argName])
+                    argVals.append(None)
 
-                    validateArg(rtVal, argName, argDataType)
+            self._argVals = argVals
 
-                    argVals.append(rtVal)
-            else:
-                if str(argDataType).endswith('[]'):
-                    rtValArray = ks.rtVal(argDataType)
-                    rtValArray.resize(len(self.outputs[argName]))
-                    for j in xrange(len(self.outputs[argName])):
-                        rtVal = getRTVal(self.outputs[argName][j],
-                                         asInput=False)
+        return self._argVals
 
-                        validateArg(rtVal, argName, argDataType[:-2])
+    def __marshalArg(self, argVals, index, argName, argDataType, value, asInput):
+        """Sets the value of a port in the argument vector.
 
-                        rtValArray[j] = rtVal
+        Array ports are written in bulk to the reused RTVal array, the
+        conversion function is resolved once per run of values of the same
+        type instead of once per element.
 
-                    argVals.append(rtValArray)
-                else:
-                    rtVal = getRTVal(self.outputs[argName],
-                                     asInput=False)
+        Args:
+            argVals (list): Argument vector passed to the solver.
+            index (int): Index of the argument.
+            argName (str): Name of the argument.
+            argDataType (str): Data type of the argument.
+            value (object): Value, or list of values, connected to the port.
+            asInput (bool): Whether the port is an input of the solver.
+
+        """
+
+        if not argDataType.endswith('[]'):
+            rtValFn = _getRTValFn(type(value), asInput)
+            rtVal = rtValFn(value)
+            if rtValFn is _builtinRTVal:
+                self.__validateArg(rtVal, argName, argDataType)
 
-                    validateArg(rtVal, argName, argDataType)
+            argVals[index] = rtVal
+            return
 
-                    argVals.append(rtVal)
+        elementDataType = argDataType[:-2]
+        rtValArray = argVals[index]
+        if len(rtValArray) != len(value):
+            rtValArray.resize(len(value))
 
+        valueType = None
+        rtValFn = None
+        for j, element in enumerate(value):
+            if type(element) is not valueType:
+                valueType = type(element)
+                rtValFn = _getRTValFn(valueType, asInput)
+
+            rtVal = rtValFn(element)
+            if rtValFn is _builtinRTVal:
+                self.__validateArg(rtVal, argName, elementDataType)
+
+            rtValArray[j] = rtVal
+
+    def __getDebugInfo(self, argVals):
+        """Returns the description of the arguments passed to the solver.
+
+        Args:
+            argVals (list): Argument vector passed to the solver.
+
+        Returns:
+            list: Data type, connection type and value of each argument.
+
+        """
+
+        debug = []
+        schema = self.getSolverArgSchema()
+        for i, (argName, argDataType, argConnectionType) in enumerate(schema):
             debug.append(
                 {
                     argName: [
@@ -232,31 +401,51 @@ class KLOperator(Operator):
                             "dataType": argDataType,
                             "connectionType": argConnectionType
                         },
-                        argVals[-1]
+                        argVals[i]
                     ]
                 })
 
+        return debug
+
+    def evaluate(self):
+        """Invokes the KL operator causing the output values to be computed.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        super(KLOperator, self).evaluate()
+
+        schema = self.getSolverArgSchema()
+        argVals = self.__getArgVals()
+        for i, (argName, argDataType, argConnectionType) in enumerate(schema):
+            if argDataType == 'EvalContext' or argName in ('time', 'frame'):
+                continue
+
+            if argConnectionType == 'In':
+                self.__marshalArg(argVals, i, argName, argDataType,
+                                  self.inputs[argName], True)
+            else:
+                self.__marshalArg(argVals, i, argName, argDataType,
+                                  self.outputs[argName], False)
+
         try:
-            self.solverRTVal.solve('', *argVals)
+            self.getSolverRTVal().solve('', *argVals)
         except:
             errorMsg = "Possible problem with KL operator '" + \
                 self.getName() + "' arguments:"
 
             print errorMsg
-            pprint.pprint(debug, width=800)
+            pprint.pprint(self.__getDebugInfo(argVals), width=800)
 
             raise Exception(errorMsg)
 
         # Now put the computed values out to the connected output objects.
         def setRTVal(obj, rtval):
-            if isinstance(obj, Object3D):
-                obj.xfo.setFromMat44(Mat44(rtval))
-            elif isinstance(obj, Xfo):
-                obj.setFromMat44(Mat44(rtval))
-            elif isinstance(obj, Mat44):
-                obj.setFromMat44(rtval)
-            elif isinstance(obj, Attribute):
-                obj.setValue(rtval)
+            setValueFn = _getSetValueFn(type(obj))
+            if setValueFn is not None:
+                setValueFn(obj, rtval)
             else:
                 if hasattr(obj, '__iter__'):
                     print "Warning: Trying to set a KL port with an " + \
@@ -266,16 +455,12 @@ class KLOperator(Operator):
                     %s\n\ton port: %s\n\tof KL object: %s\n." % \
                     (rtval, obj, self.getName())
 
-        for i in xrange(len(argVals)):
-            arg = self.args[i]
-            argName = arg.name.getSimpleType()
-            argDataType = arg.dataType.getSimpleType()
-            argConnectionType = arg.connectionType.getSimpleType()
-
+        for i, (argName, argDataType, argConnectionType) in enumerate(schema):
             if argConnectionType != 'In':
-                if str(argDataType).endswith('[]'):
+                if argDataType.endswith('[]'):
+                    outputs = self.outputs[argName]
                     for j in xrange(len(argVals[i])):
-                        setRTVal(self.outputs[argName][j], argVals[i][j])
+                        setRTVal(outputs[j], argVals[i][j])
                 else:
                     setRTVal(self.outputs[argName], argVals[i])
 
@@ -5,6 +5,7 @@ Operator - Base operator object.
 
 """
 
+from kraken.core.evaluation_cache import EvaluationCache
 from kraken.core.objects.scene_item import SceneItem
 
 
@@ -104,6 +105,8 @@ class Operator(SceneItem):
         else:
             self.inputs[name] = operatorInput
 
+        EvaluationCache.getInstance().invalidate(self)
+
         return True
 
     def getInput(self, name):
@@ -197,6 +200,8 @@ class Operator(SceneItem):
             self.outputs[name] = operatorOutput
             operatorOutput.addSource(self)
 
+        EvaluationCache.getInstance().invalidate(self)
+
         return True
 
     def getOutput(self, name):
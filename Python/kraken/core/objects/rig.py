@@ -5,6 +5,7 @@ Rig -- Rig representation.
 
 """
 
+import hashlib
 import importlib
 import json
 import os
@@ -12,6 +13,9 @@ import os
 from container import Container
 from kraken.core.kraken_system import KrakenSystem
 from kraken.core.profiler import Profiler
+from kraken.core.io.kraken_stream import isStreamFile
+from kraken.core.io.kraken_stream import KrakenStreamReader
+from kraken.core.io.kraken_stream import KrakenStreamWriter
 from kraken.helpers.utility_methods import prepareToSave, prepareToLoad
 
 
@@ -21,12 +25,16 @@ class Rig(Container):
     def __init__(self, name='rig'):
         super(Rig, self).__init__(name)
         self._metaData = {}
+        self._componentBuildHashes = {}
 
     # ====================
     # Load / Save Methods
     # ====================
     def writeRigDefinitionFile(self, filepath):
-        """Load a rig definition from a file on disk.
+        """Writes a rig definition to a file on disk.
+
+        Files with the .krb extension are written in the compact stream
+        format, all others in the JSON format.
 
         Args:
             filepath (str): The file path of the rig definition file.
@@ -36,6 +44,9 @@ class Rig(Container):
 
         """
 
+        if isStreamFile(filepath):
+            return self.writeRigStreamFile(filepath)
+
         Profiler.getInstance().push("writeRigDefinitionFile:" + filepath)
 
         jsonData = self.getData()
@@ -59,6 +70,9 @@ class Rig(Container):
 
         """
 
+        if isStreamFile(filepath):
+            return self.loadRigStreamFile(filepath)
+
         Profiler.getInstance().push("LoadRigDefinitionFile:" + filepath)
 
         if not os.path.exists(filepath):
@@ -73,6 +87,83 @@ class Rig(Container):
         self.loadRigDefinition(jsonData)
         Profiler.getInstance().pop()
 
+    def writeRigStreamFile(self, filepath):
+        """Writes a rig definition to a file on disk in the stream format.
+
+        Components are serialized and written one at a time.
+
+        Args:
+            filepath (str): The file path of the rig definition file.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        Profiler.getInstance().push("writeRigStreamFile:" + filepath)
+
+        header = {
+            'name': self.getName(),
+            'metaData': self._metaData
+        }
+
+        guideComponents = self.getChildrenByType('Component')
+        with KrakenStreamWriter(filepath) as writer:
+            writer.writeRecord('header', header)
+
+            for component in guideComponents:
+                writer.writeRecord('component', component.saveData())
+
+            writer.writeRecord('connections',
+                               self._getConnectionsData(guideComponents))
+
+        Profiler.getInstance().pop()
+
+        return True
+
+    def loadRigStreamFile(self, filepath):
+        """Load a rig definition from a stream format file on disk.
+
+        Components are loaded as their records are read.
+
+        Args:
+            filepath (str): The file path of the rig definition file.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        Profiler.getInstance().push("loadRigStreamFile:" + filepath)
+
+        if not os.path.exists(filepath):
+            raise Exception("File not found:" + filepath)
+
+        header = {}
+        with KrakenStreamReader(filepath) as reader:
+            for recordType, data in reader:
+                if recordType == 'header':
+                    header = data
+                    if 'name' in header:
+                        self.setName(header['name'])
+
+                elif recordType == 'component':
+                    self._loadComponent(data)
+
+                elif recordType == 'connections':
+                    self._makeConnections(data)
+
+        if 'metaData' in header:
+            for k, v in header['metaData'].iteritems():
+                self.setMetaData(k, v)
+
+        if 'guideData' in header:
+            self.setMetaData('guideData', header['guideData'])
+
+        Profiler.getInstance().pop()
+
+        return True
+
     def _loadComponents(self, componentsJson):
         """Loads components from a JSON dict.
 
@@ -84,28 +175,48 @@ class Rig(Container):
 
         Profiler.getInstance().push("__loadComponents")
 
-        krakenSystem = KrakenSystem.getInstance()
-
         for componentData in componentsJson:
-            # trim off the class name to get the module path.
-            modulePath = '.'.join(componentData['class'].split('.')[:-1])
-
-            if modulePath is not "":
-                try:
-                    importlib.import_module(modulePath)
-                except:
-                    print "Warning: Error finding module path: " + modulePath
-                    continue
-
-            componentClass = krakenSystem.getComponentClass(componentData['class'])
-            if 'name' in componentData:
-                component = componentClass(name=componentData['name'], parent=self)
-            else:
-                component = componentClass(parent=self)
-            component.loadData(componentData)
+            self._loadComponent(componentData)
 
         Profiler.getInstance().pop()
 
+    def _loadComponent(self, componentData):
+        """Loads a component from a JSON dict.
+
+        Args:
+            componentData (dict): Data of the component to load.
+
+        Returns:
+            object: The loaded component, None if its module wasn't found.
+
+        """
+
+        krakenSystem = KrakenSystem.getInstance()
+
+        # trim off the class name to get the module path.
+        modulePath = '.'.join(componentData['class'].split('.')[:-1])
+
+        # Known classes are imported by the KrakenSystem when needed.
+        if modulePath is not "" and \
+                not krakenSystem.isComponentClassRegistered(componentData['class']):
+            try:
+                importlib.import_module(modulePath)
+            except:
+                print "Warning: Error finding module path: " + modulePath
+                return None
+
+        componentClass = krakenSystem.getComponentClass(componentData['class'])
+        if 'name' in componentData:
+            component = componentClass(name=componentData['name'], parent=self)
+        else:
+            component = componentClass(parent=self)
+        component.loadData(componentData)
+
+        self._componentBuildHashes[component.getDecoratedName()] = \
+            self._getBuildDataHash(componentData)
+
+        return component
+
     def _makeConnections(self, connectionsJson):
         """Makes connections based on JSON dict.
 
@@ -150,6 +261,18 @@ class Rig(Container):
             if connectionFailure is False:
                 inputPort.setConnection(outputPort, index = connectionData.get('targetIndex', 0))
 
+        # The connections made to the inputs of a component are part of its
+        # build hash.
+        connectionsByTarget = {}
+        for connectionData in connectionsJson:
+            targetComponentDecoratedName = connectionData['target'].split('.')[0]
+            connectionsByTarget.setdefault(targetComponentDecoratedName, []).append(connectionData)
+
+        for decoratedName, connections in connectionsByTarget.iteritems():
+            if decoratedName in self._componentBuildHashes:
+                self._componentBuildHashes[decoratedName] = self._getBuildDataHash(
+                    [self._componentBuildHashes[decoratedName], connections])
+
         Profiler.getInstance().pop()
 
     def loadRigDefinition(self, jsonData):
@@ -227,20 +350,7 @@ class Rig(Container):
             componentsJson.append(component.saveData())
         guideData['components'] = componentsJson
 
-        connectionsJson = []
-        for component in guideComponents:
-            for i in range(component.getNumInputs()):
-                componentInput = component.getInputByIndex(i)
-                if componentInput.isConnected():
-                    componentOutput = componentInput.getConnection()
-                    connectionJson = {
-                        'source': componentOutput.getParent().getDecoratedName() + '.' + componentOutput.getName(),
-                        'target': component.getDecoratedName() + '.' + componentInput.getName(),
-                        'targetIndex': componentInput.getIndex()
-                    }
-                    connectionsJson.append(connectionJson)
-
-        guideData['connections'] = connectionsJson
+        guideData['connections'] = self._getConnectionsData(guideComponents)
         guideData['metaData'] = self._metaData
 
         return guideData
@@ -268,8 +378,23 @@ class Rig(Container):
 
         rigBuildData['components'] = componentsJson
 
+        rigBuildData['connections'] = self._getConnectionsData(guideComponents)
+
+        return rigBuildData
+
+    def _getConnectionsData(self, components):
+        """Gets the data of the connections made to the inputs of components.
+
+        Args:
+            components (list): Components to get the input connections of.
+
+        Returns:
+            list: The JSON data of the connections.
+
+        """
+
         connectionsJson = []
-        for component in guideComponents:
+        for component in components:
             for i in xrange(component.getNumInputs()):
                 componentInput = component.getInputByIndex(i)
                 if componentInput.isConnected():
@@ -281,9 +406,54 @@ class Rig(Container):
                     }
                     connectionsJson.append(connectionJson)
 
-        rigBuildData['connections'] = connectionsJson
+        return connectionsJson
 
-        return rigBuildData
+    # ====================
+    # Build Hash Methods
+    # ====================
+    def getComponentBuildHashes(self):
+        """Gets the content hashes of the components loaded from the rig
+        definition, covering their build data and input connections.
+
+        Builders compare the hashes with the ones of the previously built rig
+        to only rebuild the components that changed.
+
+        Returns:
+            dict: The build hash of each component, keyed on the component
+                decorated name.
+
+        """
+
+        return dict(self._componentBuildHashes)
+
+    def _getBuildDataHash(self, data):
+        """Gets the content hash of build data.
+
+        The hash of component data also covers the file defining the
+        component class, so editing the component code changes the hash.
+
+        Args:
+            data (object): Build data to hash.
+
+        Returns:
+            str: The hex digest of the data.
+
+        """
+
+        hashObj = hashlib.md5(json.dumps(prepareToSave(data), sort_keys=True, default=str))
+
+        if isinstance(data, dict) and 'class' in data:
+            krakenSystem = KrakenSystem.getInstance()
+            try:
+                moduleFile = krakenSystem.getComponentModuleFile(data['class'])
+                moduleStat = os.stat(moduleFile)
+            except (AttributeError, KeyError, OSError, TypeError):
+                pass
+            else:
+                hashObj.update("%s:%d:%d" % (moduleFile, moduleStat.st_mtime,
+                                             moduleStat.st_size))
+
+        return hashObj.hexdigest()
 
     # ==========
     # Meta Data
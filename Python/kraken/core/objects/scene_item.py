@@ -5,14 +5,19 @@ SceneItem - Base SceneItem Object.
 
 """
 
+from kraken.core.evaluation_cache import EvaluationCache
+
 
 class SceneItem(object):
     """Kraken base object type for any 3D object."""
 
     __maxId = 0
+    __typeHierarchies = {}
+    __hierarchyVersion = 0
 
     def __init__(self, name, parent=None):
         super(SceneItem, self).__init__()
+        self._pathCache = None
         self._parent = parent
         self._name = name
         self._component = None
@@ -43,49 +48,88 @@ class SceneItem(object):
 
         return self.__class__.__name__
 
+    @classmethod
+    def getClassTypeHierarchyNames(cls, objectType=None):
+        """Returns the class names in the hierarchy of a class, from the class
+        itself up to SceneItem. Hierarchies are cached per class.
+
+        Args:
+            objectType (type): Class to get the hierarchy of, defaults to the
+                class this method is called on.
+
+        Returns:
+            tuple: The class names, in method resolution order.
+
+        """
+
+        if objectType is None:
+            objectType = cls
+
+        hierarchy = SceneItem.__typeHierarchies.get(objectType, None)
+        if hierarchy is None:
+            typeNames = []
+            for hierarchyCls in type.mro(objectType):
+                if hierarchyCls == object:
+                    break
+                typeNames.append(hierarchyCls.__name__)
+
+            hierarchy = (tuple(typeNames), frozenset(typeNames))
+            SceneItem.__typeHierarchies[objectType] = hierarchy
+
+        return hierarchy[0]
+
     def getTypeHierarchyNames(self):
-        """Returns the class name of this object.
+        """Returns the class names in the hierarchy of this object.
 
         Returns:
-            bool: True if successful.
+            list: The class names, from the class of this object up to
+                SceneItem.
 
         """
 
-        khierarchy = []
-        for cls in type.mro(type(self)):
-            if cls == object:
-                break
-            khierarchy.append(cls.__name__)
+        return list(self.getClassTypeHierarchyNames(type(self)))
+
+    def __getTypeNameSet(self):
+        """Returns the cached set of the class names in the hierarchy of this
+        object.
+
+        Returns:
+            frozenset: The class names.
 
-        return khierarchy
+        """
+
+        hierarchy = SceneItem.__typeHierarchies.get(type(self), None)
+        if hierarchy is None:
+            self.getClassTypeHierarchyNames(type(self))
+            hierarchy = SceneItem.__typeHierarchies[type(self)]
+
+        return hierarchy[1]
 
     def isTypeOf(self, typeName):
-        """Returns the class name of this object.
+        """Returns whether this object is of the given type, or derived from it.
+
+        Args:
+            typeName (str): Name of the type to test.
 
         Returns:
             bool: True if the scene item is of the given type.
 
         """
 
-        for cls in type.mro(type(self)):
-            if cls.__name__ == typeName:
-                return True
-
-        return False
+        return typeName in self.__getTypeNameSet()
 
     def isOfAnyType(self, typeNames):
         """Returns true if this item has any of the given type names
 
+        Args:
+            typeNames (list): Names of the types to test.
+
         Returns:
             bool: True if the scene item is of the given type.
 
         """
 
-        for typeName in typeNames:
-            if self.isTypeOf(typeName):
-                return True
-
-        return False
+        return not self.__getTypeNameSet().isdisjoint(typeNames)
 
     # =============
     # Name methods
@@ -112,6 +156,7 @@ class SceneItem(object):
         """
 
         self._name = name
+        SceneItem.invalidatePaths()
 
         return True
 
@@ -123,10 +168,7 @@ class SceneItem(object):
 
         """
 
-        if self.getParent() is not None:
-            return self.getParent().getPath() + '.' + self.getName()
-
-        return self.getName()
+        return self.__getCachedPath(1)
 
     def getNameDecoration(self):
         """Gets the decorated name of the object.
@@ -156,11 +198,69 @@ class SceneItem(object):
 
         """
 
-        if self.getParent() is not None:
-            return self.getParent().getDecoratedPath() + '.' + \
-                self.getDecoratedName()
+        return self.__getCachedPath(2)
+
+    def __getCachedPath(self, index):
+        """Returns a cached path of this object, building the paths that are
+        out of date from the closest ancestor with a valid one.
+
+        Args:
+            index (int): 1 for the path, 2 for the decorated path.
+
+        Returns:
+            str: The path of the object.
+
+        """
+
+        version = SceneItem.__hierarchyVersion
+
+        # Walk up to the closest ancestor with a valid path.
+        path = None
+        items = []
+        item = self
+        while item is not None:
+            cache = item._pathCache
+            if cache is not None and cache[0] == version and \
+                    cache[index] is not None:
+                path = cache[index]
+                break
+
+            items.append(item)
+            item = item.getParent()
+
+        for item in reversed(items):
+            if index == 1:
+                name = item.getName()
+            else:
+                name = item.getDecoratedName()
+
+            if path is None:
+                path = name
+            else:
+                path = path + '.' + name
+
+            cache = item._pathCache
+            if cache is None or cache[0] != version:
+                cache = [version, None, None]
+                item._pathCache = cache
+
+            cache[index] = path
+
+        return path
+
+    @classmethod
+    def invalidatePaths(cls):
+        """Invalidates the cached paths of all the scene items.
+
+        Paths are cached against a hierarchy version which is incremented
+        whenever the name, parent or component of an item changes. The names
+        of some items depend on other items than their ancestors, e.g. a
+        ComponentGroup is named after its component, so the whole hierarchy
+        is versioned rather than each sub-tree.
+
+        """
 
-        return self.getDecoratedName()
+        SceneItem.__hierarchyVersion += 1
 
     # ===============
     # Parent Methods
@@ -189,6 +289,7 @@ class SceneItem(object):
         self.removeSource(self._parent)
         self._parent = parent
         self.addSource(parent)
+        SceneItem.invalidatePaths()
 
         return True
 
@@ -237,6 +338,7 @@ class SceneItem(object):
                 return False
 
         self._sources.append(source)
+        EvaluationCache.getInstance().invalidate(self)
 
         return True
 
@@ -253,6 +355,7 @@ class SceneItem(object):
             return False
 
         self._sources[:] = [s for s in self._sources if s != source]
+        EvaluationCache.getInstance().invalidate(self)
 
 
     def setSource(self, index, source):
@@ -265,6 +368,7 @@ class SceneItem(object):
         """
 
         self._sources[index] = source
+        EvaluationCache.getInstance().invalidate(self)
 
         return True
 
@@ -293,5 +397,6 @@ class SceneItem(object):
         """
 
         self._component = component
+        SceneItem.invalidatePaths()
 
         return True
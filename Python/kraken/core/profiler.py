@@ -3,18 +3,39 @@
 Classes:
 Profiler - Profiler Object.
 
+Functions:
+profiled - Decorator profiling the calls of a function.
+
 """
 
+import json
 import time
+import functools
 import operator
+from timeit import default_timer
+
+
+# Monotonic high resolution clock where the platform has one: perf_counter on
+# Python 3 and the performance counter on Windows.
+getTime = getattr(time, 'perf_counter', default_timer)
+
+
+def _ignore(*args):
+    """Replaces push and pop while the profiler is disabled."""
+
+    pass
 
 
 class _ProfilerItem(object):
+    """A single call, recorded in the 'calls' mode."""
+
+    __slots__ = ('label', 'start', 'end', 'children')
+
 
     def __init__(self, label):
         super(_ProfilerItem, self).__init__()
 
-        t = time.time()
+        t = getTime()
         self.label = label
         self.start = t
         self.end = t
@@ -25,28 +46,188 @@ class _ProfilerItem(object):
         self.children.append(item)
 
 
-    def endProfiling(self):
-        self.end = time.time()
+class _ProfilerNode(object):
+    """The calls of a label path, aggregated in place."""
+
+    __slots__ = ('label', 'children', 'count', 'total', 'childTotal',
+                 'minimum', 'maximum', 'start')
+
+
+    def __init__(self, label):
+        super(_ProfilerNode, self).__init__()
+
+        self.label = label
+        self.children = {}
+        self.count = 0
+        self.total = 0.0
+        self.childTotal = 0.0
+        self.minimum = None
+        self.maximum = None
+        self.start = None
+
+
+    def addCall(self, duration):
+        self.count += 1
+        self.total += duration
+
+        if self.minimum is None or duration < self.minimum:
+            self.minimum = duration
+
+        if self.maximum is None or duration > self.maximum:
+            self.maximum = duration
+
+
+class _ProfilerBracket(object):
+    """Context manager pushing a label on enter and popping it on exit."""
+
+    __slots__ = ('profiler', 'label')
+
+
+    def __init__(self, profiler, label):
+        super(_ProfilerBracket, self).__init__()
+
+        self.profiler = profiler
+        self.label = label
+
+
+    def __enter__(self):
+        self.profiler.push(self.label)
+
+        return self
+
+
+    def __exit__(self, excType, excValue, tb):
+        self.profiler.pop()
+
+        return False
+
+
+class _NullBracket(object):
+    """Context manager doing nothing, used while the profiler is disabled."""
+
+    __slots__ = ()
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, excType, excValue, tb):
+        return False
+
+
+_nullBracket = _NullBracket()
 
 
 class Profiler(object):
-    """Kraken profiler object for debugging performance issues."""
+    """Kraken profiler object for debugging performance issues.
+
+    In the 'calls' mode each push records a new item so the report lists every
+    call. In the 'aggregate' mode the calls are summed in place per label path
+    (count, total, self, min and max times), which keeps the memory use of
+    large builds constant.
+
+    While disabled, push and pop are replaced by a function doing nothing.
+
+    """
+
+    MODE_CALLS = 'calls'
+    MODE_AGGREGATE = 'aggregate'
 
     __instance = None
 
 
-    def __init__(self):
+    def __init__(self, mode=MODE_CALLS):
         super(Profiler, self).__init__()
+
+        if mode not in (self.MODE_CALLS, self.MODE_AGGREGATE):
+            raise ValueError("Invalid profiler mode: " + str(mode))
+
+        self.__mode = mode
+        self.__enabled = True
         self.reset()
 
 
     def reset(self):
         """Resets the profiler for generating a new report"""
 
+        self.__origin = getTime()
         self.__roots = []
+        self.__rootNode = _ProfilerNode(None)
         self.__stack = []
 
 
+    # ======================
+    # Mode and State Methods
+    # ======================
+    def getMode(self):
+        """Returns the profiling mode.
+
+        Returns:
+            str: 'calls' or 'aggregate'.
+
+        """
+
+        return self.__mode
+
+
+    def setMode(self, mode):
+        """Sets the profiling mode, resetting the profiler.
+
+        Args:
+            mode (str): 'calls' to record each call, 'aggregate' to sum the
+                calls per label path.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        if mode not in (self.MODE_CALLS, self.MODE_AGGREGATE):
+            raise ValueError("Invalid profiler mode: " + str(mode))
+
+        self.__checkClosed()
+
+        self.__mode = mode
+        self.reset()
+
+        return True
+
+
+    def isEnabled(self):
+        """Returns whether the profiler records the brackets.
+
+        Returns:
+            bool: True if the profiler is enabled.
+
+        """
+
+        return self.__enabled
+
+
+    def enable(self):
+        """Enables the profiler."""
+
+        if 'push' in self.__dict__:
+            del self.push
+            del self.pop
+
+        self.__enabled = True
+
+
+    def disable(self):
+        """Disables the profiler, must be called outside of any bracket."""
+
+        self.__checkClosed()
+
+        self.push = _ignore
+        self.pop = _ignore
+        self.__enabled = False
+
+
+    # ================
+    # Bracket Methods
+    # ================
     def push(self, label):
 
         """Adds a new child to the profiling tree and activates it.
@@ -56,72 +237,253 @@ class Profiler(object):
 
         """
 
+        stack = self.__stack
+
+        if self.__mode == self.MODE_AGGREGATE:
+            if len(stack) == 0:
+                parent = self.__rootNode
+            else:
+                parent = stack[-1]
+
+            node = parent.children.get(label, None)
+            if node is None:
+                node = _ProfilerNode(label)
+                parent.children[label] = node
+
+            stack.append(node)
+            node.start = getTime()
+
+            return
+
         item = _ProfilerItem(label)
-        if len(self.__stack) == 0:
+        if len(stack) == 0:
             self.__roots.append(item)
         else:
-            self.__stack[-1].addChild(item)
+            stack[-1].addChild(item)
 
-        self.__stack.append(item)
+        stack.append(item)
 
 
     def pop(self):
         """Deactivates the current item in the tree and returns the profiler to
         the parent item"""
 
-        if len(self.__stack) == 0:
+        end = getTime()
+        stack = self.__stack
+
+        if len(stack) == 0:
             raise Exception("""Unable to close bracket. Pop has been called more """ +
                             """times than push.""")
 
-        self.__stack[-1].endProfiling()
-        self.__stack.pop()
+        if self.__mode == self.MODE_AGGREGATE:
+            node = stack.pop()
+            duration = end - node.start
+            node.addCall(duration)
 
+            if len(stack) > 0:
+                stack[-1].childTotal += duration
+            else:
+                self.__rootNode.childTotal += duration
 
-    def generateReport(self, listFunctionTotals=False):
-        """Returns a report string containing all the data gathered turing
-        profiling.
+            return
+
+        stack[-1].end = end
+        stack.pop()
+
+
+    def profile(self, label):
+        """Returns a context manager profiling its block under a label.
 
         Args:
-            listFunctionTotals (bool): list information relating to the total time spent in each function.
+            label (str): The label of the block.
 
         Returns:
-            str: The profiler report.
+            object: The context manager.
 
         """
 
+        if not self.__enabled:
+            return _nullBracket
+
+        return _ProfilerBracket(self, label)
+
+
+    # ================
+    # Result Methods
+    # ================
+    def __checkClosed(self):
+        """Raises an exception if brackets are still open."""
+
         if len(self.__stack) != 0:
             raise Exception("""Profiler brackets not closed properly. """ +
                             """Pop must be called for every call to push. Pop """ +
                             """needs to be called another """ +
                             str(len(self.__stack)) + """ times""")
 
+
+    def __getAggregateTree(self):
+        """Returns the root of the calls aggregated per label path.
+
+        Returns:
+            _ProfilerNode: Root node, its children are the top level labels.
+
+        """
+
+        if self.__mode == self.MODE_AGGREGATE:
+            return self.__rootNode
+
+        rootNode = _ProfilerNode(None)
+
+        items = [(x, rootNode) for x in reversed(self.__roots)]
+        while len(items) > 0:
+            item, parent = items.pop()
+
+            node = parent.children.get(item.label, None)
+            if node is None:
+                node = _ProfilerNode(item.label)
+                parent.children[item.label] = node
+
+            duration = item.end - item.start
+            node.addCall(duration)
+            parent.childTotal += duration
+
+            items.extend([(x, node) for x in reversed(item.children)])
+
+        return rootNode
+
+
+    def __iterNodes(self):
+        """Iterates over the aggregated nodes, depth first.
+
+        Yields:
+            tuple: The label path and the node.
+
+        """
+
+        rootNode = self.__getAggregateTree()
+
+        nodes = [((x.label, ), x) for x in self.__sortedChildren(rootNode)]
+        while len(nodes) > 0:
+            path, node = nodes.pop()
+            yield path, node
+
+            nodes.extend([(path + (x.label, ), x) for x in self.__sortedChildren(node)])
+
+
+    def __sortedChildren(self, node):
+        """Returns the children of a node to push on the traversal stack, the
+        longest last so it is visited first."""
+
+        return sorted(node.children.itervalues(), key=lambda x: (x.total, x.label))
+
+
+    def getTotals(self):
+        """Returns the total time spent under each label of the closed items.
+
+        Items nested under an item with the same label, like recursive calls,
+        are already part of its time and are not counted again.
+
+        Returns:
+            dict: The total duration of each label, in seconds.
+
+        """
+
+        totals = {}
+
+        items = [(x, ()) for x in self.__roots]
+        while len(items) > 0:
+            item, labels = items.pop()
+            if item in self.__stack:
+                items.extend([(x, labels) for x in item.children])
+                continue
+
+            if item.label not in labels:
+                totals[item.label] = totals.get(item.label, 0.0) + item.end - item.start
+
+            labels = labels + (item.label, )
+            items.extend([(x, labels) for x in item.children])
+
+        if self.__mode == self.MODE_AGGREGATE:
+            for path, node in self.__iterNodes():
+                if node.label not in path[:-1]:
+                    totals[node.label] = totals.get(node.label, 0.0) + node.total
+
+        return totals
+
+
+    def getStats(self):
+        """Returns the statistics of each label path.
+
+        Returns:
+            list: A dictionary with the 'path', 'count', 'total', 'self', 'min'
+                and 'max' times of each label path, depth first with the
+                longest paths first.
+
+        """
+
+        self.__checkClosed()
+
+        stats = []
+        for path, node in self.__iterNodes():
+            stats.append({
+                'path': path,
+                'count': node.count,
+                'total': node.total,
+                'self': node.total - node.childTotal,
+                'min': node.minimum,
+                'max': node.maximum
+            })
+
+        return stats
+
+
+    def generateReport(self, listFunctionTotals=False):
+        """Returns a report string containing all the data gathered turing
+        profiling.
+
+        Args:
+            listFunctionTotals (bool): list information relating to the total time spent in each function.
+
+        Returns:
+            str: The profiler report.
+
+        """
+
+        self.__checkClosed()
+
         report = []
         report.append("--callstack--")
 
         functions = {}
 
-        def reportItem(item, indent):
-            duration = item.end - item.start
-            report.append(indent + item.label + ' duration: ' + str(duration))
-            if item.label not in functions:
-                functions[item.label] = duration
-            else:
-                functions[item.label] += duration
+        if self.__mode == self.MODE_AGGREGATE:
+            for stat in self.getStats():
+                label = stat['path'][-1]
+                report.append('  ' * len(stat['path']) + label +
+                              ' count: ' + str(stat['count']) +
+                              ' total: ' + str(stat['total']) +
+                              ' self: ' + str(stat['self']) +
+                              ' min: ' + str(stat['min']) +
+                              ' max: ' + str(stat['max']))
+
+                functions[label] = functions.get(label, 0.0) + stat['total']
+
+        else:
+            items = [(x, '  ') for x in reversed(self.__roots)]
+            while len(items) > 0:
+                item, indent = items.pop()
 
-            for childItem in item.children:
-                reportItem(childItem, indent + '  ')
+                duration = item.end - item.start
+                report.append(indent + item.label + ' duration: ' + str(duration))
+                functions[item.label] = functions.get(item.label, 0.0) + duration
 
-        for rootItem in self.__roots:
-            reportItem(rootItem, '  ')
+                items.extend([(x, indent + '  ') for x in reversed(item.children)])
 
         if listFunctionTotals:
             report.append("--functions--")
 
-            def reverse_numeric(x, y):
-                return y < x
-
             sorted_fns = sorted(functions.items(), key=operator.itemgetter(1),
-                                cmp=reverse_numeric)
+                                reverse=True)
 
             for fn_tuple in sorted_fns:
                 report.append(str(fn_tuple[1]) + ': ' + fn_tuple[0])
@@ -129,6 +491,136 @@ class Profiler(object):
         return '\n'.join(report)
 
 
+    # ================
+    # Export Methods
+    # ================
+    def getChromeTraceEvents(self):
+        """Returns the profiled brackets as Chrome trace events.
+
+        In the 'calls' mode each call is an event at the time it happened. In
+        the 'aggregate' mode each label path is an event lasting its total
+        time, placed after its previous sibling within its parent.
+
+        Returns:
+            list: The complete ('X') events, times are in microseconds.
+
+        """
+
+        self.__checkClosed()
+
+        events = []
+
+        if self.__mode == self.MODE_AGGREGATE:
+
+            # Place the children one after the other within their parent, the
+            # longest first.
+            def placeChildren(node, start):
+                placed = []
+                for child in reversed(self.__sortedChildren(node)):
+                    placed.append((child, start))
+                    start += child.total
+
+                nodes.extend(reversed(placed))
+
+            nodes = []
+            placeChildren(self.__rootNode, 0.0)
+            while len(nodes) > 0:
+                node, start = nodes.pop()
+
+                events.append({
+                    'name': node.label,
+                    'ph': 'X',
+                    'ts': start * 1000000.0,
+                    'dur': node.total * 1000000.0,
+                    'pid': 0,
+                    'tid': 0,
+                    'args': {
+                        'count': node.count,
+                        'self': node.total - node.childTotal,
+                        'min': node.minimum,
+                        'max': node.maximum
+                    }
+                })
+
+                placeChildren(node, start)
+
+            return events
+
+        items = list(reversed(self.__roots))
+        while len(items) > 0:
+            item = items.pop()
+            events.append({
+                'name': item.label,
+                'ph': 'X',
+                'ts': (item.start - self.__origin) * 1000000.0,
+                'dur': (item.end - item.start) * 1000000.0,
+                'pid': 0,
+                'tid': 0
+            })
+
+            items.extend(reversed(item.children))
+
+        return events
+
+
+    def exportChromeTrace(self, filepath):
+        """Writes the profiled brackets as a Chrome trace event file, which
+        can be opened in chrome://tracing.
+
+        Args:
+            filepath (str): Path of the JSON file to write.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        data = {
+            'traceEvents': self.getChromeTraceEvents(),
+            'displayTimeUnit': 'ms'
+        }
+
+        with open(filepath, 'w') as traceFile:
+            traceFile.write(json.dumps(data))
+
+        return True
+
+
+    def getCollapsedStacks(self):
+        """Returns the profiled brackets in the collapsed stack format read by
+        flame graph tools.
+
+        Returns:
+            list: A 'label;label;label selfTime' line for each label path, the
+                self times are in whole microseconds.
+
+        """
+
+        lines = []
+        for stat in self.getStats():
+            frames = [x.replace(';', ':') for x in stat['path']]
+            lines.append(';'.join(frames) + ' ' + str(int(round(stat['self'] * 1000000.0))))
+
+        return lines
+
+
+    def exportCollapsedStacks(self, filepath):
+        """Writes the profiled brackets in the collapsed stack format.
+
+        Args:
+            filepath (str): Path of the file to write.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        with open(filepath, 'w') as stacksFile:
+            stacksFile.write('\n'.join(self.getCollapsedStacks()) + '\n')
+
+        return True
+
+
     @classmethod
     def getInstance(cls):
         """This class method returns the singleton instance for the Profiler
@@ -142,3 +634,37 @@ class Profiler(object):
             cls.__instance = Profiler()
 
         return cls.__instance
+
+
+def profiled(label=None):
+    """Decorator profiling each call of a function with the Profiler instance.
+
+    Args:
+        label (str): The label of the calls, defaults to the module and name of
+            the function.
+
+    Returns:
+        function: The decorator.
+
+    """
+
+    def decorator(fn):
+        fnLabel = label
+        if fnLabel is None:
+            fnLabel = fn.__module__ + '.' + fn.__name__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            profiler = Profiler.getInstance()
+            if not profiler.isEnabled():
+                return fn(*args, **kwargs)
+
+            profiler.push(fnLabel)
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                profiler.pop()
+
+        return wrapper
+
+    return decorator
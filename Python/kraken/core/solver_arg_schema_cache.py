@@ -0,0 +1,272 @@
+"""Kraken - core.solver_arg_schema_cache module.
+
+Classes:
+SolverArgSchemaCache - Persistent registry of the arguments of the KL solvers.
+
+"""
+
+import os
+import json
+import hashlib
+
+from kraken.log import getLogger
+
+logger = getLogger('kraken')
+
+
+class SolverArgSchemaCache(object):
+    """Persistent registry of the argument schemas of the KL solver types.
+
+    Entries are keyed on the extension and solver type names and are valid as
+    long as the KL sources of the extension are unchanged. Operators reading
+    their schema from a valid entry don't need to boot the Fabric core.
+
+    The cache file defaults to ~/.kraken/solverArgSchemaCache.json and can be
+    set with the 'KRAKEN_SOLVER_CACHE' environment variable. Setting the
+    variable to an empty string disables the cache.
+
+    """
+
+    version = 1
+
+    __instance = None
+
+
+    def __init__(self, filepath=None):
+        super(SolverArgSchemaCache, self).__init__()
+
+        if filepath is None:
+            filepath = os.environ.get('KRAKEN_SOLVER_CACHE', None)
+            if filepath is None:
+                filepath = os.path.join(os.path.expanduser('~'), '.kraken',
+                                        'solverArgSchemaCache.json')
+
+        self._filepath = filepath
+        self._entries = None
+        self._signatures = {}
+
+
+    def isEnabled(self):
+        """Returns whether the cache has a file to persist its entries to.
+
+        Returns:
+            bool: True if the cache is enabled.
+
+        """
+
+        return bool(self._filepath)
+
+
+    def load(self):
+        """Loads the cached entries from the cache file.
+
+        Returns:
+            bool: True if entries were loaded.
+
+        """
+
+        self._entries = {}
+
+        if not self.isEnabled() or not os.path.exists(self._filepath):
+            return False
+
+        try:
+            with open(self._filepath) as cacheFile:
+                data = json.load(cacheFile)
+        except (IOError, ValueError):
+            logger.warning("Unable to read solver argument cache: %s",
+                           self._filepath)
+            return False
+
+        if data.get('version', None) != self.version:
+            return False
+
+        self._entries = data.get('solvers', {})
+
+        return True
+
+
+    def save(self):
+        """Writes the entries to the cache file.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        if not self.isEnabled() or self._entries is None:
+            return False
+
+        data = {
+            'version': self.version,
+            'solvers': self._entries
+        }
+
+        try:
+            cacheDir = os.path.dirname(self._filepath)
+            if cacheDir and not os.path.exists(cacheDir):
+                os.makedirs(cacheDir)
+
+            with open(self._filepath, 'w') as cacheFile:
+                cacheFile.write(json.dumps(data, indent=2, sort_keys=True))
+        except (IOError, OSError):
+            logger.warning("Unable to write solver argument cache: %s",
+                           self._filepath)
+            return False
+
+        return True
+
+
+    def getExtensionSignature(self, extension):
+        """Returns the signature of the KL sources of an extension.
+
+        The extension folder is looked up in the 'FABRIC_EXTS_PATH' paths and
+        the signature is computed once per process.
+
+        Args:
+            extension (str): Name of the extension.
+
+        Returns:
+            str: Hash of the paths, sizes and modification times of the
+                sources, None if the extension is not found.
+
+        """
+
+        if extension in self._signatures:
+            return self._signatures[extension]
+
+        extsPaths = os.environ.get('FABRIC_EXTS_PATH', '').split(os.pathsep)
+        krakenPath = os.environ.get('KRAKEN_PATH', None)
+        if krakenPath is not None:
+            extsPaths.append(os.path.join(krakenPath, 'Exts'))
+
+        sources = []
+        for extsPath in extsPaths:
+            if not extsPath or not os.path.isdir(extsPath):
+                continue
+
+            extensionDir = os.path.join(extsPath, extension)
+            if os.path.isfile(os.path.join(extensionDir, extension + '.fpm.json')):
+                for root, dirs, files in os.walk(extensionDir):
+                    for filename in files:
+                        if filename.endswith('.kl') or filename.endswith('.fpm.json'):
+                            sources.append(os.path.join(root, filename))
+
+            if len(sources) > 0:
+                break
+
+        signature = None
+        if len(sources) > 0:
+            hashSource = []
+            for source in sorted(sources):
+                stat = os.stat(source)
+                hashSource.append((source, stat.st_size, stat.st_mtime))
+
+            signature = hashlib.md5(json.dumps(hashSource)).hexdigest()
+
+        self._signatures[extension] = signature
+
+        return signature
+
+
+    def __getKey(self, extension, solverTypeName):
+        """Returns the key of the entry of a solver type and its signature.
+
+        Args:
+            extension (str): Name of the extension defining the solver.
+            solverTypeName (str): Name of the solver type.
+
+        Returns:
+            tuple: The key and signature, the signature is None if the sources
+                of the extensions can't be found.
+
+        """
+
+        key = extension + ':' + solverTypeName
+
+        signatures = []
+        for ext in set(['Kraken', extension]):
+            signature = self.getExtensionSignature(ext)
+            if signature is None:
+                return key, None
+
+            signatures.append(ext + ':' + signature)
+
+        return key, ';'.join(sorted(signatures))
+
+
+    def getSchema(self, extension, solverTypeName):
+        """Returns the cached argument schema of a solver type if it is still
+        valid.
+
+        Args:
+            extension (str): Name of the extension defining the solver.
+            solverTypeName (str): Name of the solver type.
+
+        Returns:
+            tuple: (name, dataType, connectionType) tuple for each argument,
+                None if there is no valid entry.
+
+        """
+
+        if not self.isEnabled():
+            return None
+
+        if self._entries is None:
+            self.load()
+
+        key, signature = self.__getKey(extension, solverTypeName)
+        entry = self._entries.get(key, None)
+        if signature is None or entry is None or entry['signature'] != signature:
+            return None
+
+        return tuple([tuple([str(y) for y in x]) for x in entry['args']])
+
+
+    def setSchema(self, extension, solverTypeName, schema):
+        """Stores the argument schema of a solver type and writes the cache
+        file.
+
+        Args:
+            extension (str): Name of the extension defining the solver.
+            solverTypeName (str): Name of the solver type.
+            schema (tuple): (name, dataType, connectionType) tuple for each
+                argument.
+
+        Returns:
+            bool: True if the schema was stored.
+
+        """
+
+        if not self.isEnabled():
+            return False
+
+        if self._entries is None:
+            self.load()
+
+        key, signature = self.__getKey(extension, solverTypeName)
+        if signature is None:
+            return False
+
+        self._entries[key] = {
+            'signature': signature,
+            'args': [list(x) for x in schema]
+        }
+
+        return self.save()
+
+
+    @classmethod
+    def getInstance(cls):
+        """This class method returns the singleton instance for the
+        SolverArgSchemaCache.
+
+        Returns:
+            object: The singleton solver argument schema cache instance.
+
+        """
+
+        if cls.__instance is None:
+            cls.__instance = SolverArgSchemaCache()
+
+        return cls.__instance
@@ -1,5 +1,9 @@
 
 
+from kraken.core.maths import Vec3, Vec4, Xfo, Mat44
+from kraken.core.maths.xfo_array import Mat44Array, isNumpyAvailable
+
+
 class Synchronizer(object):
     """The Synchronizer is a singleton object used to synchronize data between
     Kraken objects and the DCC objects."""
@@ -16,7 +20,10 @@ class Synchronizer(object):
 
         super(Synchronizer, self).__init__()
         self._hrcMap = {}
+        self._syncItems = {'xfos': [], 'curves': [], 'attributes': []}
+        self._syncedValues = {}
         self._target = None
+        self._builder = None
 
         if target is not None:
             self.setTarget(target)
@@ -56,6 +63,39 @@ class Synchronizer(object):
         return True
 
 
+    def getBuilder(self):
+        """Gets the builder used to resolve the DCC items.
+
+        Returns:
+            object: The builder, None if the DCC items are resolved by path.
+
+        """
+
+        return self._builder
+
+
+    def setBuilder(self, builder):
+        """Sets the builder whose recorded pairings are used to resolve the DCC
+        items of the target hierarchy. Objects which were not built by it are
+        resolved by path.
+
+        Args:
+            builder (object): Builder that built the target.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        self._builder = builder
+
+        if self.getTarget() is not None:
+            self.clearHierarchyMap()
+            self.createHierarchyMap(self.getTarget())
+
+        return True
+
+
     # ======================
     # Hierarchy Map Methods
     # ======================
@@ -71,40 +111,72 @@ class Synchronizer(object):
 
 
     def createHierarchyMap(self, kObject):
+        """Maps the objects of a hierarchy to their DCC items.
+
+        The DCC items of all the objects are resolved in one pass, see
+        getDCCItems. The objects are also sorted by the kind of data
+        synchronized for them.
+
+        Args:
+            kObject (object): Top object of the hierarchy to map.
+
+        """
 
         # ==============
         # Map Hierarchy
         # ==============
-
-        # Skip components in the mapping as they are not built into the DCC
-        if kObject.isTypeOf('Component') is False:
-            dccItem = self.getDCCItem(kObject)
-
-            self._hrcMap[kObject] = {
+        kObjects = []
+        syncItems = {'xfos': [], 'curves': [], 'attributes': []}
+
+        # Items are (object, synchronized) tuples, the attributes of the
+        # implicit attribute groups are mapped but not synchronized.
+        pending = [(kObject, True)]
+        while len(pending) > 0:
+            item, synchronized = pending.pop()
+
+            # Skip components in the mapping as they are not built into the DCC
+            isComponent = item.isTypeOf('Component')
+            if isComponent is False:
+                kObjects.append(item)
+
+            # =======================
+            # Iterate over hierarchy
+            # =======================
+            subItems = []
+            if item.isTypeOf('Object3D'):
+                if synchronized and not isComponent:
+                    syncItems['xfos'].append(item)
+                    if item.isTypeOf('Curve') is True:
+                        syncItems['curves'].append(item)
+
+                # Iterate over attribute groups
+                for i in xrange(item.getNumAttributeGroups()):
+                    subItems.append((item.getAttributeGroupByIndex(i), synchronized))
+
+                # Iterate over children
+                for i in xrange(item.getNumChildren()):
+                    subItems.append((item.getChildByIndex(i), synchronized))
+
+            elif item.isTypeOf('AttributeGroup'):
+                # Iterate over attributes
+                syncAttributes = synchronized and item.getName() != 'implicitAttrGrp'
+                for i in xrange(item.getNumAttributes()):
+                    subItems.append((item.getAttributeByIndex(i), syncAttributes))
+
+            elif item.isTypeOf('Attribute'):
+                if synchronized:
+                    syncItems['attributes'].append(item)
+
+            pending.extend(reversed(subItems))
+
+        dccItems = self.getDCCItems(kObjects)
+        for item, dccItem in zip(kObjects, dccItems):
+            self._hrcMap[item] = {
                            "dccItem": dccItem
                           }
 
-        # =======================
-        # Iterate over hierarchy
-        # =======================
-        if kObject.isTypeOf('Object3D'):
-            # Iterate over attribute groups
-            for i in xrange(kObject.getNumAttributeGroups()):
-                attrGrp = kObject.getAttributeGroupByIndex(i)
-                self.createHierarchyMap(attrGrp)
-
-        # Iterate over attributes
-        if kObject.isTypeOf('AttributeGroup'):
-            for i in xrange(kObject.getNumAttributes()):
-                attr = kObject.getAttributeByIndex(i)
-                self.createHierarchyMap(attr)
-
-        if kObject.isTypeOf('Object3D'):
-
-            # Iterate over children
-            for i in xrange(kObject.getNumChildren()):
-                child = kObject.getChildByIndex(i)
-                self.createHierarchyMap(child)
+        for key in syncItems:
+            self._syncItems[key] += syncItems[key]
 
         return
 
@@ -118,6 +190,8 @@ class Synchronizer(object):
         """
 
         self._hrcMap = {}
+        self._syncItems = {'xfos': [], 'curves': [], 'attributes': []}
+        self._syncedValues = {}
 
         return True
 
@@ -128,12 +202,28 @@ class Synchronizer(object):
     def sync(self):
         """Synchronizes the target hierarchy with the matching objects in the DCC.
 
+        The transforms are synchronized in bulk, see syncXfos.
+
         Returns:
             bool: True if successful.
 
         """
 
-        self.synchronize(self.getTarget())
+        target = self.getTarget()
+
+        # If the top-level rig DCC node does not exist, don't proceed through
+        # the hierarchy.
+        if target.isTypeOf('Rig') and \
+                self._hrcMap.get(target, {}).get('dccItem', None) is None:
+            return True
+
+        self.syncXfos(self._syncItems['xfos'])
+
+        for kObject in self._syncItems['curves']:
+            self.syncCurveData(kObject)
+
+        for kObject in self._syncItems['attributes']:
+            self.syncAttribute(kObject)
 
         return True
 
@@ -150,61 +240,220 @@ class Synchronizer(object):
 
         """
 
-        # =================
-        # Synchronize Data
-        # =================
-        if kObject.isTypeOf('Object3D'):
+        pending = [kObject]
+        while len(pending) > 0:
+            item = pending.pop()
 
-            # Sync Xfo if it's not a Component
-            if kObject.isTypeOf('Component') is False:
+            # =================
+            # Synchronize Data
+            # =================
+            if item.isTypeOf('Object3D'):
 
-                # If the top-level rig DCC node does not exist, don't proceed
-                # through the hierarchy.
-                if kObject.isTypeOf('Rig') and self.getDCCItem(kObject) is None:
-                    return False
+                # Sync Xfo if it's not a Component
+                if item.isTypeOf('Component') is False:
 
-                self.syncXfo(kObject)
+                    # If the top-level rig DCC node does not exist, don't
+                    # proceed through the hierarchy.
+                    if item.isTypeOf('Rig') and self.getDCCItem(item) is None:
+                        if item is kObject:
+                            return False
 
-            # Sync Curves / Controls
-            if kObject.isTypeOf('Curve') is True:
-                self.syncCurveData(kObject)
+                        continue
 
-        elif kObject.isTypeOf('Attribute'):
-            self.syncAttribute(kObject)
+                    self.syncXfo(item)
 
-        else:
-            pass
+                # Sync Curves / Controls
+                if item.isTypeOf('Curve') is True:
+                    self.syncCurveData(item)
+
+            elif item.isTypeOf('Attribute'):
+                self.syncAttribute(item)
 
-        # =======================
-        # Iterate over hierarchy
-        # =======================
-        if kObject.isTypeOf('Object3D'):
-            # Iterate over attribute groups
-            for i in xrange(kObject.getNumAttributeGroups()):
-                attrGrp = kObject.getAttributeGroupByIndex(i)
-                self.synchronize(attrGrp)
+            else:
+                pass
 
-        # Iterate over attributes
-        if kObject.isTypeOf('AttributeGroup'):
+            # =======================
+            # Iterate over hierarchy
+            # =======================
+            subItems = []
+            if item.isTypeOf('Object3D'):
+                # Iterate over attribute groups
+                for i in xrange(item.getNumAttributeGroups()):
+                    subItems.append(item.getAttributeGroupByIndex(i))
 
-            if kObject.getName() != 'implicitAttrGrp':
-                for i in xrange(kObject.getNumAttributes()):
-                    attr = kObject.getAttributeByIndex(i)
-                    self.synchronize(attr)
+            # Iterate over attributes
+            if item.isTypeOf('AttributeGroup'):
 
-        if kObject.isTypeOf('Object3D'):
+                if item.getName() != 'implicitAttrGrp':
+                    for i in xrange(item.getNumAttributes()):
+                        subItems.append(item.getAttributeByIndex(i))
 
-            # Iterate over children
-            for i in xrange(kObject.getNumChildren()):
-                child = kObject.getChildByIndex(i)
-                self.synchronize(child)
+            if item.isTypeOf('Object3D'):
+
+                # Iterate over children
+                for i in xrange(item.getNumChildren()):
+                    subItems.append(item.getChildByIndex(i))
+
+            pending.extend(reversed(subItems))
 
         return True
 
 
+    def syncXfos(self, kObjects):
+        """Syncs the xfos of objects from their DCC objects in bulk.
+
+        The world matrices of all the DCC objects are queried at once, see
+        getDCCWorldMatrices, and only the objects whose DCC matrix changed
+        since the last synchronization are written. Falls back to syncXfo
+        for each object when the DCC matrices can't be queried in bulk.
+
+        Args:
+            kObjects (list): Objects to sync the xfo for.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        syncObjects = []
+        dccItems = []
+        for kObject in kObjects:
+            dccItem = self._hrcMap.get(kObject, {}).get('dccItem', None)
+            if dccItem is None:
+                print "Warning Syncing. No DCC Item for :" + kObject.getPath()
+                continue
+
+            syncObjects.append(kObject)
+            dccItems.append(dccItem)
+
+        matrices = self.getDCCWorldMatrices(dccItems)
+        if matrices is None:
+            for kObject in syncObjects:
+                self.syncXfo(kObject)
+
+            return True
+
+        changedObjects = []
+        changedMatrices = []
+        for kObject, matrix in zip(syncObjects, matrices):
+            matrix = tuple(matrix)
+            syncedValue = self._syncedValues.get(kObject.getId(), None)
+            if syncedValue is not None and syncedValue[0] == matrix and \
+                    syncedValue[1] is kObject.xfo:
+                continue
+
+            changedObjects.append(kObject)
+            changedMatrices.append(matrix)
+
+        xfos = self.__matricesToXfos(changedMatrices)
+        for kObject, matrix, xfo in zip(changedObjects, changedMatrices, xfos):
+
+            # If flag is set, pass the DCC Scale values.
+            if kObject.testFlag('SYNC_SCALE') is not True:
+                xfo.sc = Vec3(1.0, 1.0, 1.0)
+
+            kObject.xfo = xfo
+            self._syncedValues[kObject.getId()] = (matrix, kObject.xfo)
+
+        return True
+
+
+    def __matricesToXfos(self, matrices):
+        """Converts packed world matrices to transforms.
+
+        The matrices are decomposed in bulk when NumPy is available.
+
+        Args:
+            matrices (list): 16 values of each matrix, rows first.
+
+        Returns:
+            list: The Xfo of each matrix.
+
+        """
+
+        if len(matrices) == 0:
+            return []
+
+        if isNumpyAvailable():
+            values = [(m[0:4], m[4:8], m[8:12], m[12:16]) for m in matrices]
+            return Mat44Array(values=values).toXfoArray().toXfos()
+
+        xfos = []
+        for m in matrices:
+            xfo = Xfo()
+            xfo.setFromMat44(Mat44(Vec4(*m[0:4]), Vec4(*m[4:8]),
+                                   Vec4(*m[8:12]), Vec4(*m[12:16])))
+            xfos.append(xfo)
+
+        return xfos
+
+
     # ============
     # DCC Methods
     # ============
+    def getDCCItems(self, kObjects):
+        """Gets the DCC Items of a list of objects.
+
+        The items are looked up in the pairings recorded by the builder when
+        one is set, the remaining ones are resolved with getDCCItem.
+
+        Args:
+            kObjects (list): The Kraken Python objects to get the DCC items of.
+
+        Returns:
+            list: The DCC item of each object, None for the objects that are
+                not found.
+
+        """
+
+        if self._builder is not None:
+            dccItems = self._builder.getDCCSceneItems(kObjects)
+        else:
+            dccItems = [None] * len(kObjects)
+
+        for i, dccItem in enumerate(dccItems):
+            if dccItem is None or not self.isDCCItemValid(dccItem):
+                dccItems[i] = self.getDCCItem(kObjects[i])
+
+        return dccItems
+
+
+    def isDCCItemValid(self, dccItem):
+        """Returns whether a DCC item recorded by the builder still exists.
+
+        **This should be re-implemented in the sub-classed synchronizer for each
+        plugin.**
+
+        Args:
+            dccItem (object): The DCC item.
+
+        Returns:
+            bool: True if the item can be synchronized from.
+
+        """
+
+        return True
+
+
+    def getDCCWorldMatrices(self, dccItems):
+        """Gets the world matrices of DCC items in one query.
+
+        **This should be re-implemented in the sub-classed synchronizer for each
+        plugin.**
+
+        Args:
+            dccItems (list): The DCC items to query.
+
+        Returns:
+            list: The 16 values of the world matrix of each item, in the Kraken
+                Mat44 layout (rows first, translation in the last column).
+                None if the DCC items can't be queried in bulk.
+
+        """
+
+        return None
+
+
     def getDCCItem(self, kObject):
         """Gets the DCC Item from the full decorated path.
 
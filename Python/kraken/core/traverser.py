@@ -5,12 +5,18 @@ Traverser - Base Traverser.
 
 """
 
+from kraken.log import getLogger
+
 from kraken.core.objects.scene_item import SceneItem
 from kraken.core.objects.object_3d import Object3D
 from kraken.core.objects.components.component import Component
 from kraken.core.objects.attributes.attribute_group import AttributeGroup
 from kraken.core.objects.constraints.constraint import Constraint
 from kraken.core.objects.operators.operator import Operator
+from kraken.core.objects.attributes.attribute import Attribute
+
+
+logger = getLogger('kraken')
 
 
 class Traverser(object):
@@ -21,10 +27,15 @@ class Traverser(object):
     order is then used by the builder to ensure that objects are created and
     evaluated in the correct order. Offset's will then be reliable.
 
+    The traversal is iterative so deep hierarchies don't hit the recursion
+    limit. Visited items are also sorted by build phase as they are collected,
+    and dependency cycles are reported with the path of items forming them.
+
     """
 
     def __init__(self, name='Traverser'):
         self._rootItems = []
+        self._rootItemIds = set()
         self.reset()
 
     # ==================
@@ -39,7 +50,7 @@ class Traverser(object):
 
         """
 
-        return self._xfo
+        return self._rootItems
 
     def addRootItem(self, item):
         """Adds a new root object to this Traverser
@@ -52,11 +63,11 @@ class Traverser(object):
 
         """
 
-        for rootItem in self._rootItems:
-            if rootItem.getId() == item.getId():
-                return False
+        if item.getId() in self._rootItemIds:
+            return False
 
         self._rootItems.append(item)
+        self._rootItemIds.add(item.getId())
 
         return True
 
@@ -87,6 +98,62 @@ class Traverser(object):
 
         return self._items
 
+    @property
+    def objects3d(self):
+        """Gets the traversed 3D objects of this Traverser.
+
+        Returns:
+            list: The traversed Object3D items, in traversal order.
+
+        """
+
+        return self._objects3d
+
+    @property
+    def attributeGroups(self):
+        """Gets the traversed attribute groups of this Traverser.
+
+        Returns:
+            list: The traversed AttributeGroup items, in traversal order.
+
+        """
+
+        return self._attributeGroups
+
+    @property
+    def attributes(self):
+        """Gets the traversed attributes of this Traverser.
+
+        Returns:
+            list: The traversed Attribute items, in traversal order.
+
+        """
+
+        return self._attributes
+
+    @property
+    def constraintsAndOperators(self):
+        """Gets the traversed constraints and operators of this Traverser.
+
+        Returns:
+            list: The traversed Constraint and Operator items, in traversal
+                order.
+
+        """
+
+        return self._constraintsAndOperators
+
+    def getCycles(self):
+        """Gets the dependency cycles found during the last traversal.
+
+        Returns:
+            list: A list of item paths, each starting and ending with the item
+                closing the cycle.
+
+        """
+
+        return self._cycles
+
     def getItemsOfType(self, typeNames):
         """Gets only the traversed items of a given type.
 
@@ -115,7 +182,14 @@ class Traverser(object):
         """Resets all internal structures of this Traverser."""
 
         self._visited = {}
+        self._visiting = set()
+        self._collected = set()
         self._items = []
+        self._objects3d = []
+        self._attributeGroups = []
+        self._attributes = []
+        self._constraintsAndOperators = []
+        self._cycles = []
 
     def traverse(self, itemCallback=None, discoverCallback=None,
                  discoveredItemsFirst=True):
@@ -143,11 +217,11 @@ class Traverser(object):
         return self.items
 
     def __collectVisitedItem(self, item, itemCallback):
-        """Doc String.
+        """Adds a visited item to the traversed items and its phase bucket.
 
         Args:
-            item (Type): information.
-            itemCallback (Type): information.
+            item (SceneItem): The visited item.
+            itemCallback (func): Callback invoked for the item.
 
         """
 
@@ -155,41 +229,125 @@ class Traverser(object):
             itemCallback(item=item, traverser=self)
 
         self._items.append(item)
+        self._collected.add(item.getId())
+
+        if isinstance(item, Object3D):
+            self._objects3d.append(item)
+        elif isinstance(item, AttributeGroup):
+            self._attributeGroups.append(item)
+        elif isinstance(item, Attribute):
+            self._attributes.append(item)
+        elif isinstance(item, (Constraint, Operator)):
+            self._constraintsAndOperators.append(item)
 
     def __visitItem(self, item, itemCallback, discoverCallback, discoveredItemsFirst):
-        """Doc String.
+        """Visits an item and everything it discovers, depth first.
+
+        Each visited item has a step generator on the stack which yields the
+        items to visit before it can continue, in place of recursive calls.
 
         Args:
-            item (Type): information.
-            itemCallback (Type): information.
-            discoverCallback (Type): information.
-            discoveredItemsFirst (Type): information.
+            item (SceneItem): The item to visit.
+            itemCallback (func): Callback invoked for each collected item.
+            discoverCallback (func): Callback returning the items discovered
+                from an item.
+            discoveredItemsFirst (bool): Whether items are collected after the
+                items they discover.
 
         Returns:
-            Type: information.
+            bool: True if the item was visited.
 
         """
 
-        if self._visited.get(item.getId(), False):
+        if not self.__enterItem(item, None, True, itemCallback,
+                                discoverCallback, discoveredItemsFirst):
             return False
 
-        self._visited[item.getId()] = True
+        stack = self._stack
+        while len(stack) > 0:
+            currentItem, steps = stack[-1]
+            try:
+                nextItem, isDependency = next(steps)
+            except StopIteration:
+                stack.pop()
+                continue
+
+            self.__enterItem(nextItem, currentItem, isDependency, itemCallback,
+                             discoverCallback, discoveredItemsFirst)
+
+        return True
+
+    def __enterItem(self, item, fromItem, isDependency, itemCallback,
+                    discoverCallback, discoveredItemsFirst):
+        """Pushes the steps of an item on the stack if it hasn't been visited.
+
+        Args:
+            item (SceneItem): The item to enter.
+            fromItem (SceneItem): The item which led to this one.
+            isDependency (bool): Whether fromItem depends on the item.
+            itemCallback (func): Callback invoked for each collected item.
+            discoverCallback (func): Callback returning the items discovered
+                from an item.
+            discoveredItemsFirst (bool): Whether items are collected after the
+                items they discover.
+
+        Returns:
+            bool: True if the item was entered.
+
+        """
+
+        if fromItem is None:
+            self._stack = []
+
+        itemId = item.getId()
+        if self._visited.get(itemId, False):
+            # An item which is still being visited and hasn't been collected
+            # can't be ordered before the item depending on it.
+            if isDependency and itemId in self._visiting and \
+                    itemId not in self._collected:
+                self.__reportCycle(item)
+
+            return False
+
+        self._visited[itemId] = True
+        self._stack.append((item, self.__visitSteps(item,
+                                                     itemCallback,
+                                                     discoverCallback,
+                                                     discoveredItemsFirst)))
+
+        return True
+
+    def __visitSteps(self, item, itemCallback, discoverCallback, discoveredItemsFirst):
+        """Generator visiting an item, yielding the items to visit before it
+        continues, along with whether the item depends on them.
+
+        Args:
+            item (SceneItem): The item to visit.
+            itemCallback (func): Callback invoked for each collected item.
+            discoverCallback (func): Callback returning the items discovered
+                from an item.
+            discoveredItemsFirst (bool): Whether items are collected after the
+                items they discover.
+
+        """
+
+        itemId = item.getId()
 
-        if hasattr(item, 'getParent') and item.getParent():
+        parent = None
+        if hasattr(item, 'getParent'):
+            parent = item.getParent()
+
+        if parent:
             # If this is an attribute and we have not traversed its parent AttributeGroup then skip this
             # and visit the parent so we get this attribute and all others from there (for the sake of attr order)
-            if item.isTypeOf("Attribute") and not self._visited.get(item.getParent().getId(), False):
-                self._visited[item.getId()] = False
-                self.__visitItem(item.getParent(),
-                             itemCallback,
-                             discoverCallback,
-                             discoveredItemsFirst)
-                return False
+            if item.isTypeOf("Attribute") and not self._visited.get(parent.getId(), False):
+                self._visited[itemId] = False
+                yield parent, False
+                return
 
-            self.__visitItem(item.getParent(),
-                             itemCallback,
-                             discoverCallback,
-                             discoveredItemsFirst)
+            yield parent, not item.isTypeOf("Attribute")
+
+        self._visiting.add(itemId)
 
         sourcedByConstraintOrOperator = False
         if discoveredItemsFirst:
@@ -208,16 +366,42 @@ class Traverser(object):
                 discoveredItems = discoverCallback(item)
 
             if discoveredItems:
+                # The parent has already been yielded above.
                 for discoveredItem in discoveredItems:
-                    self.__visitItem(discoveredItem,
-                                     itemCallback,
-                                     discoverCallback,
-                                     discoveredItemsFirst)
+                    yield discoveredItem, discoveredItem is not parent
 
         if discoveredItemsFirst and not sourcedByConstraintOrOperator:
             self.__collectVisitedItem(item, itemCallback)
 
-        return True
+        self._visiting.discard(itemId)
+
+    def __reportCycle(self, item):
+        """Records and logs a dependency cycle closed by an item.
+
+        Args:
+            item (SceneItem): The item closing the cycle.
+
+        """
+
+        # Attributes revisited from their attribute group appear twice on the
+        # stack, only the innermost visit is kept.
+        path = []
+        pathIds = set()
+        for stackItem, steps in reversed(self._stack):
+            stackItemId = stackItem.getId()
+            if stackItemId in pathIds:
+                continue
+
+            path.insert(0, stackItem)
+            pathIds.add(stackItemId)
+            if stackItemId == item.getId():
+                break
+
+        path.append(item)
+        self._cycles.append(path)
+
+        logger.warning("Dependency cycle found: " +
+                       " -> ".join([x.getDecoratedPath() for x in path]))
 
     def discoverChildren(self, item):
         """Doc String.
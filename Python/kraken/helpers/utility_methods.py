@@ -15,9 +15,8 @@ def logHierarchy(kObject):
     """
 
     print kObject.getDecoratedPath()
-    for i in xrange(kObject.getNumChildren()):
-        child = kObject.getChildByIndex(i)
-        logHierarchy(child)
+    for child in kObject.iterDescendents():
+        print child.getDecoratedPath()
 
 
 def __convertFromJSON(jsonData):
@@ -4,6 +4,9 @@ import logging
 from kraken.log.widget_handler import WidgetHandler
 from kraken.plugins import getLogHandler
 
+# Names of the loggers that already have their handlers attached.
+_configuredLoggers = set()
+
 
 def getLogger(name):
     """Get's a logger and attaches the correct DCC compatible Handler.
@@ -17,6 +20,8 @@ def getLogger(name):
     """
 
     logger = logging.getLogger(name)
+    if name in _configuredLoggers:
+        return logger
 
     handlerNames = [type(x).__name__ for x in logger.handlers]
 
@@ -30,4 +35,6 @@ def getLogger(name):
         if widgetHandler is not None:
             logger.addHandler(widgetHandler)
 
+    _configuredLoggers.add(name)
+
     return logger
@@ -8,98 +8,181 @@ __all__ = [os.path.splitext(os.path.basename(plugin))[0]
            for plugin in glob.glob(os.path.join(path, '*_plugin'))]
 
 
-def getBuilder():
-    """Returns the appropriate builder module for the DCC.
+# When the dev mode is enabled the plugin modules are reloaded and the DCC is
+# probed each time a plugin object is requested, so plugin code can be edited
+# without restarting the DCC. It can be enabled by setting the
+# 'KRAKEN_DEV_MODE' environment variable to 1.
+_devMode = os.environ.get('KRAKEN_DEV_MODE', '0') not in ('', '0')
 
-    Return:
-    Builder, instance of the builder for the DCC.
+# Name of the plugin of the DCC, False until the DCC has been probed.
+_dccPlugin = False
 
-    """
+# Attributes of the plugin modules, keyed by (module name, attribute name).
+_pluginAttributes = {}
 
-    dccBuilder = None
 
-    for eachPlugin in __all__:
-        mod = __import__("kraken.plugins." + eachPlugin, fromlist=['dccTest'])
-        reload(mod)
+class DCCHandler(logging.StreamHandler):
+    """DCC Handler class for stand alone."""
 
-        if mod.dccTest() is True:
-            loaded_mod = __import__("kraken.plugins." + eachPlugin + ".builder", fromlist=['builder'])
-            reload(loaded_mod)
-            loaded_class = getattr(loaded_mod, 'Builder')
+    def __init__(self, stream=None):
+        super(DCCHandler, self).__init__(stream)
 
-            dccBuilder = loaded_class()
 
-    if dccBuilder is None:
-        print "Failed to find DCC builder. Falling back to Python builder."
+def isDevMode():
+    """Returns whether the plugin modules are reloaded each time a plugin
+    object is requested.
 
-        from kraken.core import builder
-        dccBuilder = builder.Builder(debugMode=True)
+    Returns:
+        bool: True if the dev mode is enabled.
 
-    return dccBuilder
+    """
 
+    return _devMode
 
-def getSynchronizer():
-    """Gets the Synchronizer that belongs to the DCC calling this method.
 
-    Return:
-    Inspect, instance of the Synchronizer for the DCC.
+def setDevMode(devMode):
+    """Sets whether the plugin modules are reloaded each time a plugin object
+    is requested.
+
+    Args:
+        devMode (bool): True to enable the dev mode.
+
+    Returns:
+        bool: True if successful.
 
     """
 
-    dccSynchronizer = None
+    global _devMode
+    _devMode = devMode
 
-    for eachPlugin in __all__:
-        mod = __import__("kraken.plugins." + eachPlugin, fromlist=['dccTest'])
-        reload(mod)
+    return True
 
-        if mod.dccTest() is True:
-            loaded_mod = __import__("kraken.plugins." + eachPlugin + ".synchronizer", fromlist=['synchronizer'])
-            reload(loaded_mod)
-            loaded_class = getattr(loaded_mod, 'Synchronizer')
 
-            dccSynchronizer = loaded_class()
+def resetPlugins():
+    """Clears the cached plugin classes, the DCC is probed again the next time
+    a plugin object is requested.
 
-    if dccSynchronizer is None:
-        print "Failed to find DCC Synchronizer. Falling back to Python Synchronizer."
+    Returns:
+        bool: True if successful.
 
-        from kraken.core import synchronizer
-        dccSynchronizer = synchronizer.Synchronizer()
+    """
 
-    return dccSynchronizer
+    global _dccPlugin
+    _dccPlugin = False
+    _pluginAttributes.clear()
 
+    return True
 
-def getLogHandler():
-    """Returns the appropriate logging handler for the DCC.
+
+def getDCCPlugin():
+    """Returns the name of the plugin for the DCC. The DCC is only probed the
+    first time unless the dev mode is enabled.
 
     Returns:
-        class: Instance of the log handler or None if not found.
+        str: Name of the plugin package, None if no plugin matches the DCC.
 
     """
 
-    handler = None
+    global _dccPlugin
 
+    if _dccPlugin is not False and not _devMode:
+        return _dccPlugin
+
+    dccPlugin = None
     for eachPlugin in __all__:
         mod = __import__("kraken.plugins." + eachPlugin, fromlist=['dccTest'])
-        reload(mod)
+        if _devMode:
+            reload(mod)
 
         if mod.dccTest() is True:
-            loaded_mod = __import__("kraken.plugins." + eachPlugin + ".log.handler", fromlist=['handler'])
+            dccPlugin = eachPlugin
+
+    _dccPlugin = dccPlugin
+
+    return dccPlugin
+
+
+def _getPluginAttribute(moduleName, attributeName):
+    """Returns an attribute of a module of the DCC plugin.
+
+    Args:
+        moduleName (str): Name of the module in the plugin package.
+        attributeName (str): Name of the attribute to get from the module.
+
+    Returns:
+        object: The attribute, None if no plugin matches the DCC.
+
+    """
+
+    key = (moduleName, attributeName)
+    if key in _pluginAttributes and not _devMode:
+        return _pluginAttributes[key]
+
+    attribute = None
+
+    dccPlugin = getDCCPlugin()
+    if dccPlugin is not None:
+        loaded_mod = __import__("kraken.plugins." + dccPlugin + "." + moduleName,
+                                fromlist=[attributeName])
+        if _devMode:
             reload(loaded_mod)
-            loaded_class = getattr(loaded_mod, 'DCCHandler')
 
-            handler = loaded_class()
+        attribute = getattr(loaded_mod, attributeName)
+
+    _pluginAttributes[key] = attribute
+
+    return attribute
+
+
+def getBuilder():
+    """Returns the appropriate builder module for the DCC.
+
+    Return:
+    Builder, instance of the builder for the DCC.
+
+    """
+
+    builderClass = _getPluginAttribute('builder', 'Builder')
+    if builderClass is not None:
+        return builderClass()
+
+    print "Failed to find DCC builder. Falling back to Python builder."
+
+    from kraken.core import builder
+    return builder.Builder(debugMode=True)
+
+
+def getSynchronizer():
+    """Gets the Synchronizer that belongs to the DCC calling this method.
+
+    Return:
+    Inspect, instance of the Synchronizer for the DCC.
+
+    """
+
+    synchronizerClass = _getPluginAttribute('synchronizer', 'Synchronizer')
+    if synchronizerClass is not None:
+        return synchronizerClass()
+
+    print "Failed to find DCC Synchronizer. Falling back to Python Synchronizer."
+
+    from kraken.core import synchronizer
+    return synchronizer.Synchronizer()
 
-    if handler is None:
 
-        class DCCHandler(logging.StreamHandler):
-            """DCC Handler class for stand alone."""
+def getLogHandler():
+    """Returns the appropriate logging handler for the DCC.
+
+    Returns:
+        class: Instance of the log handler or None if not found.
 
-            def __init__(self, stream=None):
-                super(DCCHandler, self).__init__(stream)
+    """
 
-        handler = DCCHandler(sys.stdout)
+    handlerClass = _getPluginAttribute('log.handler', 'DCCHandler')
+    if handlerClass is not None:
+        return handlerClass()
 
-    return handler
+    return DCCHandler(sys.stdout)
 
 
 def getFabricClient():
@@ -115,15 +198,9 @@ def getFabricClient():
 
     client = None
 
-    for eachPlugin in __all__:
-        mod = __import__("kraken.plugins." + eachPlugin, fromlist=['dccTest'])
-        reload(mod)
-
-        if mod.dccTest() is True:
-            loaded_mod = __import__("kraken.plugins." + eachPlugin + ".fabric_client", fromlist=['getClient'])
-            reload(loaded_mod)
-
-            client = loaded_mod.getClient()
+    getClient = _getPluginAttribute('fabric_client', 'getClient')
+    if getClient is not None:
+        client = getClient()
 
     if client is None:
         print "Failed to find DCC client. Falling back to Python client."
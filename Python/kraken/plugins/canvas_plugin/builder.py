@@ -20,12 +20,12 @@ from kraken.core.objects.operators.operator import Operator
 from kraken.core.objects.constraints.constraint import Constraint
 from kraken.core.objects.attributes.scalar_attribute import ScalarAttribute
 from kraken.core.objects.constraints.pose_constraint import PoseConstraint
-from kraken.core.maths.vec3 import Vec3
 from kraken.core.maths.color import Color
 from kraken.core.maths.xfo import Xfo
 
-from kraken.plugins.canvas_plugin.hash import makeHash
+from kraken.plugins.canvas_plugin.curve_shape_cache import CurveShapeCache
 from kraken.plugins.canvas_plugin.graph_manager import GraphManager
+from kraken.plugins.canvas_plugin.graph_layout import GraphLayout
 
 import FabricEngine.Core as core
 
@@ -246,8 +246,8 @@ class Builder(Builder):
                 self.rigGraph.connectArg('floats', node, 'floatAnimation')
 
         if self.hasOption('SetupDebugDrawing'):
-            if hasattr(kSceneItem, 'getCurveData'):
-                curveData = kSceneItem.getCurveData()
+            if hasattr(kSceneItem, 'getPackedCurveData'):
+                curveData = kSceneItem.getPackedCurveData()
                 self.rigGraph.setCurrentGroup('DebugCurves')
                 shapeHash = self.buildCanvasCurveShape(curveData)
                 self.setCurrentGroupSI(kSceneItem)
@@ -458,44 +458,13 @@ class Builder(Builder):
             self.__dfgLastCurveNode = self.rigGraph.createNodeFromPreset('drawing', preset, title='curveDict')
             self.__dfgCurves = {}
 
-        numVertices = 0
-        for subCurve in curveData:
-            points = subCurve['points']
-            numVertices = numVertices + len(points)
-
-        hashSource = [curveData]
-        hashSource += [len(curveData)]
-        hashSource += [numVertices]
-
-        shapeHash = str(makeHash(hashSource))
+        # shapes are shared by all the builds of the session, only the
+        # nodes defining them are created per graph
+        shape = CurveShapeCache.getInstance().getShape(curveData)
+        shapeHash = shape.getDigest()
         if not self.__dfgCurves.has_key(shapeHash):
-            positions = []
-            indices = []
-            for subCurve in curveData:
-                points = subCurve['points']
-                firstIndex = len(positions)
-                index = firstIndex
-                for i in range(len(points)):
-                    positions.append(Vec3(points[i][0], points[i][1], points[i][2]))
-                    if i > 0:
-                        indices.append(index-1)
-                        indices.append(index)
-                    index = index + 1
-
-                if subCurve.get('closed', False):
-                    indices.append(index-1)
-                    indices.append(firstIndex)
-
             shapeHashVal = ks.rtVal("String", shapeHash)
-            positionsRTVal = ks.rtVal("Vec3[]")
-            indicesRTVal = ks.rtVal("UInt32[]")
-            positionsRTVal.resize(len(positions))
-            indicesRTVal.resize(len(indices))
-
-            for i in range(len(positions)):
-                positionsRTVal[i] = ks.rtVal('Vec3', positions[i])
-            for i in range(len(indices)):
-                indicesRTVal[i] = ks.rtVal('UInt32', indices[i])
+            (positionsRTVal, indicesRTVal) = shape.getRTVals()
 
             preset = "Kraken.DebugDrawing.DefineCurve"
             curveNode = self.rigGraph.createNodeFromPreset('drawing', preset, title=shapeHash)
@@ -539,14 +508,13 @@ class Builder(Builder):
         collectNode = self.rigGraph.createFunctionNode('collectors', title='collect'+arg.capitalize())
         subExec = self.rigGraph.getSubExec(collectNode)
 
-        resultPort = subExec.addExecPort('result', client.DFG.PortTypes.Out)
-        subExec.setExecPortTypeSpec(resultPort, '%s[String]' % dataType)
+        resultPort = self.rigGraph.addNodePort(collectNode, 'result', client.DFG.PortTypes.Out, '%s[String]' % dataType)
 
         driverMap = {}
         code = []
         for driver in drivers:
             driverName = str(driver.getName())
-            driverPort = subExec.addExecPort(driverName, client.DFG.PortTypes.In)
+            driverPort = self.rigGraph.addNodePort(collectNode, driverName, client.DFG.PortTypes.In)
             driverMap[driver.getPath()] = driverPort
 
             (node, port) = self.rigGraph.getNodeAndPortSI(driver, asInput=False)
@@ -938,8 +906,7 @@ class Builder(Builder):
 
         constructNode = self.rigGraph.createFunctionNodeSI(kOperator, solverTypeName+'Constructor')
         subExec = self.rigGraph.getSubExec(constructNode)
-        solverPort = subExec.addExecPort("solver", client.DFG.PortTypes.Out)
-        subExec.setExecPortTypeSpec(solverPort, solverTypeName)
+        solverPort = self.rigGraph.addNodePort(constructNode, "solver", client.DFG.PortTypes.Out, solverTypeName)
         subExec.setCode('dfgEntry { solver = %s(); }' % solverTypeName)
 
         varNode = self.rigGraph.createVariableNodeSI(kOperator, 'solver', solverTypeName, extension=kOperator.getExtension())
@@ -950,29 +917,23 @@ class Builder(Builder):
 
         # set dependencies
         self.rigGraph.addExtDep(kOperator.getExtension())
-        subExec = self.rigGraph.getSubExec(node)
 
-        solverPort = subExec.addExecPort("solver", client.DFG.PortTypes.IO)
-        subExec.setExecPortTypeSpec(solverPort, solverTypeName)
+        solverPort = self.rigGraph.addNodePort(node, "solver", client.DFG.PortTypes.IO, solverTypeName)
         self.rigGraph.connectNodes(varNode, 'value', node, solverPort)
 
         argPorts = {}
         arraySizes = {}
 
-        args = kOperator.getSolverArgs()
+        args = kOperator.getSolverArgSchema()
         for i in xrange(len(args)):
-            arg = args[i]
-            argName = arg.name.getSimpleType()
-            argDataType = arg.dataType.getSimpleType()
-            argConnectionType = arg.connectionType.getSimpleType()
+            argName, argDataType, argConnectionType = args[i]
 
             argPort = None
             if argConnectionType == 'In':
-                argPort = subExec.addExecPort(argName, client.DFG.PortTypes.In)
+                argPort = self.rigGraph.addNodePort(node, argName, client.DFG.PortTypes.In, argDataType)
             else:
-                argPort = subExec.addExecPort(argName, client.DFG.PortTypes.Out)
+                argPort = self.rigGraph.addNodePort(node, argName, client.DFG.PortTypes.Out, argDataType)
             argPorts[argName] = argPort
-            subExec.setExecPortTypeSpec(argPort, argDataType)
 
             if argDataType == 'EvalContext':
                 continue
@@ -1247,86 +1208,14 @@ class Builder(Builder):
                 self.rigGraph.connectNodes(linesNode, linesPort, ifNode, "if_true")
                 self.rigGraph.connectArg('debugDraw', ifNode, 'cond')
 
-        # perform layout based on reingold tilford
-        nodes = self.rigGraph.getAllNodeNames()
-        nodeConnections = self.rigGraph.getAllNodeConnections()
-
-        depth = {}
-        height = {}
-        for n in nodes:
-            depth[n] = 0
-
-        changed = True
-        while changed:
-            changed = False
-
-            # forward
-            for n in nodes:
-                connections = nodeConnections.get(n, [])
-                for c in connections:
-                    if depth[c] <= depth[n]:
-                        depth[c] = depth[n] + 1
-                        changed = True
-
-            # backward
-            for n in nodes:
-                connections = nodeConnections.get(n, [])
-                minDiff = 0
-                for c in connections:
-                    diff = depth[c] - depth[n]
-                    if diff < minDiff or minDiff == 0:
-                        minDiff = diff
-                if minDiff > 1:
-                    depth[n] = depth[n] + minDiff - 1
-
-        rows = []
-        maxPortsPerRow = []
-        for n in depth:
-            while len(rows) <= depth[n]:
-                rows += [[]]
-                maxPortsPerRow += [0]
-            rows[depth[n]] += [n]
-            if self.rigGraph.getNumPorts(n) > maxPortsPerRow[depth[n]]:
-                maxPortsPerRow[depth[n]] = self.rigGraph.getNumPorts(n)
-
-        for j in range(len(rows)-1, -1, -1):
-
-            row = rows[j]
-            rowHeights = {}
-            for i in range(len(row)):
-                n = row[i]
-                if j == len(rows)-1:
-                    height[n] = i
-                    continue
-
-                connectedNodes = self.rigGraph.getNodeConnections(n)
-                offset = maxPortsPerRow[j+1]
-                height[n] = len(rows[j+1]) *  + i
-                for connectedNode in connectedNodes:
-                    h = height[connectedNode] * maxPortsPerRow[j+1]
-                    h = h + self.rigGraph.getMinConnectionPortIndex(n, connectedNode)
-                    if h < height[n]:
-                        height[n] = h
-
-                h = height[n]
-                while rowHeights.has_key(h):
-                  h = h + 1
-                height[n] = h
-                rowHeights[height[n]] = True
-
-            # normalize the heights
-            sortedHeights = sorted(rowHeights.keys())
-            if len(sortedHeights) > 0:
-                heightLookup = {}
-                for i in range(len(sortedHeights)):
-                    heightLookup[sortedHeights[i]] = i
-                for i in range(len(row)):
-                    n = row[i]
-                    height[n] = heightLookup[height[n]]
-
-        for n in nodes:
-            x = float(depth[n]) * 300.0
-            y = float(height[n]) * 120.0
+        # layered layout, the port counts and indices are tracked by the graph
+        layout = GraphLayout(self.rigGraph.getAllNodeNames(),
+                             self.rigGraph.getAllNodeConnections(),
+                             portCounts=self.rigGraph.getAllNodePortCounts(),
+                             portIndices=self.rigGraph.getAllConnectionPortIndices())
+        positions = layout.getPositions(columnWidth=300.0, rowHeight=120.0)
+        for n in layout.getNodes():
+            x, y = positions[n]
             self.rigGraph.setNodeMetaData(n, 'uiGraphPos', json.dumps({"x": x, "y": y}))
             self.rigGraph.setNodeMetaData(n, 'uiCollapsedState', "1")
 
@@ -0,0 +1,191 @@
+"""Kraken Canvas - Curve Shape Cache module.
+
+Classes:
+CurveShape -- Line segments of a curve shape for debug drawing.
+CurveShapeCache -- Session wide cache of the curve shapes by digest.
+
+"""
+
+import json
+from array import array
+
+from kraken.core.kraken_system import ks
+from kraken.core.maths.vec3 import Vec3
+from kraken.core.objects.curve_data import packCurveData
+from kraken.plugins.canvas_plugin.hash import makeCurveHash
+
+
+class CurveShape(object):
+    """Line segments of a curve shape for debug drawing.
+
+    The positions and segment indices are computed once from the packed
+    sub-curves, the RTVal arrays are filled the first time they are requested
+    and then shared by every graph drawing the shape, until the Fabric client
+    is reloaded.
+
+    Args:
+        digest (str): Digest of the curve data, see hash.makeCurveHash.
+        curveData (tuple): Packed sub-curves of the shape.
+
+    """
+
+    def __init__(self, digest, curveData):
+        super(CurveShape, self).__init__()
+
+        self.__digest = digest
+        self.__positions = array('d')
+        self.__indices = array('I')
+        self.__rtVals = None
+        self.__rtValsClient = None
+
+        for subCurve in curveData:
+            firstIndex = len(self.__positions) // 3
+            numPoints = subCurve.getNumPoints()
+            self.__positions.extend(subCurve.getPackedPoints())
+
+            for i in xrange(firstIndex + 1, firstIndex + numPoints):
+                self.__indices.append(i - 1)
+                self.__indices.append(i)
+
+            if subCurve.getClosed() and numPoints > 0:
+                self.__indices.append(firstIndex + numPoints - 1)
+                self.__indices.append(firstIndex)
+
+    def getDigest(self):
+        """Returns the digest of the curve data.
+
+        Returns:
+            str: The digest.
+
+        """
+
+        return self.__digest
+
+    def getPositions(self):
+        """Returns the packed positions of the points, they must not be
+        modified.
+
+        Returns:
+            array: The x, y, z values of each point.
+
+        """
+
+        return self.__positions
+
+    def getIndices(self):
+        """Returns the indices of the points of each line segment, they must
+        not be modified.
+
+        Returns:
+            array: The start and end point indices of each segment.
+
+        """
+
+        return self.__indices
+
+    def getRTVals(self):
+        """Returns the RTVal arrays of the positions and indices.
+
+        The arrays are filled in a single call to the Fabric core when the
+        RTVals can be set from JSON, element by element otherwise.
+
+        Returns:
+            tuple: The Vec3[] positions and UInt32[] indices RTVals.
+
+        """
+
+        client = ks.getCoreClient()
+        if self.__rtVals is not None and self.__rtValsClient is client:
+            return self.__rtVals
+
+        positions = self.__positions
+        positionsRTVal = ks.rtVal('Vec3[]')
+        indicesRTVal = ks.rtVal('UInt32[]')
+
+        if hasattr(positionsRTVal, 'setJSON'):
+            values = [{'x': positions[i], 'y': positions[i + 1], 'z': positions[i + 2]}
+                      for i in xrange(0, len(positions), 3)]
+            positionsRTVal.setJSON(json.dumps(values))
+            indicesRTVal.setJSON(json.dumps(self.__indices.tolist()))
+
+        else:
+            positionsRTVal.resize(len(positions) // 3)
+            for i in xrange(0, len(positions), 3):
+                vec = Vec3(positions[i], positions[i + 1], positions[i + 2])
+                positionsRTVal[i // 3] = ks.rtVal('Vec3', vec)
+
+            indicesRTVal.resize(len(self.__indices))
+            for i in xrange(len(self.__indices)):
+                indicesRTVal[i] = ks.rtVal('UInt32', self.__indices[i])
+
+        self.__rtVals = (positionsRTVal, indicesRTVal)
+        self.__rtValsClient = client
+
+        return self.__rtVals
+
+
+class CurveShapeCache(object):
+    """Session wide cache of the curve shapes by digest.
+
+    Controls using the same shape share a single entry across builds and
+    across the graphs they are drawn in.
+
+    """
+
+    __instance = None
+
+    def __init__(self):
+        super(CurveShapeCache, self).__init__()
+
+        self.__shapes = {}
+
+    def getShape(self, curveData):
+        """Returns the shape of curve data, creating it on the first request.
+
+        Args:
+            curveData (list): Packed sub-curves, or dictionaries defining them.
+
+        Returns:
+            CurveShape: The shape of the curve data.
+
+        """
+
+        curveData = packCurveData(curveData)
+        digest = makeCurveHash(curveData)
+
+        shape = self.__shapes.get(digest)
+        if shape is None:
+            shape = CurveShape(digest, curveData)
+            self.__shapes[digest] = shape
+
+        return shape
+
+    def getNumShapes(self):
+        """Returns the number of cached shapes.
+
+        Returns:
+            int: Number of shapes.
+
+        """
+
+        return len(self.__shapes)
+
+    def clear(self):
+        """Removes all the shapes."""
+
+        self.__shapes = {}
+
+    @classmethod
+    def getInstance(cls):
+        """This class method returns the singleton instance for the
+        CurveShapeCache.
+
+        Returns:
+            object: The singleton curve shape cache instance.
+
+        """
+
+        if cls.__instance is None:
+            cls.__instance = CurveShapeCache()
+
+        return cls.__instance
@@ -0,0 +1,294 @@
+"""Kraken Canvas - Graph Layout module.
+
+Classes:
+GraphLayout -- Layered layout of a directed graph.
+
+"""
+
+from collections import deque
+
+
+class GraphLayout(object):
+    """Layered layout of a directed graph.
+
+    The nodes are assigned to columns with a single topological sort, then
+    the nodes of each column are ordered by barycenter sweeps reducing the
+    crossings of the connections. The graph is given as plain dictionaries so
+    the layout doesn't depend on the Canvas graph.
+
+    Args:
+        nodes (list): Names of the nodes, the initial order of the rows.
+        connections (dict): List of the nodes connected to each node.
+        portCounts (dict): Number of ports of each node (optional).
+        portIndices (dict): Index of the first port of the target connected
+            to the source, keyed by (source, target) (optional).
+
+    """
+
+    def __init__(self, nodes, connections, portCounts=None, portIndices=None):
+        super(GraphLayout, self).__init__()
+
+        self.__nodes = list(nodes)
+        self.__portCounts = portCounts or {}
+        self.__portIndices = portIndices or {}
+
+        self.__children = {}
+        self.__parents = {}
+        for node in self.__nodes:
+            self.__children[node] = []
+            self.__parents[node] = []
+
+        for node in self.__nodes:
+            for child in connections.get(node, []):
+                if child == node or child not in self.__children or child in self.__children[node]:
+                    continue
+
+                self.__children[node].append(child)
+                self.__parents[child].append(node)
+
+    def getNodes(self):
+        """Returns the names of the nodes.
+
+        Returns:
+            list: The nodes.
+
+        """
+
+        return list(self.__nodes)
+
+    def computeLayers(self):
+        """Computes the column of each node.
+
+        Nodes are placed one column after their last parent, then nodes with
+        connections are moved to the column before their first child.
+        Connections closing a cycle are ignored.
+
+        Returns:
+            dict: The column of each node.
+
+        """
+
+        layers = {}
+        inDegrees = {}
+        for node in self.__nodes:
+            layers[node] = 0
+            inDegrees[node] = len(self.__parents[node])
+
+        queue = deque([x for x in self.__nodes if inDegrees[x] == 0])
+        order = []
+        visited = set()
+        nextIndex = 0
+        while len(order) < len(self.__nodes):
+            if len(queue) == 0:
+                # Only cycles are left, release the first node in one.
+                while self.__nodes[nextIndex] in visited:
+                    nextIndex += 1
+                queue.append(self.__nodes[nextIndex])
+
+            node = queue.popleft()
+            if node in visited:
+                continue
+
+            visited.add(node)
+            order.append(node)
+
+            for child in self.__children[node]:
+                if child in visited:
+                    continue
+
+                layers[child] = max(layers[child], layers[node] + 1)
+                inDegrees[child] -= 1
+                if inDegrees[child] == 0:
+                    queue.append(child)
+
+        for node in reversed(order):
+            childLayers = [layers[x] for x in self.__children[node] if layers[x] > layers[node]]
+            if len(childLayers) > 0:
+                layers[node] = min(childLayers) - 1
+
+        return layers
+
+    def orderLayers(self, layers, sweeps=4):
+        """Orders the nodes of each column to reduce the crossings.
+
+        Each sweep sorts the columns by the mean position of the parents of
+        the nodes, then in reverse by the mean position of the ports of their
+        children. The order with the least crossings is kept.
+
+        Args:
+            layers (dict): The column of each node, see computeLayers.
+            sweeps (int): Maximum number of down and up sweeps.
+
+        Returns:
+            list: The list of nodes of each column, top to bottom.
+
+        """
+
+        rows = []
+        for node in self.__nodes:
+            while len(rows) <= layers[node]:
+                rows.append([])
+            rows[layers[node]].append(node)
+
+        positions = {}
+        for row in rows:
+            for i in xrange(len(row)):
+                positions[row[i]] = i
+
+        bestRows = [list(x) for x in rows]
+        bestCrossings = self.countCrossings(rows, layers)
+
+        for i in xrange(sweeps):
+            if bestCrossings == 0:
+                break
+
+            for j in xrange(1, len(rows)):
+                self.__sortRow(rows, layers, positions, j, self.__parents, False)
+            for j in xrange(len(rows) - 2, -1, -1):
+                self.__sortRow(rows, layers, positions, j, self.__children, True)
+
+            crossings = self.countCrossings(rows, layers)
+            if crossings >= bestCrossings:
+                break
+
+            bestRows = [list(x) for x in rows]
+            bestCrossings = crossings
+
+        return bestRows
+
+    def __sortRow(self, rows, layers, positions, index, neighbours, usePorts):
+        """Sorts a column by the mean position of the neighbours of its nodes
+        in the other columns and updates the positions of its nodes."""
+
+        row = rows[index]
+        keys = {}
+        for i in xrange(len(row)):
+            node = row[i]
+            total = 0.0
+            count = 0
+            for neighbour in neighbours[node]:
+                if layers[neighbour] == index:
+                    continue
+
+                slot = 0.5
+                if usePorts:
+                    portIndex = self.__portIndices.get((node, neighbour), 0)
+                    portCount = max(self.__portCounts.get(neighbour, 0), portIndex + 1)
+                    slot = (portIndex + 1.0) / (portCount + 1.0)
+
+                total += (positions[neighbour] + slot) / len(rows[layers[neighbour]])
+                count += 1
+
+            if count == 0:
+                keys[node] = ((i + 0.5) / len(row), i)
+            else:
+                keys[node] = (total / count, i)
+
+        row.sort(key=lambda x: keys[x])
+        for i in xrange(len(row)):
+            positions[row[i]] = i
+
+    def countCrossings(self, rows, layers):
+        """Counts the crossings of the connections between the same columns,
+        connections to the ports of the same node cross if their sources are
+        not in the order of the ports.
+
+        Args:
+            rows (list): The list of nodes of each column.
+            layers (dict): The column of each node.
+
+        Returns:
+            int: Number of pairs of connections crossing each other.
+
+        """
+
+        positions = {}
+        for row in rows:
+            for i in xrange(len(row)):
+                positions[row[i]] = i
+
+        edges = {}
+        for node in self.__nodes:
+            for child in self.__children[node]:
+                key = (layers[node], layers[child])
+                target = (positions[child], self.__portIndices.get((node, child), 0))
+                edges.setdefault(key, []).append((positions[node], target))
+
+        crossings = 0
+        for key in edges:
+            targets = [x[1] for x in sorted(edges[key])]
+            crossings += self.__countInversions(targets)
+
+        return crossings
+
+    def __countInversions(self, values):
+        """Counts the pairs of values out of order with a merge sort."""
+
+        inversions = 0
+        width = 1
+        values = list(values)
+        while width < len(values):
+            merged = []
+            for start in xrange(0, len(values), width * 2):
+                left = values[start:start + width]
+                right = values[start + width:start + width * 2]
+                i = 0
+                j = 0
+                while i < len(left) and j < len(right):
+                    if right[j] < left[i]:
+                        merged.append(right[j])
+                        inversions += len(left) - i
+                        j += 1
+                    else:
+                        merged.append(left[i])
+                        i += 1
+                merged += left[i:]
+                merged += right[j:]
+
+            values = merged
+            width *= 2
+
+        return inversions
+
+    def compute(self, sweeps=4):
+        """Computes the column and row of each node.
+
+        Args:
+            sweeps (int): Maximum number of crossing reduction sweeps.
+
+        Returns:
+            dict: The (column, row) of each node.
+
+        """
+
+        layers = self.computeLayers()
+        rows = self.orderLayers(layers, sweeps=sweeps)
+
+        cells = {}
+        for column in xrange(len(rows)):
+            row = rows[column]
+            for i in xrange(len(row)):
+                cells[row[i]] = (column, i)
+
+        return cells
+
+    def getPositions(self, columnWidth=300.0, rowHeight=120.0, sweeps=4):
+        """Returns the position of each node.
+
+        Args:
+            columnWidth (float): Horizontal distance between the columns.
+            rowHeight (float): Vertical distance between the rows.
+            sweeps (int): Maximum number of crossing reduction sweeps.
+
+        Returns:
+            dict: The (x, y) position of each node.
+
+        """
+
+        positions = {}
+        cells = self.compute(sweeps=sweeps)
+        for node in cells:
+            column, row = cells[node]
+            positions[node] = (float(column) * columnWidth, float(row) * rowHeight)
+
+        return positions
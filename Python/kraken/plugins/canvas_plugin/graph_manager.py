@@ -6,6 +6,7 @@ GraphManager -- Node management.
 """
 
 import json
+from collections import OrderedDict
 
 from kraken.core.kraken_system import ks
 # import FabricEngine.Core as core
@@ -21,7 +22,11 @@ class GraphManager(object):
     __dfgNodes = None
     __dfgNodeAndPortMap = None
     __dfgConnections = None
+    __dfgConnectionSources = None
+    __dfgNodeInputPorts = None
+    __dfgNodePorts = None
     __dfgGroups = None
+    __dfgNodeGroups = None
     __dfgGroupNames = None
     __dfgCurrentGroup = None
 
@@ -37,8 +42,22 @@ class GraphManager(object):
         self.__dfgArgs = {}
         self.__dfgNodes = {}
         self.__dfgNodeAndPortMap = {}
+
+        # Connections are indexed in both directions. __dfgConnections maps
+        # the source node and port to the list of target (node, port)
+        # tuples, __dfgConnectionSources maps each 'node.port' target to its
+        # source (node, port) and __dfgNodeInputPorts holds the connected
+        # input ports of each node.
         self.__dfgConnections = {}
+        self.__dfgConnectionSources = {}
+        self.__dfgNodeInputPorts = {}
+
+        # Port names of each node in the order of the exec, gathered as the
+        # nodes are created and their ports added so the layout doesn't query
+        # the exec.
+        self.__dfgNodePorts = {}
         self.__dfgGroups = {}
+        self.__dfgNodeGroups = {}
         self.__dfgGroupNames = []
         self.__dfgCurrentGroup = None
 
@@ -153,6 +172,8 @@ class GraphManager(object):
 
         node = self.__dfgExec.addInstFromPreset(preset)
         self.__dfgNodes[lookup] = node
+        subExec = self.__dfgExec.getSubExec(node)
+        self.__dfgNodePorts[node] = [subExec.getExecPortName(i) for i in xrange(subExec.getExecPortCount())]
         self.setNodeMetaDataFromDict(lookup, metaData)
         self.__addNodeToGroup(node)
 
@@ -174,6 +195,7 @@ class GraphManager(object):
 
         node = self.__dfgExec.addInstWithNewFunc(title)
         self.__dfgNodes[lookup] = node
+        self.__dfgNodePorts[node] = []
         self.setNodeMetaDataFromDict(lookup, metaData)
         self.__addNodeToGroup(node)
 
@@ -192,6 +214,7 @@ class GraphManager(object):
 
         node = self.__dfgExec.addVar(title, dataType, extension)
         self.__dfgNodes[lookup] = node
+        self.__dfgNodePorts[node] = ['value']
         self.setNodeMetaDataFromDict(lookup, metaData)
         self.__addNodeToGroup(node)
 
@@ -211,34 +234,43 @@ class GraphManager(object):
         node = self.__dfgNodes[lookup]
         self.__dfgExec.removeNode(node)
         del self.__dfgNodes[lookup]
+        self.__dfgNodePorts.pop(node, None)
 
         # clean up groups
-        for group in self.__dfgGroups:
-            for i in range(len(self.__dfgGroups[group])):
-                if self.__dfgGroups[group][i] == node:
-                    del self.__dfgGroups[group][i]
-                    break
-
-        # clean up connections
-        if node in self.__dfgConnections:
-            del self.__dfgConnections[node]
-        for nodeName in self.__dfgConnections:
-            ports = self.__dfgConnections[nodeName]
-            for portName in ports:
-                connections = ports[portName]
-                newConnections = []
-                for c in connections:
-                    if c[0] == node:
-                        continue
-
-                    newConnections += [c]
-                self.__dfgConnections[nodeName][portName] = newConnections
+        group = self.__dfgNodeGroups.pop(node, None)
+        if group is not None:
+            self.__dfgGroups[group].pop(node, None)
+
+        # clean up connections, the exec removed them with the node
+        for port in list(self.__dfgNodeInputPorts.get(node, ())):
+            self.__untrackConnection(node, port)
+
+        for port, connections in self.__dfgConnections.pop(node, {}).iteritems():
+            for (otherNode, otherPort) in connections:
+                self.__dfgConnectionSources.pop(otherNode+'.'+otherPort, None)
+                inputPorts = self.__dfgNodeInputPorts.get(otherNode, None)
+                if inputPorts is not None:
+                    inputPorts.discard(otherPort)
+                    if len(inputPorts) == 0:
+                        del self.__dfgNodeInputPorts[otherNode]
 
         return True
 
     def removeNodeSI(self, kSceneItem, title=None):
         return self.removeNode(kSceneItem.getPath(), title=title)
 
+    def addNodePort(self, node, name, portType, dataType=None):
+        subExec = self.__dfgExec.getSubExec(node)
+        port = subExec.addExecPort(name, portType)
+        if dataType is not None:
+            subExec.setExecPortTypeSpec(port, dataType)
+
+        ports = self.__dfgNodePorts.get(node, None)
+        if ports is not None:
+            ports.append(port)
+
+        return port
+
     def connectNodes(self, nodeA, portA, nodeB, portB):
 
         self.removeConnection(nodeB, portB)
@@ -266,11 +298,10 @@ class GraphManager(object):
 
         self.__dfgExec.connectTo(nodeA+'.'+portA, nodeB+'.'+portB)
 
-        if not self.__dfgConnections.has_key(nodeA):
-          self.__dfgConnections[nodeA] = {}
-        if not self.__dfgConnections[nodeA].has_key(portA):
-          self.__dfgConnections[nodeA][portA] = []
-        self.__dfgConnections[nodeA][portA].append((nodeB, portB))
+        ports = self.__dfgConnections.setdefault(nodeA, {})
+        ports.setdefault(portA, []).append((nodeB, portB))
+        self.__dfgConnectionSources[nodeB+'.'+portB] = (nodeA, portA)
+        self.__dfgNodeInputPorts.setdefault(nodeB, set()).add(portB)
 
         return True
 
@@ -293,43 +324,46 @@ class GraphManager(object):
             self.removeConnection(c[0], c[1])
             self.connectNodes(newNode, newPort, c[0], c[1])
 
+    def __untrackConnection(self, node, port):
+        source = self.__dfgConnectionSources.pop(node+'.'+port, None)
+        if source is None:
+            return None
+
+        inputPorts = self.__dfgNodeInputPorts[node]
+        inputPorts.discard(port)
+        if len(inputPorts) == 0:
+            del self.__dfgNodeInputPorts[node]
+
+        (sourceNode, sourcePort) = source
+        ports = self.__dfgConnections.get(sourceNode, None)
+        if ports is not None and sourcePort in ports:
+            connections = ports[sourcePort]
+            connections.remove((node, port))
+            if len(connections) == 0:
+                del ports[sourcePort]
+                if len(ports) == 0:
+                    del self.__dfgConnections[sourceNode]
+
+        return source
+
     def removeConnection(self, node, port):
-        result = False
-        for nodeName in self.__dfgConnections:
-            ports = self.__dfgConnections[nodeName]
-            for portName in ports:
-                connections = ports[portName]
-                newConnections = []
-                for i in range(len(connections)):
-                    if '.'.join(connections[i]) == node+'.'+port:
-                        self.__dfgExec.disconnectFrom(nodeName+'.'+portName, node+'.'+port)
-                        result = True
-                        break
-                    else:
-                        newConnections += [connections[i]]
-                self.__dfgConnections[nodeName][portName] = newConnections
-                if result:
-                    return result
+        source = self.__untrackConnection(node, port)
+        if source is None:
+            return False
 
-        return result
+        self.__dfgExec.disconnectFrom(source[0]+'.'+source[1], node+'.'+port)
+
+        return True
 
     def getConnections(self, node, port, targets=True):
-        result = []
-        for nodeName in self.__dfgConnections:
-            ports = self.__dfgConnections[nodeName]
-            for portName in ports:
-                connections = ports[portName]
-                if targets:
-                    if node+'.'+port == nodeName+'.'+portName:
-                        result += connections
-                    else:
-                        continue
-                else:
-                    for c in connections:
-                        if '.'.join(c) == node+'.'+port:
-                            result += [(nodeName, portName)]
+        if targets:
+            return list(self.__dfgConnections.get(node, {}).get(port, []))
 
-        return result
+        source = self.__dfgConnectionSources.get(node+'.'+port, None)
+        if source is None:
+            return []
+
+        return [source]
 
     def getNodeMetaData(self, path, key, defaultValue=None, title=None):
         lookup = path
@@ -414,7 +448,7 @@ class GraphManager(object):
         return self.__dfgGroupNames + []
 
     def getNodesInGroup(self, group):
-        return self.__dfgGroups.get(group, []) + []
+        return list(self.__dfgGroups.get(group, []))
 
     def setCurrentGroup(self, group):
 
@@ -423,7 +457,7 @@ class GraphManager(object):
             return None
 
         if not self.__dfgGroups.has_key(group):
-            self.__dfgGroups[group] = []
+            self.__dfgGroups[group] = OrderedDict()
             self.__dfgGroupNames.append(group)
 
         if group != self.__dfgCurrentGroup:
@@ -434,7 +468,8 @@ class GraphManager(object):
     def __addNodeToGroup(self, node):
         if(not self.__dfgCurrentGroup):
             return
-        self.__dfgGroups[self.__dfgCurrentGroup].append(node)
+        self.__dfgGroups[self.__dfgCurrentGroup][node] = True
+        self.__dfgNodeGroups[node] = self.__dfgCurrentGroup
 
     def getAllNodeNames(self):
         return self.__dfgNodes.values()
@@ -473,6 +508,10 @@ class GraphManager(object):
         return result
 
     def getNumPorts(self, node):
+        ports = self.__dfgNodePorts.get(node, None)
+        if ports is not None:
+            return len(ports)
+
         nodeType = self.__dfgExec.getNodeType(node)
         if nodeType == 3: # var
             return 1
@@ -483,25 +522,18 @@ class GraphManager(object):
         return 0
 
     def hasInputConnections(self, node):
-        for nodeName in self.__dfgConnections:
-            ports = self.__dfgConnections[nodeName]
-            for portName in ports:
-                connections = ports[portName]
-                for c in connections:
-                    if c[0] == node:
-                        return True
-
-        return False
+        return node in self.__dfgNodeInputPorts
 
     def hasOutputConnections(self, node):
-        ports = self.__dfgConnections.get(node, {})
-        for port in ports:
-            if len(ports) > 0:
-                return True
-
-        return False
+        return node in self.__dfgConnections
 
     def getPortIndex(self, node, port):
+        ports = self.__dfgNodePorts.get(node, None)
+        if ports is not None:
+            if port in ports:
+                return ports.index(port)
+            return 0
+
         nodeType = self.__dfgExec.getNodeType(node)
         if nodeType == 3: # var
             return 0
@@ -531,6 +563,26 @@ class GraphManager(object):
 
         return minIndex
 
+    def getAllNodePortCounts(self):
+        result = {}
+        for node in self.getAllNodeNames():
+            result[node] = self.getNumPorts(node)
+
+        return result
+
+    def getAllConnectionPortIndices(self):
+        result = {}
+        for nodeName in self.__dfgConnections:
+            node = self.__dfgConnections[nodeName]
+            for portName in node:
+                for (otherNode, otherPort) in node[portName]:
+                    index = self.getPortIndex(otherNode, otherPort)
+                    key = (nodeName, otherNode)
+                    if key not in result or index < result[key]:
+                        result[key] = index
+
+        return result
+
     def getAllNodePortIndices(self):
         result = {}
         nodes = self.getAllNodeNames()
@@ -555,7 +607,7 @@ class GraphManager(object):
 
     def implodeNodesByGroup(self):
         for group in self.__dfgGroupNames:
-            nodes = self.__dfgGroups[group]
+            nodes = self.getNodesInGroup(group)
 
             implodedName = self.__dfgExec.implodeNodes(group, nodes)
             break # todo... right now this doesn't work properly
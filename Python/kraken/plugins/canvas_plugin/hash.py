@@ -1,6 +1,12 @@
 """Kraken Canvas - Hash module."""
 
+import sys
 import copy
+import struct
+import hashlib
+from array import array
+
+from kraken.core.objects.curve_data import packCurveData
 
 
 def makeHash(o):
@@ -31,3 +37,32 @@ def makeHash(o):
         new_o[k] = makeHash(v)
 
     return hash(tuple(frozenset(sorted(new_o.items()))))
+
+
+def makeCurveHash(curveData):
+    """Makes a digest of curve data from its packed point positions.
+
+    The digest is computed over the raw bytes of the packed points and the
+    number of points, degree and closed flag of each sub-curve, nothing is
+    copied or sorted. Equal shapes have the same digest in every session.
+
+    Args:
+        curveData (list): Packed sub-curves, or dictionaries defining them.
+
+    Returns:
+        str: Hexadecimal digest of the curve data.
+
+    """
+
+    digest = hashlib.md5()
+    for subCurve in packCurveData(curveData):
+        points = subCurve.getPackedPoints()
+        digest.update(struct.pack('<IIB', len(points) // 3, subCurve.getDegree(),
+                                  bool(subCurve.getClosed())))
+        if sys.byteorder != 'little':
+            points = array('d', points)
+            points.byteswap()
+
+        digest.update(points.tostring())
+
+    return digest.hexdigest()
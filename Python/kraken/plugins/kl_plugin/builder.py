@@ -6,6 +6,7 @@ Builder -- Component representation.
 """
 
 import os
+import re
 import json
 
 from kraken.core.kraken_system import ks
@@ -31,6 +32,7 @@ from kraken.core.objects.attributes.attribute_group import AttributeGroup
 from kraken.core.maths.vec3 import Vec3
 from kraken.core.maths.color import Color
 from kraken.core.maths.xfo import Xfo
+from kraken.core.maths.xfo_array import isNumpyAvailable
 
 from kraken.plugins.canvas_plugin.graph_manager import GraphManager
 
@@ -48,12 +50,18 @@ class Builder(Builder):
     __canvasGraph = None
     __names = None
     __pathToName = None
+    __layers = None
     __klMembers = None
     __klObjects = None
     __klAttributes = None
     __klConstraints = None
     __klSolvers = None
     __klCanvasOps = None
+    __klObjectsByMember = None
+    __klAttributesByMember = None
+    __klConstraintsByMember = None
+    __klSolversByMember = None
+    __klCanvasOpsByMember = None
     __klPreCode = None
     __klConstants = None
     __klExtExecuted = None
@@ -64,6 +72,17 @@ class Builder(Builder):
     __krkDeformers = None
     __krkVisitedObjects = None
     __krkShapes = None
+    __solveMode = None
+    __solveBlockMinSize = None
+    __parallelBlockMinSize = None
+    __klSolveBlocks = None
+
+    # Solve modes, set with the 'SolveMode' metadata of the config. 'levels'
+    # solves the independent objects of each dependency level in batched
+    # loops, 'parallel' runs the large batches with a parallel operator.
+    solveModes = ['serial', 'levels', 'parallel']
+
+    __memberPattern = re.compile(r'^(_\w+)\[(\w+)\]$')
 
     def __init__(self):
         super(Builder, self).__init__()
@@ -83,13 +102,54 @@ class Builder(Builder):
     def setOutputFolder(self, folder):
         self.__outputFolder = folder
 
+    # ========================
+    # Canvas Methods
+    # ========================
+    def getCanvasGraph(self):
+        """Returns the Canvas graph of the build, created on first use so
+        rigs without Canvas operators don't need the Fabric core.
+
+        Returns:
+            GraphManager: The graph manager.
+
+        """
+
+        if self.__canvasGraph is None:
+            self.__canvasGraph = GraphManager()
+
+        return self.__canvasGraph
+
     # ========================
     # KL related Methods
     # ========================
 
+    def __getLayer(self, item):
+        # Same as item.getLayer(), the layer found above each parent is
+        # stored so deep hierarchies are walked once.
+        parent = item.getParent()
+        walked = []
+        layer = None
+        while parent is not None:
+            if id(parent) in self.__layers:
+                layer = self.__layers[id(parent)]
+                break
+
+            walked.append(id(parent))
+            if parent.isTypeOf('Layer'):
+                layer = parent
+                break
+
+            parent = parent.getParent()
+
+        for key in walked:
+            self.__layers[key] = layer
+
+        return layer
+
     def getUniqueName(self, item, earlyExit = False):
-        if self.__pathToName.has_key(item.getDecoratedPath()):
-            return self.__pathToName[item.getDecoratedPath()]
+        decoratedPath = item.getDecoratedPath()
+        if self.__pathToName.has_key(decoratedPath):
+            return self.__pathToName[decoratedPath]
         name = None
         if isinstance(item, AttributeGroup):
             name = self.getUniqueName(item.getParent(), earlyExit = True) + '_' + item.getName()
@@ -106,8 +166,9 @@ class Builder(Builder):
             if item.getComponent():
                 component = item.getComponent().getBuildName().replace('_', '') + '_'
         if hasattr(item, 'getLayer'):
-            if item.getLayer():
-                layer = item.getLayer().getName().replace('_', '') + '_'
+            itemLayer = self.__getLayer(item)
+            if itemLayer:
+                layer = itemLayer.getName().replace('_', '') + '_'
 
         if isinstance(item, CtrlSpace) and not name.lower().endswith('space'):
             name = name + 'Space'
@@ -117,7 +178,7 @@ class Builder(Builder):
             name = name + 'Out'
 
         if layer == '' and component == '':
-            name = item.getDecoratedPath()
+            name = decoratedPath
             if name.find('.') > -1:
                 name = name.partition('.')[2]
             name = name.replace('.', '_').replace(':', '_')
@@ -133,8 +194,8 @@ class Builder(Builder):
             nameSuffix = nameSuffix + 1
             name = namePrefix + str(nameSuffix)
 
-        self.__names[name] = item.getDecoratedPath()
-        self.__pathToName[item.getDecoratedPath()] = name
+        self.__names[name] = decoratedPath
+        self.__pathToName[decoratedPath] = name
 
         return name
 
@@ -211,12 +272,43 @@ class Builder(Builder):
         return "KRK_" + self.__rigTitle.replace(' ', '')
 
     def __visitKLObject(self, item):
+        """Returns the KL code solving an object and the objects it depends on
+        which haven't been visited yet.
+
+        The dependencies are visited with an explicit stack, so long chains of
+        objects don't hit the recursion limit.
+
+        """
 
         kl = []
         if item['visited']:
             return kl
         item['visited'] = True
 
+        stack = [self.__emitKLObject(item, kl)]
+        while len(stack) > 0:
+            try:
+                dependency = next(stack[-1])
+            except StopIteration:
+                stack.pop()
+                continue
+
+            if dependency['visited']:
+                continue
+            dependency['visited'] = True
+
+            stack.append(self.__emitKLObject(dependency, kl))
+
+        return kl
+
+    def __emitKLObject(self, item, kl):
+        """Adds the KL code solving an object to a list.
+
+        Yields the objects which have to be solved first at the point their
+        code is needed, see __visitKLObject.
+
+        """
+
         member = item['member']
         name = self.getUniqueName(item['sceneItem'])
 
@@ -226,27 +318,27 @@ class Builder(Builder):
             kl += ["  this.%s.global = this.%s.local;" % (member, member)]
             kl += self.__registerEvalID(item)
             self.__krkVisitedObjects.append(item);
-            return kl
+            return
 
-        objects = [self.findKLObjectForSI(obj) for obj in sources if self.findKLObjectForSI(obj)]
+        objects = [x for x in [self.findKLObjectForSI(obj) for obj in sources] if x]
         if len(objects) > 1:
             print ("WARNING: object %s has more than one object source: %s (Parenting to last)." % (item['sceneItem'], [o["member"] for o in objects]))
 
         # let's check if this objects has a source pose constraint or not
         needParentConstraint = True
         hasConstraints = False
-        constraints = [self.findKLConstraint(constraint) for constraint in sources if self.findKLConstraint(constraint)]
+        constraints = [x for x in [self.findKLConstraint(constraint) for constraint in sources] if x]
         for sourceConstraint in constraints:
             if sourceConstraint:
                 hasConstraints = True              
-        solvers = [self.findKLSolver(solver) for solver in sources if self.findKLSolver(solver)]
+        solvers = [x for x in [self.findKLSolver(solver) for solver in sources] if x]
         for sourceSolver in solvers:
             if sourceSolver:
               needParentConstraint = False
 
         if len(objects) and needParentConstraint:
             parent = objects[-1]
-            kl += self.__visitKLObject(parent)
+            yield parent
             kl += ["", "  // solving parent child constraint %s" % name]
             if self.__debugMode:
                 kl += ["  report(\"solving parent child constraint %s\");" % name]
@@ -254,7 +346,7 @@ class Builder(Builder):
             if not hasConstraints:
                 kl += self.__registerEvalID(item)
 
-        constraints = [self.findKLConstraint(constraint) for constraint in sources if self.findKLConstraint(constraint)]
+        constraints = [x for x in [self.findKLConstraint(constraint) for constraint in sources] if x]
         for sourceConstraint in constraints:
 
             if sourceConstraint:
@@ -264,7 +356,7 @@ class Builder(Builder):
                 for i in range(len(constraint.getConstrainers())):
                     constrainer = constraint.getConstrainers()[i]
                     constrainerObj = self.findKLObjectForSI(constrainer)
-                    kl += self.__visitKLObject(constrainerObj)
+                    yield constrainerObj
 
                 kl += ["", "  // solving %s constraint %s" % (sourceConstraint['sceneItem'].__class__.__name__, sourceName)]
                 if self.__debugMode:
@@ -282,7 +374,7 @@ class Builder(Builder):
                 kl += self.__registerEvalID(item)
 
 
-        solvers = [self.findKLSolver(solver) for solver in sources if self.findKLSolver(solver)]
+        solvers = [x for x in [self.findKLSolver(solver) for solver in sources] if x]
         for sourceSolver in solvers:
 
             if sourceSolver:
@@ -291,7 +383,7 @@ class Builder(Builder):
                 sourceMember = sourceSolver['member']
                 sourceName = self.getUniqueName(kOperator)
                 eventSolverName = sourceMember.replace('[', '').replace(']', '')
-                args = kOperator.getSolverArgs()
+                args = kOperator.getSolverArgSchema()
 
                 if not sourceSolver.get('visited', False):
                     sourceSolver['visited'] = True
@@ -304,10 +396,7 @@ class Builder(Builder):
 
                     # first let's find all args which are arrays and prepare storage
                     for i in xrange(len(args)):
-                        arg = args[i]
-                        argName = arg.name.getSimpleType()
-                        argDataType = arg.dataType.getSimpleType()
-                        argConnectionType = arg.connectionType.getSimpleType()
+                        argName, argDataType, argConnectionType = args[i]
                         connectedObjects = None
                         argMember = self.getUniqueArgMember(kOperator, argName, argDataType)
                         isArray = argDataType.endswith('[]')
@@ -332,7 +421,7 @@ class Builder(Builder):
                                     continue
                                 elif isinstance(connected, SceneItem):
                                     connectedObj = self.findKLObjectForSI(connected)
-                                    kl += self.__visitKLObject(connectedObj)
+                                    yield connectedObj
                                     kl += ["  this.%s[%d] = this.%s.global;" % (argMember, j, connectedObj['member'])]
                                 elif isinstance(connected, Xfo):
                                     if argDataType == "Mat44[]":
@@ -359,7 +448,7 @@ class Builder(Builder):
 
                         elif isinstance(connected, SceneItem):
                             connectedObj = self.findKLObjectForSI(connected)
-                            kl += self.__visitKLObject(connectedObj)
+                            yield connectedObj
                             kl += ["  this.%s = this.%s.global;" % (argMember, connectedObj['member'])]
 
                         elif isinstance(connected, Xfo):
@@ -377,10 +466,7 @@ class Builder(Builder):
                     # perform the solve
                     if self.__debugMode:
                         for i in xrange(len(args)):
-                            arg = args[i]
-                            argName = arg.name.getSimpleType()
-                            argDataType = arg.dataType.getSimpleType()
-                            argConnectionType = arg.connectionType.getSimpleType()
+                            argName, argDataType, argConnectionType = args[i]
                             if argConnectionType != 'In':
                                 continue
                             kl += ["  report(\"arg %s \" + this.%s);" % (argName, argMember)]
@@ -390,9 +476,7 @@ class Builder(Builder):
 
                     kl += ["  this.%s.solve(" % sourceMember]
                     for i in xrange(len(args)):
-                        arg = args[i]
-                        argName = arg.name.getSimpleType()
-                        argDataType = arg.dataType.getSimpleType()
+                        argName, argDataType = args[i][:2]
                         argMember = self.getUniqueArgMember(kOperator, argName, argDataType)
                         comma = ""
                         if i < len(args) - 1:
@@ -411,10 +495,7 @@ class Builder(Builder):
 
                 # output to the results!
                 for i in xrange(len(args)):
-                    arg = args[i]
-                    argName = arg.name.getSimpleType()
-                    argDataType = arg.dataType.getSimpleType()
-                    argConnectionType = arg.connectionType.getSimpleType()
+                    argName, argDataType, argConnectionType = args[i]
                     if argConnectionType == 'In':
                       continue
                     argMember = self.getUniqueArgMember(kOperator, argName, argDataType)
@@ -442,9 +523,9 @@ class Builder(Builder):
                             kl += self.__registerEvalID(item)
                         else:
                             connectedObj = self.findKLObjectForSI(connected)
-                            kl += self.__visitKLObject(connectedObj)
+                            yield connectedObj
 
-        canvases = [self.findKLCanvasOp(canvas) for canvas in sources if self.findKLCanvasOp(canvas)]
+        canvases = [x for x in [self.findKLCanvasOp(canvas) for canvas in sources] if x]
         for sourceCanvasOp in canvases:
 
             sourceMember = sourceCanvasOp['member']
@@ -458,22 +539,271 @@ class Builder(Builder):
             # todo: canvas operators
 
         self.__krkVisitedObjects.append(item)
-        return kl
 
     def __visitKLAttribute(self, attr):
         klCode = []
-        if attr.get('visited', False):
-            return klCode
 
-        source = attr['sceneItem'].getCurrentSource()
-        if not isinstance(source, Attribute):
-            return klCode
+        # Walk up the chain of driving attributes, then copy the values down
+        # from the first source. Each attribute is copied once per solve.
+        chain = []
+        while not attr.get('visited', False):
+            attr['visited'] = True
+
+            source = attr['sceneItem'].getCurrentSource()
+            if not isinstance(source, Attribute):
+                break
+
+            sourceAttr = self.findKLAttribute(source)
+            chain.append((attr, sourceAttr))
+            attr = sourceAttr
+
+        for attr, sourceAttr in reversed(chain):
+            klCode += ["  this.%s.value = this.%s.value;" % (attr['member'], sourceAttr['member'])]
 
-        sourceAttr = self.findKLAttribute(source)
-        klCode += self.__visitKLAttribute(sourceAttr)
-        klCode += ["  this.%s.value = this.%s.value;" % (attr['member'], sourceAttr['member'])]
         return klCode
 
+    def __getKLObjectDependencies(self, item):
+        """Returns the objects solved before an object by __visitKLObject."""
+
+        sources = item['sceneItem'].getSources()
+
+        dependencies = []
+        objects = [x for x in [self.findKLObjectForSI(obj) for obj in sources] if x]
+        solvers = [x for x in [self.findKLSolver(solver) for solver in sources] if x]
+        if len(objects) and not len(solvers):
+            dependencies.append(objects[-1])
+
+        constraints = [x for x in [self.findKLConstraint(constraint) for constraint in sources] if x]
+        for constraint in constraints:
+            for constrainer in constraint['sceneItem'].getConstrainers():
+                dependencies.append(self.findKLObjectForSI(constrainer))
+
+        for solver in solvers:
+            kOperator = solver['sceneItem']
+            for argName, argDataType, argConnectionType in kOperator.getSolverArgSchema():
+                if argConnectionType == 'In':
+                    connectedObjects = kOperator.getInput(argName)
+                elif argConnectionType == 'IO':
+                    connectedObjects = kOperator.getOutput(argName)
+                else:
+                    continue
+
+                if not argDataType.endswith('[]'):
+                    connectedObjects = [connectedObjects]
+                for connected in connectedObjects:
+                    if isinstance(connected, SceneItem) and not isinstance(connected, Attribute):
+                        dependencies.append(self.findKLObjectForSI(connected))
+
+        return [x for x in dependencies if x]
+
+    def __getKLObjectLevels(self):
+        """Returns the dependency level of each object member, the objects of
+        a level only depend on objects of the lower levels.
+
+        Cycles are ignored here, the serial visit breaks them.
+
+        """
+
+        levels = {}
+        for obj in self.__klObjects:
+            if obj['member'] in levels:
+                continue
+
+            # None marks the objects being visited.
+            levels[obj['member']] = None
+            stack = [[obj, iter(self.__getKLObjectDependencies(obj)), 0]]
+            while len(stack) > 0:
+                entry = stack[-1]
+                dependency = next(entry[1], None)
+                if dependency is None:
+                    stack.pop()
+                    levels[entry[0]['member']] = entry[2]
+                    if len(stack) > 0:
+                        stack[-1][2] = max(stack[-1][2], entry[2] + 1)
+                    continue
+
+                if dependency['member'] not in levels:
+                    levels[dependency['member']] = None
+                    stack.append([dependency, iter(self.__getKLObjectDependencies(dependency)), 0])
+                elif levels[dependency['member']] is not None:
+                    entry[2] = max(entry[2], levels[dependency['member']] + 1)
+
+        return levels
+
+    def __getKLSolveStep(self, item):
+        """Returns the key of the solve blocks an object can be batched in and
+        the indices of the members it reads.
+
+        Objects with solvers, canvas operators, several parents or several
+        constraints return None and are solved by __visitKLObject.
+
+        """
+
+        sources = item['sceneItem'].getSources()
+
+        objects = [x for x in [self.findKLObjectForSI(obj) for obj in sources] if x]
+        constraints = [x for x in [self.findKLConstraint(constraint) for constraint in sources] if x]
+        if len(objects) > 1 or len(constraints) > 1:
+            return None
+
+        for source in sources:
+            if self.findKLSolver(source) or self.findKLCanvasOp(source):
+                return None
+
+        members = [item]
+        if len(sources) == 0:
+            kind = 'global'
+        elif len(objects) == 0 and len(constraints) == 0:
+            return None
+        elif len(constraints) == 0:
+            kind = 'parent'
+            members.append(objects[0])
+        else:
+            kind = 'constraint'
+            if len(objects):
+                kind = 'parentConstraint'
+                members.append(objects[0])
+
+            constrainers = [self.findKLObjectForSI(x) for x in constraints[0]['sceneItem'].getConstrainers()]
+            if len(constrainers) == 0 or None in constrainers:
+                return None
+            members += [constraints[0]] + constrainers
+
+        arrays = [kind]
+        indices = []
+        for member in members:
+            match = self.__memberPattern.match(member['member'])
+            if match is None:
+                return None
+
+            arrays.append(match.group(1))
+            indices.append(match.group(2))
+
+        return tuple(arrays), indices
+
+    def __getKLSolveBlockCode(self, key, blockIndex, owner, indent):
+        """Returns the KL code solving the object at 'index' of a block."""
+
+        kind = key[0]
+        arrays = key[1:]
+
+        names = ['child']
+        if kind in ['parent', 'parentConstraint']:
+            names.append('parent')
+        if kind in ['constraint', 'parentConstraint']:
+            names.append('constraint')
+            names += ['constrainer%d' % i for i in xrange(len(arrays) - len(names))]
+
+        refs = {}
+        code = ["Index offset = index * %d;" % len(names)]
+        for i in xrange(len(names)):
+            code += ["UInt32 %s = %s.solveBlocks[%d][offset + %d];" % (names[i], owner, blockIndex, i)]
+            refs[names[i]] = "%s.%s[%s]" % (owner, arrays[i], names[i])
+
+        child = refs['child']
+        if kind == 'global':
+            code += ["%s.global = %s.local;" % (child, child)]
+        if 'parent' in refs:
+            code += ["%s.global = %s.global * %s.local;" % (child, refs['parent'], child)]
+        if 'constraint' in refs:
+            for i in xrange(len(names) - names.index('constraint') - 1):
+                code += ["%s.constrainers[%d] = %s.global;" % (refs['constraint'], i, refs['constrainer%d' % i])]
+            code += ["%s.global = %s.compute(%s.global);" % (child, refs['constraint'], child)]
+
+        return [indent + x for x in code]
+
+    def __emitKLSolveBlock(self, level, key, items, operators):
+        """Returns the KL code solving a block of independent objects.
+
+        The member indices of the objects are stored in the solveBlocks table
+        of the rig, filled by init. Blocks large enough are solved by a
+        parallel operator added to the operators list in 'parallel' mode.
+
+        """
+
+        indices = []
+        evalIDs = []
+        for obj, objIndices in items:
+            obj['visited'] = True
+            indices += objIndices
+            self.__registerEvalID(obj)
+            evalIDs.append(self.__klEvalID[obj['member']])
+            self.__krkVisitedObjects.append(obj)
+
+        blockIndex = len(self.__klSolveBlocks)
+        self.__klSolveBlocks.append(indices)
+
+        if key[0] == 'global':
+            kind = 'global transforms'
+        elif key[0] == 'parent':
+            kind = 'parent child constraints'
+        elif key[0] == 'constraint':
+            kind = '%s constraints' % key[2][len('_Kraken'):]
+        else:
+            kind = 'parent child and %s constraints' % key[3][len('_Kraken'):]
+
+        kl = ["", "  // solving level %d: %d %s" % (level, len(items), kind)]
+        if self.__debugMode:
+            kl += ["  report(\"solving level %d: %d %s\");" % (level, len(items), kind)]
+
+        if self.__solveMode == 'parallel' and len(items) >= self.__parallelBlockMinSize:
+            operatorName = "%s_solveBlock%d" % (self.getKLExtensionName(), blockIndex)
+            operators += ["operator %s<<<Index index>>>(io %s rig) {" % (operatorName, self.getKLExtensionName())]
+            operators += self.__getKLSolveBlockCode(key, blockIndex, 'rig', '  ')
+            operators += ["}", ""]
+
+            kl += ["  %s<<<%d>>>(this);" % (operatorName, len(items))]
+        else:
+            kl += ["  for(Index index=0;index<%d;index++) {" % len(items)]
+            kl += self.__getKLSolveBlockCode(key, blockIndex, 'this', '    ')
+            kl += ["  }"]
+
+        kl += ["  if(context.maxEvalID >= %d && context.maxEvalID <= %d) return;" % (min(evalIDs), max(evalIDs))]
+
+        return kl
+
+    def __visitKLObjectLevels(self, operators):
+        """Returns the KL code solving the objects level by level.
+
+        The objects of a level solved the same way are batched in blocks, the
+        others are solved one by one with __visitKLObject after the blocks.
+
+        """
+
+        levels = self.__getKLObjectLevels()
+        objectsByLevel = {}
+        for obj in self.__klObjects:
+            objectsByLevel.setdefault(levels[obj['member']], []).append(obj)
+
+        kl = []
+        for level in sorted(objectsByLevel):
+            keys = []
+            blocks = {}
+            for obj in objectsByLevel[level]:
+                # Objects can be visited early as dependencies of an object
+                # solved one by one.
+                if obj['visited']:
+                    continue
+
+                step = self.__getKLSolveStep(obj)
+                if step is None:
+                    continue
+
+                key, indices = step
+                if key not in blocks:
+                    keys.append(key)
+                    blocks[key] = []
+                blocks[key].append((obj, indices))
+
+            for key in keys:
+                if len(blocks[key]) >= self.__solveBlockMinSize:
+                    kl += self.__emitKLSolveBlock(level, key, blocks[key], operators)
+
+            for obj in objectsByLevel[level]:
+                kl += self.__visitKLObject(obj)
+
+        return kl
+
     def generateKLCode(self):
 
         controls = []
@@ -488,11 +818,9 @@ class Builder(Builder):
                 scalarAttributes.append(attr)
 
         for solver in self.__klSolvers:
-            args = solver['sceneItem'].getSolverArgs()
+            args = solver['sceneItem'].getSolverArgSchema()
             for i in xrange(len(args)):
-                arg = args[i]
-                argName = arg.name.getSimpleType()
-                argDataType = arg.dataType.getSimpleType()
+                argName, argDataType = args[i][:2]
                 argMember = self.getUniqueArgMember(solver['sceneItem'], argName, argDataType)
 
         kl = []
@@ -516,6 +844,8 @@ class Builder(Builder):
         if self.__profilingFrames > 0:
             kl += ["  SInt32 profilingFrame;"]
         kl += ["  KrakenClip clip; // the default clip of the rig"]
+        if self.__solveMode != 'serial':
+            kl += ["  UInt32 solveBlocks[][];"]
         for argType in self.__klMembers['members']:
             kl += ["  %s _%s[%d];" % (argType.replace('_Driven', ''), argType, len(self.__klMembers['members'][argType]))]
 
@@ -542,19 +872,18 @@ class Builder(Builder):
 
         kl += ["function %s.resetPose!() {" % self.getKLExtensionName()]
         kl += ["  // reset objects"]
-        for obj in self.__klObjects:
-            kl += ["  this.%s.local = %s.toMat44();" % (obj['member'], self.__getXfoAsStr(obj['sceneItem'].localXfo))]
+        sceneItems = [obj['sceneItem'] for obj in self.__klObjects]
+        if isNumpyAvailable():
+            localXfos = Object3D.getLocalXfos(sceneItems)
+        else:
+            localXfos = [sceneItem.localXfo for sceneItem in sceneItems]
+        for obj, localXfo in zip(self.__klObjects, localXfos):
+            kl += ["  this.%s.local = %s.toMat44();" % (obj['member'], self.__getXfoAsStr(localXfo))]
         kl += ["  // reset attributes"]
         for attr in scalarAttributes:
             kl += ["  this.%s.value = %f;" % (attr['member'], attr['value'])]
         kl += ["}", ""]
 
-        kl += ["function %s.solve!(KrakenClipContext context) {" % self.getKLExtensionName()]
-        if self.__profilingFrames > 0:
-            kl += ["  AutoProfilingEvent methodEvent(\"%s.solve\");" % self.getKLExtensionName()]
-
-        kl += self.__klPreCode
-
         for obj in self.__klObjects:
             obj['visited'] = False
         for solver in self.__klSolvers:
@@ -564,16 +893,31 @@ class Builder(Builder):
         for canvasOp in self.__klCanvasOps:
             canvasOp['visited'] = False
 
+        solveKL = []
         for attr in self.__klAttributes:
-            kl += self.__visitKLAttribute(attr)
+            solveKL += self.__visitKLAttribute(attr)
 
         if self.__profilingFrames > 0:
-            kl += ["  {  AutoProfilingEvent visitKLObjectsEvent(\"rig pose solve\");"]
+            solveKL += ["  {  AutoProfilingEvent visitKLObjectsEvent(\"rig pose solve\");"]
         self.__krkVisitedObjects = []
-        for obj in self.__klObjects:
-            kl += self.__visitKLObject(obj)
+        self.__klSolveBlocks = []
+        operators = []
+        if self.__solveMode == 'serial':
+            for obj in self.__klObjects:
+                solveKL += self.__visitKLObject(obj)
+        else:
+            solveKL += self.__visitKLObjectLevels(operators)
         if self.__profilingFrames > 0:
-            kl += ["  }"]
+            solveKL += ["  }"]
+
+        kl += operators
+
+        kl += ["function %s.solve!(KrakenClipContext context) {" % self.getKLExtensionName()]
+        if self.__profilingFrames > 0:
+            kl += ["  AutoProfilingEvent methodEvent(\"%s.solve\");" % self.getKLExtensionName()]
+
+        kl += self.__klPreCode
+        kl += solveKL
 
         kl += ["}", ""]
 
@@ -646,6 +990,15 @@ class Builder(Builder):
                 kl += ["  this.%s.offset = %s.toMat44();" % (memberName, self.__getXfoAsStr(constraint['sceneItem'].computeOffset()))]
             kl += ["  this.%s.constrainers.resize(%d);" % (memberName, len(constraint['constrainers']))]
 
+        if len(self.__klSolveBlocks) > 0:
+            kl += ["", "  // build solve blocks"]
+            kl += ["  this.solveBlocks.resize(%d);" % len(self.__klSolveBlocks)]
+            for i in xrange(len(self.__klSolveBlocks)):
+                indices = self.__klSolveBlocks[i]
+                kl += ["  this.solveBlocks[%d].resize(%d);" % (i, len(indices))]
+                for j in xrange(len(indices)):
+                    kl += ["  this.solveBlocks[%d][%d] = %s;" % (i, j, indices[j])]
+
         kl += ["", "  // build kl solvers"]
         for solver in self.__klSolvers:
             memberName = solver['member']
@@ -1091,38 +1444,23 @@ class Builder(Builder):
 
     def findKLObjectForSI(self, kSceneItem):
         member = self.getUniqueObjectMember(kSceneItem, None)
-        for obj in self.__klObjects:
-            if obj['member'] == member:
-                return obj
-        return None
+        return self.__klObjectsByMember.get(member, None)
 
     def findKLAttribute(self, kAttribute):
         member = self.getUniqueObjectMember(kAttribute, None)
-        for attr in self.__klAttributes:
-            if attr['member'] == member:
-                return attr
-        return None
+        return self.__klAttributesByMember.get(member, None)
 
     def findKLConstraint(self, kConstraint):
         member = self.getUniqueObjectMember(kConstraint, None)
-        for constraint in self.__klConstraints:
-            if constraint['member'] == member:
-                return constraint
-        return None
+        return self.__klConstraintsByMember.get(member, None)
 
     def findKLSolver(self, kOperator):
         member = self.getUniqueObjectMember(kOperator, None)
-        for solver in self.__klSolvers:
-            if solver['member'] == member:
-                return solver
-        return None
+        return self.__klSolversByMember.get(member, None)
 
     def findKLCanvasOp(self, kOperator):
         member = self.getUniqueObjectMember(kOperator, None)
-        for canvasOp in self.__klCanvasOps:
-            if canvasOp['member'] == member:
-                return canvasOp
-        return None
+        return self.__klCanvasOpsByMember.get(member, None)
 
     def buildKLSceneItem(self, kSceneItem, buildName):
 
@@ -1178,7 +1516,10 @@ class Builder(Builder):
             getMethod = 'get%s' % parentName.capitalize()
             if not hasattr(kSceneItem, getMethod):
                 continue
-            parent = getattr(kSceneItem, getMethod)()
+            if parentName == 'layer':
+                parent = self.__getLayer(kSceneItem)
+            else:
+                parent = getattr(kSceneItem, getMethod)()
             if not parent:
                 continue
             obj[parentName] = parent.getDecoratedPath()
@@ -1189,6 +1530,7 @@ class Builder(Builder):
                 obj['parent'] = parent.getDecoratedPath()
 
         self.__klObjects.append(obj)
+        self.__klObjectsByMember.setdefault(obj['member'], obj)
         return True
 
     def buildKLAttribute(self, kAttribute):
@@ -1225,6 +1567,7 @@ class Builder(Builder):
               attr['max'] = kAttribute.getMax()
 
         self.__klAttributes.append(attr)
+        self.__klAttributesByMember.setdefault(attr['member'], attr)
         return kAttribute
 
     def buildKLConstraint(self, kConstraint):
@@ -1246,6 +1589,7 @@ class Builder(Builder):
         }
 
         self.__klConstraints.append(constraint)
+        self.__klConstraintsByMember.setdefault(constraint['member'], constraint)
         return kConstraint
 
     # ========================
@@ -1562,6 +1906,7 @@ class Builder(Builder):
         }
 
         self.__klSolvers.append(solver)
+        self.__klSolversByMember.setdefault(solver['member'], solver)
 
         if kOperator.extension != "Kraken" and kOperator.extension not in self.__klExtensions:
             self.__klExtensions.append(kOperator.extension)
@@ -1585,8 +1930,9 @@ class Builder(Builder):
 
         # todo: we should only instaniate each preset once
         # and we should add functions to the kl code for each ONCE
-        node = self.__canvasGraph.createNodeFromPresetSI(kOperator, kOperator.getPresetPath(), title='constructor')
-        subExec = self.__canvasGraph.getSubExec(node)
+        canvasGraph = self.getCanvasGraph()
+        node = canvasGraph.createNodeFromPresetSI(kOperator, kOperator.getPresetPath(), title='constructor')
+        subExec = canvasGraph.getSubExec(node)
 
         portTypeMap = {
             0: 'In',
@@ -1603,6 +1949,7 @@ class Builder(Builder):
           "path": kOperator.getDecoratedPath()
         }
         self.__klCanvasOps.append(canvasOp)
+        self.__klCanvasOpsByMember.setdefault(canvasOp['member'], canvasOp)
 
         return False
 
@@ -1730,10 +2077,17 @@ class Builder(Builder):
         self.__useRigConstants = self.getConfig().getMetaData('UseRigConstants', False)
         self.__profilingFrames = self.getConfig().getMetaData('ProfilingFrames', 0)
         self.__profilingLogFile = self.getConfig().getMetaData('ProfilingLogFile', None)
-        self.__canvasGraph = GraphManager()
+        self.__solveMode = self.getConfig().getMetaData('SolveMode', 'serial')
+        if self.__solveMode not in self.solveModes:
+            raise ValueError("'" + str(self.__solveMode) + "' is not a valid solve mode. Valid modes are " + ', '.join(self.solveModes))
+        self.__solveBlockMinSize = self.getConfig().getMetaData('SolveBlockMinSize', 4)
+        self.__parallelBlockMinSize = self.getConfig().getMetaData('ParallelBlockMinSize', 64)
+        self.__klSolveBlocks = []
+        self.__canvasGraph = None
         self.__debugMode = False
         self.__names = {}
         self.__pathToName = {}
+        self.__layers = {}
         self.__klExtensions = []
         self.__klMembers = {'members': {}, 'lookup': {}}
         self.__klObjects = []
@@ -1742,6 +2096,11 @@ class Builder(Builder):
         self.__klSolvers = []
         self.__klEvalID = {}
         self.__klCanvasOps = []
+        self.__klObjectsByMember = {}
+        self.__klAttributesByMember = {}
+        self.__klConstraintsByMember = {}
+        self.__klSolversByMember = {}
+        self.__klCanvasOpsByMember = {}
         self.__klConstants = {}
         self.__klExtExecuted = False
         self.__klArgs = {'members': {}, 'lookup': {}}
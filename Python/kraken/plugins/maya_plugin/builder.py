@@ -30,13 +30,31 @@ logger.setLevel(logging.INFO)
 class Builder(Builder):
     """Builder object for building Kraken objects in Maya."""
 
+    _supportsIncrementalBuild = True
+
     def __init__(self):
         super(Builder, self).__init__()
 
     def deleteBuildElements(self):
         """Clear out all dcc built elements from the scene if exist."""
 
-        for builtElement in self._buildElements:
+        self._deleteBuildElements(self._buildElements)
+        self._clearBuildElements()
+
+        return
+
+    def _deleteBuildElements(self, buildElements):
+        """Deletes the dcc scene items of some of the built elements.
+
+        Args:
+            buildElements (list): The 'src' and 'tgt' pairings to delete.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        for builtElement in buildElements:
             if builtElement['src'].isTypeOf('Attribute'):
                 continue
 
@@ -44,9 +62,7 @@ class Builder(Builder):
             if node.exists():
                 pm.delete(node)
 
-        self._buildElements = []
-
-        return
+        return True
 
     # ========================
     # Object3D Build Methods
@@ -843,12 +859,9 @@ class Builder(Builder):
 
             arraySizes = {}
             # connect the operator to the objects in the DCC
-            args = kOperator.getSolverArgs()
+            args = kOperator.getSolverArgSchema()
             for i in xrange(len(args)):
-                arg = args[i]
-                argName = arg.name.getSimpleType()
-                argDataType = arg.dataType.getSimpleType()
-                argConnectionType = arg.connectionType.getSimpleType()
+                argName, argDataType, argConnectionType = args[i]
 
                 if argConnectionType == 'In':
                     pm.FabricCanvasAddPort(mayaNode=spliceNode,
@@ -1,3 +1,5 @@
+import maya.api.OpenMaya as om2
+
 from kraken.core.maths import Xfo, Vec3, Quat
 
 from kraken.core.synchronizer import Synchronizer
@@ -62,6 +64,60 @@ class Synchronizer(Synchronizer):
         return foundItem
 
 
+    def isDCCItemValid(self, dccItem):
+        """Returns whether a DCC item recorded by the builder still exists.
+
+        Args:
+            dccItem (object): The DCC item.
+
+        Returns:
+            bool: True if the item can be synchronized from.
+
+        """
+
+        try:
+            return dccItem.exists()
+        except:
+            return False
+
+
+    def getDCCWorldMatrices(self, dccItems):
+        """Gets the world matrices of DCC items in one query.
+
+        The DAG paths of all the items are resolved through a single selection
+        list.
+
+        Args:
+            dccItems (list): The DCC items to query.
+
+        Returns:
+            list: The 16 values of the world matrix of each item, in the Kraken
+                Mat44 layout. None if an item can't be resolved.
+
+        """
+
+        selList = om2.MSelectionList()
+        try:
+            for dccItem in dccItems:
+                selList.add(dccItem.longName())
+        except:
+            return None
+
+        if selList.length() != len(dccItems):
+            return None
+
+        matrices = []
+        for i in xrange(len(dccItems)):
+            mayaMat = selList.getDagPath(i).inclusiveMatrix()
+
+            # Maya matrices hold the translation in the last row, transpose
+            # them to the Kraken layout.
+            matrices.append([mayaMat.getElement(col, row)
+                             for row in xrange(4) for col in xrange(4)])
+
+        return matrices
+
+
     def syncXfo(self, kObject):
         """Syncs the xfo from the DCC object to the Kraken object.
 
@@ -75,7 +131,7 @@ class Synchronizer(Synchronizer):
 
         hrcMap = self.getHierarchyMap()
 
-        if kObject not in hrcMap.keys():
+        if kObject not in hrcMap:
             print "Warning! 3D Object '" + kObject.getName() + "' was not found in the mapping!"
             return False
 
@@ -123,7 +179,7 @@ class Synchronizer(Synchronizer):
 
         hrcMap = self.getHierarchyMap()
 
-        if kObject not in hrcMap.keys():
+        if kObject not in hrcMap:
             print "Warning! Attribute '" + kObject.getName() + "' was not found in the mapping!"
             return False
 
@@ -151,7 +207,7 @@ class Synchronizer(Synchronizer):
 
         hrcMap = self.getHierarchyMap()
 
-        if kObject not in hrcMap.keys():
+        if kObject not in hrcMap:
             print "Warning! 3D Object '" + kObject.getName() + "' was not found in the mapping!"
             return False
 
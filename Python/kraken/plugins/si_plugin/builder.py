@@ -45,7 +45,7 @@ class Builder(Builder):
             except:
                 continue
 
-        self._buildElements = []
+        self._clearBuildElements()
 
         si.SetValue("preferences.scripting.cmdlog", True, "")
 
@@ -801,15 +801,12 @@ class Builder(Builder):
 
         try:
             solverTypeName = kOperator.getSolverTypeName()
-            args = kOperator.getSolverArgs()
+            args = kOperator.getSolverArgSchema()
 
 
             def findPortOfType(dataTypes, connectionTypes):
                 for i in xrange(len(args)):
-                    arg = args[i]
-                    # argName = arg.name.getSimpleType()
-                    argDataType = arg.dataType.getSimpleType()
-                    argConnectionType = arg.connectionType.getSimpleType()
+                    argDataType, argConnectionType = args[i][1:]
 
                     if argDataType in dataTypes and argConnectionType in connectionTypes:
                         return i
@@ -942,10 +939,7 @@ class Builder(Builder):
             arraySizes = {}
             # connect the operator to the objects in the DCC
             for i in xrange(len(args)):
-                arg = args[i]
-                argName = arg.name.getSimpleType()
-                argDataType = arg.dataType.getSimpleType()
-                argConnectionType = arg.connectionType.getSimpleType()
+                argName, argDataType, argConnectionType = args[i]
 
                 canvasOpPath2 = str(canvasOpPath) + ":"
 
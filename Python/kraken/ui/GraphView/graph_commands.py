@@ -1,44 +1,57 @@
+from kraken.ui.undoredo.undo_redo_manager import Command
+from knode import KNode
+from graph_snapshots import saveComponentSnapshot, loadComponentSnapshot, getComponentPorts
 
 
-from kraken.ui.undoredo.undo_redo_manager import Command
+# Commands reference the nodes by name, the nodes removed from the graph are
+# kept as snapshots of the data of their component instead of live objects.
+def saveNodeSnapshot(node):
+    return saveComponentSnapshot(node.getComponent())
+
+
+def loadNodeSnapshot(graph, rig, snapshot):
+    component = loadComponentSnapshot(rig, snapshot)
+    node = KNode(graph, component)
+    graph.addNode(node, emitSignal=False)
+
+    return node
+
+
+def getNodes(graph, nodeNames):
+    nodes = []
+    for nodeName in nodeNames:
+        node = graph.getNode(nodeName)
+        if node is not None:
+            nodes.append(node)
+
+    return nodes
 
 
 class SelectionChangeCommand(Command):
     def __init__(self, graph, deselectedNodes, selectedNodes):
         super(SelectionChangeCommand, self).__init__()
         self.graph = graph
-        self.deselectedNodes = deselectedNodes
-        self.selectedNodes = selectedNodes
-
-        self.desc = "Deselected: ["
-        for i in range(len(self.deselectedNodes)):
-            if i == 0:
-                self.desc = self.desc + self.deselectedNodes[i].getName()
-            else:
-                self.desc = self.desc +", " + self.deselectedNodes[i].getName()
-        self.desc = self.desc + "], Selected: ["
-        for i in range(len(self.selectedNodes)):
-            if i == 0:
-                self.desc = self.desc + self.selectedNodes[i].getName()
-            else:
-                self.desc = self.desc +", " + self.selectedNodes[i].getName()
-        self.desc = self.desc + "]"
+        self.deselectedNodeNames = [x.getName() for x in deselectedNodes]
+        self.selectedNodeNames = [x.getName() for x in selectedNodes]
+
+        self.desc = "Deselected: [" + ", ".join(self.deselectedNodeNames) + \
+            "], Selected: [" + ", ".join(self.selectedNodeNames) + "]"
 
     def shortDesc(self):
         return self.desc
 
 
     def redo(self):
-        for node in self.selectedNodes:
+        for node in getNodes(self.graph, self.selectedNodeNames):
             self.graph.selectNode(node, emitSignal=False)
-        for node in self.deselectedNodes:
+        for node in getNodes(self.graph, self.deselectedNodeNames):
             self.graph.deselectNode(node, emitSignal=False)
 
 
     def undo(self):
-        for node in self.selectedNodes:
+        for node in getNodes(self.graph, self.selectedNodeNames):
             self.graph.deselectNode(node, emitSignal=False)
-        for node in self.deselectedNodes:
+        for node in getNodes(self.graph, self.deselectedNodeNames):
             self.graph.selectNode(node, emitSignal=False)
 
 
@@ -47,21 +60,36 @@ class AddNodeCommand(Command):
         super(AddNodeCommand, self).__init__()
         self.graph = graph
         self.rig = rig
-        self.node = node
+        self.nodeName = node.getName()
+        self.snapshot = None
+
+        # Nodes without components, like backdrops, are light and kept as is.
+        self.node = None
+        if not isinstance(node, KNode):
+            self.node = node
 
 
     def shortDesc(self):
-        return "Add Node '" + self.node.getName() + "'"
+        return "Add Node '" + self.nodeName + "'"
 
 
     def redo(self):
-        self.graph.addNode(self.node, emitSignal=False)
-        self.node.getComponent().attach(self.rig)
+        if self.node is not None:
+            self.graph.addNode(self.node, emitSignal=False)
+            return
+
+        loadNodeSnapshot(self.graph, self.rig, self.snapshot)
+        self.snapshot = None
 
 
     def undo(self):
-        self.graph.removeNode(self.node, emitSignal=False)
-        self.node.getComponent().detach()
+        node = self.graph.getNode(self.nodeName)
+        if self.node is None:
+            self.snapshot = saveNodeSnapshot(node)
+
+        self.graph.removeNode(node, emitSignal=False)
+        if self.node is None:
+            node.getComponent().detach()
 
 
 class RemoveNodeCommand(Command):
@@ -69,32 +97,49 @@ class RemoveNodeCommand(Command):
         super(RemoveNodeCommand, self).__init__()
         self.graph = graph
         self.rig = rig
-        self.node = node
+        self.nodeName = node.getName()
+        self.snapshot = None
+
+        # Nodes without components, like backdrops, are light and kept as is.
+        self.node = None
+        if isinstance(node, KNode):
+            self.snapshot = saveNodeSnapshot(node)
+        else:
+            self.node = node
 
 
     def shortDesc(self):
-        return "Add Node '" + self.node.getName() + "'"
+        return "Remove Node '" + self.nodeName + "'"
 
 
     def redo(self):
-        self.graph.removeNode(self.node, emitSignal=False)
-        self.node.getComponent().detach()
+        node = self.graph.getNode(self.nodeName)
+        if self.node is None:
+            self.snapshot = saveNodeSnapshot(node)
+
+        self.graph.removeNode(node, emitSignal=False)
+        if self.node is None:
+            node.getComponent().detach()
 
 
     def undo(self):
-        self.graph.addNode(self.node, emitSignal=False)
-        self.node.getComponent().attach(self.rig)
+        if self.node is not None:
+            self.graph.addNode(self.node, emitSignal=False)
+            return
+
+        loadNodeSnapshot(self.graph, self.rig, self.snapshot)
+        self.snapshot = None
 
 
 class NodesMoveCommand(Command):
     def __init__(self, graph, nodes, delta):
         super(NodesMoveCommand, self).__init__()
         self.graph = graph
-        self.nodes = nodes
+        self.nodeNames = [x.getName() for x in nodes]
         self.delta = delta
         self.desc = "Moved: "
-        for node in self.nodes:
-            self.desc = self.desc +", " + node.getName()
+        for nodeName in self.nodeNames:
+            self.desc = self.desc +", " + nodeName
 
 
     def shortDesc(self):
@@ -102,69 +147,82 @@ class NodesMoveCommand(Command):
 
 
     def redo(self):
-        for node in self.nodes:
+        for node in getNodes(self.graph, self.nodeNames):
             node.translate( self.delta.x(), self.delta.y())
 
 
     def undo(self):
-        for node in self.nodes:
+        for node in getNodes(self.graph, self.nodeNames):
             node.translate( -self.delta.x(), -self.delta.y())
 
 
 
-class ConnectionAddedCommand(Command):
+class ConnectionCommand(Command):
     def __init__(self, graph, rig, connection):
-        super(ConnectionAddedCommand, self).__init__()
+        super(ConnectionCommand, self).__init__()
         self.graph = graph
-        self.connection = connection
+        self.rig = rig
+
+        self.sourceNodeName = connection.getSrcPort().getNode().getName()
+        self.outputName = connection.getSrcPort().getName()
+        self.targetNodeName = connection.getDstPort().getNode().getName()
+        self.inputName = connection.getDstPort().getName()
+
+
+    def getComponentPorts(self):
+        return getComponentPorts(self.rig, self.sourceNodeName, self.outputName,
+                                 self.targetNodeName, self.inputName)
+
+
+    def connect(self):
+        sourceComponentOutputPort, targetComponentInputPort = self.getComponentPorts()
+        targetComponentInputPort.setConnection(sourceComponentOutputPort)
+        self.graph.connectPorts(self.sourceNodeName, self.outputName, self.targetNodeName, self.inputName)
+
 
-        self.sourceComponent = rig.getChildByDecoratedName(self.connection.getSrcPort().getNode().getName())
-        self.targetComponent = rig.getChildByDecoratedName(self.connection.getDstPort().getNode().getName())
+    def disconnect(self):
+        sourceComponentOutputPort, targetComponentInputPort = self.getComponentPorts()
+        targetComponentInputPort.removeConnection()
 
-        self.sourceComponentOutputPort = self.sourceComponent.getOutputByName(self.connection.getSrcPort().getName())
-        self.targetComponentInputPort = self.targetComponent.getInputByName(self.connection.getDstPort().getName())
+        inCircle = self.graph.getNode(self.targetNodeName).getInputPort(self.inputName).inCircle()
+        for connection in list(inCircle.getConnections()):
+            srcPort = connection.getSrcPort()
+            if srcPort.getNode().getName() == self.sourceNodeName and srcPort.getName() == self.outputName:
+                self.graph.removeConnection(connection, emitSignal=False)
 
-        self.targetComponentInputPort.setConnection(self.sourceComponentOutputPort)
+
+class ConnectionAddedCommand(ConnectionCommand):
+    def __init__(self, graph, rig, connection):
+        super(ConnectionAddedCommand, self).__init__(graph, rig, connection)
+
+        sourceComponentOutputPort, targetComponentInputPort = self.getComponentPorts()
+        targetComponentInputPort.setConnection(sourceComponentOutputPort)
 
     def shortDesc(self):
-        return "Connect Ports '" + self.connection.getSrcPort().getName() + " > " + self.connection.getDstPort().getName()
+        return "Connect Ports '" + self.outputName + " > " + self.inputName
 
 
     def redo(self):
-        self.targetComponentInputPort.setConnection(self.sourceComponentOutputPort)
-        self.connection.connect()
-        self.graph.addConnection(self.connection, emitSignal=False)
+        self.connect()
 
 
     def undo(self):
-        self.targetComponentInputPort.removeConnection()
-        self.graph.removeConnection(self.connection, emitSignal=False)
+        self.disconnect()
 
 
-class ConnectionRemovedCommand(Command):
+class ConnectionRemovedCommand(ConnectionCommand):
     def __init__(self, graph, rig, connection):
-        super(ConnectionRemovedCommand, self).__init__()
-        self.graph = graph
-        self.connection = connection
+        super(ConnectionRemovedCommand, self).__init__(graph, rig, connection)
 
-        self.sourceComponent = rig.getChildByDecoratedName(self.connection.getSrcPort().getNode().getName())
-        self.targetComponent = rig.getChildByDecoratedName(self.connection.getDstPort().getNode().getName())
-
-        self.sourceComponentOutputPort = self.sourceComponent.getOutputByName(self.connection.getSrcPort().getName())
-        self.targetComponentInputPort = self.targetComponent.getInputByName(self.connection.getDstPort().getName())
-
-        self.targetComponentInputPort.removeConnection()
+        sourceComponentOutputPort, targetComponentInputPort = self.getComponentPorts()
+        targetComponentInputPort.removeConnection()
 
     def shortDesc(self):
-        return "Disconnect Ports '" + self.connection.getSrcPort().getName() + " > " + self.connection.getDstPort().getName()
+        return "Disconnect Ports '" + self.outputName + " > " + self.inputName
 
 
     def redo(self):
-        self.targetComponentInputPort.removeConnection()
-        self.graph.removeConnection(self.connection, emitSignal=False)
+        self.disconnect()
 
     def undo(self):
-        self.targetComponentInputPort.setConnection(self.sourceComponentOutputPort)
-        self.connection.connect()
-        self.graph.addConnection(self.connection, emitSignal=False)
-
+        self.connect()
@@ -0,0 +1,65 @@
+"""Kraken UI - Graph Snapshots module.
+
+Functions:
+saveComponentSnapshot -- Saves the data of a component as a rig stream.
+loadComponentSnapshot -- Loads a component snapshot back into a rig.
+getComponentPorts -- Finds the ports of a connection by name.
+
+The graph commands keep these snapshots instead of live components, none of
+these functions need Qt.
+
+"""
+
+from kraken.core.io.kraken_stream import encodeValue, decodeValue
+
+
+def saveComponentSnapshot(component):
+    """Saves the data of a component as a rig stream.
+
+    Args:
+        component (Component): Component to save.
+
+    Returns:
+        str: The encoded data of the component.
+
+    """
+
+    return encodeValue(component.saveData())
+
+
+def loadComponentSnapshot(rig, snapshot):
+    """Loads a component snapshot back into a rig.
+
+    Args:
+        rig (Rig): Rig to load the component into.
+        snapshot (str): Snapshot returned by saveComponentSnapshot.
+
+    Returns:
+        Component: The loaded component, None if its module wasn't found.
+
+    """
+
+    return rig._loadComponent(decodeValue(snapshot))
+
+
+def getComponentPorts(rig, sourceName, outputName, targetName, inputName):
+    """Finds the ports of a connection from the names of the components and
+    of the ports.
+
+    Args:
+        rig (Rig): Rig holding the components.
+        sourceName (str): Decorated name of the source component.
+        outputName (str): Name of the output port of the source component.
+        targetName (str): Decorated name of the target component.
+        inputName (str): Name of the input port of the target component.
+
+    Returns:
+        tuple: The output port and the input port.
+
+    """
+
+    sourceComponent = rig.getChildByDecoratedName(sourceName)
+    targetComponent = rig.getChildByDecoratedName(targetName)
+
+    return (sourceComponent.getOutputByName(outputName),
+            targetComponent.getInputByName(inputName))
@@ -49,28 +49,41 @@ class KGraphView(GraphView):
 
         guideComponents = self.__rig.getChildrenByType('Component')
 
+        # Resolve the connections with the nodes of the components rather
+        # than looking them up by decorated name.
+        nodes = []
+        componentNodes = {}
         for component in guideComponents:
             node = KNode(self, component)
-            self.addNode(node)
+            nodes.append(node)
+            componentNodes[id(component)] = node
 
+        connections = []
         for component in guideComponents:
             for i in range(component.getNumInputs()):
                 componentInput = component.getInputByIndex(i)
                 if componentInput.isConnected():
                     componentOutput = componentInput.getConnection()
-
-                    self.connectPorts(
-                        srcNode=componentOutput.getParent().getDecoratedName(), outputName=componentOutput.getName(),
-                        tgtNode=component.getDecoratedName(), inputName=componentInput.getName()
-                    )
-
-        # Get backdrops from meta data
-        metaData = self.__rig.getMetaData()
-        if 'backdrops' in metaData:
-            for backdrop in metaData['backdrops']:
-                backdropNode = KBackdrop(self, backdrop.get('name', 'Backdrop'))
-                self.addNode(backdropNode)
-                backdropNode.setData(backdrop)
+                    sourceComponent = componentOutput.getParent()
+
+                    srcNode = componentNodes.get(id(sourceComponent), sourceComponent.getDecoratedName())
+                    connections.append((srcNode, componentOutput.getName(),
+                                        componentNodes[id(component)], componentInput.getName()))
+
+        self.beginBulkUpdate()
+        try:
+            self.populateGraph(nodes, connections)
+
+            # Get backdrops from meta data
+            metaData = self.__rig.getMetaData()
+            if 'backdrops' in metaData:
+                for backdrop in metaData['backdrops']:
+                    backdropNode = KBackdrop(self, backdrop.get('name', 'Backdrop'))
+                    self.addNode(backdropNode)
+                    backdropNode.setData(backdrop)
+
+        finally:
+            self.endBulkUpdate()
 
         self.frameAllNodes()
 
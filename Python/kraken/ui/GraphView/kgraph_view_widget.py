@@ -137,7 +137,8 @@ class KGraphViewWidget(GraphViewWidget):
                 fileDialog.setWindowTitle('Save Rig Preset As')
                 fileDialog.setDirectory(os.path.abspath(filePathDir))
                 fileDialog.setAcceptMode(QtGui.QFileDialog.AcceptSave)
-                fileDialog.setNameFilter('Kraken Rig (*.krg)')
+                fileDialog.setNameFilters(['Kraken Rig (*.krg)',
+                                           'Kraken Binary Rig (*.krb)'])
                 fileDialog.setDefaultSuffix('krg')
 
                 if fileDialog.exec_() == QtGui.QFileDialog.Accepted:
@@ -211,7 +212,7 @@ class KGraphViewWidget(GraphViewWidget):
             fileDialog.setWindowTitle('Open Rig Preset')
             fileDialog.setDirectory(os.path.dirname(os.path.abspath(lastFilePath)))
             fileDialog.setAcceptMode(QtGui.QFileDialog.AcceptOpen)
-            fileDialog.setNameFilter('Kraken Rig (*.krg)')
+            fileDialog.setNameFilter('Kraken Rig (*.krg *.krb)')
 
             if fileDialog.exec_() == QtGui.QFileDialog.Accepted:
                 filePath = fileDialog.selectedFiles()[0]
@@ -281,6 +282,8 @@ class KGraphViewWidget(GraphViewWidget):
         if self.guideRig.getName().endswith('_guide') is False:
             self.guideRig.setName(self.guideRig.getName() + '_guide')
 
+        # Resolve the guide objects through the pairings of the guide build.
+        synchronizer.setBuilder(self._guideBuilder)
         synchronizer.setTarget(self.guideRig)
         synchronizer.sync()
 
@@ -301,12 +304,23 @@ class KGraphViewWidget(GraphViewWidget):
 
             rig.setName(rig.getName().replace('_guide', ''))
 
-            if self.window().preferences.getPreferenceValue('delete_existing_rigs'):
-                if self._builder:
-                    self._builder.deleteBuildElements()
+            # Only the components that changed since the previous build are
+            # rebuilt when the builder supports it.
+            if self.window().preferences.getPreferenceValue('delete_existing_rigs') and \
+                    self._builder and self._builder.canRebuild(rig):
+                self._builder.rebuild(rig)
+
+                buildReport = self._builder.getBuildReport()
+                logger.inform('Reused components: ' +
+                              ', '.join(buildReport['reused']))
+
+            else:
+                if self.window().preferences.getPreferenceValue('delete_existing_rigs'):
+                    if self._builder:
+                        self._builder.deleteBuildElements()
 
-            self._builder = plugins.getBuilder()
-            self._builder.build(rig)
+                self._builder = plugins.getBuilder()
+                self._builder.build(rig)
 
             logger.inform('Rig Build Success')
 
@@ -9,6 +9,9 @@ from PySide import QtGui, QtCore
 class Connection(QtGui.QGraphicsPathItem):
     __defaultPen = QtGui.QPen(QtGui.QColor(168, 134, 3), 1.5)
 
+    # Below this zoom level the connection is drawn as a straight line.
+    _lowDetailLevel = 0.35
+
     def __init__(self, graph, srcPortCircle, dstPortCircle):
         super(Connection, self).__init__()
 
@@ -34,6 +37,10 @@ class Connection(QtGui.QGraphicsPathItem):
         self.setPen(self.__defaultPen)
         self.setZValue(-1)
 
+        # Provides the exposed rect of the view to the paint method.
+        self.setFlag(QtGui.QGraphicsItem.ItemUsesExtendedStyleOption)
+        self.__pathPoints = None
+
         self.setAcceptHoverEvents(True)
         self.connect()
 
@@ -80,19 +87,36 @@ class Connection(QtGui.QGraphicsPathItem):
 
 
     def paint(self, painter, option, widget):
+        # Skip the connections outside of the area being redrawn.
+        if not option.exposedRect.intersects(self.boundingRect()):
+            return
+
         srcPoint = self.mapFromScene(self.__srcPortCircle.centerInSceneCoords())
         dstPoint = self.mapFromScene(self.__dstPortCircle.centerInSceneCoords())
 
-        dist_between = dstPoint - srcPoint
+        levelOfDetail = QtGui.QStyleOptionGraphicsItem.levelOfDetailFromTransform(painter.worldTransform())
+        if levelOfDetail < self._lowDetailLevel:
+            painter.setPen(self.pen())
+            painter.drawLine(srcPoint, dstPoint)
+            return
+
+        # Setting the path invalidates the item, only do it when the ports
+        # have moved.
+        pathPoints = (srcPoint.x(), srcPoint.y(), dstPoint.x(), dstPoint.y())
+        if pathPoints != self.__pathPoints:
+            self.__pathPoints = pathPoints
+
+            dist_between = dstPoint - srcPoint
+
+            self.__path = QtGui.QPainterPath()
+            self.__path.moveTo(srcPoint)
+            self.__path.cubicTo(
+                srcPoint + QtCore.QPointF(dist_between.x() * 0.4, 0),
+                dstPoint - QtCore.QPointF(dist_between.x() * 0.4, 0),
+                dstPoint
+                )
+            self.setPath(self.__path)
 
-        self.__path = QtGui.QPainterPath()
-        self.__path.moveTo(srcPoint)
-        self.__path.cubicTo(
-            srcPoint + QtCore.QPointF(dist_between.x() * 0.4, 0),
-            dstPoint - QtCore.QPointF(dist_between.x() * 0.4, 0),
-            dstPoint
-            )
-        self.setPath(self.__path)
         super(Connection, self).paint(painter, option, widget)
 
 
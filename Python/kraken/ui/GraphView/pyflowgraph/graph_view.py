@@ -74,6 +74,10 @@ class GraphView(QtGui.QGraphicsView):
         self.setSceneRect(-size.width() * 0.5, -size.height() * 0.5, size.width(), size.height())
 
         self.setAcceptDrops(True)
+
+        self.__bulkUpdateDepth = 0
+        self.__signalsWereBlocked = False
+
         self.reset()
 
 
@@ -84,7 +88,11 @@ class GraphView(QtGui.QGraphicsView):
     ################################################
     ## Graph
     def reset(self):
-        self.setScene(QtGui.QGraphicsScene())
+        scene = QtGui.QGraphicsScene()
+        if self.__bulkUpdateDepth > 0:
+            scene.setItemIndexMethod(QtGui.QGraphicsScene.NoIndex)
+
+        self.setScene(scene)
 
         self.__connections = set()
         self.__nodes = {}
@@ -93,6 +101,83 @@ class GraphView(QtGui.QGraphicsView):
         self._manipulationMode = MANIP_MODE_NONE
         self._selectionRect = None
 
+    def beginBulkUpdate(self):
+        """Starts adding or removing many items at once.
+
+        Until the matching endBulkUpdate call, the scene doesn't index its
+        items, the view doesn't repaint and the graph signals are not emitted,
+        so the changes are not recorded as undoable commands either. Calls can
+        be nested.
+
+        """
+
+        self.__bulkUpdateDepth += 1
+        if self.__bulkUpdateDepth > 1:
+            return
+
+        self.scene().setItemIndexMethod(QtGui.QGraphicsScene.NoIndex)
+        self.setUpdatesEnabled(False)
+        self.__signalsWereBlocked = self.blockSignals(True)
+
+    def endBulkUpdate(self):
+        """Ends the bulk update started by beginBulkUpdate.
+
+        The scene index is rebuilt once and the view repainted when the
+        outermost bulk update ends.
+
+        """
+
+        if self.__bulkUpdateDepth == 0:
+            raise Exception("endBulkUpdate called without beginBulkUpdate.")
+
+        self.__bulkUpdateDepth -= 1
+        if self.__bulkUpdateDepth > 0:
+            return
+
+        self.blockSignals(self.__signalsWereBlocked)
+        self.scene().setItemIndexMethod(QtGui.QGraphicsScene.BspTreeIndex)
+        self.setUpdatesEnabled(True)
+        self.viewport().update()
+
+    def isBulkUpdating(self):
+        """Returns whether a bulk update is in progress.
+
+        Returns:
+            bool: True if items are added or removed in bulk.
+
+        """
+
+        return self.__bulkUpdateDepth > 0
+
+    def populateGraph(self, nodes, connections):
+        """Adds nodes and connections in a single bulk update.
+
+        Args:
+            nodes (list): The nodes to add.
+            connections (list): (srcNode, outputName, tgtNode, inputName) tuple
+                for each connection, see connectPorts. Passing the nodes rather
+                than their names avoids looking them up.
+
+        Returns:
+            list: The new connections.
+
+        """
+
+        result = []
+
+        self.beginBulkUpdate()
+        try:
+            for node in nodes:
+                self.addNode(node)
+
+            for srcNode, outputName, tgtNode, inputName in connections:
+                result.append(self.connectPorts(srcNode, outputName, tgtNode, inputName))
+
+        finally:
+            self.endBulkUpdate()
+
+        return result
+
     def getGridSize(self):
         """Gets the size of the grid of the graph.
 
@@ -108,6 +108,9 @@ class Node(QtGui.QGraphicsWidget):
     __defaultSelectedPen = QtGui.QPen(__defaultSelectedColor, 1.6)
     __defaultLinePen = QtGui.QPen(QtGui.QColor(25, 25, 25, 255), 1.25)
 
+    # Below this zoom level the node is drawn as a plain rectangle.
+    _lowDetailLevel = 0.35
+
     def __init__(self, graph, name):
         super(Node, self).__init__()
 
@@ -125,6 +128,9 @@ class Node(QtGui.QGraphicsWidget):
         self.setMinimumHeight(20)
         self.setSizePolicy(QtGui.QSizePolicy(QtGui.QSizePolicy.Expanding, QtGui.QSizePolicy.Expanding))
 
+        # Provides the exposed rect of the view to the paint method.
+        self.setFlag(QtGui.QGraphicsItem.ItemUsesExtendedStyleOption)
+
         layout = QtGui.QGraphicsLinearLayout()
         layout.setContentsMargins(5, 0, 5, 7)
         layout.setSpacing(7)
@@ -136,6 +142,8 @@ class Node(QtGui.QGraphicsWidget):
         layout.setAlignment(self.__headerItem, QtCore.Qt.AlignCenter | QtCore.Qt.AlignTop)
 
         self.__ports = []
+        self.__inputPorts = {}
+        self.__outputPorts = {}
         self.__inputPortsHolder = PortList(self)
         self.__ioPortsHolder = PortList(self)
         self.__outputPortsHolder = PortList(self)
@@ -258,6 +266,13 @@ class Node(QtGui.QGraphicsWidget):
             self.__ioPortsHolder.addPort(port, QtCore.Qt.AlignHCenter | QtCore.Qt.AlignVCenter)
         self.__ports.append(port)
 
+        # The first port added with a name is the one found by name.
+        name = port.getName()
+        if isinstance(port, (InputPort, IOPort)):
+            self.__inputPorts.setdefault(name, port)
+        if isinstance(port, (OutputPort, IOPort)):
+            self.__outputPorts.setdefault(name, port)
+
         self.adjustSize()
         return port
 
@@ -269,20 +284,27 @@ class Node(QtGui.QGraphicsWidget):
         return None
 
     def getInputPort(self, name):
-        for port in self.__ports:
-            if port.getName() == name and isinstance(port, (InputPort, IOPort)):
-                return port
-        return None
+        return self.__inputPorts.get(name, None)
 
     def getOutputPort(self, name):
-        for port in self.__ports:
-            if port.getName() == name and isinstance(port, (OutputPort, IOPort)):
-                return port
-        return None
+        return self.__outputPorts.get(name, None)
 
 
     def paint(self, painter, option, widget):
         rect = self.windowFrameRect()
+
+        # Skip the nodes outside of the area being redrawn.
+        if not option.exposedRect.intersects(rect):
+            return
+
+        levelOfDetail = QtGui.QStyleOptionGraphicsItem.levelOfDetailFromTransform(painter.worldTransform())
+        if levelOfDetail < self._lowDetailLevel:
+            if self.__selected:
+                painter.fillRect(rect, self.__selectedColor)
+            else:
+                painter.fillRect(rect, self.__color)
+            return
+
         painter.setBrush(self.__color)
 
         painter.setPen(QtGui.QPen(QtGui.QColor(0, 0, 0, 0), 0))
@@ -1,4 +1,5 @@
 
+import sys
 
 
 class UndoRedoManager(object):
@@ -6,9 +7,15 @@ class UndoRedoManager(object):
     Usually only a single undo manager is instantiated for a given application, 
     but it is possible to instantiate multiple undomanagers, each one responsible for a separate undo stack. 
 
+    The undo history is bounded, when it holds more than the maximum number of undoable actions or its estimated
+    size exceeds the maximum number of bytes, the oldest actions are discarded. 
+
     """
 
     __instance = None
+
+    defaultMaxDepth = 200
+    defaultMaxBytes = 64 * 1024 * 1024
     
     def __init__(self):
         super(UndoRedoManager, self).__init__()
@@ -17,6 +24,8 @@ class UndoRedoManager(object):
         self.__currentBracket = None
         self.__isUndoingOrRedoing = False
         self.__enabled = True
+        self.__maxDepth = self.defaultMaxDepth
+        self.__maxBytes = self.defaultMaxBytes
         
         self.__fireUpdateCallback()
     
@@ -85,6 +94,7 @@ class UndoRedoManager(object):
             self.__currentBracket = self.__currentBracket.getParentCommandBracket()
             if not self.__currentBracket:
                 # Fire the update only if the root level command bracket is closed. 
+                self.__trimUndoStack()
                 self.__fireUpdateCallback()
 
 
@@ -136,6 +146,7 @@ class UndoRedoManager(object):
                     return
 
             self.__undoStack.append(command)
+            self.__trimUndoStack()
         self.__clearRedoStack()
     
 
@@ -193,6 +204,69 @@ class UndoRedoManager(object):
         self.__redoStack = []
             
 
+    def setMaxDepth(self, maxDepth):
+        """Sets the maximum number of undoable actions kept in the undo stack, discarding the oldest ones.
+
+        :param maxDepth: Maximum number of actions, None for an unbounded undo stack.
+        """
+        self.__maxDepth = maxDepth
+        self.__trimUndoStack()
+        self.__fireUpdateCallback()
+
+    def getMaxDepth(self):
+        """Returns the maximum number of undoable actions kept in the undo stack, None if unbounded."""
+        return self.__maxDepth
+
+    def setMaxBytes(self, maxBytes):
+        """Sets the maximum estimated size in bytes of the undo stack, discarding the oldest actions.
+
+        The most recent action is always kept, even if its size exceeds the maximum.
+
+        :param maxBytes: Maximum size in bytes, None for an unbounded undo stack.
+        """
+        self.__maxBytes = maxBytes
+        self.__trimUndoStack()
+        self.__fireUpdateCallback()
+
+    def getMaxBytes(self):
+        """Returns the maximum estimated size in bytes of the undo stack, None if unbounded."""
+        return self.__maxBytes
+
+    def getMemoryFootprint(self):
+        """Returns the estimated memory footprint of the undo and redo stacks.
+
+        :return: A dictionary with the 'undoCount', 'undoBytes', 'redoCount' and 'redoBytes' of the stacks.
+        """
+        return {
+            'undoCount': len(self.__undoStack),
+            'undoBytes': sum([x.getMemorySize() for x in self.__undoStack]),
+            'redoCount': len(self.__redoStack),
+            'redoBytes': sum([x.getMemorySize() for x in self.__redoStack])
+        }
+
+    def __trimUndoStack(self):
+        # The bracket being filled is at the top of the stack and the most recent action is never discarded.
+        numKept = 1
+        if self.__currentBracket is not None:
+            numKept = 2
+
+        numDiscarded = 0
+        if self.__maxDepth is not None:
+            numDiscarded = max(len(self.__undoStack) - max(self.__maxDepth, numKept), 0)
+
+        if self.__maxBytes is not None:
+            sizes = [x.getMemorySize() for x in self.__undoStack]
+            totalSize = sum(sizes[numDiscarded:])
+            while totalSize > self.__maxBytes and numDiscarded < len(self.__undoStack) - numKept:
+                totalSize -= sizes[numDiscarded]
+                numDiscarded += 1
+
+        if numDiscarded > 0:
+            for command in self.__undoStack[:numDiscarded]:
+                command.destroy()
+            self.__undoStack = self.__undoStack[numDiscarded:]
+            
+
     def reset(self):
         """Resets the undo manager, clearing both the undo and redo stacks"""
         self.__clearUndoStack()
@@ -341,6 +415,18 @@ class Command(object):
         """
         pass
 
+    def getMemorySize(self):
+        """Returns the estimated number of bytes held by this command. 
+
+        The estimate counts the command and the values of its attributes, but not the objects they reference, 
+        which are usually shared with the scene. Commands should store the data needed to restore large objects 
+        as compact serialized snapshots so that their size is accounted for. 
+        """
+        size = sys.getsizeof(self)
+        for value in getattr(self, '__dict__', {}).itervalues():
+            size += sys.getsizeof(value)
+        return size
+
     def destroy(self):
         """Prior to a Command being discarded from the stack, the destry method is called. The destroy method
         can be used to clean up any state data assocated with this command. The case where this is important, 
@@ -426,6 +512,13 @@ class CommandBracket(Command):
             # print "Undo %s" % command.shortDesc()
             command.undo()
     
+    def getMemorySize(self):
+        """Returns the estimated number of bytes held by the commands in the command bracket"""
+        size = sys.getsizeof(self) + sys.getsizeof(self.__commands)
+        for command in self.__commands:
+            size += command.getMemorySize()
+        return size
+
     def destroy(self):
         """Destroys all commands in the command bracket"""
         for command in self.__commands:
@@ -0,0 +1,106 @@
+import json
+
+from kraken.core.kraken_system import ks
+from kraken.core.objects.curve_data import packCurveData
+from kraken.plugins.canvas_plugin import curve_shape_cache
+from kraken.plugins.canvas_plugin.hash import makeCurveHash
+from kraken.plugins.canvas_plugin.curve_shape_cache import CurveShapeCache
+
+
+ks.setMathBackend('python')
+
+
+square = [
+    {
+        'points': [[-1.0, 0.0, -1.0], [1.0, 0.0, -1.0], [1.0, 0.0, 1.0], [-1.0, 0.0, 1.0]],
+        'degree': 1,
+        'closed': True
+    }
+]
+
+# Packed and unpacked definitions of a shape have the same digest.
+print makeCurveHash(square) == makeCurveHash(packCurveData(square))
+
+# The digest changes with the points and the flags of the sub-curves.
+openSquare = [dict(square[0], closed=False)]
+movedSquare = [dict(square[0], points=square[0]['points'][1:] + square[0]['points'][:1])]
+print len(set([makeCurveHash(square), makeCurveHash(openSquare), makeCurveHash(movedSquare)]))
+
+# Shapes are computed once and shared.
+cache = CurveShapeCache.getInstance()
+shape = cache.getShape(square)
+print shape is CurveShapeCache.getInstance().getShape(packCurveData(square))
+print shape.getDigest() == makeCurveHash(square)
+print shape.getPositions().tolist()
+print [int(x) for x in shape.getIndices()]
+
+# Sub-curves index the points following the previous ones.
+shape = cache.getShape(openSquare + [{'points': [[0.0, 0.0, 0.0], [0.0, 1.0, 0.0]]}])
+print [int(x) for x in shape.getIndices()]
+print cache.getNumShapes()
+
+cache.clear()
+print cache.getNumShapes()
+
+
+# Fake Fabric client, RTVals are constructed the way the KrakenSystem does.
+class FakeRTVal(object):
+
+    def __init__(self, dataType, value=None):
+        self.dataType = dataType
+        self.value = value
+        if dataType.endswith('[]'):
+            self.value = []
+
+    def resize(self, size):
+        self.value = [None] * size
+
+    def __setitem__(self, index, value):
+        self.value[index] = value.value
+
+
+class FakeJSONRTVal(FakeRTVal):
+
+    def setJSON(self, data):
+        self.value = json.loads(data)
+
+
+class FakeKrakenSystem(object):
+
+    def __init__(self, rtValClass):
+        self.rtValClass = rtValClass
+        self.client = object()
+        self.numArrays = 0
+
+    def getCoreClient(self):
+        return self.client
+
+    def rtVal(self, dataType, defaultValue=None):
+        if dataType.endswith('[]'):
+            self.numArrays += 1
+            return self.rtValClass(dataType)
+
+        if hasattr(defaultValue, 'getRTVal'):
+            defaultValue = [defaultValue.x, defaultValue.y, defaultValue.z]
+        elif dataType == 'Vec3':
+            defaultValue = [getattr(defaultValue, x) for x in 'xyz']
+
+        return FakeRTVal(dataType, defaultValue)
+
+
+shape = cache.getShape(square)
+for rtValClass in [FakeRTVal, FakeJSONRTVal]:
+    fakeKS = FakeKrakenSystem(rtValClass)
+    curve_shape_cache.ks = fakeKS
+    positions, indices = shape.getRTVals()
+    print [[x['x'], x['y'], x['z']] if isinstance(x, dict) else x for x in positions.value]
+    print [int(x) for x in indices.value]
+
+    # The arrays are filled once per client.
+    shape.getRTVals()
+    print fakeKS.numArrays
+    fakeKS.client = object()
+    print shape.getRTVals()[0] is positions, fakeKS.numArrays
+
+curve_shape_cache.ks = ks
+cache.clear()
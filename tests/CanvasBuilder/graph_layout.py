@@ -0,0 +1,45 @@
+from kraken.plugins.canvas_plugin.graph_layout import GraphLayout
+
+
+# Nodes are placed one column after their last parent, nodes with
+# connections are moved next to their first child.
+nodes = ['a', 'b', 'c', 'd', 'e', 'f', 'g']
+connections = {
+    'a': ['c', 'd'],
+    'b': ['c'],
+    'c': ['e'],
+    'd': ['f'],
+    'e': ['f', 'f'],
+    'g': ['f']
+}
+
+layout = GraphLayout(nodes, connections)
+layers = layout.computeLayers()
+print [(x, layers[x]) for x in nodes]
+print layout.orderLayers(layers)
+
+positions = layout.getPositions()
+print [(x, positions[x]) for x in nodes]
+
+# The crossing of two connections is removed.
+layout = GraphLayout(['a', 'b', 'x', 'y'], {'a': ['y'], 'b': ['x']})
+layers = layout.computeLayers()
+print layout.countCrossings([['a', 'b'], ['x', 'y']], layers)
+rows = layout.orderLayers(layers)
+print rows, layout.countCrossings(rows, layers)
+
+# Nodes feeding the first ports of a node are placed above.
+nodes = ['a', 'b', 'c', 'target']
+connections = {'a': ['target'], 'b': ['target'], 'c': ['target']}
+portIndices = {('a', 'target'): 2, ('b', 'target'): 0, ('c', 'target'): 1}
+layout = GraphLayout(nodes, connections, portCounts={'target': 3}, portIndices=portIndices)
+print sorted(layout.compute().items())
+
+# Cycles don't prevent the layout.
+layout = GraphLayout(['a', 'b', 'c', 'd'], {'a': ['b'], 'b': ['c'], 'c': ['a', 'd']})
+layers = layout.computeLayers()
+print [(x, layers[x]) for x in ['a', 'b', 'c', 'd']]
+
+# Connections to unknown nodes and to the node itself are ignored.
+layout = GraphLayout(['a', 'b'], {'a': ['a', 'b', 'z']})
+print sorted(layout.compute().items())
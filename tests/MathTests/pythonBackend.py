@@ -0,0 +1,50 @@
+import os
+import sys
+import StringIO
+
+import kraken
+from kraken.core.kraken_system import ks
+from kraken.core.maths import *
+
+
+ks.setMathBackend('python')
+
+tr = Vec3(1.0, 2.0, 3.0)
+ori = Quat().setFromEulerAnglesWithRotOrder(Vec3(0.0, Math_degToRad(90.0), 0.0), RotationOrder('xyz'))
+xfo = Xfo(tr=tr, ori=ori, sc=Vec3(2.0, 2.0, 2.0))
+print "isVec3:" + str(isinstance(tr, Vec3))
+print "xfo:" + str(xfo)
+print "transformVector:" + str(xfo.transformVector(Vec3(1.0, 0.0, 0.0)))
+print "inverseTransformVector:" + str(xfo.inverseTransformVector(xfo.transformVector(Vec3(1.0, 0.0, 0.0))))
+print "inverse:" + str(xfo.multiply(xfo.inverse()).toMat44().almostEqual(Mat44()))
+xfo2 = Xfo()
+xfo2.setFromMat44(xfo.toMat44())
+print "setFromMat44:" + str(xfo2.tr.almostEqual(xfo.tr) and xfo2.ori.almostEqual(xfo.ori) and xfo2.sc.almostEqual(xfo.sc))
+print "toEuler:" + str(ori.toEuler(RotationOrder('zyx')))
+print "mat33Inverse:" + str(ori.toMat33().multiply(ori.toMat33().inverse()).almostEqual(Mat33()))
+print "jsonEncode:" + str(tr.jsonEncode())
+
+# The other math tests must print their reference output with this backend
+# too, so any difference with the KL results is caught.
+mathTestsDir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(
+    os.path.realpath(kraken.__file__)))), 'tests', 'MathTests')
+for fileName in sorted(os.listdir(mathTestsDir)):
+    testName, ext = os.path.splitext(fileName)
+    if ext != '.py' or testName == 'pythonBackend':
+        continue
+
+    output = StringIO.StringIO()
+    stdout = sys.stdout
+    sys.stdout = output
+    try:
+        execfile(os.path.join(mathTestsDir, fileName), {})
+    except Exception as e:
+        print e.__class__.__name__ + ': ' + str(e)
+    finally:
+        sys.stdout = stdout
+
+    with open(os.path.join(mathTestsDir, testName + '.out')) as referenceFile:
+        reference = referenceFile.read()
+
+    lines = [x for x in output.getvalue().split('\n') if not x.startswith('[FABRIC')]
+    print testName + ":" + str('\n'.join(lines) == reference)
@@ -0,0 +1,46 @@
+from kraken.core.maths import *
+
+
+xfos = [
+    Xfo(tr=Vec3(1.0, 2.0, 3.0), ori=Quat().setFromAxisAndAngle(Vec3(0.0, 1.0, 0.0), 0.5), sc=Vec3(1.0, 1.0, 1.0)),
+    Xfo(tr=Vec3(-4.0, 0.5, 2.0), ori=Quat().setFromAxisAndAngle(Vec3(1.0, 0.0, 0.0), -1.2), sc=Vec3(2.0, 2.0, 2.0)),
+    Xfo(tr=Vec3(0.0, 0.0, -1.0), ori=Quat().setFromAxisAndAngle(Vec3(1.0, 1.0, 0.0), 2.5), sc=Vec3(1.0, 0.5, 1.5))
+]
+parent = Xfo(tr=Vec3(0.0, 3.0, 0.0), ori=Quat().setFromAxisAndAngle(Vec3(0.0, 0.0, 1.0), 0.3))
+
+
+def almostEqual(xfo, expected):
+    return (xfo.tr.almostEqual(expected.tr) and
+            abs(xfo.ori.dot(expected.ori)) > 1.0 - 1e-4 and
+            xfo.sc.almostEqual(expected.sc))
+
+
+def check(label, array, expected):
+    print label + ":" + str(len(array) == len(expected) and
+                            all([almostEqual(array[i], expected[i]) for i in xrange(len(expected))]))
+
+
+xfoArray = XfoArray.fromXfos(xfos)
+print "length:" + str(len(xfoArray))
+check("toXfos", xfoArray.toXfos(), xfos)
+check("multiply", xfoArray.multiply(parent), [xfo.multiply(parent) for xfo in xfos])
+check("multiplyArray", xfoArray.multiply(xfoArray), [xfo.multiply(xfo) for xfo in xfos])
+check("inverse", xfoArray.inverse(), [xfo.inverse() for xfo in xfos])
+check("toMat44", xfoArray.toMat44().toXfoArray(), xfos)
+check("linearInterpolate", xfoArray.linearInterpolate(parent, 0.25), [xfo.linearInterpolate(parent, 0.25) for xfo in xfos])
+
+mirrored = []
+for xfo in xfos:
+    mirroredXfo = xfo.clone()
+    mirroredXfo.tr.x = -mirroredXfo.tr.x
+    mirroredXfo.ori = mirroredXfo.ori.mirror(0)
+    mirrored.append(mirroredXfo)
+check("mirror", xfoArray.mirror(0), mirrored)
+
+matrices = Mat44Array.fromMat44s([xfo.toMat44() for xfo in xfos])
+print "mat44:" + str(all([matrices[i].almostEqual(xfos[i].toMat44()) for i in xrange(len(xfos))]))
+
+element = xfoArray[1]
+element.tr = Vec3(5.0, 6.0, 7.0)
+print "elementTr:" + str(xfoArray.tr[1].tolist())
+print "element:" + str(element.toXfo().ori.almostEqual(xfos[1].ori))
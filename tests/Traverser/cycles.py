@@ -0,0 +1,42 @@
+import logging
+
+from kraken.log import getLogger
+from kraken.core.kraken_system import ks
+from kraken.core.objects.locator import Locator
+from kraken.core.objects.attributes.attribute_group import AttributeGroup
+from kraken.core.objects.attributes.scalar_attribute import ScalarAttribute
+from kraken.core.traverser import Traverser
+
+
+getLogger('kraken').setLevel(logging.ERROR)
+
+ks.setMathBackend('python')
+
+# Hierarchies deeper than the recursion limit.
+parent = None
+for i in xrange(5000):
+    parent = Locator("locator" + str(i), parent=parent)
+
+trav = Traverser()
+trav.addRootItem(parent)
+trav.traverse()
+print "deep items:" + str(len(trav.items))
+print "deep objects3d:" + str(len(trav.objects3d))
+print "deep attributeGroups:" + str(len(trav.attributeGroups))
+print "deep attributes:" + str(len(trav.attributes))
+print "deep cycles:" + str(len(trav.getCycles()))
+
+locA = Locator("locatorA")
+locB = Locator("locatorB")
+groupA = AttributeGroup("settings", locA)
+groupB = AttributeGroup("settings", locB)
+attrA = ScalarAttribute('value', 0.0, parent=groupA)
+attrB = ScalarAttribute('value', 0.0, parent=groupB)
+attrB.connect(attrA)
+attrA.connect(attrB)
+
+trav = Traverser()
+trav.addRootItem(attrA)
+trav.traverse()
+for cycle in trav.getCycles():
+    print "cycle:" + " -> ".join([item.getDecoratedPath() for item in cycle])
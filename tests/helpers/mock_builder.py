@@ -0,0 +1,66 @@
+"""Kraken tests - helpers.mock_builder module.
+
+Classes:
+DCCItem -- Light weight stand-in for a DCC scene item.
+MockBuilder -- Builder creating a DCCItem for each built 3D object.
+
+"""
+
+from kraken.core.builder import Builder
+
+
+class DCCItem(object):
+    """Light weight stand-in for a DCC scene item."""
+
+    def __init__(self, name, parent=None):
+        self.name = name
+        self.parent = parent
+
+
+class MockBuilder(Builder):
+    """Builder creating a DCCItem for each built 3D object instead of a DCC
+    node, subclasses override _createDCCItem to change the created items."""
+
+    def _createDCCItem(self, kSceneItem, buildName):
+        """Creates the DCC item of a kraken scene item.
+
+        Args:
+            kSceneItem (Object3D): Kraken object being built.
+            buildName (str): The name to use on the built object.
+
+        Returns:
+            object: The DCC item.
+
+        """
+
+        return DCCItem(buildName)
+
+    def _buildItem(self, kSceneItem, buildName):
+        dccSceneItem = self._createDCCItem(kSceneItem, buildName)
+        self._registerSceneItemPair(kSceneItem, dccSceneItem)
+
+        return dccSceneItem
+
+    def buildContainer(self, kSceneItem, buildName):
+        return self._buildItem(kSceneItem, buildName)
+
+    def buildLayer(self, kSceneItem, buildName):
+        return self._buildItem(kSceneItem, buildName)
+
+    def buildHierarchyGroup(self, kSceneItem, buildName):
+        return self._buildItem(kSceneItem, buildName)
+
+    def buildGroup(self, kSceneItem, buildName):
+        return self._buildItem(kSceneItem, buildName)
+
+    def buildJoint(self, kSceneItem, buildName):
+        return self._buildItem(kSceneItem, buildName)
+
+    def buildLocator(self, kSceneItem, buildName):
+        return self._buildItem(kSceneItem, buildName)
+
+    def buildCurve(self, kSceneItem, buildName):
+        return self._buildItem(kSceneItem, buildName)
+
+    def buildControl(self, kSceneItem, buildName):
+        return self._buildItem(kSceneItem, buildName)
@@ -0,0 +1,59 @@
+import os
+import json
+import logging
+import tempfile
+
+from kraken.log import getLogger
+from kraken.core.kraken_system import ks
+from kraken.core.build_events import BuildEventStream, BuildEventRecorder, BuildEventFileWriter
+from kraken.core.objects.container import Container
+from kraken.core.objects.layer import Layer
+from kraken.core.objects.locator import Locator
+
+from helpers.mock_builder import MockBuilder
+
+
+getLogger('kraken').setLevel(logging.WARNING)
+
+ks.setMathBackend('python')
+
+
+container = Container('rig')
+layer = Layer('layer', parent=container)
+locA = Locator('locA', parent=layer)
+locB = Locator('locB', parent=locA)
+for obj in [container, layer, locA, locB]:
+    obj.setFlag('EXPLICIT_NAME')
+
+stream = BuildEventStream.getInstance()
+recorder = BuildEventRecorder()
+stream.addListener(recorder)
+
+filepath = os.path.join(tempfile.gettempdir(), 'kraken_build_events.jsonl')
+writer = BuildEventFileWriter(filepath)
+stream.addListener(writer)
+
+MockBuilder().build(container)
+
+stream.removeListener(writer)
+writer.close()
+
+for event in recorder.events:
+    print str(event.phase) + ' ' + event.item.getPath() + ' ' + str(event.duration >= 0.0)
+
+print sorted(recorder.getTotals().keys())
+
+with open(filepath) as eventFile:
+    lines = [json.loads(x) for x in eventFile]
+os.remove(filepath)
+
+print len(lines)
+print sorted(lines[0].keys())
+print lines[-1]['path'] + ' ' + lines[-1]['type']
+
+# Events are not sent once the listeners are removed.
+stream.removeListener(recorder)
+recorder.clear()
+MockBuilder().build(container)
+print len(recorder.events)
+print stream.hasListeners()
@@ -0,0 +1,71 @@
+import logging
+
+from kraken.log import getLogger
+from kraken.core.kraken_system import ks
+from kraken.core.builder import Builder
+from kraken.core.objects.container import Container
+from kraken.core.objects.layer import Layer
+from kraken.core.objects.locator import Locator
+from kraken.core.objects.components.component import Component
+
+
+getLogger('kraken').setLevel(logging.WARNING)
+
+ks.setMathBackend('python')
+
+
+class Guide(Locator):
+    pass
+
+
+class RecordingBuilder(Builder):
+
+    def __init__(self):
+        super(RecordingBuilder, self).__init__()
+        self.built = []
+
+    def buildLayer(self, kSceneItem, buildName):
+        self.built.append('layer:' + kSceneItem.getName())
+
+    def buildLocator(self, kSceneItem, buildName):
+        self.built.append('locator:' + kSceneItem.getName())
+
+
+def buildGuide(builder, kObject, buildName):
+    builder.built.append('guide:' + kObject.getName())
+
+
+RecordingBuilder.registerBuildHandler('Guide',
+                                      Builder._buildPhase_3DObjectsAttributes,
+                                      buildGuide)
+
+rig = Container('rig')
+layer = Layer('layer', parent=rig)
+component = Component('cmp', parent=rig)
+locator = Locator('locator', parent=layer)
+locator.setComponent(component)
+guide = Guide('guide', parent=locator)
+guide.setComponent(component)
+
+print "isTypeOf:" + str(guide.isTypeOf('Locator')) + " " + str(guide.isTypeOf('Joint'))
+print "isOfAnyType:" + str(guide.isOfAnyType(['Joint', 'Object3D'])) + " " + str(guide.isOfAnyType(['Joint']))
+print "getTypeHierarchyNames:" + str(guide.getTypeHierarchyNames())
+
+builder = RecordingBuilder()
+builder.build(rig)
+print "RecordingBuilder:" + str(builder.built)
+
+# Handlers registered on a builder class don't apply to the other builders.
+class OtherBuilder(Builder):
+
+    def __init__(self):
+        super(OtherBuilder, self).__init__()
+        self.built = []
+
+    def buildLocator(self, kSceneItem, buildName):
+        self.built.append('locator:' + kSceneItem.getName())
+
+
+builder = OtherBuilder()
+builder.build(rig)
+print "OtherBuilder:" + str(builder.built)
@@ -0,0 +1,30 @@
+from kraken.core.kraken_system import ks
+from kraken.core.builder import Builder
+from kraken.core.objects.locator import Locator
+
+from helpers.mock_builder import DCCItem
+
+
+ks.setMathBackend('python')
+
+
+locA = Locator("locatorA")
+locB = Locator("locatorB", parent=locA)
+locC = Locator("locatorC")
+
+builder = Builder()
+dccA = DCCItem("dccA")
+dccB = DCCItem("dccB")
+builder._registerSceneItemPair(locA, dccA)
+builder._registerSceneItemPair(locB, dccB)
+builder._registerSceneItemPair(locB, DCCItem("duplicate"))
+
+print "getDCCSceneItem:" + builder.getDCCSceneItem(locB).name
+print "getDCCSceneItem unbuilt:" + str(builder.getDCCSceneItem(locC))
+print "getDCCSceneItems:" + str([item and item.name for item in builder.getDCCSceneItems([locA, locC, locB])])
+print "getDCCSceneItemByPath:" + builder.getDCCSceneItemByPath("locatorA.locatorB").name
+print "getKrakenSceneItem:" + builder.getKrakenSceneItem(dccA).getName()
+print "pairs:" + str(len(builder.getDCCSceneItemPairs()))
+
+builder._clearBuildElements()
+print "cleared:" + str(builder.getDCCSceneItem(locA)) + " " + str(builder.getKrakenSceneItem(dccA))
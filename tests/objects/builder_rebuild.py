@@ -0,0 +1,129 @@
+import logging
+
+from kraken.log import getLogger
+from kraken.core.kraken_system import ks
+from kraken.core.objects.rig import Rig
+from kraken.core.objects.locator import Locator
+from kraken.core.objects.components.base_example_component import BaseExampleComponent
+
+from helpers.mock_builder import DCCItem, MockBuilder
+
+
+getLogger('kraken').setLevel(logging.WARNING)
+
+ks.setMathBackend('python')
+
+
+class RebuildTestComponent(BaseExampleComponent):
+
+    def __init__(self, name='test', parent=None):
+        super(RebuildTestComponent, self).__init__(name, parent)
+
+        self.parentInputTgt = self.createInput('parent', dataType='Xfo', parent=self.inputHrcGrp).getTarget()
+        self.outputTgt = self.createOutput('output', dataType='Xfo', parent=self.outputHrcGrp).getTarget()
+
+        self.locator = Locator('loc', parent=self.ctrlCmpGrp)
+        self.outputTgt.constrainTo(self.locator)
+
+    def loadData(self, data):
+        super(RebuildTestComponent, self).loadData(data)
+
+        self.locator.xfo.tr.x = data.get('offset', 0.0)
+
+
+ks.registerComponent(RebuildTestComponent)
+
+
+class RebuildTestBuilder(MockBuilder):
+
+    _supportsIncrementalBuild = True
+
+    def __init__(self):
+        super(RebuildTestBuilder, self).__init__()
+        self.built = []
+        self.deleted = []
+
+    def _deleteBuildElements(self, buildElements):
+        self.deleted += [x['tgt'].name for x in buildElements]
+
+        return True
+
+    def _createDCCItem(self, kSceneItem, buildName):
+        self.built.append(kSceneItem.getDecoratedPath())
+
+        return DCCItem(kSceneItem.getDecoratedPath())
+
+    def buildPoseConstraint(self, kConstraint):
+        return self._buildItem(kConstraint, kConstraint.getName())
+
+
+def createRig(offsets, components=('root:M', 'arm:L', 'hand:L', 'arm:R')):
+    componentClass = RebuildTestComponent.__module__ + '.' + RebuildTestComponent.__name__
+    rigData = {
+        'name': 'rig',
+        'components': [],
+        'connections': [
+            {'source': 'root:M.output', 'target': 'arm:L.parent'},
+            {'source': 'arm:L.output', 'target': 'hand:L.parent'},
+            {'source': 'root:M.output', 'target': 'arm:R.parent'}
+        ]
+    }
+    rigData['connections'] = [x for x in rigData['connections']
+                              if x['target'].split('.')[0] in components]
+
+    for decoratedName in components:
+        name, location = decoratedName.split(':')
+        rigData['components'].append({
+            'class': componentClass,
+            'name': name,
+            'location': location,
+            'offset': offsets.get(decoratedName, 0.0)
+        })
+
+    rig = Rig()
+    rig.loadRigDefinition(rigData)
+
+    return rig
+
+
+def printBuild(title, builder):
+    report = builder.getBuildReport()
+    print title
+    for key in ['rebuilt', 'reconnected', 'reused', 'removed']:
+        print "  " + key + ": " + ', '.join(report[key])
+    print "  built: " + str(len(builder.built))
+    for name in builder.built:
+        if 'Constraint' in name or 'loc' in name:
+            print "    " + name
+    print "  deleted: " + str(len(builder.deleted))
+    for name in sorted(builder.deleted):
+        print "    " + name
+
+    builder.built = []
+    builder.deleted = []
+
+
+builder = RebuildTestBuilder()
+print "canRebuild before build: " + str(builder.canRebuild(createRig({})))
+
+builder.build(createRig({}))
+printBuild("build", builder)
+
+rig = createRig({})
+print "canRebuild: " + str(builder.canRebuild(rig))
+builder.rebuild(rig)
+printBuild("rebuild unchanged", builder)
+
+rig = createRig({'arm:L': 2.0})
+builder.rebuild(rig)
+printBuild("rebuild arm:L", builder)
+
+print "hand:L input paired: " + builder.getDCCSceneItem(rig.getChildByDecoratedName('hand:L').parentInputTgt).name
+
+rig = createRig({'arm:L': 2.0}, components=('root:M', 'arm:L', 'hand:L'))
+builder.rebuild(rig)
+printBuild("rebuild without arm:R", builder)
+
+rig = createRig({'arm:L': 2.0})
+rig.setName('other')
+print "canRebuild renamed: " + str(builder.canRebuild(rig))
@@ -0,0 +1,59 @@
+import logging
+
+from kraken.log import getLogger
+from kraken.core.kraken_system import ks
+from kraken.core.configs.config import Config
+from kraken.core.maths import Vec3
+from kraken.core.objects.control import Control
+
+
+getLogger('kraken').setLevel(logging.WARNING)
+
+ks.setMathBackend('python')
+
+
+def printCurveData(control):
+    for subCurve in control.getCurveData():
+        points = [[round(x, 4) + 0.0 for x in point] for point in subCurve['points']]
+        print str(subCurve['degree']) + ' ' + str(subCurve['closed']) + ' ' + str(points)
+
+
+ctrlA = Control('ctrlA', shape='arrow')
+ctrlB = Control('ctrlB', shape='arrow')
+
+# Controls share the shape data of the config until they are modified.
+print ctrlA.getPackedCurveData() is ctrlB.getPackedCurveData()
+
+ctrlA.scalePoints(Vec3(2.0, 1.0, 0.5))
+print ctrlA.getPackedCurveData() is ctrlB.getPackedCurveData()
+printCurveData(ctrlA)
+printCurveData(ctrlB)
+
+ctrlA.rotatePoints(0.0, 90.0, 0.0)
+printCurveData(ctrlA)
+
+ctrlA.translatePoints(Vec3(1.0, 2.0, 3.0))
+printCurveData(ctrlA)
+
+ctrlA.alignOnXAxis()
+ctrlA.alignOnZAxis(negative=True)
+printCurveData(ctrlA)
+
+# Curve data is returned as new lists.
+curveData = ctrlB.getCurveData()
+curveData[0]['points'][0][0] = 100.0
+printCurveData(ctrlB)
+
+ctrlB.setCurveData(curveData)
+ctrlB.removeSubCurveByIndex(0)
+print ctrlB.getNumSubCurves()
+
+# The shape library is built once and can't be modified.
+shapes = Config.getInstance().getControlShapes()
+try:
+    shapes['arrow'] = []
+except TypeError as e:
+    print e
+
+Config.makeCurrent()
+print Config.getInstance().getControlShapes() is shapes
@@ -0,0 +1,82 @@
+from kraken.core.kraken_system import ks
+from kraken.core.evaluation_cache import EvaluationCache
+from kraken.core.maths import Xfo, Vec3
+from kraken.core.objects.locator import Locator
+from kraken.core.objects.operators.operator import Operator
+from kraken.core.objects.constraints.pose_constraint import PoseConstraint
+
+
+ks.setMathBackend('python')
+
+
+class CountingOperator(Operator):
+
+    def __init__(self, name):
+        super(CountingOperator, self).__init__(name)
+        self.inputs = {'input': None}
+        self.outputs = {'outputs': []}
+        self.evaluations = 0
+
+    def evaluate(self):
+        self.evaluations += 1
+
+        # Outputs are written in place, like the KL operators do.
+        tr = self.getInput('input').globalXfo.tr
+        for output in self.getOutput('outputs'):
+            output.xfo.tr = Vec3(tr.x + 1.0, tr.y, tr.z)
+
+        return super(CountingOperator, self).evaluate()
+
+
+locA = Locator("locatorA")
+locB = Locator("locatorB")
+locC = Locator("locatorC")
+locD = Locator("locatorD")
+locE = Locator("locatorE")
+
+operator = CountingOperator("operator")
+operator.setInput('input', locA)
+operator.setOutput('outputs', [locB, locC])
+
+constraint = PoseConstraint("D to C")
+constraint.setMaintainOffset(True)
+constraint.addConstrainer(locC)
+constraint.setConstrainee(locD)
+
+cache = EvaluationCache.getInstance()
+cache.resetCounters()
+
+locB.globalXfo
+locC.globalXfo
+print "disabled evaluations:" + str(operator.evaluations)
+
+cache.enable()
+locB.globalXfo
+locC.globalXfo
+locD.globalXfo
+locD.globalXfo
+print "enabled evaluations:" + str(operator.evaluations)
+print "counters:" + str(cache.getCounters())
+
+locD.xfo = Xfo(tr=Vec3(1.0, 2.0, 3.0))
+locB.globalXfo
+print "after downstream change:" + str(operator.evaluations)
+print "locD:" + str(locD.globalXfo.tr)
+
+locE.globalXfo
+locA.xfo = Xfo(tr=Vec3(4.0, 5.0, 6.0))
+print "locC:" + str(locC.globalXfo.tr)
+locB.globalXfo
+locD.globalXfo
+print "after upstream change:" + str(operator.evaluations)
+
+# Items unrelated to the change stay cached.
+cache.resetCounters()
+locE.globalXfo
+print "unrelated item counters:" + str(cache.getCounters())
+
+operator.setInput('input', locD)
+locB.globalXfo
+print "after input change:" + str(operator.evaluations)
+print "counters:" + str(cache.getCounters())
+cache.disable()
@@ -0,0 +1,51 @@
+import logging
+
+from kraken.log import getLogger
+from kraken.core.kraken_system import ks
+from kraken.core.objects.rig import Rig
+from kraken.core.objects.layer import Layer
+from kraken.core.objects.locator import Locator
+from kraken.core.objects.joint import Joint
+from kraken.core.objects.components.base_example_component import BaseExampleComponent
+
+
+getLogger('kraken').setLevel(logging.WARNING)
+
+ks.setMathBackend('python')
+
+
+rig = Rig('rig')
+layer = Layer('layer', parent=rig)
+component = BaseExampleComponent('arm', parent=rig)
+component.setLocation('L')
+locA = Locator('locA', parent=component.ctrlCmpGrp)
+jointA = Joint('jointA', parent=locA)
+
+print locA.getPath()
+print locA.getDecoratedPath()
+print jointA.getVisibilityAttr().getPath()
+
+# Paths follow renames, re-parenting and location changes.
+component.setName('leg')
+component.setLocation('R')
+print locA.getDecoratedPath()
+
+locA.setName('locB')
+print jointA.getPath()
+
+layer.addChild(locA)
+print jointA.getDecoratedPath()
+print jointA.getVisibilityAttr().getDecoratedPath()
+
+# Filtered iteration.
+print [x.getName() for x in rig.iterDescendents(classType='Joint')]
+print [x.getName() for x in rig.iterDescendents(classType=['Layer', 'Locator'], inheritedClass=False)]
+print [x.getName() for x in rig.getDescendents(classType='Object3D')]
+
+# Deep hierarchies don't hit the recursion limit.
+parent = rig
+for i in xrange(3000):
+    parent = Locator('chain' + str(i), parent=parent)
+
+print len(parent.getPath().split('.'))
+print len(list(rig.iterDescendents(classType='Locator')))
@@ -0,0 +1,34 @@
+import os
+import tempfile
+
+from kraken.core.solver_arg_schema_cache import SolverArgSchemaCache
+from kraken.core.objects.operators.kl_operator import KLOperator
+
+
+schema = (
+    ('drawDebug', 'Boolean', 'In'),
+    ('rigScale', 'Scalar', 'In'),
+    ('bones', 'Mat44[]', 'In'),
+    ('result', 'Mat44', 'Out'),
+    ('results', 'Mat44[]', 'Out')
+)
+
+# Schemas are persisted per solver type.
+filepath = os.path.join(tempfile.gettempdir(), 'kraken_solver_cache_test.json')
+cache = SolverArgSchemaCache(filepath)
+print cache.setSchema('Kraken', 'TestDeferredSolver', schema)
+print SolverArgSchemaCache(filepath).getSchema('Kraken', 'TestDeferredSolver') == schema
+print SolverArgSchemaCache(filepath).getSchema('Kraken', 'OtherSolver')
+print SolverArgSchemaCache('').getSchema('Kraken', 'TestDeferredSolver')
+os.remove(filepath)
+
+# Operators read the schema of their solver type without constructing it.
+KLOperator._solverArgSchemas[('Kraken', 'TestDeferredSolver')] = schema
+operator = KLOperator('testOp', 'TestDeferredSolver', 'Kraken')
+
+print sorted(operator.inputs.keys())
+print sorted(operator.outputs.keys())
+print operator.solverRTVal is None
+print operator.generateSourceCode(arraySizes={'results': 2})
+
+del KLOperator._solverArgSchemas[('Kraken', 'TestDeferredSolver')]
@@ -0,0 +1,88 @@
+import re
+import logging
+
+from kraken.log import getLogger
+from kraken.core.kraken_system import ks
+from kraken.core.maths.xfo import Xfo
+from kraken.core.objects.container import Container
+from kraken.core.objects.layer import Layer
+from kraken.core.objects.locator import Locator
+from kraken.core.objects.components.component import Component
+from kraken.core.objects.constraints import pose_constraint
+from kraken.plugins.kl_plugin.builder import Builder as KLBuilder
+
+
+getLogger('kraken').setLevel(logging.WARNING)
+
+ks.setMathBackend('python')
+
+
+class PoseConstraint(pose_constraint.PoseConstraint):
+
+    def computeOffset(self):
+        return Xfo()
+
+
+class TestKLBuilder(KLBuilder):
+
+    def setTransform(self, kSceneItem):
+        return True
+
+    def _postBuild(self):
+        return True
+
+
+# A hand with 5 fingers of 3 joints, the tips are constrained to the palm.
+rig = Container('hand')
+layer = Layer('layer', parent=rig)
+component = Component('hand', parent=rig)
+palm = Locator('palm', parent=layer)
+palm.setComponent(component)
+for i in xrange(5):
+    parent = palm
+    for j in xrange(3):
+        parent = Locator('finger%d_%d' % (i, j), parent=parent)
+        parent.setComponent(component)
+
+    constraint = PoseConstraint('tip%d' % i)
+    constraint.addConstrainer(palm)
+    constraint.setMaintainOffset(True)
+    parent.addConstraint(constraint)
+
+
+def generate(solveMode):
+    builder = TestKLBuilder()
+    config = builder.getConfig()
+    config.setMetaData('SolveMode', solveMode)
+    config.setMetaData('ParallelBlockMinSize', 4)
+    builder.build(rig)
+    getLogger('kraken').setLevel(logging.WARNING)
+
+    return builder.generateKLCode().split('\n')
+
+
+def getFunction(lines, name):
+    start = lines.index([x for x in lines if re.match(r'function \w+\.%s!' % name, x)][0])
+    return lines[start + 1:lines.index('}', start)]
+
+
+serial = generate('serial')
+print len([x for x in getFunction(serial, 'solve') if x.startswith('  // solving')])
+print len([x for x in serial if 'solveBlocks' in x])
+
+levels = generate('levels')
+for line in getFunction(levels, 'solve'):
+    if line.startswith('  // solving') or line.startswith('  for('):
+        print line
+print len([x for x in getFunction(levels, 'init') if x.startswith('  this.solveBlocks[')])
+
+parallel = generate('parallel')
+print [x for x in parallel if x.startswith('operator')]
+print [x.strip() for x in getFunction(parallel, 'solve') if '<<<' in x]
+
+try:
+    generate('threads')
+except ValueError as e:
+    print e
+
+TestKLBuilder().getConfig().setMetaData('SolveMode', 'serial')
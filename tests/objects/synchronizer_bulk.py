@@ -0,0 +1,105 @@
+import logging
+
+from kraken.log import getLogger
+from kraken.core.kraken_system import ks
+from kraken.core.builder import Builder
+from kraken.core.synchronizer import Synchronizer
+from kraken.core.maths import Vec3, Xfo
+from kraken.core.objects.rig import Rig
+from kraken.core.objects.locator import Locator
+
+from helpers.mock_builder import DCCItem
+
+
+getLogger('kraken').setLevel(logging.WARNING)
+
+ks.setMathBackend('python')
+
+
+class MatrixDCCItem(DCCItem):
+
+    def __init__(self, name, tr=(0.0, 0.0, 0.0), sc=1.0):
+        super(MatrixDCCItem, self).__init__(name)
+        self.setMatrix(tr, sc)
+
+    def setMatrix(self, tr, sc=1.0):
+        self.matrix = [sc, 0.0, 0.0, tr[0],
+                       0.0, sc, 0.0, tr[1],
+                       0.0, 0.0, sc, tr[2],
+                       0.0, 0.0, 0.0, 1.0]
+
+
+class MockSynchronizer(Synchronizer):
+
+    def __init__(self, scene):
+        super(MockSynchronizer, self).__init__()
+        self.scene = scene
+        self.resolved = []
+        self.queries = []
+
+    def getDCCItem(self, kObject):
+        if kObject.isTypeOf('Object3D'):
+            self.resolved.append(kObject.getName())
+
+        return self.scene.get(kObject.getPath(), None)
+
+    def getDCCWorldMatrices(self, dccItems):
+        self.queries.append([x.name for x in dccItems])
+
+        return [x.matrix for x in dccItems]
+
+
+def printXfos(objects):
+    for obj in objects:
+        print obj.getName() + ': ' + str(obj.xfo.tr) + ' ' + str(obj.xfo.sc)
+
+
+rig = Rig('rig')
+locA = Locator('locA', parent=rig)
+locB = Locator('locB', parent=locA)
+locC = Locator('locC', parent=rig)
+locC.setFlag('SYNC_SCALE')
+
+scene = {}
+for obj in [rig, locA, locB, locC]:
+    scene[obj.getPath()] = MatrixDCCItem(obj.getName())
+
+# Only the rig and locA were built by the builder.
+builder = Builder()
+builder._registerSceneItemPair(rig, scene[rig.getPath()])
+builder._registerSceneItemPair(locA, scene[locA.getPath()])
+
+synchronizer = MockSynchronizer(scene)
+synchronizer.setBuilder(builder)
+synchronizer.setTarget(rig)
+
+print "Resolved by path: " + str(synchronizer.resolved)
+
+scene[locA.getPath()].setMatrix((1.0, 2.0, 3.0))
+scene[locC.getPath()].setMatrix((4.0, 0.0, 0.0), sc=2.0)
+
+synchronizer.sync()
+print "Queries: " + str(synchronizer.queries)
+printXfos([locA, locB, locC])
+
+# Objects whose DCC matrix is unchanged are not written.
+xfoA = locA.xfo
+xfoB = locB.xfo
+scene[locB.getPath()].setMatrix((0.0, 5.0, 0.0), sc=3.0)
+synchronizer.sync()
+print "Queries: " + str(len(synchronizer.queries))
+print "locA written: " + str(locA.xfo is not xfoA)
+print "locB written: " + str(locB.xfo is not xfoB)
+printXfos([locB])
+
+# Objects modified on the Kraken side are written again.
+locA.xfo = Xfo(tr=Vec3(9.0, 9.0, 9.0))
+synchronizer.sync()
+printXfos([locA])
+
+# Missing DCC items are skipped.
+del scene[locB.getPath()]
+synchronizer.clearHierarchyMap()
+synchronizer.createHierarchyMap(rig)
+synchronizer.sync()
+print "Queries: " + str(synchronizer.queries[-1])
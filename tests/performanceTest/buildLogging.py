@@ -0,0 +1,97 @@
+import time
+import logging
+
+from kraken.log import getLogger
+from kraken.core.kraken_system import ks
+from kraken.core.builder import Builder
+from kraken.core.build_events import BuildEventStream, BuildEventRecorder
+from kraken.core.objects.container import Container
+from kraken.core.objects.layer import Layer
+from kraken.core.objects.locator import Locator
+from kraken.core.objects.components.component import Component
+
+from helpers.mock_builder import MockBuilder
+
+
+logger = getLogger('kraken')
+
+ks.setMathBackend('python')
+
+
+class BenchmarkBuilder(MockBuilder):
+    """Builder creating light weight DCC items after logging through the base
+    build methods."""
+
+    def buildLocator(self, kSceneItem, buildName):
+        Builder.buildLocator(self, kSceneItem, buildName)
+
+        return self._buildItem(kSceneItem, buildName)
+
+
+def logEagerly(items, phase):
+    """Logs the items the way the builder did before the messages were
+    formatted lazily."""
+
+    for item in items:
+        logger.debug("building(" + str(phase) + "): " + item.getPath() +
+                     " as: " + item.getName() + " type: " + item.getTypeName())
+        logger.info("build" + item.getTypeName() + ": " + item.getPath() +
+                    " as: " + item.getName())
+
+
+def logLazily(items, phase):
+    """Logs the items the way the builder does."""
+
+    logBuildSteps = logger.isEnabledFor(logging.DEBUG)
+    for item in items:
+        if logBuildSteps:
+            logger.debug("building(%d): %s as: %s type: %s", phase,
+                         item.getPath(), item.getName(), item.getTypeName())
+        logger.info("build%s: %s as: %s", item.getTypeName(), item.getPath(),
+                    item.getName())
+
+
+def createRig(count):
+    rig = Container('rig')
+    layer = Layer('layer', parent=rig)
+    component = Component('bench', parent=rig)
+
+    parent = layer
+    for i in xrange(count):
+        if i % 10 == 0:
+            parent = layer
+
+        locator = Locator('loc' + str(i), parent=parent)
+        locator.setComponent(component)
+        parent = locator
+
+    return rig
+
+
+def timeCall(fn, *args):
+    start = time.time()
+    fn(*args)
+
+    return time.time() - start
+
+
+logger.setLevel(logging.WARNING)
+
+for count in [2500, 5000, 10000]:
+    rig = createRig(count)
+
+    build = timeCall(BenchmarkBuilder().build, rig)
+
+    recorder = BuildEventRecorder()
+    BuildEventStream.getInstance().addListener(recorder)
+    events = timeCall(BenchmarkBuilder().build, rig)
+    BuildEventStream.getInstance().removeListener(recorder)
+
+    # Time the log statements of every built item with the levels disabled.
+    items = [x.item for x in recorder.events]
+    eager = timeCall(logEagerly, items, 0)
+    lazy = timeCall(logLazily, items, 0)
+
+    print "objects:%d build:%.3fs events:%.3fs (%d) logging eager:%.1fms lazy:%.1fms (-%.0f%%)" % (
+        count, build, events, len(items), eager * 1000.0, lazy * 1000.0,
+        (eager - lazy) * 100.0 / eager)
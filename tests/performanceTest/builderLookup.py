@@ -0,0 +1,75 @@
+import time
+import logging
+
+from kraken.log import getLogger
+from kraken.core.kraken_system import ks
+from kraken.core.objects.container import Container
+from kraken.core.objects.layer import Layer
+from kraken.core.objects.locator import Locator
+from kraken.core.objects.components.component import Component
+from kraken.core.objects.constraints.pose_constraint import PoseConstraint
+
+from helpers.mock_builder import DCCItem, MockBuilder
+
+
+getLogger('kraken').setLevel(logging.WARNING)
+
+ks.setMathBackend('python')
+
+
+class BenchmarkBuilder(MockBuilder):
+    """Builder creating light weight DCC items, looking up parents the same
+    way the DCC builders do."""
+
+    def _createDCCItem(self, kSceneItem, buildName):
+        parent = self.getDCCSceneItem(kSceneItem.getParent())
+
+        return DCCItem(buildName, parent)
+
+    def buildPoseConstraint(self, kConstraint):
+        constrainee = self.getDCCSceneItem(kConstraint.getConstrainee())
+        constrainers = self.getDCCSceneItems(kConstraint.getConstrainers())
+        dccSceneItem = DCCItem(kConstraint.getName(), constrainee)
+        dccSceneItem.constrainers = constrainers
+        self._registerSceneItemPair(kConstraint, dccSceneItem)
+
+        return dccSceneItem
+
+
+def createRig(count):
+    rig = Container('rig')
+    layer = Layer('layer', parent=rig)
+    component = Component('bench', parent=rig)
+
+    # Locators are chained in groups of ten, every tenth locator is
+    # constrained to the previous chain.
+    parent = layer
+    previous = None
+    for i in xrange(count):
+        if i % 10 == 0:
+            parent = layer
+
+        locator = Locator('loc' + str(i), parent=parent)
+        locator.setComponent(component)
+        if i % 10 == 0 and previous is not None:
+            constraint = PoseConstraint('con' + str(i))
+            constraint.setMaintainOffset(True)
+            constraint.addConstrainer(previous)
+            locator.addConstraint(constraint)
+
+        parent = locator
+        previous = locator
+
+    return rig
+
+
+for count in [1250, 2500, 5000, 10000]:
+    rig = createRig(count)
+    builder = BenchmarkBuilder()
+
+    start = time.time()
+    builder.build(rig)
+    duration = time.time() - start
+
+    print "objects:%d build:%.3fs perObject:%.1fus" % (
+        count, duration, duration * 1000000.0 / count)
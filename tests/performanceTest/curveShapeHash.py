@@ -0,0 +1,45 @@
+import time
+
+from kraken.core.objects.curve_data import packCurveData
+from kraken.plugins.canvas_plugin.hash import makeHash, makeCurveHash
+from kraken.plugins.canvas_plugin.curve_shape_cache import CurveShapeCache
+
+
+def createShape(numSubCurves, numPoints, seed):
+    """Creates a shape with points depending on the seed."""
+
+    curveData = []
+    for i in xrange(numSubCurves):
+        points = [[float(seed + i), float(j), float(j * j)] for j in xrange(numPoints)]
+        curveData.append({'points': points, 'degree': 1, 'closed': i % 2 == 0})
+
+    return curveData
+
+
+# Many controls sharing few shapes, the way the Canvas builder sees them.
+for numControls, numShapes, numPoints in [(1000, 20, 32), (2000, 50, 64)]:
+    shapes = [createShape(3, numPoints, x) for x in xrange(numShapes)]
+    controls = [shapes[x % numShapes] for x in xrange(numControls)]
+    packedControls = [packCurveData(x) for x in controls]
+
+    start = time.time()
+    for curveData in controls:
+        numVertices = sum([len(x['points']) for x in curveData])
+        str(makeHash([curveData, len(curveData), numVertices]))
+    deepHash = time.time() - start
+
+    start = time.time()
+    for curveData in packedControls:
+        makeCurveHash(curveData)
+    digest = time.time() - start
+
+    cache = CurveShapeCache.getInstance()
+    cache.clear()
+    start = time.time()
+    for curveData in packedControls:
+        cache.getShape(curveData)
+    cached = time.time() - start
+
+    print "controls:%d shapes:%d points:%d makeHash:%.3fs makeCurveHash:%.3fs cache:%.3fs (%d shapes)" % (
+        numControls, numShapes, numPoints * 3, deepHash, digest, cached,
+        cache.getNumShapes())
@@ -0,0 +1,91 @@
+import time
+import random
+
+from kraken.plugins.canvas_plugin.graph_layout import GraphLayout
+
+
+def createGraph(count, chainLength, seed=0):
+    """Creates a graph shaped like a rig graph: chains of nodes with some
+    nodes also driven by a node of a previous chain."""
+
+    rand = random.Random(seed)
+
+    nodes = []
+    connections = {}
+    portCounts = {}
+    portIndices = {}
+    for i in xrange(count):
+        node = 'node%d' % i
+        nodes.append(node)
+        portCounts[node] = rand.randint(2, 8)
+
+        if i % chainLength != 0:
+            connections.setdefault(nodes[i - 1], []).append(node)
+            portIndices[(nodes[i - 1], node)] = 0
+
+        if i > chainLength and rand.random() < 0.2:
+            driver = nodes[rand.randint(0, i - i % chainLength - 1)]
+            connections.setdefault(driver, []).append(node)
+            portIndices[(driver, node)] = rand.randint(1, portCounts[node] - 1)
+
+    # The graph manager returns the nodes in no particular order.
+    rand.shuffle(nodes)
+
+    return nodes, connections, portCounts, portIndices
+
+
+def fixedPointLayers(nodes, connections):
+    """Layers the nodes the way the Canvas builder did before."""
+
+    depth = {}
+    for n in nodes:
+        depth[n] = 0
+
+    changed = True
+    while changed:
+        changed = False
+
+        for n in nodes:
+            for c in connections.get(n, []):
+                if depth[c] <= depth[n]:
+                    depth[c] = depth[n] + 1
+                    changed = True
+
+        for n in nodes:
+            minDiff = 0
+            for c in connections.get(n, []):
+                diff = depth[c] - depth[n]
+                if diff < minDiff or minDiff == 0:
+                    minDiff = diff
+            if minDiff > 1:
+                depth[n] = depth[n] + minDiff - 1
+
+    return depth
+
+
+for count, chainLength in [(1000, 20), (10000, 20), (10000, 200)]:
+    nodes, connections, portCounts, portIndices = createGraph(count, chainLength)
+
+    start = time.time()
+    previousLayers = fixedPointLayers(nodes, connections)
+    fixedPoint = time.time() - start
+
+    layout = GraphLayout(nodes, connections, portCounts=portCounts, portIndices=portIndices)
+
+    start = time.time()
+    layers = layout.computeLayers()
+    layering = time.time() - start
+
+    rows = [[] for x in xrange(max(layers.values()) + 1)]
+    for node in nodes:
+        rows[layers[node]].append(node)
+    initialCrossings = layout.countCrossings(rows, layers)
+
+    start = time.time()
+    rows = layout.orderLayers(layers)
+    ordering = time.time() - start
+
+    print "nodes:%d chain:%d layers fixed point:%.3fs (%d columns) topological:%.3fs (%d columns) ordering:%.3fs crossings:%d -> %d" % (
+        count, chainLength, fixedPoint, max(previousLayers.values()) + 1,
+        layering, len(rows), ordering, initialCrossings,
+        layout.countCrossings(rows, layers))
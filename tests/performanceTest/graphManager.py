@@ -0,0 +1,46 @@
+import time
+
+from kraken.plugins.canvas_plugin.graph_manager import GraphManager
+
+
+def buildGraph(count):
+    """Builds a graph of Mat44 variables, each one connected to the previous
+    one and every tenth one rewired to a node further up the graph."""
+
+    graphManager = GraphManager()
+    graphManager.setCurrentGroup('bench')
+
+    nodes = []
+    for i in xrange(count):
+        node = graphManager.createVariableNode('bench', 'var' + str(i), 'Mat44')
+        if i > 0:
+            graphManager.connectNodes(nodes[-1], 'value', node, 'value')
+
+        if i >= 10 and i % 10 == 0:
+            graphManager.connectNodes(nodes[i - 10], 'value', node, 'value')
+
+        nodes.append(node)
+
+    return graphManager, nodes
+
+
+for count in [1250, 2500, 5000]:
+    start = time.time()
+    graphManager, nodes = buildGraph(count)
+    buildDuration = time.time() - start
+
+    start = time.time()
+    for node in nodes:
+        graphManager.hasInputConnections(node)
+        graphManager.getConnections(node, 'value', targets=True)
+        graphManager.getConnections(node, 'value', targets=False)
+    queryDuration = time.time() - start
+
+    start = time.time()
+    for i in xrange(0, count, 10):
+        graphManager.removeNode('bench', title='var' + str(i))
+    removeDuration = time.time() - start
+
+    print "nodes:%d build:%.3fs query:%.3fs remove:%.3fs perNode:%.1fus" % (
+        count, buildDuration, queryDuration, removeDuration,
+        buildDuration * 1000000.0 / count)
@@ -0,0 +1,118 @@
+import time
+import logging
+
+from kraken.log import getLogger
+from kraken.core.kraken_system import ks
+from kraken.core.maths.xfo import Xfo
+from kraken.core.objects.container import Container
+from kraken.core.objects.layer import Layer
+from kraken.core.objects.locator import Locator
+from kraken.core.objects.components.component import Component
+from kraken.core.objects.attributes.attribute_group import AttributeGroup
+from kraken.core.objects.attributes.scalar_attribute import ScalarAttribute
+from kraken.core.objects.constraints import pose_constraint
+from kraken.core.objects.operators.kl_operator import KLOperator
+from kraken.plugins.kl_plugin.builder import Builder as KLBuilder
+
+
+ks.setMathBackend('python')
+
+# The argument schema of the benchmark solver is registered up front so the
+# operators are created without the Fabric core.
+KLOperator._solverArgSchemas[('Kraken', 'BenchmarkSolver')] = (
+    ('drawDebug', 'Boolean', 'In'),
+    ('rigScale', 'Scalar', 'In'),
+    ('driver', 'Mat44', 'In'),
+    ('result', 'Mat44', 'Out'))
+
+
+class BenchmarkSolver(KLOperator):
+    """Operator which is never evaluated, the outputs keep their transforms."""
+
+    def __init__(self, name):
+        super(BenchmarkSolver, self).__init__(name, 'BenchmarkSolver', 'Kraken')
+
+    def evaluate(self):
+        return True
+
+
+class PoseConstraint(pose_constraint.PoseConstraint):
+    """Pose constraint with an identity offset, computing the offset needs
+    the Fabric core. The class name is the one of the KL constraint type."""
+
+    def computeOffset(self):
+        return Xfo()
+
+
+class BenchmarkKLBuilder(KLBuilder):
+    """KL builder skipping the steps which need the Fabric core, only the KL
+    code generation is timed."""
+
+    def setTransform(self, kSceneItem):
+        return True
+
+    def _postBuild(self):
+        return True
+
+
+def createRig(count, chainLength):
+    """Creates chains of locators with attributes driving each other, every
+    tenth locator is constrained and every twentieth driven by a solver."""
+
+    rig = Container('rig')
+    layer = Layer('layer', parent=rig)
+
+    previousAttr = None
+    for i in xrange(count):
+        if i % chainLength == 0:
+            component = Component('chain' + str(i // chainLength), parent=rig)
+            parent = layer
+            chainRoot = None
+
+        locator = Locator('loc' + str(i), parent=parent)
+        locator.setComponent(component)
+
+        attrGroup = AttributeGroup('settings', parent=locator)
+        attr = ScalarAttribute('blend', value=0.5, parent=attrGroup)
+        if previousAttr is not None and i % chainLength != 0:
+            attr.connect(previousAttr)
+        previousAttr = attr
+
+        if chainRoot is None:
+            chainRoot = locator
+        elif i % 10 == 0:
+            constraint = PoseConstraint('constraint' + str(i))
+            constraint.addConstrainer(chainRoot)
+            constraint.setMaintainOffset(True)
+            locator.addConstraint(constraint)
+        elif i % 20 == 5:
+            solver = BenchmarkSolver('solver' + str(i))
+            component.addOperator(solver)
+            solver.setInput('drawDebug', False)
+            solver.setInput('rigScale', 1.0)
+            solver.setInput('driver', chainRoot)
+            solver.setOutput('result', locator)
+
+        parent = locator
+
+    return rig
+
+
+getLogger('kraken').setLevel(logging.WARNING)
+
+for count, chainLength in [(5000, 100), (20000, 100), (20000, 5000)]:
+    rig = createRig(count, chainLength)
+
+    builder = BenchmarkKLBuilder()
+    start = time.time()
+    builder.build(rig)
+    build = time.time() - start
+
+    getLogger('kraken').setLevel(logging.WARNING)
+
+    start = time.time()
+    klCode = builder.generateKLCode()
+    generate = time.time() - start
+
+    print "objects:%d chain:%d build:%.3fs generateKLCode:%.3fs (%d lines)" % (
+        count, chainLength, build, generate, klCode.count('\n') + 1)
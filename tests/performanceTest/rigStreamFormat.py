@@ -0,0 +1,67 @@
+import os
+import json
+import time
+import tempfile
+
+from kraken.core.kraken_system import ks
+from kraken.core.io.kraken_stream import writeStreamData, readStreamData
+from kraken.helpers.utility_methods import prepareToSave, prepareToLoad
+
+
+ks.setMathBackend('python')
+
+iterations = 5
+sourcePath = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'arms.krg')
+tempDir = tempfile.mkdtemp()
+krgPath = os.path.join(tempDir, 'arms.krg')
+krbPath = os.path.join(tempDir, 'arms.krb')
+
+with open(sourcePath) as sourceFile:
+    rigData = prepareToLoad(json.load(sourceFile))
+
+
+def timeIt(fn):
+    start = time.time()
+    for i in xrange(iterations):
+        fn()
+
+    return (time.time() - start) / iterations
+
+
+def writeKrg():
+    with open(krgPath, 'w') as rigFile:
+        rigFile.write(json.dumps(prepareToSave(rigData), indent=2))
+
+
+def readKrg():
+    with open(krgPath) as rigFile:
+        prepareToLoad(json.load(rigFile))
+
+
+def writeKrb():
+    writeStreamData(krbPath, rigData)
+
+
+def readKrb():
+    readStreamData(krbPath)
+
+
+writeKrgTime = timeIt(writeKrg)
+readKrgTime = timeIt(readKrg)
+writeKrbTime = timeIt(writeKrb)
+readKrbTime = timeIt(readKrb)
+
+krgSize = os.path.getsize(krgPath)
+krbSize = os.path.getsize(krbPath)
+
+print "krg: %d bytes write:%.1fms read:%.1fms" % (
+    krgSize, writeKrgTime * 1000.0, readKrgTime * 1000.0)
+print "krb: %d bytes write:%.1fms read:%.1fms" % (
+    krbSize, writeKrbTime * 1000.0, readKrbTime * 1000.0)
+print "size ratio:%.2f write speedup:%.1fx read speedup:%.1fx" % (
+    float(krbSize) / krgSize, writeKrgTime / writeKrbTime,
+    readKrgTime / readKrbTime)
+
+os.remove(krgPath)
+os.remove(krbPath)
+os.rmdir(tempDir)
@@ -0,0 +1,447 @@
+"""Kraken build benchmarks.
+
+Builds the sample rigs and the example rigs with the base Builder and with a
+builder recording light weight DCC items, then reports the wall times, the
+peak memory and the time spent in each build phase as JSON.
+
+Each case runs in its own process so the peak memory is the one of the case.
+Passing the results of a previous run as the baseline fails the run when a
+case got slower or bigger than the threshold allows. The samples listed in
+STALE_CASES can't be loaded any more, they are reported instead of being run.
+
+Usage:
+    python runBenchmarks.py --output before.json
+    python runBenchmarks.py --output after.json --baseline before.json
+
+"""
+
+import os
+import sys
+import json
+import glob
+import logging
+import argparse
+import platform
+import importlib
+import subprocess
+from timeit import default_timer
+
+
+testsDir = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+rootDir = os.path.dirname(testsDir)
+
+# (module, class) of the example rigs.
+EXAMPLE_RIGS = [
+    ('kraken_examples.bob_rig', 'BobRig'),
+    ('kraken_examples.bob_guide_rig', 'BobGuideRig'),
+    ('kraken_examples.biped.biped_guide_rig', 'BipedGuideRig'),
+    ('kraken_examples.spineClav_rig', 'SpineClavRig')
+]
+
+BUILDERS = ['base', 'recording']
+
+# Samples which can't be loaded any more and the reason, they are left out of
+# the default run and listed separately so they don't fail it.
+STALE_CASES = {
+    'krg:arms': "uses kraken_examples.arm_component.ArmComponentGuide and its "
+                "clavicleEnd input, which no longer exist"
+}
+
+# Metrics compared with the baseline and the smallest change reported as a
+# regression, timings of a few milliseconds are mostly noise.
+COMPARED_METRICS = [
+    ('build', 0.01),
+    ('load', 0.01),
+    ('peakMemory', 1024)
+]
+
+
+# ======
+# Cases
+# ======
+def getCases():
+    """Returns the benchmark cases, including the stale ones.
+
+    Returns:
+        dict: The rig definition file or (module, class) of the example rig of
+            each case name.
+
+    """
+
+    cases = {}
+
+    krgPaths = glob.glob(os.path.join(os.path.dirname(os.path.realpath(__file__)), '*.krg'))
+    krgPaths += glob.glob(os.path.join(rootDir, 'Samples', 'Kraken', '*.krg'))
+    for krgPath in krgPaths:
+        name = os.path.splitext(os.path.basename(krgPath))[0]
+        cases['krg:' + name] = krgPath
+
+    for moduleName, className in EXAMPLE_RIGS:
+        cases['example:' + className] = (moduleName, className)
+
+    return cases
+
+
+def loadCase(source):
+    """Creates the rig of a case.
+
+    Args:
+        source (object): The rig definition file or the (module, class) of the
+            example rig.
+
+    Returns:
+        object: The rig.
+
+    """
+
+    if isinstance(source, tuple):
+        rigClass = getattr(importlib.import_module(source[0]), source[1])
+        return rigClass(source[1])
+
+    from kraken.core.objects.rig import Rig
+
+    rig = Rig()
+    rig.loadRigDefinitionFile(source)
+
+    return rig
+
+
+def getBuilderClass(builderName):
+    """Returns the builder class of a benchmark builder name.
+
+    Args:
+        builderName (str): 'base' or 'recording'.
+
+    Returns:
+        type: The builder class.
+
+    """
+
+    from kraken.core.builder import Builder
+
+    if builderName == 'base':
+        return Builder
+
+    # The cases run in their own process, the tests directory isn't on the
+    # path of these.
+    if testsDir not in sys.path:
+        sys.path.append(testsDir)
+
+    from helpers.mock_builder import MockBuilder
+
+    class RecordingBuilder(MockBuilder):
+        """Builder creating a light weight DCC item for each 3D object and
+        recording every build call."""
+
+        def __init__(self):
+            super(RecordingBuilder, self).__init__()
+
+            self.calls = []
+
+    def objectBuildMethod(methodName):
+        def build(self, kSceneItem, buildName):
+            self.calls.append((methodName, kSceneItem.getPath()))
+
+            return getattr(super(RecordingBuilder, self), methodName)(kSceneItem, buildName)
+
+        return build
+
+    def itemBuildMethod(methodName):
+        def build(self, kSceneItem):
+            self.calls.append((methodName, kSceneItem.getPath()))
+
+            return getattr(super(RecordingBuilder, self), methodName)(kSceneItem)
+
+        return build
+
+    for methodName in ['buildContainer', 'buildLayer', 'buildHierarchyGroup',
+                       'buildGroup', 'buildJoint', 'buildLocator', 'buildCurve',
+                       'buildControl']:
+        setattr(RecordingBuilder, methodName, objectBuildMethod(methodName))
+
+    for methodName in ['buildBoolAttribute', 'buildScalarAttribute',
+                       'buildIntegerAttribute', 'buildStringAttribute',
+                       'buildAttributeGroup', 'buildOrientationConstraint',
+                       'buildPoseConstraint', 'buildPositionConstraint',
+                       'buildScaleConstraint', 'buildKLOperator',
+                       'buildCanvasOperator']:
+        setattr(RecordingBuilder, methodName, itemBuildMethod(methodName))
+
+    return RecordingBuilder
+
+
+def getPeakMemory():
+    """Returns the peak memory used by the process.
+
+    Returns:
+        int: Peak resident memory in kilobytes, None if it can't be measured.
+
+    """
+
+    try:
+        import resource
+    except ImportError:
+        resource = None
+
+    if resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        if sys.platform == 'darwin':
+            peak = peak // 1024
+
+        return peak
+
+    try:
+        import psutil
+    except ImportError:
+        return None
+
+    memoryInfo = psutil.Process().memory_info()
+
+    return getattr(memoryInfo, 'peak_wset', memoryInfo.rss) // 1024
+
+
+def runCase(caseName, builderName, iterations):
+    """Loads and builds a case, in the current process.
+
+    Args:
+        caseName (str): Name of the case, see getCases.
+        builderName (str): Name of the builder to build the rig with.
+        iterations (int): Number of times the case is loaded and built.
+
+    Returns:
+        dict: The results of the fastest build.
+
+    """
+
+    from kraken.log import getLogger
+    from kraken.core.profiler import Profiler
+    from kraken.core.build_events import BuildEventStream, BuildEventRecorder
+
+    source = getCases()[caseName]
+    builderClass = getBuilderClass(builderName)
+
+    # The builder module sets the level when imported.
+    getLogger('kraken').setLevel(logging.WARNING)
+
+    phaseNames = {}
+    for attributeName in dir(builderClass):
+        if attributeName.startswith('_buildPhase_'):
+            phaseNames[getattr(builderClass, attributeName)] = attributeName[len('_buildPhase_'):]
+
+    profiler = Profiler.getInstance()
+    stream = BuildEventStream.getInstance()
+
+    result = None
+    for i in xrange(iterations):
+        profiler.reset()
+
+        start = default_timer()
+        rig = loadCase(source)
+        loadTime = default_timer() - start
+
+        recorder = BuildEventRecorder()
+        stream.addListener(recorder)
+        try:
+            builder = builderClass()
+
+            start = default_timer()
+            builder.build(rig)
+            buildTime = default_timer() - start
+        finally:
+            stream.removeListener(recorder)
+
+        if result is not None and buildTime >= result['build']:
+            continue
+
+        phases = recorder.getTotals(key=lambda event: phaseNames.get(event.phase, str(event.phase)))
+
+        result = {
+            'load': loadTime,
+            'build': buildTime,
+            'items': len(recorder.events),
+            'phases': phases,
+            'profiler': profiler.getTotals()
+        }
+
+    result['iterations'] = iterations
+    result['peakMemory'] = getPeakMemory()
+
+    return result
+
+
+def runCaseProcess(caseName, builderName, iterations):
+    """Runs a case in a new process.
+
+    Args:
+        caseName (str): Name of the case.
+        builderName (str): Name of the builder to build the rig with.
+        iterations (int): Number of times the case is loaded and built.
+
+    Returns:
+        dict: The results of the case, with an 'error' if it failed.
+
+    """
+
+    args = [sys.executable, os.path.realpath(__file__), '--run-case', caseName,
+            '--builder', builderName, '--iterations', str(iterations)]
+
+    proc = subprocess.Popen(args, stdout=subprocess.PIPE,
+                            stderr=subprocess.PIPE)
+    stdout, stderr = proc.communicate()
+
+    lines = [x for x in stdout.splitlines() if x.startswith('{')]
+    if proc.returncode != 0 or len(lines) == 0:
+        errorLines = [x for x in stderr.splitlines() if x.strip() != '']
+        if len(errorLines) > 0:
+            error = errorLines[-1]
+        else:
+            error = 'exit code ' + str(proc.returncode)
+
+        return {'error': error}
+
+    return json.loads(lines[-1])
+
+
+# ===========
+# Comparison
+# ===========
+def compareResults(results, baseline, threshold):
+    """Finds the cases which regressed compared to a baseline.
+
+    Args:
+        results (dict): Results of the current run.
+        baseline (dict): Results of the run to compare with.
+        threshold (float): Allowed relative increase, 0.1 for 10%.
+
+    Returns:
+        list: A message for each regression.
+
+    """
+
+    regressions = []
+    for key in sorted(results['cases']):
+        current = results['cases'][key]
+        previous = baseline['cases'].get(key, None)
+        if previous is None or 'error' in current or 'error' in previous:
+            continue
+
+        for metric, minDelta in COMPARED_METRICS:
+            value = current.get(metric, None)
+            previousValue = previous.get(metric, None)
+            if value is None or previousValue is None:
+                continue
+
+            delta = value - previousValue
+            if delta > minDelta and delta > previousValue * threshold:
+                regressions.append("%s %s: %g -> %g (+%.0f%%)" % (
+                    key, metric, previousValue, value,
+                    delta * 100.0 / max(previousValue, 1e-9)))
+
+    return regressions
+
+
+def printResults(results):
+    """Prints a summary of the results.
+
+    Args:
+        results (dict): Results of a run.
+
+    """
+
+    for key in sorted(results['cases']):
+        result = results['cases'][key]
+        if 'error' in result:
+            print "%-40s error: %s" % (key, result['error'])
+            continue
+
+        phases = ' '.join(["%s:%.3fs" % (x, result['phases'][x]) for x in sorted(result['phases'])])
+        peakMemory = result['peakMemory']
+        if peakMemory is None:
+            peakMemory = '-'
+        else:
+            peakMemory = str(peakMemory // 1024) + 'MB'
+
+        print "%-40s load:%.3fs build:%.3fs items:%d peak:%s %s" % (
+            key, result['load'], result['build'], result['items'], peakMemory,
+            phases)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--output', required=False, help="The file to write the results to (optional)")
+    parser.add_argument('--baseline', required=False, help="Results of a previous run to compare with (optional)")
+    parser.add_argument('--threshold', required=False, type=float, default=0.1, help="Relative increase reported as a regression, defaults to 0.1 (optional)")
+    parser.add_argument('--iterations', required=False, type=int, default=3, help="Number of builds per case, the fastest is kept (optional)")
+    parser.add_argument('--case', required=False, action='append', help="Name of a case to run, all by default (optional)")
+    parser.add_argument('--builder', required=False, choices=BUILDERS, action='append', help="Builder to use, all by default (optional)")
+    parser.add_argument('--math-backend', required=False, choices=['rtval', 'python'], help="Math backend to build with (optional)")
+    parser.add_argument('--run-case', required=False, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.math_backend is not None:
+        os.environ['KRAKEN_MATH_BACKEND'] = args.math_backend
+
+    if args.run_case is not None:
+        print json.dumps(runCase(args.run_case, args.builder[0], args.iterations))
+        sys.exit(0)
+
+    caseNames = args.case
+    staleCaseNames = []
+    if caseNames is None:
+        caseNames = sorted([x for x in getCases() if x not in STALE_CASES])
+        staleCaseNames = sorted([x for x in getCases() if x in STALE_CASES])
+
+    builderNames = args.builder
+    if builderNames is None:
+        builderNames = BUILDERS
+
+    results = {
+        'version': 1,
+        'python': platform.python_version(),
+        'platform': sys.platform,
+        'mathBackend': os.environ.get('KRAKEN_MATH_BACKEND', 'rtval'),
+        'cases': {},
+        'stale': dict([(x, STALE_CASES[x]) for x in staleCaseNames])
+    }
+
+    for caseName in caseNames:
+        for builderName in builderNames:
+            results['cases'][caseName + '/' + builderName] = runCaseProcess(caseName, builderName, args.iterations)
+
+    printResults(results)
+
+    if len(staleCaseNames) > 0:
+        print "======================================"
+        print "STALE CASES (not run)"
+        for caseName in staleCaseNames:
+            print caseName + ": " + STALE_CASES[caseName]
+
+    if args.output is not None:
+        with open(args.output, 'w') as resultsFile:
+            resultsFile.write(json.dumps(results, indent=2, sort_keys=True))
+
+    failed = False
+
+    errors = [x for x in results['cases'] if 'error' in results['cases'][x]]
+    if len(errors) > 0:
+        print "======================================"
+        print "FAILED CASES"
+        for key in sorted(errors):
+            print key
+        failed = True
+
+    if args.baseline is not None:
+        with open(args.baseline) as baselineFile:
+            baseline = json.load(baselineFile)
+
+        regressions = compareResults(results, baseline, args.threshold)
+        print "======================================"
+        if len(regressions) > 0:
+            print "REGRESSIONS"
+            for regression in regressions:
+                print regression
+            failed = True
+        else:
+            print "NO REGRESSIONS"
+
+    sys.exit(int(failed))
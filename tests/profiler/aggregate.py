@@ -0,0 +1,99 @@
+import os
+import json
+import tempfile
+
+from kraken.core.profiler import Profiler, profiled
+
+
+profiler = Profiler(mode=Profiler.MODE_AGGREGATE)
+
+for i in xrange(3):
+    profiler.push('build')
+    for j in xrange(4):
+        with profiler.profile('buildLocator'):
+            profiler.push('setTransform')
+            profiler.pop()
+    profiler.push('buildAttribute')
+    profiler.pop()
+    profiler.pop()
+
+profiler.push('save')
+profiler.pop()
+
+for stat in sorted(profiler.getStats(), key=lambda x: x['path']):
+    print '/'.join(stat['path']) + ' count: ' + str(stat['count']) + ' ' + \
+        str(stat['min'] <= stat['max'] and stat['self'] <= stat['total'])
+
+# Label totals, the same label under several paths is summed.
+print sorted(profiler.getTotals().keys())
+
+# Collapsed stacks
+for line in sorted(profiler.getCollapsedStacks()):
+    frames, selfTime = line.rsplit(' ', 1)
+    print frames + ' ' + str(int(selfTime) >= 0)
+
+# Chrome trace events, children are within their parent.
+events = profiler.getChromeTraceEvents()
+eventsByName = dict([(x['name'], x) for x in events])
+print len(events)
+build = eventsByName['build']
+locator = eventsByName['buildLocator']
+print locator['ts'] >= build['ts'] and locator['ts'] + locator['dur'] <= build['ts'] + build['dur'] + 1e-6
+print locator['args']['count']
+
+filepath = os.path.join(tempfile.gettempdir(), 'kraken_profile.json')
+profiler.exportChromeTrace(filepath)
+with open(filepath) as traceFile:
+    print sorted(json.load(traceFile).keys())
+os.remove(filepath)
+
+# Calls mode aggregates the recorded calls the same way.
+profiler.setMode(Profiler.MODE_CALLS)
+for i in xrange(2):
+    with profiler.profile('build'):
+        profiler.push('buildLocator')
+        profiler.pop()
+print [(x['path'], x['count']) for x in profiler.getStats()]
+print len(profiler.getChromeTraceEvents())
+
+# Nested brackets with the same label are counted once in the totals.
+for mode in [Profiler.MODE_CALLS, Profiler.MODE_AGGREGATE]:
+    profiler.setMode(mode)
+    with profiler.profile('build'):
+        with profiler.profile('build'):
+            profiler.push('buildLocator')
+            profiler.pop()
+    stats = dict([(x['path'], x['total']) for x in profiler.getStats()])
+    print profiler.getTotals()['build'] == stats[('build', )]
+
+
+# Decorator and disabled state
+@profiled('decorated')
+def decorated(value):
+    return value * 2
+
+singleton = Profiler.getInstance()
+singleton.reset()
+print decorated(2)
+print [(x['path'], x['count']) for x in singleton.getStats()]
+
+singleton.disable()
+singleton.reset()
+print decorated(3)
+singleton.push('ignored')
+with singleton.profile('ignored'):
+    pass
+print singleton.isEnabled(), len(singleton.getStats())
+
+singleton.enable()
+singleton.push('enabled')
+singleton.pop()
+print singleton.isEnabled(), len(singleton.getStats())
+singleton.reset()
+
+# Brackets must be closed to change the mode.
+profiler.push('open')
+try:
+    profiler.setMode(Profiler.MODE_AGGREGATE)
+except Exception as e:
+    print str(e)
@@ -10,6 +10,7 @@ import logging
 
 
 from kraken.log import getLogger
+from kraken.core.kraken_system import ks
 
 failedTests = []
 updatedReferences = []
@@ -97,7 +98,13 @@ def runPytonTest(filepath, update, printoutput):
             for handler in logger.handlers:
                 handler.setLevel(logging.DEBUG)
 
-            execfile(filepath, {})
+            # Tests switching the math backend don't change it for the next test.
+            mathBackend = ks.getMathBackend()
+            try:
+                execfile(filepath, {})
+            finally:
+                ks.setMathBackend(mathBackend)
+
             output = s.getvalue()
         except Exception as e:
             print(format_exception(e))
@@ -162,6 +169,8 @@ if __name__ == '__main__':
     else:
         testsDir = os.path.join(os.path.dirname(os.path.realpath(__file__)))
         for root, dirs, files in os.walk(testsDir):
+            # The helpers package is imported by the tests, it holds no tests.
+            dirs[:] = [name for name in dirs if name != 'helpers']
             for filename in [name for name in files if name != 'runTests.py']:
                 filepath = os.path.join(root, filename)
                 runTest(filepath, update)
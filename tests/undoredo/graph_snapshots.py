@@ -0,0 +1,55 @@
+import logging
+
+from kraken.log import getLogger
+from kraken.core.kraken_system import ks
+from kraken.core.maths import Vec2
+from kraken.core.objects.rig import Rig
+from kraken.core.objects.components.base_example_component import BaseExampleComponent
+from kraken.ui.GraphView.graph_snapshots import saveComponentSnapshot, loadComponentSnapshot, getComponentPorts
+
+
+getLogger('kraken').setLevel(logging.WARNING)
+
+ks.setMathBackend('python')
+
+
+class SnapshotTestComponent(BaseExampleComponent):
+
+    def __init__(self, name='test', parent=None):
+        super(SnapshotTestComponent, self).__init__(name, parent)
+
+        self.createInput('parent', dataType='Xfo', parent=self.inputHrcGrp)
+        self.createOutput('output', dataType='Xfo', parent=self.outputHrcGrp)
+
+
+ks.registerComponent(SnapshotTestComponent)
+
+
+def connect(rig, sourceName, targetName):
+    output, input = getComponentPorts(rig, sourceName, 'output', targetName, 'parent')
+    input.setConnection(output)
+
+    return input
+
+
+rig = Rig('rig')
+root = SnapshotTestComponent('root', parent=rig)
+arm = SnapshotTestComponent('arm', parent=rig)
+arm.setLocation('L')
+arm.setGraphPos(Vec2(10.0, 20.0))
+print "connected:" + str(connect(rig, 'root:M', 'arm:L').isConnected())
+
+# Removing a node keeps a snapshot of its component.
+snapshot = saveComponentSnapshot(arm)
+arm.getInputByName('parent').removeConnection()
+arm.detach()
+print "detached:" + str(rig.getChildByDecoratedName('arm:L'))
+
+# Undoing the removal loads the component back and reconnects it by name.
+loaded = loadComponentSnapshot(rig, snapshot)
+print "loaded:" + loaded.getDecoratedName() + " " + str(loaded is arm) + " " + str(loaded.getGraphPos())
+print "found:" + str(rig.getChildByDecoratedName('arm:L') is loaded)
+print "disconnected:" + str(loaded.getInputByName('parent').isConnected())
+
+input = connect(rig, 'root:M', 'arm:L')
+print "reconnected:" + str(input.isConnected()) + " " + input.getConnection().getDecoratedPath()
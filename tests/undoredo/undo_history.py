@@ -0,0 +1,90 @@
+from kraken.core.io.kraken_stream import encodeValue
+from kraken.ui.undoredo.undo_redo_manager import UndoRedoManager, Command
+
+
+class SetValueCommand(Command):
+
+    def __init__(self, values, key, value, payload=None):
+        super(SetValueCommand, self).__init__()
+        self.values = values
+        self.key = key
+        self.oldValue = values.get(key)
+        self.newValue = value
+
+        # Snapshot of the data needed to restore the change.
+        self.snapshot = None
+        if payload is not None:
+            self.snapshot = encodeValue(payload)
+
+    def shortDesc(self):
+        return "Set " + self.key
+
+    def redo(self):
+        self.values[self.key] = self.newValue
+
+    def undo(self):
+        self.values[self.key] = self.oldValue
+
+    def destroy(self):
+        destroyed.append(self.newValue)
+
+
+def setValue(manager, values, key, value, payload=None):
+    manager.openBracket("Set " + key)
+    manager.addCommand(SetValueCommand(values, key, value, payload=payload), invokeRedoOnAdd=True)
+    manager.closeBracket()
+
+
+def undoAll(manager):
+    count = 0
+    while manager.canUndo():
+        manager.undo()
+        count += 1
+
+    return count
+
+
+# The oldest actions are discarded once the maximum depth is reached.
+destroyed = []
+values = {}
+manager = UndoRedoManager()
+manager.setMaxDepth(3)
+for i in xrange(5):
+    setValue(manager, values, 'a', i)
+
+print destroyed
+print manager.getMemoryFootprint()['undoCount']
+print undoAll(manager), values
+
+# Lowering the limits trims the existing history.
+destroyed = []
+manager = UndoRedoManager()
+for i in xrange(5):
+    setValue(manager, values, 'b', i)
+
+manager.setMaxDepth(2)
+print destroyed
+
+# Actions holding large snapshots are discarded first when the stack is too big.
+destroyed = []
+manager = UndoRedoManager()
+manager.setMaxDepth(None)
+payload = [[float(x)] * 16 for x in xrange(256)]
+for i in xrange(6):
+    setValue(manager, values, 'c', i, payload=payload)
+
+footprint = manager.getMemoryFootprint()
+print footprint['undoCount'], footprint['undoBytes'] > 6 * len(encodeValue(payload))
+
+manager.setMaxBytes(footprint['undoBytes'] // 2)
+footprint = manager.getMemoryFootprint()
+print destroyed, footprint['undoCount'], footprint['undoBytes'] <= manager.getMaxBytes()
+
+# The last action is kept even if it's bigger than the maximum size.
+manager.setMaxBytes(1)
+print manager.getMemoryFootprint()['undoCount']
+
+# Undone actions are reported in the redo stack.
+manager.undo()
+footprint = manager.getMemoryFootprint()
+print footprint['undoCount'], footprint['redoCount'], footprint['redoBytes'] > 0
@@ -0,0 +1,100 @@
+import os
+import sys
+import time
+import shutil
+import logging
+import tempfile
+
+from kraken.log import getLogger
+from kraken.core.kraken_system import KrakenSystem
+
+
+getLogger('kraken').setLevel(logging.WARNING)
+previousRootLevel = logging.getLogger().level
+logging.getLogger().setLevel(logging.WARNING)
+
+moduleSource = """
+from kraken.core.kraken_system import KrakenSystem
+from kraken.core.objects.components.component import Component
+
+
+class CacheTestComponentGuide(Component):
+
+    @classmethod
+    def getComponentType(cls):
+        return 'Guide'
+
+    # %s
+
+
+KrakenSystem.getInstance().registerComponent(CacheTestComponentGuide)
+"""
+
+tempDir = tempfile.mkdtemp()
+krakenPath = os.path.join(tempDir, 'kraken')
+os.makedirs(os.path.join(krakenPath, 'Python', 'kraken_components'))
+packagePath = os.path.join(tempDir, 'components', 'cache_test_components')
+os.makedirs(packagePath)
+open(os.path.join(packagePath, '__init__.py'), 'w').close()
+modulePath = os.path.join(packagePath, 'cache_test_component.py')
+with open(modulePath, 'w') as moduleFile:
+    moduleFile.write(moduleSource % 'version 1')
+
+className = 'cache_test_components.cache_test_component.CacheTestComponentGuide'
+moduleName = 'cache_test_components.cache_test_component'
+
+ks = KrakenSystem.getInstance()
+previousState = (ks.registeredComponents, ks.registeredConfigs)
+previousEnviron = dict([(key, os.environ.get(key, None)) for key in
+                        ['KRAKEN_PATH', 'KRAKEN_PATHS', 'KRAKEN_COMPONENT_CACHE']])
+
+ks.registeredComponents = {}
+ks.registeredConfigs = {}
+os.environ['KRAKEN_PATH'] = krakenPath
+os.environ['KRAKEN_PATHS'] = os.path.join(tempDir, 'components')
+os.environ['KRAKEN_COMPONENT_CACHE'] = os.path.join(tempDir, 'cache', 'componentModuleCache.json')
+
+
+def load(label):
+    ks.loadComponentModules()
+    report = ks.getComponentModulesReport()[-1]
+    print label + ": modules:%d imported:%d cached:%d failed:%d imported:%s" % (
+        report['modules'], report['imported'], report['cached'],
+        len(report['failed']), moduleName in sys.modules)
+
+
+try:
+    load("first load")
+    print "known:" + str(ks.isComponentClassRegistered(className))
+
+    load("second load")
+    print "type:" + ks.getComponentType(className)
+    print "file:" + str(ks.getComponentModuleFile(className) == os.path.normpath(modulePath))
+    print "class:" + ks.getComponentClass(className).__name__
+    print "imported on request:" + str(moduleName in sys.modules)
+
+    # Touching the file keeps the entry valid as its content is unchanged.
+    stat = os.stat(modulePath)
+    os.utime(modulePath, (stat.st_atime, stat.st_mtime + 10))
+    load("touched")
+
+    with open(modulePath, 'w') as moduleFile:
+        moduleFile.write(moduleSource % 'version 2, edited')
+    load("edited")
+
+finally:
+    logging.getLogger().setLevel(previousRootLevel)
+
+    for key, value in previousEnviron.iteritems():
+        if value is None:
+            os.environ.pop(key, None)
+        else:
+            os.environ[key] = value
+
+    ks.registeredComponents, ks.registeredConfigs = previousState
+    ks.cachedComponents.clear()
+    ks.cachedConfigs.clear()
+    sys.path.remove(os.path.join(tempDir, 'components'))
+    sys.modules.pop(moduleName, None)
+    sys.modules.pop('cache_test_components', None)
+    shutil.rmtree(tempDir)
@@ -0,0 +1,49 @@
+import os
+import tempfile
+from collections import OrderedDict
+
+from kraken.core.kraken_system import ks
+from kraken.core.maths import Vec2, Vec3, Quat, Euler, Xfo, Mat44
+from kraken.core.io.kraken_stream import encodeValue, decodeValue
+from kraken.core.io.kraken_stream import writeStreamData, readStreamData
+from kraken.helpers.utility_methods import prepareToSave
+
+
+ks.setMathBackend('python')
+
+xfo = Xfo(tr=Vec3(1.0, 2.0, 3.0), ori=Quat(Vec3(0.0, 0.7071067690849304, 0.0), 0.7071067690849304), sc=Vec3(2.0, 2.0, 2.0))
+data = {
+    'name': 'rig',
+    'metaData': {'flag': True, 'count': 300, 'offset': -2, 'none': None},
+    'components': [
+        {
+            'class': 'kraken_components.biped.arm_component.ArmComponentGuide',
+            'name': u'arm',
+            'graphPos': Vec2(-24.0, 18.0),
+            'bicepXfo': xfo,
+            'rotation': Euler(0.5, 0.25, 0.125, 3),
+            'matrix': Mat44(),
+            'weights': [0.25, 0.5, 0.75],
+            'points': [[0.0, 1.0, 2.0], [3.0, 4.0, 5.0]]
+        }
+    ],
+    'connections': [
+        {'source': 'spine:M.neckEnd', 'target': 'arm:L.root', 'targetIndex': 0}
+    ]
+}
+
+pureJSON = prepareToSave(data)
+encoded = encodeValue(data)
+print "encodedJSON:" + str(decodeValue(encodeValue(pureJSON), mathObjects=False) == pureJSON)
+print "decodedObjects:" + str(prepareToSave(decodeValue(encoded)) == pureJSON)
+print "decodedJSON:" + str(decodeValue(encoded, mathObjects=False) == pureJSON)
+print "xfoType:" + decodeValue(encodeValue(xfo)).__class__.__name__
+
+# Subclasses of the builtin types are encoded as their base types.
+ordered = OrderedDict([('b', 1), ('a', OrderedDict([('weights', [0.5, 1.0])]))])
+print "ordered:" + str(decodeValue(encodeValue(ordered)) == ordered)
+
+filepath = os.path.join(tempfile.mkdtemp(), 'rig.krb')
+writeStreamData(filepath, data)
+print "streamed:" + str(prepareToSave(readStreamData(filepath)) == pureJSON)
+os.remove(filepath)
@@ -0,0 +1,36 @@
+import os
+
+from kraken import plugins
+
+
+previousDCC = os.environ.pop('KRAKEN_DCC', None)
+previousDevMode = plugins.isDevMode()
+plugins.setDevMode(False)
+plugins.resetPlugins()
+
+print plugins.getDCCPlugin()
+
+builder = plugins.getBuilder()
+print builder.__class__.__module__ + '.' + builder.__class__.__name__
+print type(plugins.getLogHandler()).__name__
+
+# The DCC is only probed once.
+os.environ['KRAKEN_DCC'] = 'Maya'
+print plugins.getDCCPlugin()
+
+# The dev mode probes the DCC every time.
+plugins.setDevMode(True)
+print plugins.getDCCPlugin()
+
+plugins.setDevMode(False)
+del os.environ['KRAKEN_DCC']
+print plugins.getDCCPlugin()
+
+plugins.resetPlugins()
+print plugins.getDCCPlugin()
+
+if previousDCC is not None:
+    os.environ['KRAKEN_DCC'] = previousDCC
+
+plugins.setDevMode(previousDevMode)
+plugins.resetPlugins()